@@ -0,0 +1,42 @@
+"""count reader API key requests
+
+Revision ID: 0037
+Revises: 0036
+Create Date: 2026-10-17 00:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0037"
+down_revision = "0036"
+branch_labels = None
+depends_on = None
+
+TABLE_NAME = "api_keys"
+COLUMN_NAME = "request_count"
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    if not inspector.has_table(TABLE_NAME):
+        return
+    columns = {column["name"] for column in inspector.get_columns(TABLE_NAME)}
+    if COLUMN_NAME not in columns:
+        op.add_column(
+            TABLE_NAME,
+            sa.Column(COLUMN_NAME, sa.Integer(), nullable=False, server_default="0"),
+        )
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    if not inspector.has_table(TABLE_NAME):
+        return
+    columns = {column["name"] for column in inspector.get_columns(TABLE_NAME)}
+    if COLUMN_NAME in columns:
+        op.drop_column(TABLE_NAME, COLUMN_NAME)
@@ -0,0 +1,46 @@
+"""add reader feed keyset indexes
+
+Revision ID: 0038
+Revises: 0037
+Create Date: 2026-10-17 00:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0038"
+down_revision = "0037"
+branch_labels = None
+depends_on = None
+
+_READER_ELIGIBLE = "current_path IS NOT NULL AND download_status IS NULL AND deleted_at IS NULL"
+
+
+def upgrade():
+    conn = op.get_bind()
+    if not sa.inspect(conn).has_table("books") or conn.dialect.name != "postgresql":
+        return
+
+    op.execute(
+        sa.text(
+            "CREATE INDEX IF NOT EXISTS ix_books_reader_updates_seek "
+            f"ON books (content_updated_at DESC, coalesce(title, ''), id) WHERE {_READER_ELIGIBLE}"
+        )
+    )
+    op.execute(
+        sa.text(
+            "CREATE INDEX IF NOT EXISTS ix_books_reader_title_seek "
+            f"ON books (coalesce(title, ''), id) WHERE {_READER_ELIGIBLE}"
+        )
+    )
+
+
+def downgrade():
+    conn = op.get_bind()
+    if not sa.inspect(conn).has_table("books") or conn.dialect.name != "postgresql":
+        return
+
+    op.execute(sa.text("DROP INDEX IF EXISTS ix_books_reader_title_seek"))
+    op.execute(sa.text("DROP INDEX IF EXISTS ix_books_reader_updates_seek"))
@@ -0,0 +1,79 @@
+"""add hourly endpoint metric rollups and a covering summary index
+
+Revision ID: 0039
+Revises: 0038
+Create Date: 2026-10-17 00:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0039"
+down_revision = "0038"
+branch_labels = None
+depends_on = None
+
+_METRICS_TABLE = "ai_endpoint_request_metrics"
+_ROLLUP_TABLE = "ai_endpoint_metric_rollups"
+_INDEX = "ix_ai_endpoint_metrics_settings_capability_endpoint_created"
+_INDEX_COLUMNS = ["settings_id", "capability", "endpoint_id", "created_at"]
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    if not inspector.has_table(_ROLLUP_TABLE):
+        op.create_table(
+            _ROLLUP_TABLE,
+            sa.Column("id", sa.BigInteger().with_variant(sa.Integer(), "sqlite"), primary_key=True, autoincrement=True),
+            sa.Column(
+                "settings_id",
+                sa.Integer(),
+                sa.ForeignKey("audiobook_settings.id", ondelete="CASCADE"),
+                nullable=False,
+            ),
+            sa.Column("capability", sa.String(), nullable=False),
+            sa.Column("endpoint_id", sa.String(), nullable=False),
+            sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("requests", sa.Integer(), nullable=False),
+            sa.Column("failures", sa.Integer(), nullable=False),
+            sa.Column("answered_duration_sum_ms", sa.Float(), nullable=False),
+            sa.Column("fastest_ms", sa.Float(), nullable=True),
+            sa.Column("slowest_ms", sa.Float(), nullable=True),
+            sa.Column("under_5s", sa.Integer(), nullable=False),
+            sa.Column("from_5s_to_15s", sa.Integer(), nullable=False),
+            sa.Column("from_15s_to_60s", sa.Integer(), nullable=False),
+            sa.Column("over_60s", sa.Integer(), nullable=False),
+            sa.Column("last_answered_at", sa.DateTime(timezone=True), nullable=True),
+            sa.UniqueConstraint(
+                "settings_id",
+                "capability",
+                "endpoint_id",
+                "bucket_start",
+                name="uq_ai_endpoint_metric_rollups_bucket",
+            ),
+        )
+
+    if inspector.has_table(_METRICS_TABLE) and conn.dialect.name == "postgresql":
+        if _INDEX in {index["name"] for index in inspector.get_indexes(_METRICS_TABLE)}:
+            op.drop_index(_INDEX, table_name=_METRICS_TABLE)
+        op.create_index(
+            _INDEX,
+            _METRICS_TABLE,
+            _INDEX_COLUMNS,
+            unique=False,
+            postgresql_include=["success", "duration_ms"],
+        )
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    if inspector.has_table(_METRICS_TABLE) and conn.dialect.name == "postgresql":
+        if _INDEX in {index["name"] for index in inspector.get_indexes(_METRICS_TABLE)}:
+            op.drop_index(_INDEX, table_name=_METRICS_TABLE)
+        op.create_index(_INDEX, _METRICS_TABLE, _INDEX_COLUMNS, unique=False)
+    if inspector.has_table(_ROLLUP_TABLE):
+        op.drop_table(_ROLLUP_TABLE)
@@ -0,0 +1,41 @@
+"""add periodic per-lane processing queue samples
+
+Revision ID: 0040
+Revises: 0039
+Create Date: 2026-10-17 00:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0040"
+down_revision = "0039"
+branch_labels = None
+depends_on = None
+
+_TABLE = "processing_queue_samples"
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    if inspector.has_table(_TABLE):
+        return
+    op.create_table(
+        _TABLE,
+        sa.Column("id", sa.BigInteger().with_variant(sa.Integer(), "sqlite"), primary_key=True, autoincrement=True),
+        sa.Column("sampled_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("resource_lane", sa.String(), nullable=False),
+        sa.Column("queued", sa.Integer(), nullable=False),
+        sa.Column("running", sa.Integer(), nullable=False),
+        sa.Column("oldest_queued_age_ms", sa.Float(), nullable=True),
+    )
+    op.create_index("ix_processing_queue_samples_sampled_at", _TABLE, ["sampled_at"], unique=False)
+    op.create_index("ix_processing_queue_samples_lane_sampled", _TABLE, ["resource_lane", "sampled_at"], unique=False)
+
+
+def downgrade():
+    inspector = sa.inspect(op.get_bind())
+    if inspector.has_table(_TABLE):
+        op.drop_table(_TABLE)
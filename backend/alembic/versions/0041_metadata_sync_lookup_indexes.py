@@ -0,0 +1,133 @@
+"""add normalized author keys and a remote identifier index for metadata sync
+
+Revision ID: 0041
+Revises: 0040
+Create Date: 2026-10-17 00:00:00
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0041"
+down_revision = "0040"
+branch_labels = None
+depends_on = None
+
+_COLUMN_COMMENT = "story-manager:alembic:0041"
+_TABLE = "book_remote_identifiers"
+_BATCH_SIZE = 1000
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_ISBN_RE = re.compile(r"[^0-9Xx]")
+
+
+def _normalize_text(value: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", value or "")
+    ascii_text = "".join(character for character in decomposed if not unicodedata.combining(character))
+    ascii_text = ascii_text.casefold().replace("&", " and ")
+    return _NON_ALNUM_RE.sub(" ", ascii_text).strip()
+
+
+def _canonical_isbn(value) -> str:
+    if value is None:
+        return ""
+    cleaned = _ISBN_RE.sub("", str(value)).upper()
+    if len(cleaned) == 13 and cleaned.isdigit():
+        return cleaned
+    if len(cleaned) != 10 or not re.fullmatch(r"\d{9}[\dX]", cleaned):
+        return ""
+    body = "978" + cleaned[:9]
+    checksum = (10 - (sum((1 if index % 2 == 0 else 3) * int(digit) for index, digit in enumerate(body)) % 10)) % 10
+    return body + str(checksum)
+
+
+def _stable_remote_identifiers(remote_ids) -> set[tuple[str, str]]:
+    remote_ids = remote_ids if isinstance(remote_ids, dict) else {}
+    identifiers = {
+        (key, str(remote_ids[key]).strip())
+        for key in ("google_books_volume_id", "open_library_work_key", "asin")
+        if remote_ids.get(key) and str(remote_ids[key]).strip()
+    }
+    identifiers.update(
+        ("isbn", normalized) for key in ("isbn_10", "isbn_13") if (normalized := _canonical_isbn(remote_ids.get(key)))
+    )
+    return identifiers
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    if not inspector.has_table("books"):
+        return
+
+    columns = {column["name"] for column in inspector.get_columns("books")}
+    if "author_key" not in columns:
+        op.add_column("books", sa.Column("author_key", sa.String(), nullable=True, comment=_COLUMN_COMMENT))
+    if not inspector.has_table(_TABLE):
+        op.create_table(
+            _TABLE,
+            sa.Column("book_id", sa.Integer(), sa.ForeignKey("books.id", ondelete="CASCADE"), primary_key=True),
+            sa.Column("kind", sa.String(), primary_key=True),
+            sa.Column("value", sa.String(), primary_key=True),
+        )
+
+    books = sa.table(
+        "books",
+        sa.column("id", sa.Integer),
+        sa.column("author", sa.String),
+        sa.column("author_key", sa.String),
+        sa.column("metadata_remote_ids", sa.JSON),
+    )
+    identifiers = sa.table(
+        _TABLE,
+        sa.column("book_id", sa.Integer),
+        sa.column("kind", sa.String),
+        sa.column("value", sa.String),
+    )
+    conn.execute(identifiers.delete())
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.select(books.c.id, books.c.author, books.c.metadata_remote_ids)
+            .where(books.c.id > last_id)
+            .order_by(books.c.id)
+            .limit(_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        conn.execute(
+            books.update().where(books.c.id == sa.bindparam("book_id")).values(author_key=sa.bindparam("key")),
+            [{"book_id": row.id, "key": _normalize_text(row.author or "")} for row in rows],
+        )
+        identifier_rows = [
+            {"book_id": row.id, "kind": kind, "value": value}
+            for row in rows
+            for kind, value in sorted(_stable_remote_identifiers(row.metadata_remote_ids))
+        ]
+        if identifier_rows:
+            conn.execute(identifiers.insert(), identifier_rows)
+        last_id = rows[-1].id
+
+    indexes = {index["name"] for index in sa.inspect(conn).get_indexes("books")}
+    if "ix_books_author_key" not in indexes:
+        op.create_index("ix_books_author_key", "books", ["author_key"], unique=False)
+    if "ix_book_remote_identifiers_kind_value" not in {index["name"] for index in sa.inspect(conn).get_indexes(_TABLE)}:
+        op.create_index("ix_book_remote_identifiers_kind_value", _TABLE, ["kind", "value"], unique=False)
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    if inspector.has_table(_TABLE):
+        op.drop_table(_TABLE)
+    if not inspector.has_table("books"):
+        return
+    if "ix_books_author_key" in {index["name"] for index in inspector.get_indexes("books")}:
+        op.drop_index("ix_books_author_key", table_name="books")
+    columns = {column["name"]: column for column in inspector.get_columns("books")}
+    if columns.get("author_key", {}).get("comment") == _COLUMN_COMMENT:
+        op.drop_column("books", "author_key")
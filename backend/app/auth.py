@@ -9,15 +9,14 @@ import hmac
 import os
 import secrets
 import time
-from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Optional
 
 from fastapi import Depends, HTTPException, Query, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBasic, HTTPBasicCredentials, HTTPBearer
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from . import models
+from . import config, models
 from .database import get_db
 
 _bearer = HTTPBearer(auto_error=False)
@@ -30,9 +29,9 @@ ADMIN_SESSION_SECONDS = 60 * 60 * 24 * 14
 ADMIN_AUTH_MODES = {ADMIN_AUTH_DISABLED, ADMIN_AUTH_PASSWORD}
 ADMIN_COOKIE_SECURE_AUTO = "auto"
 
-
-def _now_utc() -> datetime:
-    return datetime.now(timezone.utc)
+_CACHED_KEY_COLUMNS = ("id", "label", "token_prefix", "token_hash", "created_at", "last_used_at", "request_count")
+_verified_keys: dict[str, tuple[float, dict[str, Any]]] = {}
+_verified_key_generation = 0
 
 
 def hash_token(token: str) -> str:
@@ -135,11 +134,46 @@ def _extract_prefix(token: str) -> Optional[str]:
     return f"{parts[0]}_{parts[1]}"
 
 
+def forget_verified_key(key_id: Optional[int] = None) -> None:
+    """Drop cached verifications for one key, or for every key when omitted."""
+    global _verified_key_generation
+    _verified_key_generation += 1
+    if key_id is None:
+        _verified_keys.clear()
+        return
+    for token_digest, (_expires_at, values) in list(_verified_keys.items()):
+        if values["id"] == key_id:
+            _verified_keys.pop(token_digest, None)
+
+
 async def _get_key_by_token(db: AsyncSession, token: str) -> Optional[models.ApiKey]:
+    """Verify a reader token, serving repeat requests from a short-lived cache.
+
+    Usage is recorded in the write-behind buffer instead of committing a
+    ``last_used_at`` update on every request.
+    """
+    token_digest = hash_token(token)
+    cached = _verified_keys.get(token_digest)
+    if cached is not None and cached[0] > time.monotonic():
+        api_key = models.ApiKey(**cached[1])
+    else:
+        _verified_keys.pop(token_digest, None)
+        api_key = await _lookup_key(db, token, token_digest)
+        if api_key is None:
+            return None
+
+    from .services.api_key_usage import get_api_key_usage_recorder
+
+    get_api_key_usage_recorder().record(api_key.id)
+    return api_key
+
+
+async def _lookup_key(db: AsyncSession, token: str, token_digest: str) -> Optional[models.ApiKey]:
     prefix = _extract_prefix(token)
     if prefix is None:
         return None
 
+    generation = _verified_key_generation
     result = await db.execute(
         select(models.ApiKey).where(
             models.ApiKey.token_prefix == prefix,
@@ -150,12 +184,14 @@ async def _get_key_by_token(db: AsyncSession, token: str) -> Optional[models.Api
     if api_key is None:
         return None
 
-    if not hmac.compare_digest(api_key.token_hash, hash_token(token)):
+    if not hmac.compare_digest(api_key.token_hash, token_digest):
         return None
 
-    api_key.last_used_at = _now_utc()
-    await db.commit()
-    await db.refresh(api_key)
+    # A revocation that landed while this lookup was in flight must not be
+    # undone by caching the key we read before it.
+    if config.READER_KEY_CACHE_SECONDS > 0 and generation == _verified_key_generation:
+        values = {column: getattr(api_key, column) for column in _CACHED_KEY_COLUMNS}
+        _verified_keys[token_digest] = (time.monotonic() + config.READER_KEY_CACHE_SECONDS, values)
     return api_key
 
 
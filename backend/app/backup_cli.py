@@ -9,14 +9,14 @@ from pathlib import Path
 
 from .config import LIBRARY_PATH
 from .database import DATABASE_URL
-from .services.backups import BackupError, restore_backup_archive, verify_backup_archive
+from .services.backups import BackupError, restore_backup_archive, verify_backup
 
 
 def _parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Verify or restore a Story Manager backup.")
     subparsers = parser.add_subparsers(dest="command", required=True)
 
-    verify = subparsers.add_parser("verify", help="Verify the manifest and every file checksum.")
+    verify = subparsers.add_parser("verify", help="Verify a backup manifest or archive and every file checksum.")
     verify.add_argument("archive", type=Path)
 
     restore = subparsers.add_parser("restore", help="Replace the database and library from a verified backup.")
@@ -35,7 +35,7 @@ def main(argv: list[str] | None = None) -> int:
     args = _parser().parse_args(argv)
     try:
         if args.command == "verify":
-            manifest = verify_backup_archive(args.archive.resolve())
+            manifest = verify_backup(args.archive.resolve())
             library = manifest.get("library", {})
             print(
                 json.dumps(
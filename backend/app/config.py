@@ -37,6 +37,62 @@ GOOGLE_BOOKS_ALLOW_UNAUTHENTICATED = os.getenv("GOOGLE_BOOKS_ALLOW_UNAUTHENTICAT
 AMAZON_METADATA_ENABLED = os.getenv("AMAZON_METADATA_ENABLED", "false").strip().lower() in {"1", "true", "yes", "on"}
 AMAZON_METADATA_DOMAIN = os.getenv("AMAZON_METADATA_DOMAIN", "com").strip().lower() or "com"
 
+# Rebuildable derived data (provider responses, per-chapter cleaning results)
+# lives outside the library so backups never pick it up.
+CACHE_DIR = Path(os.getenv("STORY_MANAGER_CACHE_DIR", str(LIBRARY_PATH.parent / "cache"))).resolve()
+# Metadata provider responses are cached on disk so weekly re-checks of
+# unchanged books are answered locally. Stale entries are revalidated with the
+# provider's ETag/Last-Modified where available; the least recently used
+# entries are evicted beyond the size budget. Set the budget to 0 to disable.
+METADATA_CACHE_TTL_HOURS = max(0.0, float(os.getenv("METADATA_CACHE_TTL_HOURS", "720")))
+METADATA_CACHE_MAX_MB = max(0, int(os.getenv("METADATA_CACHE_MAX_MB", "256")))
+
+# Books searched at once during a metadata sync. Each provider's own rate
+# limit still applies, so this only bounds how many lookups wait in line.
+METADATA_SYNC_CONCURRENCY = max(1, int(os.getenv("METADATA_SYNC_CONCURRENCY", "8")))
+
 # Deleted books remain restorable for this many days. Operators can override
 # the window without changing existing recycle-bin deadlines.
 RECYCLE_BIN_RETENTION_DAYS = max(1, int(os.getenv("RECYCLE_BIN_RETENTION_DAYS", "30")))
+
+# Scheduled web-novel refreshes run concurrently. The global worker count bounds
+# total FanFicFare downloads, while each source host (RoyalRoad, AO3, ...) gets
+# its own smaller limit and a minimum spacing between request starts.
+WEB_REFRESH_CONCURRENCY = max(1, int(os.getenv("WEB_REFRESH_CONCURRENCY", "4")))
+WEB_REFRESH_PER_HOST_CONCURRENCY = max(1, int(os.getenv("WEB_REFRESH_PER_HOST_CONCURRENCY", "1")))
+WEB_REFRESH_HOST_DELAY_SECONDS = max(0.0, float(os.getenv("WEB_REFRESH_HOST_DELAY_SECONDS", "2")))
+
+# CPU-bound EPUB transforms (cleaning, prose normalization, word counts and
+# ingestion parsing) run in a bounded process pool so one large book cannot
+# stall the event loop. Set to 0 to run them in a worker thread instead.
+EPUB_PROCESS_WORKERS = max(0, int(os.getenv("EPUB_PROCESS_WORKERS", str(min(4, os.cpu_count() or 1)))))
+
+# AI provider calls (LLM, TTS, transcription) reuse one pooled HTTP client per
+# endpoint origin instead of opening a new connection for every request.
+AI_HTTP_MAX_CONNECTIONS = max(1, int(os.getenv("AI_HTTP_MAX_CONNECTIONS", "20")))
+AI_HTTP_MAX_KEEPALIVE_CONNECTIONS = max(0, int(os.getenv("AI_HTTP_MAX_KEEPALIVE_CONNECTIONS", "10")))
+AI_HTTP_KEEPALIVE_SECONDS = max(0.0, float(os.getenv("AI_HTTP_KEEPALIVE_SECONDS", "60")))
+
+# Routed AI requests are spread across every healthy endpoint in a pool; each
+# endpoint serves at most this many requests at once before callers queue.
+AI_ENDPOINT_MAX_IN_FLIGHT = max(1, int(os.getenv("AI_ENDPOINT_MAX_IN_FLIGHT", "2")))
+# A queued caller gives up after waiting this long for a free slot, matching
+# the read timeout of a single LLM or TTS request.
+AI_ENDPOINT_WAIT_TIMEOUT_SECONDS = max(1.0, float(os.getenv("AI_ENDPOINT_WAIT_TIMEOUT_SECONDS", "600")))
+
+# Imported narration is transcribed in windows of about this length, cut at a
+# nearby silence and overlapping their neighbours so words at each seam are
+# heard in context. Windows are transcribed concurrently and cached one by one.
+TRANSCRIPTION_WINDOW_SECONDS = max(60.0, float(os.getenv("TRANSCRIPTION_WINDOW_SECONDS", "600")))
+TRANSCRIPTION_WINDOW_OVERLAP_SECONDS = max(0.0, float(os.getenv("TRANSCRIPTION_WINDOW_OVERLAP_SECONDS", "15")))
+
+# Verified reader API keys are cached in memory for this many seconds (revoking
+# a key clears it immediately). Their last-used time and request count are
+# buffered and written in one batched UPDATE every flush interval.
+READER_KEY_CACHE_SECONDS = max(0.0, float(os.getenv("READER_KEY_CACHE_SECONDS", "30")))
+API_KEY_USAGE_FLUSH_SECONDS = max(1.0, float(os.getenv("API_KEY_USAGE_FLUSH_SECONDS", "5")))
+
+# Raw AI endpoint attempts are folded into hourly rollups by a maintenance job,
+# then deleted once older than this many days. Latency percentiles cover the
+# retained attempts; all other endpoint statistics are all-time.
+ENDPOINT_METRICS_RETENTION_DAYS = max(1, int(os.getenv("ENDPOINT_METRICS_RETENTION_DAYS", "14")))
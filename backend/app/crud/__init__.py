@@ -21,7 +21,11 @@ from .books import (  # noqa: F401
     get_catalog_total_count,
     get_books,
     get_books_by_author,
+    get_books_by_author_keys,
     get_books_by_ids,
+    get_book_ids_in_author_order,
+    get_live_book_ids,
+    get_books_with_remote_identifiers,
     get_books_without_series,
     get_all_books_including_deleted,
     get_recycled_books,
@@ -77,9 +81,10 @@ from .cleaning import (  # noqa: F401
 from .reader import (  # noqa: F401
     get_all_reader_books,
     get_reader_book,
-    get_reader_books,
     get_reader_books_by_series,
     get_reader_books_by_series_names,
+    get_reader_feed_page,
+    get_reader_feed_version,
     get_reader_series,
     get_reader_standalone_books,
     get_reader_updates,
@@ -92,21 +97,30 @@ from .scheduler_settings import (  # noqa: F401
 from .api_keys import (  # noqa: F401
     create_api_key,
     get_api_keys,
+    record_api_key_usage,
     revoke_api_key,
 )
 from .processing import (  # noqa: F401
     claim_processing_job,
+    claim_processing_jobs,
     complete_processing_job,
     create_processing_job,
     fail_processing_job,
+    get_next_processing_job_available_at,
     get_processing_job,
     get_processing_jobs,
+    get_processing_queue_samples,
     heartbeat_processing_job,
     is_processing_job_cancel_requested,
     mark_processing_job_canceled,
+    notify_processing_lane,
+    processing_lane_channel,
+    record_processing_queue_samples,
     recover_abandoned_processing_jobs,
+    release_processing_jobs,
     request_processing_job_cancel,
     retry_processing_job,
+    start_prefetched_processing_job,
     update_processing_job_progress,
 )
 from .metadata import (  # noqa: F401
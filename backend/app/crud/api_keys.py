@@ -3,10 +3,11 @@
 from typing import List
 from datetime import datetime, timezone
 
+from sqlalchemy import bindparam, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from .. import models
-from ..auth import hash_token
+from ..auth import forget_verified_key, hash_token
 
 
 async def create_api_key(db: AsyncSession, label: str, token: str, prefix: str) -> models.ApiKey:
@@ -30,4 +31,22 @@ async def revoke_api_key(db: AsyncSession, key_id: int) -> bool:
         api_key.revoked_at = datetime.now(timezone.utc)
         await db.commit()
         await db.refresh(api_key)
+    forget_verified_key(key_id)
     return True
+
+
+async def record_api_key_usage(db: AsyncSession, usage: dict[int, tuple[datetime, int]]) -> None:
+    """Apply buffered ``{key_id: (last_used_at, requests)}`` with one batched UPDATE."""
+    if not usage:
+        return
+    table = models.ApiKey.__table__
+    await db.execute(
+        update(table)
+        .where(table.c.id == bindparam("key_id"))
+        .values(
+            last_used_at=bindparam("used_at"),
+            request_count=table.c.request_count + bindparam("requests"),
+        ),
+        [{"key_id": key_id, "used_at": used_at, "requests": requests} for key_id, (used_at, requests) in usage.items()],
+    )
+    await db.commit()
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Collection
 from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy import and_, delete, func, insert, or_, select, update
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..config import AUDIOBOOK_ASSEMBLY_MARKER, LIBRARY_PATH
@@ -120,6 +122,16 @@ async def request_book_pipeline_pause(db: AsyncSession, book_id: int) -> None:
     await db.commit()
 
 
+async def get_book_pipeline_stop_request(db: AsyncSession, book_id: int) -> tuple[bool, Optional[int]]:
+    """Return whether a pause is pending and the remaining one-batch budget, read from the database."""
+    row = (
+        await db.execute(select(Book.audiobook_pause_requested, Book.audiobook_batch_limit).where(Book.id == book_id))
+    ).one_or_none()
+    if row is None:
+        return False, None
+    return bool(row.audiobook_pause_requested), row.audiobook_batch_limit
+
+
 async def update_book_pipeline_progress(
     db: AsyncSession,
     book_id: int,
@@ -150,12 +162,12 @@ async def set_book_audiobook_summary(db: AsyncSession, book_id: int, summary: Op
     await db.commit()
 
 
-async def consume_book_batch_limit(db: AsyncSession, book_id: int) -> bool:
-    """Consume one durable work unit and pause when a one-batch run is exhausted."""
+async def consume_book_batch_limit(db: AsyncSession, book_id: int, units: int = 1) -> bool:
+    """Consume durable work units and pause when a one-batch run is exhausted."""
     book = await db.get(Book, book_id)
     if book is None or book.audiobook_batch_limit is None:
         return False
-    remaining = book.audiobook_batch_limit - 1
+    remaining = book.audiobook_batch_limit - units
     if remaining > 0:
         await db.execute(update(Book).where(Book.id == book_id).values(audiobook_batch_limit=remaining))
         await db.commit()
@@ -758,6 +770,52 @@ async def create_sentences_bulk(db: AsyncSession, chapter_id: int, sentences_dat
     return len(sentences)
 
 
+# Keeps IN lists and multi-row statements well under driver parameter limits.
+_SENTENCE_BATCH_SIZE = 5_000
+
+
+async def get_sentence_outlines_for_book(db: AsyncSession, book_id: int) -> dict[int, list[Row]]:
+    """Return every chapter's sentence ids, texts and audio paths in reading order, in one query."""
+    result = await db.execute(
+        select(
+            AudiobookSentence.chapter_id,
+            AudiobookSentence.html_element_id,
+            AudiobookSentence.original_text,
+            AudiobookSentence.audio_file_path,
+        )
+        .join(AudiobookChapter, AudiobookSentence.chapter_id == AudiobookChapter.id)
+        .where(AudiobookChapter.book_id == book_id)
+        .order_by(AudiobookSentence.chapter_id, AudiobookSentence.sequence_order)
+    )
+    outlines: dict[int, list[Row]] = {}
+    for row in result:
+        outlines.setdefault(row.chapter_id, []).append(row)
+    return outlines
+
+
+async def replace_sentences_for_chapters(
+    db: AsyncSession,
+    chapter_ids: Collection[int],
+    sentences_by_chapter: dict[int, list[dict]],
+) -> int:
+    """Delete the sentences of ``chapter_ids`` and insert the given ones, as bulk statements.
+
+    Does not commit, so the replacement lands with the caller's transaction.
+    """
+    ids = list(chapter_ids)
+    for start in range(0, len(ids), _SENTENCE_BATCH_SIZE):
+        batch = ids[slice(start, start + _SENTENCE_BATCH_SIZE)]
+        await db.execute(delete(AudiobookSentence).where(AudiobookSentence.chapter_id.in_(batch)))
+    rows = [
+        {"chapter_id": chapter_id, **sentence}
+        for chapter_id, sentences in sentences_by_chapter.items()
+        for sentence in sentences
+    ]
+    for start in range(0, len(rows), _SENTENCE_BATCH_SIZE):
+        await db.execute(insert(AudiobookSentence), rows[slice(start, start + _SENTENCE_BATCH_SIZE)])
+    return len(rows)
+
+
 async def get_sentences_for_chapter(db: AsyncSession, chapter_id: int) -> list[AudiobookSentence]:
     result = await db.execute(
         select(AudiobookSentence).where(AudiobookSentence.chapter_id == chapter_id).order_by(AudiobookSentence.sequence_order)
@@ -832,17 +890,23 @@ async def get_sentences_pending_diarization(
     return list(result.scalars().all())
 
 
-async def get_sentences_ready_for_audio(db: AsyncSession, book_id: int, limit: int = 20) -> list[AudiobookSentence]:
-    result = await db.execute(
+async def get_sentences_ready_for_audio(
+    db: AsyncSession,
+    book_id: int,
+    limit: int = 20,
+    exclude_ids: Collection[int] = (),
+) -> list[AudiobookSentence]:
+    query = (
         select(AudiobookSentence)
         .join(AudiobookChapter, AudiobookSentence.chapter_id == AudiobookChapter.id)
         .where(
             AudiobookChapter.book_id == book_id,
             AudiobookSentence.status == SentenceStatus.READY_FOR_AUDIO.value,
         )
-        .order_by(AudiobookChapter.chapter_number, AudiobookSentence.sequence_order)
-        .limit(limit)
     )
+    if exclude_ids:
+        query = query.where(AudiobookSentence.id.not_in(list(exclude_ids)))
+    result = await db.execute(query.order_by(AudiobookChapter.chapter_number, AudiobookSentence.sequence_order).limit(limit))
     return list(result.scalars().all())
 
 
@@ -925,6 +989,70 @@ async def update_sentence_audio(db: AsyncSession, sentence_id: int, audio_file_p
     await db.commit()
 
 
+def _assign_sentence_audio(clips: list[tuple[AudiobookSentence, str, int]]) -> None:
+    for sentence, audio_file_path, audio_duration_ms in clips:
+        sentence.audio_file_path = audio_file_path
+        sentence.audio_duration_ms = audio_duration_ms
+        sentence.status = SentenceStatus.AUDIO_GENERATED.value
+
+
+async def update_sentence_audio_batch(db: AsyncSession, clips: list[tuple[AudiobookSentence, str, int]]) -> None:
+    """Store several generated clips with one flush and commit."""
+    _assign_sentence_audio(clips)
+    await db.commit()
+
+
+async def record_sentence_audio_batch(
+    db: AsyncSession,
+    book_id: int,
+    clips: list[tuple[AudiobookSentence, str, int]],
+    failed: list[AudiobookSentence],
+    *,
+    current: int,
+    total: int,
+    detail: Optional[str],
+) -> list[int]:
+    """Persist one TTS batch, its progress and finished chapters in one transaction.
+
+    Returns the chapters whose sentences now all have audio; they are flagged
+    for reassembly the same way ``flag_chapter_for_reassembly`` would.
+    """
+    _assign_sentence_audio(clips)
+    for sentence in failed:
+        transition_state(sentence, "status", SENTENCE, SentenceStatus.ERROR, context=f"audiobook sentence {sentence.id}")
+    await db.execute(
+        update(Book)
+        .where(Book.id == book_id)
+        .values(
+            audiobook_progress_current=max(0, current),
+            audiobook_progress_total=max(0, total),
+            audiobook_progress_detail=detail,
+            audiobook_pipeline_updated_at=datetime.now(timezone.utc),
+        )
+    )
+    chapter_ids = {sentence.chapter_id for sentence, _path, _duration in clips}
+    completed: list[int] = []
+    if chapter_ids:
+        await db.flush()
+        result = await db.execute(
+            select(AudiobookSentence.chapter_id)
+            .where(AudiobookSentence.chapter_id.in_(chapter_ids))
+            .group_by(AudiobookSentence.chapter_id)
+            .having(func.count().filter(AudiobookSentence.status != SentenceStatus.AUDIO_GENERATED.value) == 0)
+        )
+        completed = sorted(result.scalars().all())
+    if completed:
+        await db.execute(
+            update(AudiobookChapter)
+            .where(AudiobookChapter.id.in_(completed))
+            .values(needs_reassembly=True, preview_status=None, preview_error=None)
+        )
+    await db.commit()
+    if completed:
+        await invalidate_packaged_audiobook(db, book_id)
+    return completed
+
+
 async def mark_sentence_error(db: AsyncSession, sentence_id: int) -> None:
     await set_sentence_status(db, sentence_id, SentenceStatus.ERROR.value)
 
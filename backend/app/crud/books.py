@@ -1,9 +1,9 @@
 """Book CRUD operations: queries, creation, update, deletion."""
 
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import String, and_, asc, case, cast, delete, desc, exists, func, literal, or_, true, union
+from sqlalchemy import String, and_, asc, case, cast, delete, desc, exists, func, literal, or_, true, tuple_, union
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from .. import models, schemas
@@ -424,6 +424,74 @@ async def get_books_by_ids(db: AsyncSession, book_ids: List[int]) -> List[models
     return [books[book_id] for book_id in book_ids if book_id in books]
 
 
+async def get_live_book_ids(db: AsyncSession) -> List[int]:
+    """Return the id of every live book without loading the rows."""
+    result = await db.execute(select(models.Book.id).where(models.Book.deleted_at.is_(None)).order_by(asc(models.Book.id)))
+    return list(result.scalars().all())
+
+
+async def get_book_ids_in_author_order(db: AsyncSession, book_ids: List[int], *, chunk_size: int = 500) -> List[int]:
+    """Order live ``book_ids`` by author, series, series position and title.
+
+    Only the sort columns are loaded, a chunk of ids at a time, so ordering a
+    library-wide scope never materializes every book.
+    """
+    rows = []
+    for start in range(0, len(book_ids), chunk_size):
+        result = await db.execute(
+            select(
+                models.Book.id,
+                models.Book.author,
+                models.Book.series,
+                models.Book.series_index,
+                models.Book.title,
+            ).where(
+                models.Book.id.in_(book_ids[slice(start, start + chunk_size)]),
+                models.Book.deleted_at.is_(None),
+            )
+        )
+        rows.extend(result.all())
+    rows.sort(
+        key=lambda row: (
+            (row.author or "").casefold(),
+            (row.series or "").casefold(),
+            float(row.series_index) if row.series_index is not None else float("inf"),
+            (row.title or "").casefold(),
+        )
+    )
+    return [row.id for row in rows]
+
+
+async def get_books_by_author_keys(db: AsyncSession, author_keys: Iterable[str]) -> List[models.Book]:
+    """Retrieve every live book whose normalized author is one of ``author_keys``."""
+    keys = sorted({key for key in author_keys if key is not None})
+    if not keys:
+        return []
+    result = await db.execute(
+        select(models.Book)
+        .where(models.Book.author_key.in_(keys), models.Book.deleted_at.is_(None))
+        .order_by(asc(models.Book.id))
+    )
+    return list(result.scalars().all())
+
+
+async def get_books_with_remote_identifiers(
+    db: AsyncSession,
+    identifiers: Iterable[tuple[str, str]],
+) -> List[models.Book]:
+    """Retrieve live books already assigned any of the given stable remote identifiers."""
+    pairs = sorted(set(identifiers))
+    if not pairs:
+        return []
+    holders = select(models.BookRemoteIdentifier.book_id).where(
+        tuple_(models.BookRemoteIdentifier.kind, models.BookRemoteIdentifier.value).in_(pairs)
+    )
+    result = await db.execute(
+        select(models.Book).where(models.Book.id.in_(holders), models.Book.deleted_at.is_(None)).order_by(asc(models.Book.id))
+    )
+    return list(result.scalars().all())
+
+
 async def update_book(db: AsyncSession, book: models.Book, update_data: schemas.BookUpdate) -> models.Book:
     """Update a book record in the database."""
     update_data_dict = update_data.model_dump(exclude_unset=True)
@@ -598,6 +666,7 @@ async def delete_all_books(db: AsyncSession) -> int:
     await db.execute(delete(models.MetadataProposal).where(models.MetadataProposal.book_id.in_(book_ids)))
     await db.execute(delete(models.BookMetadataMatch).where(models.BookMetadataMatch.book_id.in_(book_ids)))
     await db.execute(delete(models.BookLog).where(models.BookLog.book_id.in_(book_ids)))
+    await db.execute(delete(models.BookRemoteIdentifier))
     await db.execute(delete(models.Book))
     await db.commit()
     return book_count
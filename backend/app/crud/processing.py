@@ -6,15 +6,29 @@ from datetime import datetime, timedelta, timezone
 from typing import Iterable
 from uuid import uuid4
 
-from sqlalchemy import and_, desc, or_, select, update
+from sqlalchemy import and_, case, delete, desc, func, not_, or_, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..lifecycle import PROCESSING_JOB, ProcessingJobStatus, transition_state
-from ..models import Book, ProcessingJob
+from ..models import Book, ProcessingJob, ProcessingQueueSample
 from ..observability_context import request_id_var
 
 ACTIVE_PROCESSING_STATUSES = tuple(PROCESSING_JOB.active_states)
+PROCESSING_NOTIFY_CHANNEL_PREFIX = "processing_jobs_"
+PREFETCHED_DETAIL = "Prefetched"
+
+
+def processing_lane_channel(resource_lane: str) -> str:
+    """Return the PostgreSQL LISTEN/NOTIFY channel for one resource lane."""
+    return f"{PROCESSING_NOTIFY_CHANNEL_PREFIX}{resource_lane}"
+
+
+async def notify_processing_lane(db: AsyncSession, resource_lane: str, job_id: int | None = None) -> None:
+    """Queue a lane wakeup that PostgreSQL delivers only if the transaction commits."""
+    if db.get_bind().dialect.name != "postgresql":
+        return
+    await db.execute(select(func.pg_notify(processing_lane_channel(resource_lane), str(job_id or ""))))
 
 
 async def create_processing_job(
@@ -63,6 +77,8 @@ async def create_processing_job(
     )
     db.add(job)
     try:
+        await db.flush()
+        await notify_processing_lane(db, resource_lane, job.id)
         await db.commit()
     except IntegrityError:
         await db.rollback()
@@ -117,14 +133,20 @@ async def get_processing_jobs(
     return list(result.all())
 
 
-async def claim_processing_job(
+async def claim_processing_jobs(
     db: AsyncSession,
     *,
     resource_lane: str,
     lease_owner: str,
     lease_seconds: int,
-) -> ProcessingJob | None:
-    """Atomically claim the oldest runnable job in a resource lane."""
+    limit: int = 1,
+) -> list[ProcessingJob]:
+    """Atomically claim up to ``limit`` of the oldest runnable jobs in a resource lane.
+
+    All claimed jobs share one lease; a worker that cannot start them all before it
+    runs out hands the rest back with ``release_processing_jobs``. Only the first job
+    starts now; the others are marked prefetched until ``start_prefetched_processing_job``.
+    """
     now = datetime.now(timezone.utc)
     runnable = or_(
         and_(ProcessingJob.status == ProcessingJobStatus.QUEUED.value, ProcessingJob.available_at <= now),
@@ -139,26 +161,139 @@ async def claim_processing_job(
             runnable,
         )
         .order_by(ProcessingJob.available_at, ProcessingJob.created_at, ProcessingJob.id)
-        .limit(1)
+        .limit(max(1, limit))
         .with_for_update(skip_locked=True)
     )
-    job = (await db.execute(query)).scalar_one_or_none()
-    if job is None:
+    jobs = list((await db.execute(query)).scalars().all())
+    if not jobs:
         await db.rollback()
-        return None
+        return []
+
+    lease_expires_at = now + timedelta(seconds=lease_seconds)
+    for index, job in enumerate(jobs):
+        transition_state(job, "status", PROCESSING_JOB, ProcessingJobStatus.RUNNING, context=f"processing job {job.id}")
+        job.attempt_count = (job.attempt_count or 0) + 1
+        job.completed_at = None
+        job.error = None
+        job.lease_owner = lease_owner
+        job.lease_expires_at = lease_expires_at
+        if index == 0:
+            _mark_started(job, now)
+        else:
+            job.started_at = None
+            job.heartbeat_at = None
+            job.progress_detail = PREFETCHED_DETAIL
+    await db.commit()
+    return jobs
+
 
-    transition_state(job, "status", PROCESSING_JOB, ProcessingJobStatus.RUNNING, context=f"processing job {job.id}")
-    job.attempt_count = (job.attempt_count or 0) + 1
+def _mark_started(job: ProcessingJob, now: datetime) -> None:
     job.started_at = now
-    job.completed_at = None
-    job.error = None
-    job.lease_owner = lease_owner
     job.heartbeat_at = now
-    job.lease_expires_at = now + timedelta(seconds=lease_seconds)
     job.progress_detail = "Running" if job.attempt_count == 1 else f"Retry attempt {job.attempt_count}"
+
+
+async def start_prefetched_processing_job(db: AsyncSession, job_id: int, *, lease_owner: str) -> bool:
+    """Start a job that waited behind others in its claimed batch; return whether it should run.
+
+    A job whose cancellation was requested while it waited is canceled instead.
+    """
+    job = await db.get(ProcessingJob, job_id)
+    if job is None or job.status != ProcessingJobStatus.RUNNING.value or job.lease_owner != lease_owner:
+        return False
+    now = datetime.now(timezone.utc)
+    if job.cancel_requested:
+        transition_state(job, "status", PROCESSING_JOB, ProcessingJobStatus.CANCELED, context=f"processing job {job.id}")
+        job.progress_detail = "Canceled"
+        job.completed_at = now
+        job.lease_owner = None
+        job.lease_expires_at = None
+        job.heartbeat_at = None
+        await db.commit()
+        return False
+    _mark_started(job, now)
     await db.commit()
-    await db.refresh(job)
-    return job
+    return True
+
+
+async def claim_processing_job(
+    db: AsyncSession,
+    *,
+    resource_lane: str,
+    lease_owner: str,
+    lease_seconds: int,
+) -> ProcessingJob | None:
+    """Atomically claim the oldest runnable job in a resource lane."""
+    jobs = await claim_processing_jobs(
+        db,
+        resource_lane=resource_lane,
+        lease_owner=lease_owner,
+        lease_seconds=lease_seconds,
+    )
+    if not jobs:
+        return None
+    await db.refresh(jobs[0])
+    return jobs[0]
+
+
+async def release_processing_jobs(
+    db: AsyncSession,
+    job_ids: Iterable[int],
+    *,
+    resource_lane: str,
+    lease_owner: str,
+    detail: str = "Queued",
+) -> int:
+    """Return claimed but unstarted jobs to the queue without spending an attempt.
+
+    Jobs whose cancellation was requested while they waited are canceled
+    instead of queued.
+    """
+    job_ids = list(job_ids)
+    if not job_ids:
+        return 0
+    canceled = ProcessingJob.cancel_requested.is_(True)
+    result = await db.execute(
+        update(ProcessingJob)
+        .where(
+            ProcessingJob.id.in_(job_ids),
+            ProcessingJob.status == ProcessingJobStatus.RUNNING.value,
+            ProcessingJob.lease_owner == lease_owner,
+        )
+        .values(
+            status=case(
+                (canceled, ProcessingJobStatus.CANCELED.value),
+                else_=ProcessingJobStatus.QUEUED.value,
+            ),
+            attempt_count=case((ProcessingJob.attempt_count > 0, ProcessingJob.attempt_count - 1), else_=0),
+            started_at=None,
+            completed_at=case((canceled, datetime.now(timezone.utc)), else_=None),
+            lease_owner=None,
+            lease_expires_at=None,
+            heartbeat_at=None,
+            progress_detail=case((canceled, "Canceled"), else_=detail),
+        )
+    )
+    if result.rowcount:
+        await notify_processing_lane(db, resource_lane)
+    await db.commit()
+    return result.rowcount or 0
+
+
+async def get_next_processing_job_available_at(db: AsyncSession, *, resource_lane: str) -> datetime | None:
+    """Return when the earliest delayed job in a lane becomes claimable."""
+    now = datetime.now(timezone.utc)
+    available_at = await db.scalar(
+        select(func.min(ProcessingJob.available_at)).where(
+            ProcessingJob.resource_lane == resource_lane,
+            ProcessingJob.status == ProcessingJobStatus.QUEUED.value,
+            ProcessingJob.cancel_requested.is_(False),
+            ProcessingJob.available_at > now,
+        )
+    )
+    if available_at is not None and available_at.tzinfo is None:
+        available_at = available_at.replace(tzinfo=timezone.utc)
+    return available_at
 
 
 async def heartbeat_processing_job(
@@ -194,6 +329,7 @@ async def defer_processing_job_for_backup(db: AsyncSession, job_id: int, *, leas
     job.lease_expires_at = None
     job.heartbeat_at = None
     job.progress_detail = "Waiting for library backup to finish"
+    await notify_processing_lane(db, job.resource_lane, job.id)
     await db.commit()
     return True
 
@@ -279,6 +415,7 @@ async def complete_processing_job(
         job.progress_detail = detail
     if job.progress_total:
         job.progress_current = job.progress_total
+    await notify_processing_lane(db, job.resource_lane, job.id)
     await db.commit()
     return True
 
@@ -309,6 +446,7 @@ async def fail_processing_job(
         job.available_at = now + timedelta(seconds=delay)
         job.progress_detail = f"Retrying in {delay} seconds"
         job.completed_at = None
+        await notify_processing_lane(db, job.resource_lane, job.id)
     else:
         transition_state(job, "status", PROCESSING_JOB, ProcessingJobStatus.ERROR, context=f"processing job {job.id}")
         job.progress_detail = "Failed"
@@ -376,6 +514,7 @@ async def retry_processing_job(db: AsyncSession, job_id: int) -> ProcessingJob |
     job.lease_expires_at = None
     job.heartbeat_at = None
     try:
+        await notify_processing_lane(db, job.resource_lane, job.id)
         await db.commit()
     except IntegrityError:
         await db.rollback()
@@ -387,3 +526,77 @@ async def retry_processing_job(db: AsyncSession, job_id: int) -> ProcessingJob |
 async def is_processing_job_cancel_requested(db: AsyncSession, job_id: int) -> bool:
     job = await db.get(ProcessingJob, job_id)
     return job is None or bool(job.cancel_requested)
+
+
+async def record_processing_queue_samples(
+    db: AsyncSession,
+    *,
+    resource_lanes: Iterable[str],
+    min_interval_seconds: float,
+    retention_days: int,
+) -> list[ProcessingQueueSample]:
+    """Record queue depth, running count and oldest claimable age for every lane.
+
+    Skipped when another process sampled within ``min_interval_seconds``;
+    samples older than ``retention_days`` are deleted in the same transaction.
+    """
+    now = datetime.now(timezone.utc)
+    latest = await db.scalar(select(func.max(ProcessingQueueSample.sampled_at)))
+    if latest is not None:
+        if latest.tzinfo is None:
+            latest = latest.replace(tzinfo=timezone.utc)
+        if latest > now - timedelta(seconds=min_interval_seconds):
+            return []
+
+    # Prefetched jobs hold a lease but have not started, so they still count as waiting.
+    prefetched = and_(
+        ProcessingJob.status == ProcessingJobStatus.RUNNING.value,
+        func.coalesce(ProcessingJob.progress_detail, "") == PREFETCHED_DETAIL,
+    )
+    running = and_(ProcessingJob.status == ProcessingJobStatus.RUNNING.value, not_(prefetched))
+    waiting = or_(ProcessingJob.status == ProcessingJobStatus.QUEUED.value, prefetched)
+    rows = await db.execute(
+        select(
+            ProcessingJob.resource_lane,
+            func.count().filter(waiting).label("queued"),
+            func.count().filter(running).label("running"),
+            func.min(ProcessingJob.available_at).filter(waiting, ProcessingJob.available_at <= now).label("oldest"),
+        )
+        .where(ProcessingJob.status.in_(ACTIVE_PROCESSING_STATUSES))
+        .group_by(ProcessingJob.resource_lane)
+    )
+    by_lane = {row.resource_lane: row for row in rows}
+    samples = []
+    for lane in resource_lanes:
+        row = by_lane.get(lane)
+        oldest = row.oldest if row is not None else None
+        if oldest is not None and oldest.tzinfo is None:
+            oldest = oldest.replace(tzinfo=timezone.utc)
+        samples.append(
+            ProcessingQueueSample(
+                sampled_at=now,
+                resource_lane=lane,
+                queued=row.queued if row is not None else 0,
+                running=row.running if row is not None else 0,
+                oldest_queued_age_ms=max(0.0, (now - oldest).total_seconds() * 1000) if oldest is not None else None,
+            )
+        )
+    db.add_all(samples)
+    await db.execute(
+        delete(ProcessingQueueSample).where(ProcessingQueueSample.sampled_at < now - timedelta(days=retention_days))
+    )
+    await db.commit()
+    return samples
+
+
+async def get_processing_queue_samples(
+    db: AsyncSession,
+    *,
+    since: datetime,
+    resource_lane: str | None = None,
+) -> list[ProcessingQueueSample]:
+    query = select(ProcessingQueueSample).where(ProcessingQueueSample.sampled_at >= since)
+    if resource_lane is not None:
+        query = query.where(ProcessingQueueSample.resource_lane == resource_lane)
+    result = await db.scalars(query.order_by(ProcessingQueueSample.sampled_at, ProcessingQueueSample.resource_lane))
+    return list(result.all())
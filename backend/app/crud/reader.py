@@ -4,10 +4,13 @@ from datetime import datetime
 from typing import List, Optional
 
 from fastapi import HTTPException
-from sqlalchemy import asc, case, desc, func
+from sqlalchemy import asc, case, desc, func, literal
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from .. import models
+from .books import _seek_condition
+
+READER_FEEDS = ("all", "standalone", "updates")
 
 
 def _reader_books_query():
@@ -18,31 +21,57 @@ def _reader_books_query():
     )
 
 
-async def get_reader_books(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[models.Book]:
-    result = await db.execute(
-        _reader_books_query().order_by(desc(models.Book.content_updated_at), asc(models.Book.title)).offset(skip).limit(limit)
+def _reader_search_rank(db: AsyncSession, term: str):
+    """Relevance of a book to a casefolded search term, higher first.
+
+    PostgreSQL ranks by ``pg_trgm`` word similarity against the same
+    ``catalog_search_text`` document its trigram index covers. Other dialects
+    fall back to preferring exact, then prefix, then substring title matches.
+    """
+    if not term:
+        return literal(0.0)
+    if db.get_bind().dialect.name == "postgresql":
+        return func.word_similarity(term, models.Book.catalog_search_text)
+    title = func.lower(func.coalesce(models.Book.title, ""))
+    return case(
+        (title == term, 1.0),
+        (title.like(f"{term}%"), 0.75),
+        (title.like(f"%{term}%"), 0.5),
+        else_=0.25,
     )
-    return result.scalars().all()
 
 
-async def search_reader_books(db: AsyncSession, q: str, skip: int = 0, limit: int = 100) -> List[models.Book]:
-    from sqlalchemy import or_
-
-    pattern = f"%{q}%"
-    result = await db.execute(
-        _reader_books_query()
-        .where(
-            or_(
-                models.Book.title.ilike(pattern),
-                models.Book.author.ilike(pattern),
-                models.Book.series.ilike(pattern),
-            )
-        )
-        .order_by(asc(models.Book.title))
-        .offset(skip)
-        .limit(limit)
-    )
-    return result.scalars().all()
+async def search_reader_books(
+    db: AsyncSession,
+    q: str,
+    *,
+    limit: int = 100,
+    position: list | None = None,
+    snapshot_max_id: int | None = None,
+) -> tuple[list[models.Book], bool, list]:
+    """Return one ranked page of reader-eligible books matching ``q``.
+
+    Matching uses the trigram-indexed ``catalog_search_text`` document (title,
+    author, series and tags), ordered by rank, then title and id so pages can
+    seek past ``position``, the ``[rank, title, id]`` key of the previous page.
+    """
+    term = (q or "").strip().casefold()
+    rank = _reader_search_rank(db, term)
+    title = func.lower(func.coalesce(models.Book.title, ""))
+    expressions = (rank, title, models.Book.id)
+    query = _reader_books_query().add_columns(rank.label("rank"), title.label("title_key"))
+    if term:
+        query = query.where(models.Book.catalog_search_text.ilike(f"%{term}%"))
+    if snapshot_max_id is not None:
+        query = query.where(models.Book.id <= snapshot_max_id)
+    if position is not None:
+        query = query.where(_seek_condition(expressions, position, "desc"))
+    result = await db.execute(query.order_by(desc(rank), asc(title), asc(models.Book.id)).limit(limit + 1))
+    rows = result.all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    last_position = [float(rows[-1].rank), rows[-1].title_key, rows[-1].Book.id] if rows else []
+    return [row.Book for row in rows], has_more, last_position
 
 
 async def get_reader_book(db: AsyncSession, book_id: int) -> models.Book:
@@ -115,6 +144,63 @@ async def get_reader_updates(db: AsyncSession, since: Optional[datetime]) -> Lis
     return result.scalars().all()
 
 
+def _reader_feed_query(feed: str, since: Optional[datetime] = None):
+    query = _reader_books_query()
+    if feed == "standalone":
+        query = query.where(models.Book.series.is_(None))
+    if since is not None:
+        query = query.where(models.Book.content_updated_at > since)
+    return query
+
+
+def _reader_feed_sort_expressions(feed: str):
+    """Keyset columns for a reader feed: newest content first for updates, otherwise by title."""
+    title = func.coalesce(models.Book.title, "")
+    primary = models.Book.content_updated_at if feed == "updates" else title
+    return primary, title, models.Book.id
+
+
+async def get_reader_feed_page(
+    db: AsyncSession,
+    *,
+    feed: str,
+    limit: int,
+    position: list | None,
+    snapshot_max_id: int,
+    since: Optional[datetime] = None,
+    offset: int = 0,
+) -> tuple[list[models.Book], bool]:
+    expressions = _reader_feed_sort_expressions(feed)
+    sort_order = "desc" if feed == "updates" else "asc"
+    primary_order = desc(expressions[0]) if sort_order == "desc" else asc(expressions[0])
+    query = _reader_feed_query(feed, since).where(models.Book.id <= snapshot_max_id)
+    if position is not None:
+        query = query.where(_seek_condition(expressions, position, sort_order))
+    elif offset:
+        query = query.offset(offset)
+    result = await db.execute(query.order_by(primary_order, asc(expressions[1]), asc(expressions[2])).limit(limit + 1))
+    books = list(result.scalars().all())
+    return books[:limit], len(books) > limit
+
+
+async def get_reader_feed_version(db: AsyncSession, *, feed: str, since: Optional[datetime] = None) -> dict:
+    """Summarize a feed cheaply enough to answer conditional requests before loading any books."""
+    row = (
+        await db.execute(
+            _reader_feed_query(feed, since).with_only_columns(
+                func.count(models.Book.id).label("book_count"),
+                func.max(models.Book.content_updated_at).label("content_updated_at"),
+                func.max(models.Book.updated_at).label("updated_at"),
+            )
+        )
+    ).one()
+    return {
+        "book_count": int(row.book_count or 0),
+        "content_updated_at": row.content_updated_at,
+        "updated_at": row.updated_at,
+    }
+
+
 async def get_reader_books_by_series_names(db: AsyncSession, series_names: list[str]) -> dict[str, list[models.Book]]:
     """Fetch reader-eligible books grouped by series name."""
     if not series_names:
@@ -1,5 +1,10 @@
 import logging
 import filecmp
+import hashlib
+import json
+import posixpath
+import zipfile
+from dataclasses import dataclass
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 
@@ -8,8 +13,15 @@ from ebooklib import epub
 from bs4 import BeautifulSoup
 import re
 
-from . import models
-from .services.epub_utils import collect_epub_book_styled_classes, normalize_xhtml_prose_blocks
+from . import config, models
+from .services.epub_utils import (
+    collect_epub_book_styled_classes,
+    count_epub_words,
+    count_xhtml_words,
+    epub_package_dir,
+    normalize_xhtml_prose_blocks,
+)
+from .services.epub_workers import run_epub_transform
 
 logger = logging.getLogger(__name__)
 
@@ -92,7 +104,7 @@ def _merge_cleaning_rules(book, configs) -> tuple[list[str], list[str], list[str
     return removed_chapters, content_selectors, chapter_selectors
 
 
-def _match_cleaning_configs(book, cleaning_configs) -> list:
+def match_cleaning_configs(book, cleaning_configs) -> list:
     if not book.source_url:
         return []
     return [cfg for cfg in cleaning_configs if re.search(cfg.url_pattern, str(book.source_url))]
@@ -140,20 +152,103 @@ def get_chapters(epub_path: str):
 
 
 def get_word_count(epub_path: str) -> int:
-    book = epub.read_epub(epub_path)
-    return _compute_word_count(book)
+    """Count words in every non-navigation document, streamed straight from the zip."""
+    word_count, _chapter_count = count_epub_words(epub_path)
+    return word_count
 
 
-def _compute_word_count(book: epub.EpubBook) -> int:
-    """Count words across all document items in an in-memory EpubBook."""
-    word_count = 0
-    for item in book.get_items_of_type(ebooklib.ITEM_DOCUMENT):
-        if isinstance(item, (epub.EpubNav, epub.EpubNcx)):
-            continue
-        content = item.get_content()
-        soup = BeautifulSoup(content, "html.parser")
-        word_count += len(re.findall(r"\S+", soup.get_text()))
-    return word_count
+CLEANING_CACHE_VERSION = 1
+
+
+def _sha256(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def _cleaning_fingerprint(
+    content_selectors: list[str],
+    chapter_selectors: list[str],
+    normalize_prose_blocks: bool,
+    styled_classes: set[str] | None,
+) -> str:
+    """Identify the per-chapter transform; any rule or stylesheet change invalidates the cache."""
+    rules = {
+        "version": CLEANING_CACHE_VERSION,
+        "content_selectors": content_selectors,
+        "chapter_selectors": chapter_selectors,
+        "normalize_prose_blocks": normalize_prose_blocks,
+        "styled_classes": sorted(styled_classes or ()),
+    }
+    return _sha256(json.dumps(rules, sort_keys=True).encode("utf-8"))
+
+
+def _load_cleaning_cache(cache_path: Path | None, fingerprint: str) -> dict[str, dict]:
+    if cache_path is None or not cache_path.is_file():
+        return {}
+    try:
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if cache.get("fingerprint") != fingerprint:
+        return {}
+    return cache.get("chapters") or {}
+
+
+def _save_cleaning_cache(cache_path: Path | None, fingerprint: str, chapters: dict[str, dict]) -> None:
+    if cache_path is None:
+        return
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = cache_path.with_suffix(".tmp")
+        temporary_path.write_text(json.dumps({"fingerprint": fingerprint, "chapters": chapters}), encoding="utf-8")
+        temporary_path.replace(cache_path)
+    except OSError as e:
+        logger.warning("Could not write cleaning cache %s: %s", cache_path, e)
+
+
+def _open_previous_output(current_path: Path) -> tuple[zipfile.ZipFile, str] | None:
+    """Open the last cleaned EPUB so cached chapters can be copied out of it."""
+    if not current_path.is_file():
+        return None
+    try:
+        archive = zipfile.ZipFile(current_path)
+    except (OSError, zipfile.BadZipFile):
+        return None
+    package_dir = epub_package_dir(archive)
+    if package_dir is None:
+        archive.close()
+        return None
+    return archive, package_dir
+
+
+def _read_previous_chapter(previous: tuple[zipfile.ZipFile, str] | None, name: str) -> bytes | None:
+    if previous is None:
+        return None
+    archive, package_dir = previous
+    try:
+        return archive.read(posixpath.join(package_dir, name))
+    except KeyError:
+        return None
+
+
+def _written_document_hashes(epub_path: Path, names: set[str]) -> dict[str, str]:
+    previous = _open_previous_output(epub_path)
+    if previous is None:
+        return {}
+    try:
+        return {name: _sha256(content) for name in names if (content := _read_previous_chapter(previous, name)) is not None}
+    finally:
+        previous[0].close()
+
+
+def cleaning_cache_path(book_id: int) -> Path:
+    """Where a book's per-chapter cleaning cache lives; derived data, so outside the library and its backups."""
+    return config.CACHE_DIR / "cleaning" / f"{book_id}.json"
+
+
+def _document_word_count(item) -> int:
+    if isinstance(item, (epub.EpubNav, epub.EpubNcx)):
+        return 0
+    return count_xhtml_words(item.get_content())
 
 
 def process_epub(
@@ -163,11 +258,24 @@ def process_epub(
     content_selectors: list[str],
     chapter_selectors: list[str] = [],
     normalize_prose_blocks: bool = False,
+    cache_path: str | None = None,
 ) -> int | None:
-    """Process an epub, returning the new word count if changed, or None if unchanged."""
+    """Process an epub, returning the new word count if changed, or None if unchanged.
+
+    With ``cache_path``, each chapter's source hash, cleaned output hash and word
+    count are remembered under a fingerprint of the rules. Chapters whose source
+    and rules are unchanged are copied from the previous ``current_path`` instead
+    of being parsed again, so a refresh that adds a few chapters only cleans those.
+    """
     book = epub.read_epub(immutable_path)
     new_book = epub.EpubBook()
     styled_classes = collect_epub_book_styled_classes(book) if normalize_prose_blocks else None
+    cache_file = Path(cache_path) if cache_path else None
+    fingerprint = _cleaning_fingerprint(content_selectors, chapter_selectors, normalize_prose_blocks, styled_classes)
+    cached_chapters = _load_cleaning_cache(cache_file, fingerprint)
+    chapter_cache: dict[str, dict] = {}
+    current_path_obj = Path(current_path)
+    previous_output = _open_previous_output(current_path_obj) if cached_chapters else None
 
     # Copy metadata, filtering out Calibre custom columns (e.g. "user_metadata:#sort")
     # that cause ValueError in ebooklib when serialising to XML.
@@ -177,29 +285,60 @@ def process_epub(
         else:
             new_book.metadata[ns] = {name: vals for name, vals in values.items() if not name.startswith("user_metadata:")}
 
-    # Build the set of chapters to remove: explicit list + CSS-selector matches
+    # Explicit removals are by name; selector-based removals are decided per
+    # chapter below, while its content is already parsed.
     chapters_to_remove = set(removed_chapters)
-    if chapter_selectors:
-        for item in book.get_items_of_type(ebooklib.ITEM_DOCUMENT):
-            soup = BeautifulSoup(item.get_content().decode("utf-8", "ignore"), "html.parser")
-            if any(soup.select(sel) for sel in chapter_selectors):
-                chapters_to_remove.add(item.get_name())
+    word_count = 0
+    try:
+        kept_items = []
+        for item in book.items:
+            if item is None:
+                continue
+            name = item.get_name()
+            if name in chapters_to_remove:
+                continue
+            if item.get_type() != ebooklib.ITEM_DOCUMENT:
+                kept_items.append(item)
+                continue
 
-    for item in book.items:
-        if item is None:
-            continue
-        if item.get_name() not in chapters_to_remove:
-            if item.get_type() == ebooklib.ITEM_DOCUMENT:
-                content = item.get_content().decode("utf-8", "ignore")
-                soup = BeautifulSoup(content, "html.parser")
-                for selector in content_selectors:
-                    for elem in soup.select(selector):
-                        elem.decompose()
-                if normalize_prose_blocks:
-                    normalized_content, _ = normalize_xhtml_prose_blocks(str(soup), styled_classes=styled_classes)
-                    soup = BeautifulSoup(normalized_content, "html.parser")
-                item.set_content(str(soup).encode("utf-8"))
-            new_book.add_item(item)
+            source = item.get_content()
+            source_hash = _sha256(source)
+            cached = cached_chapters.get(name)
+            if cached and cached.get("source") == source_hash:
+                if cached.get("removed"):
+                    chapters_to_remove.add(name)
+                    chapter_cache[name] = cached
+                    continue
+                previous = _read_previous_chapter(previous_output, name)
+                if previous is not None and _sha256(previous) == cached.get("output"):
+                    item.set_content(previous)
+                    kept_items.append(item)
+                    chapter_cache[name] = cached
+                    word_count += cached.get("words", 0)
+                    continue
+
+            soup = BeautifulSoup(source.decode("utf-8", "ignore"), "html.parser")
+            if chapter_selectors and any(soup.select(sel) for sel in chapter_selectors):
+                chapters_to_remove.add(name)
+                chapter_cache[name] = {"source": source_hash, "removed": True}
+                continue
+            for selector in content_selectors:
+                for elem in soup.select(selector):
+                    elem.decompose()
+            if normalize_prose_blocks:
+                normalized_content, _ = normalize_xhtml_prose_blocks(str(soup), styled_classes=styled_classes)
+                soup = BeautifulSoup(normalized_content, "html.parser")
+            item.set_content(str(soup).encode("utf-8"))
+            words = _document_word_count(item)
+            word_count += words
+            chapter_cache[name] = {"source": source_hash, "words": words}
+            kept_items.append(item)
+    finally:
+        if previous_output is not None:
+            previous_output[0].close()
+
+    for item in kept_items:
+        new_book.add_item(item)
 
     # Rebuild spine and TOC without assuming every spine entry is a tuple
     new_book.spine = [
@@ -209,17 +348,24 @@ def process_epub(
     ]
     new_book.toc = _filter_toc(book.toc, chapters_to_remove)
 
-    current_path_obj = Path(current_path)
     current_path_obj.parent.mkdir(parents=True, exist_ok=True)
     temporary_path: Path | None = None
     try:
         with NamedTemporaryFile(suffix=".epub", dir=str(current_path_obj.parent), delete=False) as temp_file:
             temporary_path = Path(temp_file.name)
         epub.write_epub(str(temporary_path), new_book, {})
+        if cache_file is not None:
+            # Record what ebooklib actually wrote, which is what the next run reads back.
+            written = _written_document_hashes(
+                temporary_path, {name for name, entry in chapter_cache.items() if not entry.get("removed")}
+            )
+            for name, output_hash in written.items():
+                chapter_cache[name] = {**chapter_cache[name], "output": output_hash}
+            _save_cleaning_cache(cache_file, fingerprint, chapter_cache)
         if _files_match(temporary_path, current_path_obj):
             return None
         temporary_path.replace(current_path_obj)
-        return _compute_word_count(new_book)
+        return word_count
     finally:
         if temporary_path is not None and temporary_path.exists():
             temporary_path.unlink()
@@ -252,26 +398,21 @@ def preview_epub(
     return {"elements_removed": elements_removed, "estimated_word_count": estimated_word_count}
 
 
-async def apply_book_cleaning(book, db, force: bool = False, cleaning_configs: list | None = None) -> bool:
-    """Apply all cleaning rules (site-wide configs + per-book settings) to a book.
-
-    Looks up all matching CleaningConfigs for the book's source URL, merges their
-    selectors with the book's own settings, then rewrites current_path from
-    immutable_path and updates current_word_count in the DB.
+@dataclass(frozen=True)
+class CleaningPlan:
+    """Picklable arguments for one ``process_epub`` rewrite."""
 
-    Books with no applicable rules are skipped unless force=True. A forced
-    rebuild must still restore current_path from immutable_path after the last
-    cleaning rule is removed.
-    """
-    from . import crud
+    immutable_path: str
+    current_path: str
+    removed_chapters: list[str]
+    content_selectors: list[str]
+    chapter_selectors: list[str]
+    normalize_prose_blocks: bool
+    cache_path: str | None = None
 
-    if cleaning_configs is None:
-        configs = []
-        if book.source_url:
-            configs = await crud.get_all_matching_cleaning_configs(db, str(book.source_url))
-    else:
-        configs = _match_cleaning_configs(book, cleaning_configs)
 
+def plan_book_cleaning(book, configs: list, force: bool = False) -> CleaningPlan | None:
+    """Merge a book's cleaning rules into a rewrite plan, or None when nothing needs rewriting."""
     removed_chapters, content_selectors, chapter_selectors = _merge_cleaning_rules(book, configs)
 
     normalize_prose_blocks = book.source_type == models.SourceType.web
@@ -280,7 +421,7 @@ async def apply_book_cleaning(book, db, force: bool = False, cleaning_configs: l
     # Nothing to do — skip the (potentially expensive) epub rewrite unless a
     # forced rebuild needs to restore a stale current copy.
     if not has_rules and not force:
-        return False
+        return None
 
     if not book.immutable_path or not book.current_path:
         logger.warning(
@@ -290,36 +431,82 @@ async def apply_book_cleaning(book, db, force: bool = False, cleaning_configs: l
             book.immutable_path,
             book.current_path,
         )
-        return False
+        return None
 
     library_path = (Path(__file__).parent.resolve() / ".." / ".." / "library").resolve()
     immutable_path = library_path.parent / book.immutable_path
     current_path = library_path.parent / book.current_path
 
     if not has_rules and _files_match(immutable_path, current_path):
-        return False
+        return None
+
+    return CleaningPlan(
+        immutable_path=str(immutable_path),
+        current_path=str(current_path),
+        removed_chapters=removed_chapters,
+        content_selectors=content_selectors,
+        chapter_selectors=chapter_selectors,
+        normalize_prose_blocks=normalize_prose_blocks,
+        cache_path=str(cleaning_cache_path(book.id)),
+    )
+
+
+async def run_cleaning_plan(plan: CleaningPlan) -> int | None:
+    """Rewrite current_path in the EPUB process pool; returns the new word count or None."""
+    return await run_epub_transform(
+        process_epub,
+        plan.immutable_path,
+        plan.current_path,
+        plan.removed_chapters,
+        plan.content_selectors,
+        plan.chapter_selectors,
+        normalize_prose_blocks=plan.normalize_prose_blocks,
+        cache_path=plan.cache_path,
+    )
+
+
+async def record_book_cleaning(book, db, word_count: int | None, force: bool = False) -> bool:
+    """Persist the outcome of a cleaning rewrite; returns whether the book changed."""
+    from . import crud
 
-    try:
-        word_count = process_epub(
-            str(immutable_path),
-            str(current_path),
-            removed_chapters,
-            content_selectors,
-            chapter_selectors,
-            normalize_prose_blocks=normalize_prose_blocks,
-        )
-        if word_count is None:
-            if force:
-                await crud.touch_book_content(db, book)
-                await db.commit()
-                await db.refresh(book)
-                return True
+    if word_count is None:
+        if not force:
             return False
+    else:
         book.current_word_count = word_count
-        await crud.touch_book_content(db, book)
-        await db.commit()
-        await db.refresh(book)
-        return True
+    await crud.touch_book_content(db, book)
+    await db.commit()
+    await db.refresh(book)
+    return True
+
+
+async def apply_book_cleaning(book, db, force: bool = False, cleaning_configs: list | None = None) -> bool:
+    """Apply all cleaning rules (site-wide configs + per-book settings) to a book.
+
+    Looks up all matching CleaningConfigs for the book's source URL, merges their
+    selectors with the book's own settings, then rewrites current_path from
+    immutable_path in the EPUB process pool and updates current_word_count in the DB.
+
+    Books with no applicable rules are skipped unless force=True. A forced
+    rebuild must still restore current_path from immutable_path after the last
+    cleaning rule is removed.
+    """
+    from . import crud
+
+    if cleaning_configs is None:
+        configs = []
+        if book.source_url:
+            configs = await crud.get_all_matching_cleaning_configs(db, str(book.source_url))
+    else:
+        configs = match_cleaning_configs(book, cleaning_configs)
+
+    plan = plan_book_cleaning(book, configs, force=force)
+    if plan is None:
+        return False
+
+    try:
+        word_count = await run_cleaning_plan(plan)
+        return await record_book_cleaning(book, db, word_count, force=force)
     except Exception as e:
         logger.error("Failed to apply cleaning to %s: %s", book.title, e, exc_info=True)
         return False
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import collections
+import hashlib
 import json
 import logging
 import os
 import re
+import struct
 import sys
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
@@ -18,6 +21,12 @@ from .observability_context import job_id_var, request_id_var
 
 _LOG_BUFFER: collections.deque = collections.deque(maxlen=1000)
 _LOG_FILE = LOG_DIR / "story-manager.jsonl"
+# Each log file has a sidecar of fixed-size records: byte offset and length of
+# the line, creation time in ms, level number, job id (-1 for none), an 8-byte
+# hash of the request id (0 for none) and a flag for quiet polling access.
+INDEX_SUFFIX = ".idx"
+_INDEX_RECORD = struct.Struct("<QIqBqQB")
+_INDEX_BLOCK_RECORDS = 4096
 QUIET_SUCCESS_PATHS = frozenset(
     {
         "/api/dashboard/attention",
@@ -79,14 +88,17 @@ def redact_value(value: Any) -> Any:
     return value
 
 
-def is_quiet_successful_access_entry(entry: dict[str, Any]) -> bool:
-    """Identify historical successful polling access records for UI filtering."""
-    if entry.get("logger") != "story_manager.access":
+def _is_quiet_access(logger_name: str | None, message: str) -> bool:
+    if logger_name != "story_manager.access":
         return False
-    message = str(entry.get("message") or "")
     return any(re.match(rf"^GET {re.escape(path)} completed with [23]\d\d\b", message) for path in QUIET_SUCCESS_PATHS)
 
 
+def is_quiet_successful_access_entry(entry: dict[str, Any]) -> bool:
+    """Identify historical successful polling access records for UI filtering."""
+    return _is_quiet_access(entry.get("logger"), str(entry.get("message") or ""))
+
+
 class _CorrelationFilter(logging.Filter):
     def filter(self, record: logging.LogRecord) -> bool:
         if not getattr(record, "request_id", None):
@@ -143,6 +155,78 @@ class _MemoryLogHandler(logging.Handler):
             self.handleError(record)
 
 
+def _index_path(log_file: Path | str) -> Path:
+    return Path(f"{log_file}{INDEX_SUFFIX}")
+
+
+def _request_key(request_id: str | None) -> int:
+    if not request_id:
+        return 0
+    return int.from_bytes(hashlib.blake2b(request_id.encode("utf-8"), digest_size=8).digest(), "little") or 1
+
+
+class _IndexedRotatingFileHandler(RotatingFileHandler):
+    """Rotating JSON-lines handler that also appends a seekable sidecar index."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._index_stream = None
+
+    def _index(self):
+        if self._index_stream is None:
+            self._index_stream = _index_path(self.baseFilename).open("ab")
+        return self._index_stream
+
+    def _close_index(self) -> None:
+        if self._index_stream is not None:
+            self._index_stream.close()
+            self._index_stream = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            offset = self.stream.tell()
+            logging.StreamHandler.emit(self, record)
+            length = self.stream.tell() - offset
+            index = self._index()
+            index.write(
+                _INDEX_RECORD.pack(
+                    offset,
+                    length,
+                    round(record.created * 1000),
+                    min(255, max(0, record.levelno)),
+                    job_id if isinstance(job_id := getattr(record, "job_id", None), int) else -1,
+                    _request_key(getattr(record, "request_id", None)),
+                    _is_quiet_access(record.name, record.getMessage()),
+                )
+            )
+            index.flush()
+        except Exception:
+            self.handleError(record)
+
+    def doRollover(self) -> None:
+        super().doRollover()
+        self._close_index()
+        for number in range(self.backupCount - 1, 0, -1):
+            source = _index_path(f"{self.baseFilename}.{number}")
+            if source.exists():
+                os.replace(source, _index_path(f"{self.baseFilename}.{number + 1}"))
+        current = _index_path(self.baseFilename)
+        if current.exists():
+            os.replace(current, _index_path(f"{self.baseFilename}.1"))
+
+    def close(self) -> None:
+        self.acquire()
+        try:
+            self._close_index()
+        finally:
+            self.release()
+        super().close()
+
+
 def setup_logging() -> tuple[logging.StreamHandler, _MemoryLogHandler, RotatingFileHandler]:
     use_json = os.getenv("LOG_FORMAT", "").lower() == "json"
     correlation_filter = _CorrelationFilter()
@@ -166,7 +250,7 @@ def setup_logging() -> tuple[logging.StreamHandler, _MemoryLogHandler, RotatingF
     root_logger.addHandler(mem_handler)
 
     LOG_DIR.mkdir(parents=True, exist_ok=True)
-    file_handler = RotatingFileHandler(
+    file_handler = _IndexedRotatingFileHandler(
         _LOG_FILE,
         maxBytes=LOG_MAX_BYTES,
         backupCount=LOG_BACKUP_COUNT,
@@ -178,30 +262,170 @@ def setup_logging() -> tuple[logging.StreamHandler, _MemoryLogHandler, RotatingF
     return console_handler, mem_handler, file_handler
 
 
-def read_persisted_logs(*, limit: int = 500, level: str | None = None, log_file: Path | None = None) -> list[dict]:
-    """Read the newest structured entries across the bounded rotated files."""
+class _LogFilter:
+    def __init__(
+        self,
+        level: str | None,
+        request_id: str | None,
+        job_id: int | None,
+        include_polling: bool,
+        since: datetime | None,
+    ) -> None:
+        self.level = level.upper() if level else None
+        levelno = logging.getLevelName(self.level) if self.level else None
+        self.levelno = levelno if isinstance(levelno, int) else None
+        self.request_id = request_id
+        self.request_key = _request_key(request_id)
+        self.job_id = job_id
+        self.include_polling = include_polling
+        if since is not None and since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        self.since = since
+        self.since_ms = round(since.timestamp() * 1000) if since else None
+
+    def matches_record(self, record: tuple) -> bool:
+        """Cheap pre-filter on an index record; entries must still pass ``matches``."""
+        _offset, _length, created_ms, levelno, job_id, request_key, quiet = record
+        return (
+            (self.level is None or self.levelno is None or levelno == self.levelno)
+            and (self.request_id is None or request_key == self.request_key)
+            and (self.job_id is None or job_id == self.job_id)
+            and (self.include_polling or not quiet)
+            and (self.since_ms is None or created_ms >= self.since_ms)
+        )
+
+    def matches(self, entry: dict[str, Any]) -> bool:
+        if self.level and entry.get("level") != self.level:
+            return False
+        if self.request_id is not None and entry.get("request_id") != self.request_id:
+            return False
+        if self.job_id is not None and entry.get("job_id") != self.job_id:
+            return False
+        if not self.include_polling and is_quiet_successful_access_entry(entry):
+            return False
+        if self.since is not None:
+            try:
+                timestamp = datetime.fromisoformat(str(entry.get("timestamp")))
+            except ValueError:
+                return False
+            if timestamp.tzinfo is None:
+                timestamp = timestamp.replace(tzinfo=timezone.utc)
+            if timestamp < self.since:
+                return False
+        return True
+
+
+def _decode_line(line: bytes) -> dict[str, Any] | None:
+    try:
+        entry = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError, TypeError):
+        return None
+    return entry if isinstance(entry, dict) else None
+
+
+def _index_records_backwards(index_file: Path, log_size: int) -> tuple[Iterator[tuple], int] | None:
+    """Return newest-first index records and the byte offset they cover up to.
+
+    ``None`` means the index is missing or does not describe this log file.
+    """
+    try:
+        handle = index_file.open("rb")
+    except OSError:
+        return None
+    count = os.fstat(handle.fileno()).st_size // _INDEX_RECORD.size
+    if not count:
+        handle.close()
+        return None
+    handle.seek((count - 1) * _INDEX_RECORD.size)
+    newest = _INDEX_RECORD.unpack(handle.read(_INDEX_RECORD.size))
+    indexed_end = newest[0] + newest[1]
+    if indexed_end > log_size:
+        handle.close()
+        return None
+
+    def records() -> Iterator[tuple]:
+        with handle:
+            end = count
+            while end > 0:
+                start = max(0, end - _INDEX_BLOCK_RECORDS)
+                handle.seek(start * _INDEX_RECORD.size)
+                block = handle.read((end - start) * _INDEX_RECORD.size)
+                yield from reversed(list(_INDEX_RECORD.iter_unpack(block)))
+                end = start
+
+    return records(), indexed_end
+
+
+def _scan_lines(handle, start: int, end: int, filters: _LogFilter, limit: int) -> list[dict[str, Any]]:
+    """Decode unindexed lines between two offsets, keeping the newest matches."""
+    handle.seek(start)
+    matches: collections.deque = collections.deque(maxlen=limit)
+    remaining = end - start
+    for line in handle:
+        remaining -= len(line)
+        entry = _decode_line(line)
+        if entry is not None and filters.matches(entry):
+            matches.append(entry)
+        if remaining <= 0:
+            break
+    return list(matches)
+
+
+def _read_log_file_backwards(log_file: Path, filters: _LogFilter, limit: int) -> list[dict[str, Any]]:
+    """Return up to ``limit`` newest matching entries in one file, newest first."""
+    try:
+        handle = log_file.open("rb")
+    except OSError:
+        return []
+    with handle:
+        size = os.fstat(handle.fileno()).st_size
+        indexed = _index_records_backwards(_index_path(log_file), size)
+        indexed_end = indexed[1] if indexed else 0
+        # Lines written after the newest index record (or files from before the
+        # index existed) are decoded directly.
+        found = list(reversed(_scan_lines(handle, indexed_end, size, filters, limit)))
+        if indexed is None:
+            return found
+        for record in indexed[0]:
+            if len(found) >= limit:
+                break
+            if filters.since_ms is not None and record[2] < filters.since_ms:
+                break
+            if not filters.matches_record(record):
+                continue
+            handle.seek(record[0])
+            entry = _decode_line(handle.read(record[1]))
+            if entry is not None and filters.matches(entry):
+                found.append(entry)
+        return found
+
+
+def read_persisted_logs(
+    *,
+    limit: int = 500,
+    level: str | None = None,
+    request_id: str | None = None,
+    job_id: int | None = None,
+    include_polling: bool = True,
+    since: datetime | None = None,
+    log_file: Path | None = None,
+) -> list[dict]:
+    """Read the newest matching structured entries across the bounded rotated files.
+
+    Files are searched from the newest backwards through their sidecar indexes,
+    so only matching lines are decoded and the search stops at ``limit``.
+    """
+    limit = max(1, limit)
+    filters = _LogFilter(level, request_id, job_id, include_polling, since)
     target = log_file or _LOG_FILE
-    candidates = [target.with_name(f"{target.name}.{index}") for index in range(LOG_BACKUP_COUNT, 0, -1)]
-    candidates.append(target)
-    entries: collections.deque = collections.deque(maxlen=max(1, limit))
+    candidates = [target, *(target.with_name(f"{target.name}.{index}") for index in range(1, LOG_BACKUP_COUNT + 1))]
+    newest_first: list[dict[str, Any]] = []
     for candidate in candidates:
-        if not candidate.is_file():
-            continue
-        try:
-            with candidate.open("r", encoding="utf-8", errors="replace") as handle:
-                for line in handle:
-                    try:
-                        entry = redact_value(json.loads(line))
-                    except (json.JSONDecodeError, TypeError):
-                        continue
-                    if level and entry.get("level") != level.upper():
-                        continue
-                    entries.append(entry)
-        except OSError:
-            continue
-    if entries:
-        return list(entries)
-    memory = [redact_value(entry) for entry in _LOG_BUFFER]
-    if level:
-        memory = [entry for entry in memory if entry.get("level") == level.upper()]
+        if len(newest_first) >= limit:
+            break
+        if candidate.is_file():
+            newest_first.extend(_read_log_file_backwards(candidate, filters, limit - len(newest_first)))
+    if newest_first:
+        return [redact_value(entry) for entry in reversed(newest_first)]
+    memory = [entry for entry in (redact_value(entry) for entry in _LOG_BUFFER) if filters.matches(entry)]
     return memory[-limit:]
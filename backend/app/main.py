@@ -40,7 +40,15 @@ from .routers import (
     upload,
     web_novels,
 )
-from .services.update_scheduler import get_scheduler, schedule_next_metadata_recheck, schedule_next_web_novel_update
+from .services.update_scheduler import (
+    get_scheduler,
+    schedule_endpoint_metrics_rollup,
+    schedule_next_metadata_recheck,
+    schedule_next_web_novel_update,
+)
+from .services.api_key_usage import get_api_key_usage_recorder
+from .services.epub_workers import shutdown_epub_workers
+from .services.http_clients import close_http_clients
 from .services.processing_queue import get_processing_queue
 
 logger = logging.getLogger(__name__)
@@ -80,7 +88,8 @@ async def lifespan(app: FastAPI):
     logger.info("Starting up Story Manager services.")
     async with SessionLocal() as db:
         await crud.reset_stuck_update_tasks(db)
-    await _processing_queue.start()
+    await _processing_queue.start(listen=not is_test_app)
+    await get_api_key_usage_recorder().start()
     if not is_test_app:
         processing_requeued = await _processing_queue.requeue_pending()
         if processing_requeued:
@@ -90,8 +99,12 @@ async def lifespan(app: FastAPI):
     await schedule_next_web_novel_update()
     if not is_test_app:
         await schedule_next_metadata_recheck()
+        schedule_endpoint_metrics_rollup()
     yield
     await _processing_queue.stop()
+    await get_api_key_usage_recorder().stop()
+    await close_http_clients()
+    shutdown_epub_workers()
     if _scheduler.running:
         _scheduler.shutdown()
 
@@ -14,7 +14,10 @@ from sqlalchemy import (
     Numeric,
     Text,
     UniqueConstraint,
+    delete,
     event,
+    insert,
+    inspect,
     text,
 )
 from sqlalchemy.sql import func
@@ -40,6 +43,7 @@ from .lifecycle import (
     StateMachine,
     UpdateTaskStatus,
 )
+from .normalization import normalize_text, stable_remote_identifiers
 import enum
 from uuid import uuid4
 
@@ -70,6 +74,9 @@ class Book(Base):
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True)
     author = Column(String, index=True)
+    # Provider-neutral normalized author, kept in step with ``author`` so a
+    # metadata sync can load one author's books through an index.
+    author_key = Column(String, nullable=True, index=True)
     series = Column(String, nullable=True, index=True)
     series_index = Column(Numeric(6, 2), nullable=True)
     genre_tags = Column(JSON, nullable=True)
@@ -150,6 +157,42 @@ def _catalog_search_text(book: Book) -> str:
 @event.listens_for(Book, "before_update")
 def _sync_catalog_search_text(_mapper, _connection, book: Book) -> None:
     book.catalog_search_text = _catalog_search_text(book)
+    book.author_key = normalize_text(book.author or "")
+
+
+class BookRemoteIdentifier(Base):
+    """One stable remote record identifier assigned to a book.
+
+    Mirrors ``Book.metadata_remote_ids`` so that checking whether a remote
+    record already belongs to another book is an index lookup.
+    """
+
+    __tablename__ = "book_remote_identifiers"
+
+    book_id = Column(Integer, ForeignKey("books.id", ondelete="CASCADE"), primary_key=True)
+    kind = Column(String, primary_key=True)
+    value = Column(String, primary_key=True)
+
+    __table_args__ = (Index("ix_book_remote_identifiers_kind_value", "kind", "value"),)
+
+
+@event.listens_for(Book, "after_insert")
+@event.listens_for(Book, "after_update")
+def _sync_remote_identifiers(_mapper, connection, book: Book) -> None:
+    if not inspect(book).attrs.metadata_remote_ids.history.has_changes():
+        return
+    connection.execute(delete(BookRemoteIdentifier).where(BookRemoteIdentifier.book_id == book.id))
+    identifiers = stable_remote_identifiers(book.metadata_remote_ids)
+    if identifiers:
+        connection.execute(
+            insert(BookRemoteIdentifier),
+            [{"book_id": book.id, "kind": kind, "value": value} for kind, value in sorted(identifiers)],
+        )
+
+
+@event.listens_for(Book, "after_delete")
+def _delete_remote_identifiers(_mapper, connection, book: Book) -> None:
+    connection.execute(delete(BookRemoteIdentifier).where(BookRemoteIdentifier.book_id == book.id))
 
 
 class BookRevision(Base):
@@ -338,6 +381,7 @@ class ApiKey(Base):
     token_hash = Column(String, unique=True, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     last_used_at = Column(DateTime(timezone=True), nullable=True)
+    request_count = Column(Integer, nullable=False, default=0, server_default="0")
     revoked_at = Column(DateTime(timezone=True), nullable=True)
 
 
@@ -366,6 +410,21 @@ class AudiobookSettings(Base):
     diarization_prompt_template = Column(Text, nullable=True)
 
 
+class ProcessingQueueSample(Base):
+    """Periodic per-lane snapshot of processing backlog and saturation."""
+
+    __tablename__ = "processing_queue_samples"
+    __table_args__ = (Index("ix_processing_queue_samples_lane_sampled", "resource_lane", "sampled_at"),)
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    sampled_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    resource_lane = Column(String, nullable=False)
+    queued = Column(Integer, nullable=False, default=0)
+    running = Column(Integer, nullable=False, default=0)
+    # Age of the oldest claimable queued job; None when nothing is waiting.
+    oldest_queued_age_ms = Column(Float, nullable=True)
+
+
 class AiEndpointRequestMetric(Base):
     """One completed attempt against a configured AI endpoint."""
 
@@ -377,6 +436,8 @@ class AiEndpointRequestMetric(Base):
             "capability",
             "endpoint_id",
             "created_at",
+            # Covering the summarized values lets endpoint stats use index-only scans.
+            postgresql_include=["success", "duration_ms"],
         ),
     )
 
@@ -397,6 +458,43 @@ class AiEndpointRequestMetric(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
 
+class AiEndpointMetricRollup(Base):
+    """Hourly totals of endpoint attempts, kept after the raw metrics are pruned."""
+
+    __tablename__ = "ai_endpoint_metric_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "settings_id",
+            "capability",
+            "endpoint_id",
+            "bucket_start",
+            name="uq_ai_endpoint_metric_rollups_bucket",
+        ),
+    )
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    settings_id = Column(
+        Integer,
+        ForeignKey("audiobook_settings.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    capability = Column(String, nullable=False)
+    endpoint_id = Column(String, nullable=False)
+    bucket_start = Column(DateTime(timezone=True), nullable=False)
+    requests = Column(Integer, nullable=False, default=0)
+    failures = Column(Integer, nullable=False, default=0)
+    # Duration totals and extremes cover answered attempts only.
+    answered_duration_sum_ms = Column(Float, nullable=False, default=0.0)
+    fastest_ms = Column(Float, nullable=True)
+    slowest_ms = Column(Float, nullable=True)
+    # Answered-latency histogram matching the settings page speed buckets.
+    under_5s = Column(Integer, nullable=False, default=0)
+    from_5s_to_15s = Column(Integer, nullable=False, default=0)
+    from_15s_to_60s = Column(Integer, nullable=False, default=0)
+    over_60s = Column(Integer, nullable=False, default=0)
+    last_answered_at = Column(DateTime(timezone=True), nullable=True)
+
+
 class AudiobookChapter(Base):
     __tablename__ = "audiobook_chapters"
     __table_args__ = (
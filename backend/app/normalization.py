@@ -0,0 +1,58 @@
+"""Text and identifier normalization with no application dependencies.
+
+The models derive their lookup keys from these helpers and metadata scoring
+compares provider records with them, so both agree on what counts as the
+same author or the same remote record.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from typing import Any
+
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_ISBN_RE = re.compile(r"[^0-9Xx]")
+
+
+def normalize_text(value: str) -> str:
+    """Return a search-safe representation that is stable across providers."""
+
+    decomposed = unicodedata.normalize("NFKD", value or "")
+    ascii_text = "".join(character for character in decomposed if not unicodedata.combining(character))
+    ascii_text = ascii_text.casefold().replace("&", " and ")
+    return _NON_ALNUM_RE.sub(" ", ascii_text).strip()
+
+
+def clean_isbn(value: Any) -> str:
+    if value is None:
+        return ""
+    cleaned = _ISBN_RE.sub("", str(value)).upper()
+    if len(cleaned) == 10 and re.fullmatch(r"\d{9}[\dX]", cleaned):
+        return cleaned
+    if len(cleaned) == 13 and cleaned.isdigit():
+        return cleaned
+    return ""
+
+
+def canonical_isbn(value: Any) -> str:
+    isbn = clean_isbn(value)
+    if len(isbn) != 10:
+        return isbn
+    body = "978" + isbn[:9]
+    checksum = (10 - (sum((1 if index % 2 == 0 else 3) * int(digit) for index, digit in enumerate(body)) % 10)) % 10
+    return body + str(checksum)
+
+
+def stable_remote_identifiers(remote_ids: dict[str, Any] | None) -> set[tuple[str, str]]:
+    """Identifiers that name one remote record whichever provider reported them."""
+    remote_ids = remote_ids or {}
+    identifiers = {
+        (key, str(remote_ids[key]).strip())
+        for key in ("google_books_volume_id", "open_library_work_key", "asin")
+        if remote_ids.get(key) and str(remote_ids[key]).strip()
+    }
+    identifiers.update(
+        ("isbn", normalized) for key in ("isbn_10", "isbn_13") if (normalized := canonical_isbn(remote_ids.get(key)))
+    )
+    return identifiers
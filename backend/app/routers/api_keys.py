@@ -1,17 +1,29 @@
 """Admin endpoints for managing reader API keys."""
 
+import logging
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .. import crud, schemas
 from ..auth import generate_reader_token
 from ..database import get_db
+from ..services.api_key_usage import get_api_key_usage_recorder
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
 @router.get("/api/reader-keys", response_model=list[schemas.ApiKey])
 async def list_reader_keys(db: AsyncSession = Depends(get_db)) -> list[schemas.ApiKey]:
+    # Show up-to-date usage instead of waiting for the next periodic flush. A failed
+    # write keeps the counts buffered for the next flush and lists what is stored.
+    try:
+        await get_api_key_usage_recorder().flush(db)
+    except Exception:
+        logger.exception("Failed to flush reader API key usage before listing keys")
+        await db.rollback()
     return await crud.get_api_keys(db)
 
 
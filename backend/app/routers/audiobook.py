@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 import shutil
@@ -44,7 +45,7 @@ from ..services.audiobook_import import (
 )
 from ..services.audiobook_reading import ReadingBlock, chapter_reading_blocks
 from ..services.processing_queue import queue_processing_job
-from ..services import audiobook_llm
+from ..services import audiobook_llm, snippet_packs
 from ..services.transcription_providers import (
     transcription_provider_name,
     transcription_service_health,
@@ -1798,7 +1799,7 @@ async def generate_sentence_audio(
 
 
 @router.get("/api/audiobook/sentences/{sentence_id}/audio")
-async def get_sentence_audio(sentence_id: int, db: AsyncSession = Depends(get_db)) -> FileResponse:
+async def get_sentence_audio(sentence_id: int, db: AsyncSession = Depends(get_db)) -> Response:
     sentence = await db.get(AudiobookSentence, sentence_id)
     if sentence is None or not sentence.audio_file_path:
         raise HTTPException(status_code=404, detail="Audio not available")
@@ -1806,6 +1807,12 @@ async def get_sentence_audio(sentence_id: int, db: AsyncSession = Depends(get_db
     if chapter:
         await _get_audiobook_book_or_404(chapter.book_id, db)
     full_path = _resolve_path(sentence.audio_file_path)
+    if full_path and snippet_packs.is_snippet_index(full_path):
+        try:
+            audio_bytes = await asyncio.to_thread(snippet_packs.read_snippet, full_path, sentence.id)
+        except (FileNotFoundError, KeyError, ValueError):
+            raise HTTPException(status_code=404, detail="Audio file not found on disk")
+        return Response(content=audio_bytes, media_type="audio/mpeg")
     if not full_path or not full_path.exists():
         raise HTTPException(status_code=404, detail="Audio file not found on disk")
     return FileResponse(str(full_path), media_type="audio/mpeg")
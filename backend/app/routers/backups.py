@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException, Response, status
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .. import schemas
 from ..config import BACKUP_PATH, BACKUP_RETENTION_COUNT
 from ..database import get_db
-from ..services.backups import BackupError, list_backups, resolve_backup
+from ..services.backups import (
+    BackupError,
+    iter_backup_archive,
+    list_backups,
+    portable_archive_name,
+    resolve_backup,
+)
 from ..services.processing_queue import queue_processing_job
 
 router = APIRouter()
@@ -56,11 +62,21 @@ async def verify_backup(filename: str, db: AsyncSession = Depends(get_db)) -> sc
 
 
 @router.get("/api/backups/{filename}/download")
-async def download_backup(filename: str) -> FileResponse:
+async def download_backup(filename: str) -> Response:
     try:
         archive = resolve_backup(BACKUP_PATH, filename)
     except BackupError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
+    if archive.name != portable_archive_name(archive):
+        # Snapshots are assembled from the blob store into the portable ZIP as they download.
+        return StreamingResponse(
+            iter_backup_archive(archive),
+            media_type="application/zip",
+            headers={
+                "Content-Disposition": f'attachment; filename="{portable_archive_name(archive)}"',
+                "X-Content-Type-Options": "nosniff",
+            },
+        )
     return FileResponse(
         archive,
         filename=archive.name,
@@ -15,6 +15,8 @@ from ..config import LIBRARY_PATH, RECYCLE_BIN_RETENTION_DAYS
 from ..database import get_db
 from ..services.catalog import build_book_catalog_page, normalize_genre_tags
 from ..services.chapter_history import build_chapter_update_history
+from ..services.epub_utils import analyze_epub
+from ..services.epub_workers import run_epub_transform
 from ..services.library_paths import remove_empty_parent_dirs
 from ..services.metadata_jobs import queue_metadata_sync_job
 from ..services.processing_queue import queue_processing_job
@@ -53,6 +55,8 @@ def _remove_book_files(book: models.Book) -> list[str]:
         removed_paths.extend(str(path.relative_to(LIBRARY_PATH.parent)) for path in audiobook_dir.rglob("*") if path.is_file())
         shutil.rmtree(audiobook_dir)
 
+    epub_editor.cleaning_cache_path(book.id).unlink(missing_ok=True)
+
     return removed_paths
 
 
@@ -415,7 +419,8 @@ async def restore_original_epub(book_id: int, db: AsyncSession = Depends(get_db)
     book.content_selectors = []
     current_path.parent.mkdir(parents=True, exist_ok=True)
     shutil.copy2(immutable_path, current_path)
-    book.current_word_count = epub_editor.get_word_count(str(current_path))
+    analysis = await run_epub_transform(analyze_epub, current_path)
+    book.current_word_count = analysis.word_count
     await crud.touch_book_content(db, book)
     await db.commit()
     await db.refresh(book)
@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from .. import crud, epub_editor, models, schemas
 from ..config import LIBRARY_PATH
 from ..database import get_db
+from ..services.epub_workers import run_epub_transform
 from ..services.processing_queue import get_processing_queue, queue_audio_reconciliation, queue_processing_job
 
 logger = logging.getLogger(__name__)
@@ -106,7 +107,9 @@ async def preview_cleaning(book_id: int, req: PreviewCleaningRequest, db: AsyncS
         config_content_selectors += list(cfg.content_selectors or [])
     all_content_selectors = config_content_selectors + req.content_selectors
     immutable_path = LIBRARY_PATH.parent / db_book.immutable_path
-    return epub_editor.preview_epub(str(immutable_path), req.removed_chapters, all_content_selectors, chapter_selectors)
+    return await run_epub_transform(
+        epub_editor.preview_epub, str(immutable_path), req.removed_chapters, all_content_selectors, chapter_selectors
+    )
 
 
 @router.get("/api/books/{book_id}/matched-config", response_model=List[schemas.CleaningConfig])
@@ -18,6 +18,7 @@ from ..services.observability import (
     diagnostic_logs,
     health_report,
     processing_job_metrics,
+    processing_queue_depth,
 )
 from ..services.processing_queue import get_processing_queue
 
@@ -43,6 +44,14 @@ async def get_job_metrics(
     return await processing_job_metrics(db, window_hours=window_hours)
 
 
+@router.get("/queue-depth")
+async def get_queue_depth(
+    window_hours: int = Query(default=24, ge=1, le=24 * 90),
+    db: AsyncSession = Depends(get_db),
+):
+    return await processing_queue_depth(db, window_hours=window_hours)
+
+
 @router.get("/diagnostics")
 async def download_diagnostics(db: AsyncSession = Depends(get_db)):
     """Download a redacted bundle with no library files, audio, or secret configuration."""
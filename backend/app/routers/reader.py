@@ -5,12 +5,15 @@ from __future__ import annotations
 import json
 import re
 import xml.etree.ElementTree as ET
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
 from pathlib import Path
 from typing import Iterator
 from urllib.parse import quote
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -18,6 +21,7 @@ from .. import crud, models, schemas
 from ..auth import get_reader_api_key
 from ..config import LIBRARY_PATH
 from ..database import get_db
+from ..services.catalog import build_reader_feed_page, build_reader_search_page
 from ..services.audiobook_publication import (
     chapter_reader_audio_path,
     chapter_reader_smil_bytes,
@@ -34,6 +38,7 @@ router = APIRouter(dependencies=[Depends(get_reader_api_key)])
 _ATOM_NS = "http://www.w3.org/2005/Atom"
 _OPDS_NS = "http://opds-spec.org/2010/catalog"
 _RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+_MAX_FEED_PAGE_SIZE = 500
 
 ET.register_namespace("", _ATOM_NS)
 ET.register_namespace("opds", _OPDS_NS)
@@ -235,47 +240,83 @@ async def reader_opds_root(request: Request) -> Response:
 @router.get("/reader/opds/catalog")
 async def reader_opds_catalog(
     request: Request,
-    page: int = 0,
-    page_size: int = 20,
+    page_size: int = Query(20, ge=1, le=_MAX_FEED_PAGE_SIZE),
+    cursor: str | None = None,
+    page: int = Query(0, ge=0),
     db: AsyncSession = Depends(get_db),
 ) -> Response:
+    validators = await _feed_validators(request, db, feed="updates")
+    if _feed_not_modified(request, validators):
+        return Response(status_code=304, headers=validators.headers)
     base_url = str(request.base_url).rstrip("/")
-    books = await crud.get_reader_books(db, skip=page * page_size, limit=page_size)
+    # Clients bookmarked on the old ?page=N links start at that offset once and
+    # continue through cursors from there.
+    page = 0 if cursor else page
+    books, next_cursor = await build_reader_feed_page(
+        db,
+        feed="updates",
+        limit=page_size,
+        cursor=cursor,
+        offset=page * page_size,
+    )
     acq_type = "application/atom+xml;profile=opds-catalog;kind=acquisition"
     nav_type = "application/atom+xml;profile=opds-catalog;kind=navigation"
+    page_url = f"{base_url}/reader/opds/catalog?page_size={page_size}"
+    if cursor:
+        self_url = f"{page_url}&cursor={cursor}"
+    else:
+        self_url = f"{page_url}&page={page}" if page else page_url
 
     feed = ET.Element(f"{{{_ATOM_NS}}}feed")
     ET.SubElement(feed, f"{{{_ATOM_NS}}}id").text = "urn:story-manager:reader-catalog"
     ET.SubElement(feed, f"{{{_ATOM_NS}}}title").text = "All Books"
-    ET.SubElement(feed, f"{{{_ATOM_NS}}}updated").text = _now_utc()
-    _feed_link(feed, "self", f"{base_url}/reader/opds/catalog?page={page}&page_size={page_size}", acq_type)
+    ET.SubElement(feed, f"{{{_ATOM_NS}}}updated").text = validators.updated
+    _feed_link(feed, "self", self_url, acq_type)
     _feed_link(feed, "start", f"{base_url}/reader/opds", nav_type)
 
-    if page > 0:
-        _feed_link(feed, "previous", f"{base_url}/reader/opds/catalog?page={page - 1}&page_size={page_size}", acq_type)
-    if len(books) == page_size:
-        _feed_link(feed, "next", f"{base_url}/reader/opds/catalog?page={page + 1}&page_size={page_size}", acq_type)
+    if cursor or page:
+        _feed_link(feed, "first", page_url, acq_type)
+    if page:
+        _feed_link(feed, "previous", f"{page_url}&page={page - 1}" if page > 1 else page_url, acq_type)
+    if next_cursor:
+        _feed_link(feed, "next", f"{page_url}&cursor={next_cursor}", acq_type)
 
     for book in books:
         feed.append(_build_book_entry(book, base_url))
 
-    return Response(content=_opds_xml(feed), media_type="application/atom+xml; charset=utf-8")
+    return Response(
+        content=_opds_xml(feed),
+        media_type="application/atom+xml; charset=utf-8",
+        headers=validators.headers,
+    )
 
 
 @router.get("/reader/opds/search")
-async def reader_opds_search(request: Request, q: str = "", db: AsyncSession = Depends(get_db)) -> Response:
+async def reader_opds_search(
+    request: Request,
+    q: str = "",
+    page_size: int = Query(20, ge=1, le=_MAX_FEED_PAGE_SIZE),
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_db),
+) -> Response:
     base_url = str(request.base_url).rstrip("/")
-    books = await crud.search_reader_books(db, q=q, skip=0, limit=100)
+    books, next_cursor = await build_reader_search_page(db, q=q, limit=page_size, cursor=cursor)
     acq_type = "application/atom+xml;profile=opds-catalog;kind=acquisition"
     nav_type = "application/atom+xml;profile=opds-catalog;kind=navigation"
+    page_url = f"{base_url}/reader/opds/search?q={quote(q, safe='')}&page_size={page_size}"
 
     feed = ET.Element(f"{{{_ATOM_NS}}}feed")
     ET.SubElement(feed, f"{{{_ATOM_NS}}}id").text = "urn:story-manager:reader-search"
     ET.SubElement(feed, f"{{{_ATOM_NS}}}title").text = f"Search: {q}"
     ET.SubElement(feed, f"{{{_ATOM_NS}}}updated").text = _now_utc()
-    _feed_link(feed, "self", f"{base_url}/reader/opds/search?q={q}", acq_type)
+    _feed_link(feed, "self", f"{page_url}&cursor={cursor}" if cursor else page_url, acq_type)
     _feed_link(feed, "start", f"{base_url}/reader/opds", nav_type)
 
+    if cursor:
+        _feed_link(feed, "first", page_url, acq_type)
+    if next_cursor:
+        _feed_link(feed, "next", f"{page_url}&cursor={next_cursor}", acq_type)
+
     for book in books:
         feed.append(_build_book_entry(book, base_url))
 
@@ -391,16 +432,123 @@ async def get_reader_series_books(
     return await _reader_books_response(books, request, db)
 
 
+@dataclass(frozen=True)
+class _FeedValidators:
+    """Conditional-request validators for one reader feed response."""
+
+    etag: str
+    last_modified: datetime | None
+
+    @property
+    def headers(self) -> dict[str, str]:
+        headers = {"ETag": self.etag, "Cache-Control": "private, max-age=0, must-revalidate"}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(self.last_modified, usegmt=True)
+        return headers
+
+    @property
+    def updated(self) -> str:
+        if self.last_modified is None:
+            return _now_utc()
+        return self.last_modified.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+async def _feed_validators(
+    request: Request,
+    db: AsyncSession,
+    *,
+    feed: str,
+    since: datetime | None = None,
+) -> _FeedValidators:
+    """Derive a strong ETag and Last-Modified from the feed's book count and newest change.
+
+    The aggregate is one indexed query, so polling clients that already hold
+    the current page get their 304 without any books or chapters being loaded.
+    """
+    version = await crud.get_reader_feed_version(db, feed=feed, since=since)
+    changes = [value for value in (version["content_updated_at"], version["updated_at"]) if value is not None]
+    last_modified = None
+    if changes:
+        last_modified = max(
+            value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc) for value in changes
+        ).replace(microsecond=0)
+    fingerprint = json.dumps(
+        [
+            str(request.url),
+            version["book_count"],
+            *(
+                value.isoformat() if value is not None else None
+                for value in (version["content_updated_at"], version["updated_at"])
+            ),
+        ],
+        separators=(",", ":"),
+    )
+    return _FeedValidators(_etag(sha256_bytes(fingerprint.encode("utf-8"))), last_modified)
+
+
+def _feed_not_modified(request: Request, validators: _FeedValidators) -> bool:
+    if request.headers.get("if-none-match"):
+        return _etag_matches(request, validators.etag)
+    since_header = request.headers.get("if-modified-since")
+    if not since_header or validators.last_modified is None:
+        return False
+    try:
+        modified_since = parsedate_to_datetime(since_header)
+    except (TypeError, ValueError):
+        return False
+    if modified_since.tzinfo is None:
+        modified_since = modified_since.replace(tzinfo=timezone.utc)
+    return validators.last_modified <= modified_since
+
+
+async def _reader_feed_response(
+    feed: str,
+    request: Request,
+    db: AsyncSession,
+    *,
+    limit: int | None,
+    cursor: str | None,
+    since: datetime | None = None,
+) -> Response:
+    validators = await _feed_validators(request, db, feed=feed, since=since)
+    if _feed_not_modified(request, validators):
+        return Response(status_code=304, headers=validators.headers)
+    headers = validators.headers
+    if limit is None:
+        if cursor:
+            raise HTTPException(status_code=400, detail="A feed cursor must be sent with its limit")
+        if feed == "updates":
+            books = await crud.get_reader_updates(db, since)
+        elif feed == "standalone":
+            books = await crud.get_reader_standalone_books(db)
+        else:
+            books = await crud.get_all_reader_books(db)
+    else:
+        books, next_cursor = await build_reader_feed_page(db, feed=feed, limit=limit, cursor=cursor, since=since)
+        if next_cursor:
+            headers["Link"] = f'<{request.url.include_query_params(cursor=next_cursor)}>; rel="next"'
+    results = await _reader_books_response(books, request, db)
+    return JSONResponse(content=jsonable_encoder(results), headers=headers)
+
+
 @router.get("/reader/books/all", response_model=list[schemas.ReaderBook])
-async def get_all_reader_books(request: Request, db: AsyncSession = Depends(get_db)) -> list[schemas.ReaderBook]:
-    books = await crud.get_all_reader_books(db)
-    return await _reader_books_response(books, request, db)
+async def get_all_reader_books(
+    request: Request,
+    limit: int | None = Query(None, ge=1, le=_MAX_FEED_PAGE_SIZE),
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    return await _reader_feed_response("all", request, db, limit=limit, cursor=cursor)
 
 
 @router.get("/reader/books/standalone", response_model=list[schemas.ReaderBook])
-async def get_reader_standalone_books(request: Request, db: AsyncSession = Depends(get_db)) -> list[schemas.ReaderBook]:
-    books = await crud.get_reader_standalone_books(db)
-    return await _reader_books_response(books, request, db)
+async def get_reader_standalone_books(
+    request: Request,
+    limit: int | None = Query(None, ge=1, le=_MAX_FEED_PAGE_SIZE),
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    return await _reader_feed_response("standalone", request, db, limit=limit, cursor=cursor)
 
 
 @router.get("/reader/books/{book_id}", response_model=schemas.ReaderBook)
@@ -414,10 +562,27 @@ async def get_reader_book(book_id: int, request: Request, db: AsyncSession = Dep
 async def get_reader_updates(
     request: Request,
     since: datetime | None = None,
+    limit: int | None = Query(None, ge=1, le=_MAX_FEED_PAGE_SIZE),
+    cursor: str | None = None,
     db: AsyncSession = Depends(get_db),
-) -> list[schemas.ReaderBook]:
-    books = await crud.get_reader_updates(db, since)
-    return await _reader_books_response(books, request, db)
+) -> Response:
+    return await _reader_feed_response("updates", request, db, limit=limit, cursor=cursor, since=since)
+
+
+@router.get("/reader/search", response_model=list[schemas.ReaderBook])
+async def search_reader_books(
+    request: Request,
+    q: str = "",
+    limit: int = Query(20, ge=1, le=_MAX_FEED_PAGE_SIZE),
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    books, next_cursor = await build_reader_search_page(db, q=q, limit=limit, cursor=cursor)
+    headers = {}
+    if next_cursor:
+        headers["Link"] = f'<{request.url.include_query_params(cursor=next_cursor)}>; rel="next"'
+    results = await _reader_books_response(books, request, db)
+    return JSONResponse(content=jsonable_encoder(results), headers=headers)
 
 
 async def _reader_audiobook_book(book_id: int, db: AsyncSession) -> models.Book:
@@ -7,7 +7,6 @@ from pathlib import PurePosixPath
 from collections.abc import Iterator
 from typing import List, Optional
 
-from ebooklib import epub
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
 from pydantic import BaseModel, Field, HttpUrl, TypeAdapter, ValidationError
 from sqlalchemy.exc import IntegrityError
@@ -16,7 +15,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from .. import crud, epub_editor, models, schemas
 from ..config import LIBRARY_PATH
 from ..database import get_db
-from ..services.epub_utils import get_and_save_epub_cover, get_epub_tag_metadata, get_epub_word_and_chapter_count
+from ..services.epub_utils import analyze_epub
+from ..services.epub_workers import run_epub_transform
 from ..services.library_paths import build_book_paths
 from ..services.metadata_jobs import queue_metadata_sync_job
 from ..services.series import enrich_series_metadata
@@ -150,9 +150,12 @@ async def _upload_epub_bytes(filename: str, payload: bytes, db: AsyncSession) ->
         f.write(payload)
 
     try:
-        epub_book = epub.read_epub(temp_immutable_path)
-        title = epub_book.get_metadata("DC", "title")[0][0]
-        author = epub_book.get_metadata("DC", "creator")[0][0]
+        # One pass over the archive yields metadata, tags, counts, and the cover.
+        analysis = await run_epub_transform(analyze_epub, temp_immutable_path)
+        title = analysis.title
+        author = analysis.author
+        if not title or not author:
+            raise ValueError("EPUB metadata must include a title and author.")
     except Exception as e:
         temp_immutable_path.unlink(missing_ok=True)
         temp_current_path.unlink(missing_ok=True)
@@ -200,11 +203,11 @@ async def _upload_epub_bytes(filename: str, payload: bytes, db: AsyncSession) ->
 
         existing.immutable_path = str(immutable_path.relative_to(LIBRARY_PATH.parent))
         existing.current_path = str(current_path.relative_to(LIBRARY_PATH.parent))
-        existing.master_word_count = epub_editor.get_word_count(str(immutable_path))
+        existing.master_word_count = analysis.word_count
         existing.current_word_count = existing.master_word_count
 
         if not existing.cover_path or not (LIBRARY_PATH.parent / existing.cover_path).exists():
-            cover_path = get_and_save_epub_cover(epub_path=immutable_path, book_id=existing.id)
+            cover_path = analysis.save_cover(existing.id)
             if cover_path:
                 existing.cover_path = str(cover_path.relative_to(LIBRARY_PATH.parent))
 
@@ -219,37 +222,22 @@ async def _upload_epub_bytes(filename: str, payload: bytes, db: AsyncSession) ->
     temp_immutable_path.replace(immutable_path)
     temp_current_path.replace(current_path)
 
-    try:
-        series_metadata = epub_book.get_metadata("calibre", "series")
-        series = series_metadata[0][0] if series_metadata else None
-    except Exception as e:
-        logger.warning(f"Failed to parse series metadata: {e}")
-        series = None
-
-    source_url: Optional[str] = None
+    source_url = analysis.source_url
     source_type = models.SourceType.epub
-    try:
-        dc_source = epub_book.get_metadata("DC", "source")
-        if dc_source:
-            raw_url = dc_source[0][0]
-            if isinstance(raw_url, str) and raw_url.lower().startswith(("http://", "https://")):
-                source_url = raw_url
-                source_type = models.SourceType.web
-                logger.info(f"Detected FFF epub with source URL: {source_url}")
-            else:
-                logger.info(f"Skipping non-HTTP dc:source metadata: {raw_url}")
-    except Exception as e:
-        logger.warning(f"Failed to parse dc:source metadata: {e}")
+    if source_url:
+        source_type = models.SourceType.web
+        logger.info(f"Detected FFF epub with source URL: {source_url}")
+    elif analysis.source:
+        logger.info(f"Skipping non-HTTP dc:source metadata: {analysis.source}")
 
-    master_word_count = epub_editor.get_word_count(str(immutable_path))
-    tag_metadata = get_epub_tag_metadata(immutable_path)
+    master_word_count = analysis.word_count
 
     book_to_create = schemas.BookCreate(
         title=title,
         author=author,
-        series=series,
-        genre_tags=tag_metadata["genre_tags"],
-        source_tags=tag_metadata["source_tags"],
+        series=analysis.series,
+        genre_tags=analysis.genre_tags,
+        source_tags=analysis.source_tags,
         immutable_path=str(immutable_path.relative_to(LIBRARY_PATH.parent)),
         current_path=str(current_path.relative_to(LIBRARY_PATH.parent)),
         source_url=source_url,
@@ -269,17 +257,16 @@ async def _upload_epub_bytes(filename: str, payload: bytes, db: AsyncSession) ->
             detail=f"A book with title '{title}' by '{author}' already exists at the target path",
         )
 
-    cover_path = get_and_save_epub_cover(epub_path=immutable_path, book_id=db_book.id)
+    cover_path = analysis.save_cover(db_book.id)
     if cover_path:
         db_book.cover_path = str(cover_path.relative_to(LIBRARY_PATH.parent))
         await db.commit()
         await db.refresh(db_book)
 
-    _, chapter_count = get_epub_word_and_chapter_count(current_path)
     log_entry = schemas.BookLogCreate(
         book_id=db_book.id,
         entry_type="added",
-        new_chapter_count=chapter_count,
+        new_chapter_count=analysis.chapter_count,
         words_added=master_word_count,
     )
     await crud.create_book_log(db, log_entry)
@@ -295,15 +282,8 @@ async def _upload_epub_file(file: UploadFile, db: AsyncSession) -> models.Book:
     return await _upload_epub_bytes(file.filename, payload, db)
 
 
-def _first_epub_metadata(epub_book, namespace: str, key: str) -> Optional[str]:
-    try:
-        values = epub_book.get_metadata(namespace, key)
-    except KeyError:
-        return None
-    if not values:
-        return None
-    value = values[0][0]
-    return str(value).strip() if value is not None else None
+def _clean_metadata_value(value: Optional[str]) -> Optional[str]:
+    return value.strip() if value is not None else None
 
 
 async def _preview_epub_bytes(
@@ -315,11 +295,11 @@ async def _preview_epub_bytes(
     seen_books: set[tuple[str, str]],
 ) -> ImportPreviewItem:
     try:
-        epub_book = epub.read_epub(BytesIO(_fix_nested_epub(payload)))
-        title = _first_epub_metadata(epub_book, "DC", "title")
-        author = _first_epub_metadata(epub_book, "DC", "creator")
-        series = _first_epub_metadata(epub_book, "calibre", "series")
-        source_url = _first_epub_metadata(epub_book, "DC", "source")
+        analysis = await run_epub_transform(analyze_epub, BytesIO(_fix_nested_epub(payload)), include_text=False)
+        title = _clean_metadata_value(analysis.title)
+        author = _clean_metadata_value(analysis.author)
+        series = _clean_metadata_value(analysis.series)
+        source_url = _clean_metadata_value(analysis.source)
         if source_url and not source_url.lower().startswith(("http://", "https://")):
             source_url = None
         if not title or not author:
@@ -563,7 +543,7 @@ async def upload_epubs(files: List[UploadFile] = File(...), db: AsyncSession = D
     existing_no_series = [b for b in await crud.get_books_without_series(db) if b.id not in batch_ids]
     all_candidates = created_books + existing_no_series
 
-    updated = enrich_series_metadata(all_candidates)
+    updated = enrich_series_metadata(all_candidates, changed_ids=batch_ids)
     if updated:
         await db.commit()
         for b in updated:
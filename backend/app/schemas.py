@@ -277,6 +277,7 @@ class ApiKey(BaseModel):
     token_prefix: str
     created_at: datetime
     last_used_at: Optional[datetime] = None
+    request_count: int = 0
     revoked_at: Optional[datetime] = None
 
 
@@ -427,6 +428,7 @@ class BackupArchive(BaseModel):
     filename: str
     created_at: datetime
     size_bytes: int
+    added_size_bytes: Optional[int] = None
     library_file_count: int
     library_size_bytes: int
     valid_manifest: bool
@@ -0,0 +1,91 @@
+"""Write-behind buffer for reader API key usage."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .. import config, crud
+from ..database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+class ApiKeyUsageRecorder:
+    """App-scoped buffer of reader key usage flushed in one batched UPDATE.
+
+    Authenticated reader requests only touch memory; a background task writes
+    each key's latest use and request count every
+    ``API_KEY_USAGE_FLUSH_SECONDS``, and ``stop`` flushes whatever is left.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[int, tuple[datetime, int]] = {}
+        self._worker_task: Optional[asyncio.Task[None]] = None
+
+    def record(self, key_id: int, used_at: Optional[datetime] = None) -> None:
+        used_at = used_at or datetime.now(timezone.utc)
+        previous_used_at, requests = self._pending.get(key_id, (used_at, 0))
+        self._pending[key_id] = (max(previous_used_at, used_at), requests + 1)
+
+    def pending(self) -> dict[int, tuple[datetime, int]]:
+        return dict(self._pending)
+
+    def clear(self) -> None:
+        """Discard buffered usage without writing it (primarily useful for tests)."""
+        self._pending.clear()
+
+    async def flush(self, db: Optional[AsyncSession] = None) -> int:
+        """Write buffered usage and return how many keys were updated."""
+        if not self._pending:
+            return 0
+        pending, self._pending = self._pending, {}
+        try:
+            if db is not None:
+                await crud.record_api_key_usage(db, pending)
+            else:
+                async with SessionLocal() as session:
+                    await crud.record_api_key_usage(session, pending)
+        except Exception:
+            for key_id, (used_at, requests) in pending.items():
+                newer_used_at, newer_requests = self._pending.get(key_id, (used_at, 0))
+                self._pending[key_id] = (max(used_at, newer_used_at), requests + newer_requests)
+            raise
+        return len(pending)
+
+    async def start(self) -> None:
+        if self._worker_task and not self._worker_task.done():
+            return
+        self._worker_task = asyncio.create_task(self._run(), name="api-key-usage-flusher")
+
+    async def stop(self) -> None:
+        if self._worker_task:
+            self._worker_task.cancel()
+            try:
+                await self._worker_task
+            except asyncio.CancelledError:
+                pass
+            self._worker_task = None
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("Failed to flush reader API key usage during shutdown")
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(config.API_KEY_USAGE_FLUSH_SECONDS)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Failed to flush reader API key usage")
+
+
+_recorder = ApiKeyUsageRecorder()
+
+
+def get_api_key_usage_recorder() -> ApiKeyUsageRecorder:
+    return _recorder
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
 import gzip
 import json
 import logging
@@ -17,6 +18,7 @@ from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .. import crud
+from .. import config
 from ..config import LIBRARY_PATH
 from ..lifecycle import (
     ALIGNMENT_METHOD,
@@ -32,7 +34,8 @@ from ..models import (
     ImportedAudiobookTrack,
 )
 from .audiobook_import import imported_audiobook_dir, relative_library_path
-from .endpoint_pool import configured_endpoints
+from .endpoint_pool import configured_endpoints, dispatch_capacity
+from .fuzzy_alignment import banded_alignment
 from .transcription_providers import (
     TranscriptResult,
     TranscriptWord,
@@ -66,7 +69,14 @@ _NUMBER_ALIASES = {
     "nineteen": "19",
     "twenty": "20",
 }
-_MAX_FUZZY_GAP_CELLS = 250_000
+# Gaps wider than the budget are aligned inside a diagonal band instead.
+_MAX_FUZZY_GAP_CELLS = 5_000_000
+_SILENCE_RE = re.compile(r"silence_(start|end): (-?[0-9.]+)")
+# Window cuts snap to the middle of a pause at least this long and this quiet,
+# searched within a tenth of a window either side of the nominal cut.
+_SILENCE_MIN_SECONDS = 0.3
+_SILENCE_NOISE = "-35dB"
+_SILENCE_SEARCH_RATIO = 0.1
 
 
 @dataclass(frozen=True)
@@ -87,6 +97,21 @@ class AlignmentResult:
     canonical_token_count: int
 
 
+@dataclass(frozen=True)
+class TranscriptionWindow:
+    """A stretch of track audio sent to transcription, relative to the track start.
+
+    Words whose midpoint falls between ``keep_from_ms`` and ``keep_until_ms``
+    belong to this window; the rest of the extracted audio is overlap that
+    neighbouring windows own.
+    """
+
+    start_ms: int
+    end_ms: int
+    keep_from_ms: int
+    keep_until_ms: int
+
+
 @dataclass(frozen=True)
 class _CanonicalToken:
     normalized: str
@@ -118,52 +143,16 @@ def _fuzzy_gap_matches(
     transcript_offset: int,
 ) -> dict[int, tuple[int, float]]:
     """Globally align one unmatched gap and return credible substitutions."""
-    m, n = len(canonical), len(transcript)
-    if not m or not n or m * n > _MAX_FUZZY_GAP_CELLS:
-        return {}
-
-    gap_penalty = -1.15
-    prior = [index * gap_penalty for index in range(n + 1)]
-    trace = [bytearray(n + 1) for _ in range(m + 1)]
-    for column in range(1, n + 1):
-        trace[0][column] = 2  # left
-    for row in range(1, m + 1):
-        trace[row][0] = 1  # up
-        current = [row * gap_penalty] + [0.0] * n
-        for column in range(1, n + 1):
-            similarity = _token_similarity(
-                canonical[row - 1].normalized,
-                transcript[column - 1].normalized,
-            )
-            diagonal_score = 2.5 if similarity == 1 else (2.0 * similarity - 1.25)
-            diagonal = prior[column - 1] + diagonal_score
-            up = prior[column] + gap_penalty
-            left = current[column - 1] + gap_penalty
-            best = max(diagonal, up, left)
-            current[column] = best
-            trace[row][column] = 0 if best == diagonal else (1 if best == up else 2)
-        prior = current
-
+    pairs = banded_alignment(
+        [token.normalized for token in canonical],
+        [token.normalized for token in transcript],
+        max_cells=_MAX_FUZZY_GAP_CELLS,
+    )
     matches = {}
-    row, column = m, n
-    while row or column:
-        direction = trace[row][column]
-        if row and column and direction == 0:
-            similarity = _token_similarity(
-                canonical[row - 1].normalized,
-                transcript[column - 1].normalized,
-            )
-            if similarity >= 0.58:
-                matches[canonical_offset + row - 1] = (
-                    transcript_offset + column - 1,
-                    similarity,
-                )
-            row -= 1
-            column -= 1
-        elif row and (not column or direction == 1):
-            row -= 1
-        else:
-            column -= 1
+    for row, column in pairs or ():
+        similarity = _token_similarity(canonical[row].normalized, transcript[column].normalized)
+        if similarity >= 0.58:
+            matches[canonical_offset + row] = (transcript_offset + column, similarity)
     return matches
 
 
@@ -329,24 +318,34 @@ def _resolve_library_path(relative_path: str | None) -> Path | None:
     return path if path.is_relative_to(LIBRARY_PATH.resolve()) else None
 
 
-async def _extract_track_clip(track: ImportedAudiobookTrack, destination: Path) -> None:
+def _track_audio_source(track: ImportedAudiobookTrack) -> tuple[str, Path]:
     source = _resolve_library_path(track.audio_file_path)
     if source is None or not source.is_file():
         raise ValueError(f"Audio source for track {track.title!r} is missing.")
     ffmpeg = shutil.which("ffmpeg")
     if not ffmpeg:
         raise RuntimeError("ffmpeg is required to prepare audiobook transcription clips.")
+    return ffmpeg, source
+
+
+async def _extract_track_clip(
+    track: ImportedAudiobookTrack,
+    destination: Path,
+    window: TranscriptionWindow | None = None,
+) -> None:
+    ffmpeg, source = _track_audio_source(track)
+    start_ms, end_ms = (window.start_ms, window.end_ms) if window else (0, track.duration_ms)
     destination.parent.mkdir(parents=True, exist_ok=True)
     process = await asyncio.create_subprocess_exec(
         ffmpeg,
         "-v",
         "error",
         "-ss",
-        f"{track.source_start_ms / 1000:.3f}",
+        f"{(track.source_start_ms + start_ms) / 1000:.3f}",
         "-i",
         str(source),
         "-t",
-        f"{track.duration_ms / 1000:.3f}",
+        f"{(end_ms - start_ms) / 1000:.3f}",
         "-vn",
         "-ac",
         "1",
@@ -365,6 +364,97 @@ async def _extract_track_clip(track: ImportedAudiobookTrack, destination: Path)
         raise RuntimeError(f"Could not prepare {track.title!r} for transcription: {message}")
 
 
+async def _detect_track_silences(track: ImportedAudiobookTrack) -> list[tuple[int, int]]:
+    """Return ``(start_ms, end_ms)`` pauses in the track, relative to its start."""
+    ffmpeg, source = _track_audio_source(track)
+    process = await asyncio.create_subprocess_exec(
+        ffmpeg,
+        "-hide_banner",
+        "-nostats",
+        "-ss",
+        f"{track.source_start_ms / 1000:.3f}",
+        "-i",
+        str(source),
+        "-t",
+        f"{track.duration_ms / 1000:.3f}",
+        "-vn",
+        "-af",
+        f"silencedetect=noise={_SILENCE_NOISE}:d={_SILENCE_MIN_SECONDS}",
+        "-f",
+        "null",
+        "-",
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    _stdout, stderr = await process.communicate()
+    if process.returncode:
+        message = stderr.decode("utf-8", errors="replace")[-500:]
+        raise RuntimeError(f"Could not scan {track.title!r} for pauses: {message}")
+    silences = []
+    started = None
+    for kind, seconds in _SILENCE_RE.findall(stderr.decode("utf-8", errors="replace")):
+        milliseconds = max(0, round(float(seconds) * 1000))
+        if kind == "start":
+            started = milliseconds
+        elif started is not None:
+            silences.append((started, milliseconds))
+            started = None
+    return silences
+
+
+def plan_transcription_windows(
+    duration_ms: int,
+    silences: list[tuple[int, int]],
+    *,
+    window_ms: int,
+    overlap_ms: int,
+) -> list[TranscriptionWindow]:
+    """Cut a track into overlapping windows of about ``window_ms``.
+
+    Each cut lands in the middle of the pause closest to its nominal position,
+    when one is near enough, so the seam words are rarely split mid-syllable.
+    Windows extend half the overlap past each cut for context.
+    """
+    if duration_ms <= window_ms + overlap_ms:
+        return [TranscriptionWindow(0, duration_ms, 0, duration_ms)]
+    pauses = sorted((start + end) // 2 for start, end in silences)
+    tolerance = int(window_ms * _SILENCE_SEARCH_RATIO)
+    cuts = [0]
+    while duration_ms - cuts[-1] > window_ms + overlap_ms:
+        target = cuts[-1] + window_ms
+        nearby = pauses[slice(bisect.bisect_left(pauses, target - tolerance), bisect.bisect_right(pauses, target + tolerance))]
+        cuts.append(min(nearby, key=lambda pause: abs(pause - target)) if nearby else target)
+    cuts.append(duration_ms)
+    half = overlap_ms // 2
+    return [
+        TranscriptionWindow(max(0, keep_from - half), min(duration_ms, keep_until + half), keep_from, keep_until)
+        for keep_from, keep_until in zip(cuts, cuts[1:])
+    ]
+
+
+def stitch_window_transcripts(
+    windows: list[TranscriptionWindow],
+    results: list[TranscriptResult],
+) -> TranscriptResult:
+    """Shift window words onto the track timeline and drop duplicated overlap."""
+    words: list[TranscriptWord] = []
+    last = len(windows) - 1
+    for index, (window, result) in enumerate(zip(windows, results)):
+        # A word spanning the cut may be timed on both sides of it by the two
+        # windows that heard it; keep the earlier window's copy.
+        seam_ms = words[-1].end_ms if words else 0
+        for word in result.words:
+            start_ms, end_ms = word.start_ms + window.start_ms, word.end_ms + window.start_ms
+            midpoint = (start_ms + end_ms) / 2
+            if index and (midpoint < window.keep_from_ms or midpoint < seam_ms):
+                continue
+            if index < last and midpoint >= window.keep_until_ms:
+                continue
+            words.append(TranscriptWord(text=word.text, start_ms=start_ms, end_ms=end_ms, score=word.score))
+    language = next((result.language for result in results if result.language), None)
+    return TranscriptResult(language=language, duration_ms=windows[-1].end_ms, words=words)
+
+
 def _normalized_cache_language(language: str | None) -> str | None:
     value = (language or "").strip().casefold()
     return None if not value or value == "auto" else value
@@ -464,6 +554,110 @@ def _transcription_cache_config(settings) -> tuple[str, str | None, str | None,
     return "endpoint-pool", signature, None, None
 
 
+def _read_window_plan(
+    path: Path,
+    track: ImportedAudiobookTrack,
+    window_ms: int,
+    overlap_ms: int,
+) -> list[TranscriptionWindow] | None:
+    """Reuse the silence-snapped cuts of an interrupted run so its windows stay cached."""
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        if payload.get("source") != [track.source_start_ms, track.duration_ms, window_ms, overlap_ms]:
+            return None
+        return [TranscriptionWindow(*window) for window in payload["windows"]]
+    except FileNotFoundError:
+        return None
+    except (OSError, KeyError, TypeError, ValueError):
+        logger.warning("Ignoring invalid transcription window plan at %s.", path)
+        return None
+
+
+def _write_window_plan(
+    path: Path,
+    track: ImportedAudiobookTrack,
+    window_ms: int,
+    overlap_ms: int,
+    windows: list[TranscriptionWindow],
+) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "source": [track.source_start_ms, track.duration_ms, window_ms, overlap_ms],
+        "windows": [list(asdict(window).values()) for window in windows],
+    }
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+async def _gather_or_cancel(tasks: list[asyncio.Task]) -> list:
+    """Await every task, cancelling the rest as soon as one of them fails."""
+    try:
+        return await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _transcribe_track(
+    settings,
+    track: ImportedAudiobookTrack,
+    edition_dir: Path,
+    cache_config: tuple[str, str | None, str | None, str | None],
+    slots: asyncio.Semaphore,
+) -> tuple[Path, TranscriptResult]:
+    """Transcribe one track window by window, resuming from cached windows.
+
+    ``slots`` bounds transcription requests across the whole edition, so the
+    windows of every track are spread over all configured endpoints at once.
+    """
+    transcripts_dir = edition_dir / "alignment" / "transcripts"
+    cache_path = transcripts_dir / f"track-{track.id}.json.gz"
+    transcript = _read_transcript_cache(cache_path, *cache_config)
+    if transcript is not None:
+        return cache_path, transcript
+
+    window_ms = round(config.TRANSCRIPTION_WINDOW_SECONDS * 1000)
+    overlap_ms = round(config.TRANSCRIPTION_WINDOW_OVERLAP_SECONDS * 1000)
+    window_dir = transcripts_dir / f"track-{track.id}"
+    windows = plan_transcription_windows(track.duration_ms, [], window_ms=window_ms, overlap_ms=overlap_ms)
+    if len(windows) > 1:
+        plan_path = window_dir / "windows.json"
+        windows = _read_window_plan(plan_path, track, window_ms, overlap_ms)
+        if windows is None:
+            async with slots:
+                silences = await _detect_track_silences(track)
+            windows = plan_transcription_windows(
+                track.duration_ms,
+                silences,
+                window_ms=window_ms,
+                overlap_ms=overlap_ms,
+            )
+            _write_window_plan(plan_path, track, window_ms, overlap_ms, windows)
+
+    async def transcribe_window(window: TranscriptionWindow) -> TranscriptResult:
+        window_path = window_dir / f"window-{window.start_ms}-{window.end_ms}.json.gz"
+        if len(windows) > 1:
+            cached = _read_transcript_cache(window_path, *cache_config)
+            if cached is not None:
+                return cached
+        clip_path = edition_dir / "alignment" / "clips" / f"track-{track.id}-{window.start_ms}.flac"
+        async with slots:
+            await _extract_track_clip(track, clip_path, window)
+            try:
+                result = await transcribe_file(settings, clip_path)
+            finally:
+                clip_path.unlink(missing_ok=True)
+        if len(windows) > 1:
+            _write_transcript_cache(window_path, result, *cache_config)
+        return result
+
+    results = await _gather_or_cancel([asyncio.create_task(transcribe_window(window)) for window in windows])
+    transcript = results[0] if len(windows) == 1 else stitch_window_transcripts(windows, results)
+    _write_transcript_cache(cache_path, transcript, *cache_config)
+    shutil.rmtree(window_dir, ignore_errors=True)
+    return cache_path, transcript
+
+
 async def _sentences_for_track(track: ImportedAudiobookTrack, db: AsyncSession) -> list[AudiobookSentence]:
     result = await db.execute(
         select(AudiobookSentence)
@@ -515,37 +709,21 @@ async def process_alignment(edition_id: int, db: AsyncSession) -> None:
     edition.progress_detail = "Preparing timestamp alignment"
     await db.commit()
 
+    transcriptions: list[asyncio.Task] = []
     try:
         scores = []
         edition_dir = imported_audiobook_dir(edition.book_id, edition.id)
-        cache_provider, cache_model, cache_language, cache_root = _transcription_cache_config(settings)
+        cache_config = _transcription_cache_config(settings)
+        slots = asyncio.Semaphore(dispatch_capacity(settings, "transcription"))
+        # Later tracks transcribe while earlier ones are aligned and saved.
+        transcriptions = [
+            asyncio.create_task(_transcribe_track(settings, track, edition_dir, cache_config, slots)) for track in tracks
+        ]
         for index, track in enumerate(tracks, start=1):
             edition.progress_detail = f"Transcribing {track.title} ({index} of {len(tracks)})"
             await db.commit()
 
-            cache_path = edition_dir / "alignment" / "transcripts" / f"track-{track.id}.json.gz"
-            transcript = _read_transcript_cache(
-                cache_path,
-                cache_provider,
-                cache_model,
-                cache_language,
-                cache_root,
-            )
-            if transcript is None:
-                clip_path = edition_dir / "alignment" / "clips" / f"track-{track.id}.flac"
-                await _extract_track_clip(track, clip_path)
-                try:
-                    transcript = await transcribe_file(settings, clip_path)
-                finally:
-                    clip_path.unlink(missing_ok=True)
-                _write_transcript_cache(
-                    cache_path,
-                    transcript,
-                    cache_provider,
-                    cache_model,
-                    cache_language,
-                    cache_root,
-                )
+            cache_path, transcript = await transcriptions[index - 1]
             track.transcript_file_path = relative_library_path(cache_path)
 
             sentences = await _sentences_for_track(track, db)
@@ -613,3 +791,7 @@ async def process_alignment(edition_id: int, db: AsyncSession) -> None:
             edition.alignment_error = str(exc)
             edition.progress_detail = "Timestamp alignment failed; estimated cues retained where available"
             await db.commit()
+    finally:
+        for transcription in transcriptions:
+            transcription.cancel()
+        await asyncio.gather(*transcriptions, return_exceptions=True)
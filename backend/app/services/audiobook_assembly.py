@@ -16,6 +16,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from .. import crud
 from ..config import AUDIOBOOK_ASSEMBLY_MARKER, LIBRARY_PATH
 from ..models import AudiobookChapter
+from . import snippet_packs
 from .audiobook_publication import publish_reader_audiobook
 
 logger = logging.getLogger(__name__)
@@ -144,27 +145,48 @@ async def _assemble_chapter(book_id: int, chapter, sentences: list, output_dir:
         logger.warning("Chapter %s has no sentences with audio; skipping assembly.", chapter.id)
         return
 
-    snippet_paths: list[Path] = []
+    # Compact each chapter pack first so superseded clips are dropped and the
+    # live ones are stored in reading order before the frame copy below.
+    pack_sentences: dict[Path, list[int]] = {}
     for sentence in sentences:
         if not sentence.audio_file_path:
             raise RuntimeError(f"Sentence {sentence.id} is missing audio path during assembly.")
         snippet_full = LIBRARY_PATH.parent / sentence.audio_file_path
+        if snippet_packs.is_snippet_index(snippet_full):
+            pack_sentences.setdefault(snippet_full, []).append(sentence.id)
+    packs = {
+        index_path: await asyncio.to_thread(snippet_packs.compact_pack, index_path, sentence_ids)
+        for index_path, sentence_ids in pack_sentences.items()
+    }
+
+    from mutagen.mp3 import MP3
+
+    # Each source is an ffmpeg concat input and the exact duration of its MP3
+    # frames. Packed clips are read in place through ffmpeg's subfile protocol.
+    sources: list[tuple[str, float]] = []
+    for sentence in sentences:
+        snippet_full = LIBRARY_PATH.parent / sentence.audio_file_path
+        pack = packs.get(snippet_full)
+        if pack is not None:
+            entry = pack.entries.get(sentence.id)
+            if entry is None or not pack.path.is_file():
+                raise RuntimeError(f"Snippet audio missing for sentence {sentence.id}: {snippet_full}")
+            end = entry.offset + entry.length
+            sources.append((f"subfile,,start,{entry.offset},end,{end},,:{pack.path}", entry.duration_ms))
+            continue
         if not snippet_full.exists():
             raise RuntimeError(f"Snippet file missing for sentence {sentence.id}: {snippet_full}")
-        snippet_paths.append(snippet_full)
+        sources.append((str(snippet_full), MP3(str(snippet_full)).info.length * 1000))
 
     # Treat the MP3 artifacts as authoritative. Older pipeline versions trusted
     # provider-reported durations, which accumulated into visibly incorrect
     # SMIL timelines. Rounding cumulative frame durations preserves both every
     # intermediate boundary and the exact rounded chapter total.
-    from mutagen.mp3 import MP3
-
     cumulative_exact_ms = 0.0
     previous_boundary_ms = 0
     corrected_durations = 0
-    for sentence, snippet_path in zip(sentences, snippet_paths, strict=True):
-        snippet = MP3(str(snippet_path))
-        cumulative_exact_ms += snippet.info.length * 1000
+    for sentence, (_source, exact_duration_ms) in zip(sentences, sources, strict=True):
+        cumulative_exact_ms += exact_duration_ms
         next_boundary_ms = round(cumulative_exact_ms)
         duration_ms = next_boundary_ms - previous_boundary_ms
         if sentence.audio_duration_ms != duration_ms:
@@ -185,14 +207,16 @@ async def _assemble_chapter(book_id: int, chapter, sentences: list, output_dir:
     if not ffmpeg:
         raise RuntimeError("ffmpeg is required to assemble audiobook chapters.")
     with tempfile.NamedTemporaryFile("w", suffix=".txt", dir=output_dir, encoding="utf-8") as manifest:
-        for snippet_path in snippet_paths:
-            escaped_path = str(snippet_path).replace("'", "'\\''")
-            manifest.write(f"file '{escaped_path}'\n")
+        for source, _duration_ms in sources:
+            escaped_source = source.replace("'", "'\\''")
+            manifest.write(f"file '{escaped_source}'\n")
         manifest.flush()
         process = await asyncio.create_subprocess_exec(
             ffmpeg,
             "-v",
             "error",
+            "-protocol_whitelist",
+            "file,subfile",
             "-f",
             "concat",
             "-safe",
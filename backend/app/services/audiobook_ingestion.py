@@ -6,7 +6,10 @@ import hashlib
 import logging
 import shutil
 import tempfile
+import re
 from collections import Counter
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from pathlib import Path
 
 import ebooklib
@@ -16,7 +19,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from .. import crud
 from ..config import LIBRARY_PATH
-from ..models import AudiobookChapter, AudiobookSentence, Book
+from ..models import AudiobookChapter, Book
 from ..lifecycle import (
     AUDIOBOOK_PIPELINE,
     AUDIOBOOK_PUBLICATION,
@@ -26,17 +29,22 @@ from ..lifecycle import (
     ChapterGenerationStatus,
     transition_state,
 )
+from . import snippet_packs
 from .audiobook_publication import (
     normalize_resource_href,
     stable_chapter_key,
     stage_reader_text_rendition,
 )
 from .audiobook_text import SpeechSegment, split_speech_segments
+from .epub_workers import run_epub_transform
 
 logger = logging.getLogger(__name__)
 
 _NLP = None  # lazy-load spaCy model to avoid startup cost
 _SKIP_TEXT_ANCESTORS = {"script", "style", "head", "title", "svg", "math", "audio", "video"}
+# Text nodes handed to spaCy per nlp.pipe batch.
+_SPACY_BATCH_SIZE = 256
+_SPAN_ID_RE = re.compile(r"<span id=\"([^\"]+)\"")
 
 
 def _get_nlp():
@@ -54,23 +62,22 @@ def _get_nlp():
     return _NLP
 
 
-def _tokenize_text(text: str) -> list[str]:
+def _tokenize_texts(texts: list[str]) -> list[list[str]]:
+    """Split each text into sentences, streaming the whole batch through spaCy."""
+    if not texts:
+        return []
     nlp = _get_nlp()
-    doc = nlp(text)
-    return [sent.text.strip() for sent in doc.sents if sent.text.strip()]
+    return [
+        [sent.text.strip() for sent in doc.sents if sent.text.strip()] for doc in nlp.pipe(texts, batch_size=_SPACY_BATCH_SIZE)
+    ]
 
 
-def _tokenize_speech_units(
-    text: str,
-    quote_state: str | None = None,
-) -> tuple[list[SpeechSegment], str | None]:
+def _merge_speech_units(segments: list[SpeechSegment], tokenized: Iterator[list[str]]) -> list[SpeechSegment]:
     """Tokenize within quote-aware speaker spans instead of across them."""
-
-    segments, ending_quote_state = split_speech_segments(text, quote_state)
     units: list[SpeechSegment] = []
     for segment in segments:
-        tokenized = _tokenize_text(segment.text) if segment.has_speech else []
-        if not tokenized:
+        sentences = next(tokenized) if segment.has_speech else []
+        if not sentences:
             if units:
                 previous = units[-1]
                 units[-1] = SpeechSegment(
@@ -80,16 +87,32 @@ def _tokenize_speech_units(
                     ends_quote=segment.ends_quote or previous.ends_quote,
                 )
             continue
-        for index, value in enumerate(tokenized):
+        for index, value in enumerate(sentences):
             units.append(
                 SpeechSegment(
                     text=value,
                     is_dialogue=segment.is_dialogue,
                     starts_quote=segment.starts_quote and index == 0,
-                    ends_quote=segment.ends_quote and index == len(tokenized) - 1,
+                    ends_quote=segment.ends_quote and index == len(sentences) - 1,
                 )
             )
-    return units, ending_quote_state
+    return units
+
+
+def _speech_units_for_texts(texts: list[str]) -> list[list[SpeechSegment]]:
+    """Split consecutive text nodes into sentence units, carrying quote state across nodes.
+
+    Every node's speech segments are tokenized together in one spaCy batch.
+    """
+    node_segments = []
+    quote_state: str | None = None
+    for text in texts:
+        segments, quote_state = split_speech_segments(text, quote_state)
+        node_segments.append(segments)
+    tokenized = iter(
+        _tokenize_texts([segment.text for segments in node_segments for segment in segments if segment.has_speech])
+    )
+    return [_merge_speech_units(segments, tokenized) for segments in node_segments]
 
 
 def _span_for_sentence(span_id: str, text: str):
@@ -137,28 +160,22 @@ def _stable_sentence_id(chapter_key: str, text: str, occurrence: int) -> str:
 
 def _inject_spans_into_text_node(
     text_node: NavigableString,
+    speech_units: list[SpeechSegment],
     chapter_key: str,
     start_seq: int,
     occurrences: Counter[str],
     existing_ids: list[str] | None = None,
-    quote_state: str | None = None,
-) -> tuple[int, list[dict], str | None]:
+) -> tuple[int, list[dict]]:
     """Wrap one text node's sentences without disturbing surrounding markup.
 
     Returns (next_sequence_number, list_of_sentence_dicts).
     """
     sentences_data = []
     seq = start_seq
-
-    raw_text = str(text_node)
-    stripped = raw_text.strip()
-    if not stripped or _should_skip_text_node(text_node):
-        return seq, sentences_data, quote_state
-
-    speech_units, quote_state = _tokenize_speech_units(stripped, quote_state)
     if not speech_units:
-        return seq, sentences_data, quote_state
+        return seq, sentences_data
 
+    raw_text = str(text_node)
     leading_whitespace = raw_text[: len(raw_text) - len(raw_text.lstrip())]
     trailing_start = len(raw_text.rstrip())
     trailing_whitespace = raw_text[trailing_start:]
@@ -195,7 +212,32 @@ def _inject_spans_into_text_node(
         replacement_nodes.append(NavigableString(trailing_whitespace))
 
     _replace_text_node(text_node, replacement_nodes)
-    return seq, sentences_data, quote_state
+    return seq, sentences_data
+
+
+def _narratable_text_nodes(soup: BeautifulSoup) -> list[NavigableString]:
+    container = soup.body or soup
+    return [
+        text_node
+        for text_node in container.find_all(string=True)
+        if str(text_node).strip() and not _should_skip_text_node(text_node)
+    ]
+
+
+def _inject_chapter_spans(soup: BeautifulSoup, chapter_key: str, existing_ids: list[str] | None) -> list[dict]:
+    """Add stable sentence anchors to every narratable text node, in document order.
+
+    This preserves existing block and inline structure.
+    """
+    text_nodes = _narratable_text_nodes(soup)
+    speech_units = _speech_units_for_texts([str(text_node).strip() for text_node in text_nodes])
+    chapter_sentences: list[dict] = []
+    seq = 0
+    occurrences: Counter[str] = Counter()
+    for text_node, units in zip(text_nodes, speech_units, strict=True):
+        seq, new_sentences = _inject_spans_into_text_node(text_node, units, chapter_key, seq, occurrences, existing_ids)
+        chapter_sentences.extend(new_sentences)
+    return chapter_sentences
 
 
 def _source_content_hash(soup: BeautifulSoup) -> str:
@@ -245,101 +287,126 @@ def _chapter_title(
 
 
 def _sentence_texts(soup: BeautifulSoup) -> list[str]:
-    texts: list[str] = []
-    quote_state: str | None = None
-    container = soup.body or soup
-    for text_node in list(container.find_all(string=True)):
-        stripped = str(text_node).strip()
-        if stripped and not _should_skip_text_node(text_node):
-            units, quote_state = _tokenize_speech_units(stripped, quote_state)
-            texts.extend(unit.text for unit in units)
-    return texts
+    texts = [str(text_node).strip() for text_node in _narratable_text_nodes(soup)]
+    return [unit.text for units in _speech_units_for_texts(texts) for unit in units]
 
 
-def _chapter_artifact_paths(chapter: AudiobookChapter, sentences: list[AudiobookSentence]) -> set[Path]:
+def _chapter_artifact_paths(chapter: AudiobookChapter, sentence_audio_paths: Iterable[str | None]) -> set[Path]:
     paths: set[Path] = set()
     for relative_path in (
         chapter.audio_file_path,
         chapter.smil_file_path,
         chapter.reader_audio_file_path,
         chapter.reader_smil_file_path,
-        *(sentence.audio_file_path for sentence in sentences),
+        *sentence_audio_paths,
     ):
         if relative_path:
             path = (LIBRARY_PATH.parent / relative_path).resolve()
             if path.is_relative_to(LIBRARY_PATH.parent.resolve()):
-                paths.add(path)
+                paths.update(snippet_packs.pack_files(path) if snippet_packs.is_snippet_index(path) else (path,))
     return paths
 
 
-async def ingest_epub(book_id: int, db: AsyncSession) -> None:
-    """Diff the current EPUB into stable chapters and publish its text rendition."""
-    book: Book = await db.get(Book, book_id)
-    if book is None:
-        raise ValueError(f"Book {book_id} not found")
+@dataclass(frozen=True)
+class _KnownChapter:
+    """A chapter from the previous ingestion, as the EPUB worker needs to see it."""
 
-    epub_path = (LIBRARY_PATH.parent / book.current_path).resolve()
-    ingested_content_version = book.content_version or 1
-    logger.info("Ingesting EPUB for book %s from %s", book_id, epub_path)
+    id: int
+    href: str
+    content_hash: str | None
+    stable_chapter_key: str | None
+    sentence_ids: tuple[str, ...]
+    # Only loaded for chapters ingested before content hashes were recorded.
+    sentence_texts: tuple[str, ...] = ()
 
-    output_dir = LIBRARY_PATH.parent / "library" / "audiobooks" / str(book_id)
-    output_dir.mkdir(parents=True, exist_ok=True)
-    snippets_dir = output_dir / "snippets"
-    snippets_dir.mkdir(exist_ok=True)
 
-    with tempfile.NamedTemporaryFile(dir=output_dir, suffix=".source.epub", delete=False) as handle:
+@dataclass(frozen=True)
+class _IngestedChapter:
+    known_id: int | None
+    chapter_number: int
+    href: str
+    stable_chapter_key: str
+    content_hash: str
+    title: str
+    unchanged: bool
+    sentence_count: int
+    # New sentence rows; empty for unchanged chapters, whose rows are kept.
+    sentences: list[dict]
+
+
+def _spine_documents(ebook: epub.EpubBook) -> list:
+    items = []
+    for item_id, _linear in ebook.spine:
+        item = ebook.get_item_with_id(item_id)
+        if item and item.get_type() == ebooklib.ITEM_DOCUMENT and not isinstance(item, epub.EpubNav):
+            items.append(item)
+    return items
+
+
+def _previous_working_markup(working_path: Path) -> dict[str, bytes]:
+    """Span-injected chapter markup from the last working EPUB, by normalized href."""
+    try:
+        ebook = epub.read_epub(str(working_path))
+    except Exception:
+        return {}
+    return {
+        normalize_resource_href(item.get_name(), chapter_number): item.content
+        for chapter_number, item in enumerate(_spine_documents(ebook), start=1)
+    }
+
+
+def _has_sentence_spans(markup: bytes, sentence_ids: tuple[str, ...]) -> bool:
+    wanted = set(sentence_ids)
+    found = tuple(span_id for span_id in _SPAN_ID_RE.findall(markup.decode("utf-8", "replace")) if span_id in wanted)
+    return found == sentence_ids
+
+
+def _build_working_epub(
+    source_path: str,
+    working_path: str,
+    known_chapters: list[_KnownChapter],
+) -> list[_IngestedChapter]:
+    """Match spine documents to known chapters and write the span-injected working EPUB.
+
+    Runs in the EPUB process pool. Unchanged chapters reuse their markup from
+    the previous working EPUB when its sentence anchors still match, so only
+    new and edited chapters are tokenized.
+    """
+    working = Path(working_path)
+    with tempfile.NamedTemporaryFile(dir=working.parent, suffix=".source.epub", delete=False) as handle:
         source_snapshot = Path(handle.name)
     try:
-        shutil.copyfile(epub_path, source_snapshot)
+        shutil.copyfile(source_path, source_snapshot)
         ebook = epub.read_epub(str(source_snapshot))
     finally:
         source_snapshot.unlink(missing_ok=True)
+    previous_markup = _previous_working_markup(working)
     toc_titles = _toc_title_map(ebook.toc)
-    existing_chapters = await crud.audiobook.get_chapters_for_book(db, book_id)
-    existing_chapter_ids = {chapter.id for chapter in existing_chapters}
-    existing_sentences = {
-        chapter.id: await crud.audiobook.get_sentences_for_chapter(db, chapter.id) for chapter in existing_chapters
-    }
-    by_href = {
-        normalize_resource_href(chapter.source_href or chapter.content_file_name, chapter.chapter_number): chapter
-        for chapter in existing_chapters
-    }
-    by_hash: dict[str, list[AudiobookChapter]] = {}
-    for chapter in existing_chapters:
-        if chapter.source_content_hash:
-            by_hash.setdefault(chapter.source_content_hash, []).append(chapter)
-
-    # Collect spine items in order
-    spine_items = []
-    for item_id, _linear in ebook.spine:
-        item = ebook.get_item_with_id(item_id)
-        if item and item.get_type() == ebooklib.ITEM_DOCUMENT and not isinstance(item, epub.EpubNav):
-            spine_items.append(item)
-
-    all_chapter_records = []
+    by_href = {chapter.href: chapter for chapter in known_chapters}
+    by_hash: dict[str, list[_KnownChapter]] = {}
+    for chapter in known_chapters:
+        if chapter.content_hash:
+            by_hash.setdefault(chapter.content_hash, []).append(chapter)
+    used_keys = {chapter.stable_chapter_key for chapter in known_chapters if chapter.stable_chapter_key}
     matched_ids: set[int] = set()
-    used_keys = {chapter.stable_chapter_key for chapter in existing_chapters if chapter.stable_chapter_key}
-    changed_chapter_ids: set[int] = set()
-    new_chapter_count = 0
-    obsolete_paths: set[Path] = set()
 
-    for chapter_num, item in enumerate(spine_items, start=1):
-        content = item.get_content()
-        soup = BeautifulSoup(content, "html.parser")
+    ingested = []
+    for chapter_num, item in enumerate(_spine_documents(ebook), start=1):
+        soup = BeautifulSoup(item.get_content(), "html.parser")
         href = normalize_resource_href(item.get_name(), chapter_num)
         content_hash = _source_content_hash(soup)
-        sentence_texts = _sentence_texts(soup)
+        title = _chapter_title(item, soup, chapter_num, toc_titles)
 
-        chapter = by_href.get(href)
-        if chapter is not None and chapter.id in matched_ids:
-            chapter = None
-        if chapter is None:
-            chapter = next(
+        known = by_href.get(href)
+        if known is not None and known.id in matched_ids:
+            known = None
+        if known is None:
+            known = next(
                 (candidate for candidate in by_hash.get(content_hash, []) if candidate.id not in matched_ids),
                 None,
             )
 
-        if chapter is None:
+        if known is None:
             base_key = stable_chapter_key(href)
             key = base_key
             suffix = 2
@@ -347,112 +414,146 @@ async def ingest_epub(book_id: int, db: AsyncSession) -> None:
                 key = f"{base_key}-{suffix}"
                 suffix += 1
             used_keys.add(key)
-            chapter = AudiobookChapter(
-                book_id=book_id,
-                chapter_number=chapter_num,
-                content_file_name=href,
-                stable_chapter_key=key,
-                source_href=href,
-                source_content_hash=content_hash,
-                title=_chapter_title(item, soup, chapter_num, toc_titles),
-                spine_order=chapter_num - 1,
-                generation_state="pending",
-                needs_reassembly=True,
-            )
-            db.add(chapter)
-            await db.flush()
-            previous_sentences: list[AudiobookSentence] = []
             unchanged = False
-            new_chapter_count += 1
         else:
-            matched_ids.add(chapter.id)
-            previous_sentences = existing_sentences[chapter.id]
-            unchanged = chapter.source_content_hash == content_hash or (
-                chapter.source_content_hash is None
-                and [sentence.original_text for sentence in previous_sentences] == sentence_texts
-            )
-            if not unchanged:
-                changed_chapter_ids.add(chapter.id)
-
-        key = chapter.stable_chapter_key or stable_chapter_key(href)
-        existing_ids = [sentence.html_element_id for sentence in previous_sentences] if unchanged else None
-
-        chapter_sentences: list[dict] = []
-        seq = 0
-        occurrences: Counter[str] = Counter()
-        quote_state: str | None = None
-
-        # Process text nodes in document order. This preserves existing block and
-        # inline structure while adding stable sentence-level anchors.
-        container = soup.body or soup
-        for text_node in list(container.find_all(string=True)):
-            seq, new_sentences, quote_state = _inject_spans_into_text_node(
-                text_node,
-                key,
-                seq,
-                occurrences,
-                existing_ids,
-                quote_state,
+            matched_ids.add(known.id)
+            key = known.stable_chapter_key or stable_chapter_key(href)
+            unchanged = known.content_hash == content_hash or (
+                known.content_hash is None and list(known.sentence_texts) == _sentence_texts(soup)
             )
-            chapter_sentences.extend(new_sentences)
-
-        # Save modified XHTML back into the ebook item
-        item.set_content(str(soup).encode("utf-8"))
-        if not chapter_sentences:
-            if chapter.id not in existing_chapter_ids:
-                await db.delete(chapter)
-            continue
 
-        chapter.chapter_number = chapter_num
-        chapter.content_file_name = href
-        chapter.stable_chapter_key = key
-        chapter.source_href = href
-        chapter.source_content_hash = content_hash
-        chapter.title = _chapter_title(item, soup, chapter_num, toc_titles)
-        chapter.spine_order = chapter_num - 1
-
-        if not unchanged:
-            obsolete_paths.update(_chapter_artifact_paths(chapter, previous_sentences))
-            for sentence in previous_sentences:
-                await db.delete(sentence)
-            chapter.audio_file_path = None
-            chapter.smil_file_path = None
-            chapter.reader_audio_file_path = None
-            chapter.reader_smil_file_path = None
-            chapter.audio_size_bytes = None
-            chapter.audio_sha256 = None
-            chapter.smil_size_bytes = None
-            chapter.smil_sha256 = None
-            chapter.duration_ms = None
-            chapter.needs_reassembly = True
-            transition_state(
-                chapter,
-                "generation_state",
-                CHAPTER_GENERATION,
-                ChapterGenerationStatus.PENDING,
-                context=f"audiobook chapter {chapter.id}",
+        reusable = previous_markup.get(href) if unchanged else None
+        if reusable is not None and _has_sentence_spans(reusable, known.sentence_ids):
+            item.set_content(reusable)
+            sentence_count, sentences = len(known.sentence_ids), []
+        else:
+            existing_ids = list(known.sentence_ids) if unchanged else None
+            sentences = _inject_chapter_spans(soup, key, existing_ids)
+            item.set_content(str(soup).encode("utf-8"))
+            sentence_count = len(sentences)
+            if unchanged:
+                sentences = []
+        ingested.append(
+            _IngestedChapter(
+                known_id=known.id if known is not None else None,
+                chapter_number=chapter_num,
+                href=href,
+                stable_chapter_key=key,
+                content_hash=content_hash,
+                title=title,
+                unchanged=unchanged,
+                sentence_count=sentence_count,
+                sentences=sentences,
             )
-            chapter.summary = None
-            chapter.summary_updated_at = None
-            db.add_all([AudiobookSentence(chapter_id=chapter.id, **sentence) for sentence in chapter_sentences])
-        all_chapter_records.append((chapter, unchanged))
+        )
 
-    # Write modified EPUB to working copy
-    working_epub_path = output_dir / "working.epub"
     _ensure_toc_link_ids(ebook.toc)
-    with tempfile.NamedTemporaryFile(dir=output_dir, suffix=".epub", delete=False) as handle:
+    with tempfile.NamedTemporaryFile(dir=working.parent, suffix=".epub", delete=False) as handle:
         temporary_epub = Path(handle.name)
     try:
         epub.write_epub(str(temporary_epub), ebook)
-        temporary_epub.replace(working_epub_path)
+        temporary_epub.replace(working)
     finally:
         temporary_epub.unlink(missing_ok=True)
+    return ingested
+
+
+def _reset_chapter_audio(chapter: AudiobookChapter) -> None:
+    chapter.audio_file_path = None
+    chapter.smil_file_path = None
+    chapter.reader_audio_file_path = None
+    chapter.reader_smil_file_path = None
+    chapter.audio_size_bytes = None
+    chapter.audio_sha256 = None
+    chapter.smil_size_bytes = None
+    chapter.smil_sha256 = None
+    chapter.duration_ms = None
+    chapter.needs_reassembly = True
+    transition_state(
+        chapter,
+        "generation_state",
+        CHAPTER_GENERATION,
+        ChapterGenerationStatus.PENDING,
+        context=f"audiobook chapter {chapter.id}",
+    )
+    chapter.summary = None
+    chapter.summary_updated_at = None
+
+
+async def ingest_epub(book_id: int, db: AsyncSession) -> None:
+    """Diff the current EPUB into stable chapters and publish its text rendition."""
+    book: Book = await db.get(Book, book_id)
+    if book is None:
+        raise ValueError(f"Book {book_id} not found")
+
+    epub_path = (LIBRARY_PATH.parent / book.current_path).resolve()
+    ingested_content_version = book.content_version or 1
+    logger.info("Ingesting EPUB for book %s from %s", book_id, epub_path)
+
+    output_dir = LIBRARY_PATH.parent / "library" / "audiobooks" / str(book_id)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    snippets_dir = output_dir / "snippets"
+    snippets_dir.mkdir(exist_ok=True)
+    working_epub_path = output_dir / "working.epub"
+
+    existing_chapters = await crud.audiobook.get_chapters_for_book(db, book_id)
+    existing_by_id = {chapter.id: chapter for chapter in existing_chapters}
+    existing_sentences = await crud.audiobook.get_sentence_outlines_for_book(db, book_id)
+    known_chapters = [
+        _KnownChapter(
+            id=chapter.id,
+            href=normalize_resource_href(chapter.source_href or chapter.content_file_name, chapter.chapter_number),
+            content_hash=chapter.source_content_hash,
+            stable_chapter_key=chapter.stable_chapter_key,
+            sentence_ids=tuple(row.html_element_id for row in existing_sentences.get(chapter.id, ())),
+            sentence_texts=(
+                tuple(row.original_text for row in existing_sentences.get(chapter.id, ()))
+                if chapter.source_content_hash is None
+                else ()
+            ),
+        )
+        for chapter in existing_chapters
+    ]
+    ingested = await run_epub_transform(_build_working_epub, str(epub_path), str(working_epub_path), known_chapters)
     logger.info("Wrote span-injected EPUB to %s", working_epub_path)
 
-    retained_existing_ids = {chapter.id for chapter, _unchanged in all_chapter_records if chapter.id in existing_chapter_ids}
+    all_chapter_records = []
+    replaced_sentences: dict[AudiobookChapter, list[dict]] = {}
+    changed_chapter_ids: set[int] = set()
+    new_chapter_count = 0
+    obsolete_paths: set[Path] = set()
+    for result in ingested:
+        chapter = existing_by_id.get(result.known_id)
+        if chapter is not None and not result.unchanged:
+            changed_chapter_ids.add(chapter.id)
+        if not result.sentence_count:
+            continue
+        if chapter is None:
+            chapter = AudiobookChapter(book_id=book_id, generation_state="pending", needs_reassembly=True)
+            db.add(chapter)
+            new_chapter_count += 1
+        elif not result.unchanged:
+            obsolete_paths.update(
+                _chapter_artifact_paths(chapter, (row.audio_file_path for row in existing_sentences.get(chapter.id, ())))
+            )
+            _reset_chapter_audio(chapter)
+        chapter.chapter_number = result.chapter_number
+        chapter.content_file_name = result.href
+        chapter.stable_chapter_key = result.stable_chapter_key
+        chapter.source_href = result.href
+        chapter.source_content_hash = result.content_hash
+        chapter.title = result.title
+        chapter.spine_order = result.chapter_number - 1
+        if not result.unchanged:
+            replaced_sentences[chapter] = result.sentences
+        all_chapter_records.append((chapter, result.unchanged))
+
+    retained_existing_ids = {chapter.id for chapter, _unchanged in all_chapter_records if chapter.id in existing_by_id}
     removed_chapters = [chapter for chapter in existing_chapters if chapter.id not in retained_existing_ids]
     for chapter in removed_chapters:
-        obsolete_paths.update(_chapter_artifact_paths(chapter, existing_sentences[chapter.id]))
+        obsolete_paths.update(
+            _chapter_artifact_paths(chapter, (row.audio_file_path for row in existing_sentences.get(chapter.id, ())))
+        )
         await db.delete(chapter)
 
     persisted_chapters = len(all_chapter_records)
@@ -460,6 +561,13 @@ async def ingest_epub(book_id: int, db: AsyncSession) -> None:
         await db.rollback()
         raise RuntimeError(f"EPUB for book {book_id} contains no narratable text.")
 
+    await db.flush()
+    await crud.audiobook.replace_sentences_for_chapters(
+        db,
+        [chapter.id for chapter in (*replaced_sentences, *removed_chapters) if chapter.id in existing_by_id],
+        {chapter.id: sentences for chapter, sentences in replaced_sentences.items()},
+    )
+
     text_path, text_size, text_sha = stage_reader_text_rendition(
         book_id,
         ingested_content_version,
@@ -18,6 +18,7 @@ from .. import crud
 from ..models import AudiobookSettings, Book
 from .audiobook_text import quote_group_ids, quote_groups
 from .endpoint_pool import RoutedResult, route_request
+from .http_clients import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -382,35 +383,35 @@ async def _call_llm_endpoint(
             "keep_alive": "30m",
         }
         timeout = httpx.Timeout(600.0, connect=10.0)
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            if progress_callback is not None:
-                chunks: list[str] = []
-                received_chars = 0
-                last_reported_chars = 0
-                async with client.stream("POST", url, json=payload, headers=headers) as resp:
-                    if resp.is_error:
-                        await resp.aread()
-                        resp.raise_for_status()
-                    async for line in resp.aiter_lines():
-                        if not line:
-                            continue
-                        try:
-                            event = json.loads(line)
-                        except json.JSONDecodeError:
-                            logger.warning("Ignoring malformed Ollama stream event: %s", line[:200])
-                            continue
-                        content = event.get("message", {}).get("content") or ""
-                        if content:
-                            chunks.append(content)
-                            received_chars += len(content)
-                        if received_chars - last_reported_chars >= 1024 or event.get("done"):
-                            await progress_callback(received_chars)
-                            last_reported_chars = received_chars
-                return "".join(chunks)
-            resp = await client.post(url, json=payload, headers=headers)
-            if resp.is_error:
-                resp.raise_for_status()
-            data = resp.json()
+        client = get_http_client(url)
+        if progress_callback is not None:
+            chunks: list[str] = []
+            received_chars = 0
+            last_reported_chars = 0
+            async with client.stream("POST", url, json=payload, headers=headers, timeout=timeout) as resp:
+                if resp.is_error:
+                    await resp.aread()
+                    resp.raise_for_status()
+                async for line in resp.aiter_lines():
+                    if not line:
+                        continue
+                    try:
+                        event = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning("Ignoring malformed Ollama stream event: %s", line[:200])
+                        continue
+                    content = event.get("message", {}).get("content") or ""
+                    if content:
+                        chunks.append(content)
+                        received_chars += len(content)
+                    if received_chars - last_reported_chars >= 1024 or event.get("done"):
+                        await progress_callback(received_chars)
+                        last_reported_chars = received_chars
+            return "".join(chunks)
+        resp = await client.post(url, json=payload, headers=headers, timeout=timeout)
+        if resp.is_error:
+            resp.raise_for_status()
+        data = resp.json()
         return data["message"]["content"]
 
     if provider == "anthropic":
@@ -422,10 +423,9 @@ async def _call_llm_endpoint(
             "max_tokens": 4096,
             "messages": messages,
         }
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            resp = await client.post(url, json=payload, headers=headers)
-            resp.raise_for_status()
-            data = resp.json()
+        resp = await get_http_client(url).post(url, json=payload, headers=headers, timeout=120.0)
+        resp.raise_for_status()
+        data = resp.json()
         return data["content"][0]["text"]
 
     else:
@@ -444,10 +444,9 @@ async def _call_llm_endpoint(
                 "type": "json_schema",
                 "json_schema": {"name": "audiobook_analysis", "strict": True, "schema": response_schema},
             }
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            resp = await client.post(url, json=payload, headers=headers)
-            resp.raise_for_status()
-            data = resp.json()
+        resp = await get_http_client(url).post(url, json=payload, headers=headers, timeout=120.0)
+        resp.raise_for_status()
+        data = resp.json()
         return data["choices"][0]["message"]["content"]
 
 
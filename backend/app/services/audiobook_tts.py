@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Collection
+import io
 import logging
 import os
 from pathlib import Path
@@ -16,7 +18,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from .. import crud
 from ..config import LIBRARY_PATH
 from ..models import AudiobookChapter, AudiobookCharacter, AudiobookSentence, AudiobookSettings
+from . import snippet_packs
 from .audiobook_text import split_speech_segments
+from .endpoint_pool import dispatch_capacity
 from .tts_providers import (
     DEFAULT_VOICE_PROMPT,
     TTSRequest,
@@ -35,19 +39,35 @@ _LEADING_EXPRESSION_RE = re.compile(
 )
 
 
-def _snippet_path(book_id: int, sentence_id: int) -> Path:
-    return LIBRARY_PATH.parent / "library" / "audiobooks" / str(book_id) / "snippets" / f"{sentence_id}.mp3"
+def _snippet_index_path(book_id: int, chapter_id: int) -> Path:
+    return (
+        LIBRARY_PATH.parent
+        / "library"
+        / "audiobooks"
+        / str(book_id)
+        / "snippets"
+        / snippet_packs.chapter_index_name(chapter_id)
+    )
 
 
 def _relative_path(full_path: Path) -> str:
     return str(full_path.relative_to(LIBRARY_PATH.parent))
 
 
-def _get_mp3_duration_ms(path: Path) -> int:
+def _sentence_audio_exists(sentence: AudiobookSentence) -> bool:
+    if not sentence.audio_file_path:
+        return False
+    path = LIBRARY_PATH.parent / sentence.audio_file_path
+    if snippet_packs.is_snippet_index(path):
+        return snippet_packs.has_snippet(path, sentence.id)
+    return path.exists()
+
+
+def _get_mp3_duration_ms(audio_bytes: bytes) -> float:
     from mutagen.mp3 import MP3
 
-    audio = MP3(str(path))
-    return round(audio.info.length * 1000)
+    audio = MP3(io.BytesIO(audio_bytes))
+    return audio.info.length * 1000
 
 
 def _voice_id_for_provider(
@@ -94,14 +114,17 @@ async def _generate_sentence_clip(
     requests: list[TTSRequest] | None = None,
 ) -> None:
     requests = requests or await _build_sentence_requests(settings, sentence, db)
-    audio_parts = [await _synthesize_with_retries(settings, sentence.id, request) for request in requests]
-    audio_bytes = await _concatenate_mp3_parts(audio_parts, sentence.id)
-    await _persist_sentence_audio(
-        book_id,
-        sentence,
-        TTSResult(audio_bytes=audio_bytes),
-        db,
-    )
+    result = await _synthesize_sentence_parts(settings, sentence.id, requests)
+    await _persist_sentence_audio(book_id, sentence, result, db)
+
+
+async def _synthesize_sentence_parts(
+    settings: AudiobookSettings | None,
+    sentence_id: int,
+    requests: list[TTSRequest],
+) -> TTSResult:
+    audio_parts = [await _synthesize_with_retries(settings, sentence_id, request) for request in requests]
+    return TTSResult(audio_bytes=await _concatenate_mp3_parts(audio_parts, sentence_id))
 
 
 async def _build_sentence_request(
@@ -259,32 +282,37 @@ async def _synthesize_with_retries(
     return audio_bytes
 
 
-async def _persist_sentence_audio(
-    book_id: int,
-    sentence: AudiobookSentence,
-    result: TTSResult,
-    db: AsyncSession,
-) -> None:
-    out_path = _snippet_path(book_id, sentence.id)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_bytes(result.audio_bytes)
-    # Always inspect the artifact we actually wrote. Provider metadata is
+def _measure_sentence_audio(sentence_id: int, result: TTSResult) -> float:
+    # Always inspect the artifact we actually store. Provider metadata is
     # useful for transport, but accepting it without parsing could defer a
     # corrupt/empty MP3 failure until final chapter assembly.
-    duration_ms = _get_mp3_duration_ms(out_path)
+    duration_ms = _get_mp3_duration_ms(result.audio_bytes)
     if result.duration_ms and abs(result.duration_ms - duration_ms) > 1_000:
         logger.warning(
             "Sentence %s reported %d ms of audio but the MP3 contains %d ms.",
-            sentence.id,
+            sentence_id,
             result.duration_ms,
             duration_ms,
         )
-    await crud.audiobook.update_sentence_audio(
-        db,
-        sentence.id,
-        _relative_path(out_path),
-        duration_ms,
-    )
+    return duration_ms
+
+
+def _write_sentence_audio(book_id: int, sentence: AudiobookSentence, result: TTSResult) -> tuple[str, int]:
+    clips, failures = _write_sentence_clips(book_id, [sentence], {sentence.id: result})
+    if failures:
+        raise failures[sentence.id]
+    _sentence, audio_file_path, duration_ms = clips[0]
+    return audio_file_path, duration_ms
+
+
+async def _persist_sentence_audio(
+    book_id: int,
+    sentence: AudiobookSentence,
+    result: TTSResult,
+    db: AsyncSession,
+) -> None:
+    audio_file_path, duration_ms = _write_sentence_audio(book_id, sentence, result)
+    await crud.audiobook.update_sentence_audio(db, sentence.id, audio_file_path, duration_ms)
 
 
 async def _generate_sentence_clips(
@@ -297,18 +325,28 @@ async def _generate_sentence_clips(
     if not sentences:
         return {}
     request_groups = [await _build_sentence_requests(settings, sentence, db) for sentence in sentences]
+    outcomes = await _synthesize_sentence_clips(settings, sentences, request_groups)
+    return await _persist_sentence_clips(book_id, sentences, outcomes, db)
+
+
+async def _synthesize_sentence_clips(
+    settings: AudiobookSettings | None,
+    sentences: list[AudiobookSentence],
+    request_groups: list[list[TTSRequest]],
+) -> dict[int, TTSResult | Exception]:
+    """Synthesize prepared requests without touching the database session."""
+    outcomes: dict[int, TTSResult | Exception] = {}
     if (
         len(sentences) == 1
         or tts_provider_name(settings) != "omnivoice"
         or any(len(requests) > 1 for requests in request_groups)
     ):
-        failures = {}
         for sentence, requests in zip(sentences, request_groups, strict=True):
             try:
-                await _generate_sentence_clip(settings, book_id, sentence, db, requests)
+                outcomes[sentence.id] = await _synthesize_sentence_parts(settings, sentence.id, requests)
             except Exception as exc:
-                failures[sentence.id] = exc
-        return failures
+                outcomes[sentence.id] = exc
+        return outcomes
 
     requests = [group[0] for group in request_groups]
     results = None
@@ -340,23 +378,101 @@ async def _generate_sentence_clips(
             "TTS batch for %d sentences failed; retrying each sentence independently.",
             len(sentences),
         )
-        failures = {}
-        for sentence in sentences:
+        for sentence, group in zip(sentences, request_groups, strict=True):
             try:
-                await _generate_sentence_clip(settings, book_id, sentence, db)
+                outcomes[sentence.id] = await _synthesize_sentence_parts(settings, sentence.id, group)
             except Exception as exc:
-                failures[sentence.id] = exc
-        return failures
+                outcomes[sentence.id] = exc
+        return outcomes
 
-    failures = {}
     for sentence, result in zip(sentences, results, strict=True):
+        outcomes[sentence.id] = result
+    return outcomes
+
+
+def _write_sentence_clips(
+    book_id: int,
+    sentences: list[AudiobookSentence],
+    outcomes: dict[int, TTSResult | Exception],
+) -> tuple[list[tuple[AudiobookSentence, str, int]], dict[int, Exception]]:
+    """Append synthesized clips to their chapter packs and split out failures."""
+    measured: dict[int, list[tuple[AudiobookSentence, bytes, float]]] = {}
+    failures = {}
+    for sentence in sentences:
+        outcome = outcomes[sentence.id]
+        if isinstance(outcome, Exception):
+            failures[sentence.id] = outcome
+            continue
         try:
-            await _persist_sentence_audio(book_id, sentence, result, db)
+            duration_ms = _measure_sentence_audio(sentence.id, outcome)
         except Exception as exc:
             failures[sentence.id] = exc
+            continue
+        measured.setdefault(sentence.chapter_id, []).append((sentence, outcome.audio_bytes, duration_ms))
+
+    clips = []
+    for chapter_id, chapter_clips in measured.items():
+        index_path = _snippet_index_path(book_id, chapter_id)
+        try:
+            snippet_packs.append_snippets(
+                index_path,
+                [(sentence.id, audio_bytes, duration_ms) for sentence, audio_bytes, duration_ms in chapter_clips],
+            )
+        except Exception as exc:
+            failures.update({sentence.id: exc for sentence, _audio_bytes, _duration_ms in chapter_clips})
+            continue
+        clips.extend(
+            (sentence, _relative_path(index_path), round(duration_ms)) for sentence, _audio_bytes, duration_ms in chapter_clips
+        )
+    return clips, failures
+
+
+async def _persist_sentence_clips(
+    book_id: int,
+    sentences: list[AudiobookSentence],
+    outcomes: dict[int, TTSResult | Exception],
+    db: AsyncSession,
+) -> dict[int, Exception]:
+    clips, failures = await asyncio.to_thread(_write_sentence_clips, book_id, sentences, outcomes)
+    if clips:
+        await crud.audiobook.update_sentence_audio_batch(db, clips)
     return failures
 
 
+async def _synthesize_round(
+    settings: AudiobookSettings | None,
+    sentences: list[AudiobookSentence],
+    request_groups: list[list[TTSRequest]],
+) -> dict[int, TTSResult | Exception]:
+    """Issue one provider batch per ``TTS_BATCH_SIZE`` sentences concurrently."""
+    batches = [slice(index, index + TTS_BATCH_SIZE) for index in range(0, len(sentences), TTS_BATCH_SIZE)]
+    batch_outcomes = await asyncio.gather(
+        *(_synthesize_sentence_clips(settings, sentences[batch], request_groups[batch]) for batch in batches)
+    )
+    return {sentence_id: outcome for outcomes in batch_outcomes for sentence_id, outcome in outcomes.items()}
+
+
+async def _start_tts_round(
+    settings: AudiobookSettings | None,
+    book_id: int,
+    db: AsyncSession,
+    exclude_ids: Collection[int] = (),
+) -> tuple[list[AudiobookSentence], asyncio.Task[dict[int, TTSResult | Exception]]] | None:
+    """Prepare the next sentences with the session and synthesize them in the background."""
+    # Fetch enough sentences for one provider batch per free slot on every
+    # healthy TTS endpoint.
+    sentences = await crud.audiobook.get_sentences_ready_for_audio(
+        db,
+        book_id,
+        limit=TTS_BATCH_SIZE * dispatch_capacity(settings, "tts"),
+        exclude_ids=exclude_ids,
+    )
+    if not sentences:
+        return None
+    request_groups = [await _build_sentence_requests(settings, sentence, db) for sentence in sentences]
+    return sentences, asyncio.create_task(_synthesize_round(settings, sentences, request_groups))
+
+
 async def generate_audio_for_sentences(
     book_id: int,
     sentence_ids: list[int],
@@ -418,45 +534,57 @@ async def generate_audio_for_book(book_id: int, db: AsyncSession) -> None:
         total=total,
         detail=f"Preparing remaining speech ({processed:,} of {total:,} clips generated)",
     )
-    while True:
-        if await crud.audiobook.pause_book_pipeline_if_requested(db, book_id):
-            logger.info("Book %s paused during TTS generation.", book_id)
-            return
-
-        batch = await crud.audiobook.get_sentences_ready_for_audio(
-            db,
-            book_id,
-            limit=TTS_BATCH_SIZE,
-        )
-        if not batch:
-            break
-
-        failures = await _generate_sentence_clips(settings, book_id, batch, db)
-        for sentence in batch:
-            if error := failures.get(sentence.id):
+    # Pipeline rounds: the next round is prepared and synthesizing while the
+    # previous one is written to disk and recorded in a single transaction.
+    in_flight = None
+    try:
+        while True:
+            pause_requested, batch_limit = await crud.audiobook.get_book_pipeline_stop_request(db, book_id)
+            if in_flight is None and pause_requested:
+                if await crud.audiobook.pause_book_pipeline_if_requested(db, book_id):
+                    logger.info("Book %s paused during TTS generation.", book_id)
+                    return
+
+            # Only start the next round when the run will outlive the one in flight;
+            # a pause or an exhausted batch budget would throw its synthesis away.
+            queued = None
+            if in_flight is None or not (pause_requested or (batch_limit is not None and len(in_flight[0]) >= batch_limit)):
+                exclude_ids = [sentence.id for sentence in in_flight[0]] if in_flight else ()
+                queued = await _start_tts_round(settings, book_id, db, exclude_ids)
+            if in_flight is None:
+                if queued is None:
+                    break
+                in_flight = queued
+                continue
+
+            sentences, synthesis = in_flight
+            in_flight = queued
+            outcomes = await synthesis
+            clips, failures = await asyncio.to_thread(_write_sentence_clips, book_id, sentences, outcomes)
+            failed_sentences = [sentence for sentence in sentences if sentence.id in failures]
+            for sentence in failed_sentences:
                 logger.error(
                     "Unable to generate audio for sentence %s: %s",
                     sentence.id,
-                    error,
-                )
-                await crud.audiobook.mark_sentence_error(db, sentence.id)
-                failed += 1
-            else:
-                processed += 1
-                await crud.audiobook.update_book_pipeline_progress(
-                    db,
-                    book_id,
-                    current=processed,
-                    total=total,
-                    detail=f"Generated speech for {processed} of {total} sentences",
+                    failures[sentence.id],
                 )
-
-            # Flag chapter for reassembly if all its sentences are done
-            if await crud.audiobook.chapter_all_audio_generated(db, sentence.chapter_id):
-                await crud.audiobook.flag_chapter_for_reassembly(db, sentence.chapter_id)
-            if await crud.audiobook.consume_book_batch_limit(db, book_id):
-                logger.info("Book %s paused after one TTS sentence.", book_id)
+            failed += len(failed_sentences)
+            processed += len(clips)
+            await crud.audiobook.record_sentence_audio_batch(
+                db,
+                book_id,
+                clips,
+                failed_sentences,
+                current=processed,
+                total=total,
+                detail=f"Generated speech for {processed} of {total} sentences",
+            )
+            if await crud.audiobook.consume_book_batch_limit(db, book_id, units=len(sentences)):
+                logger.info("Book %s paused after one TTS batch.", book_id)
                 return
+    finally:
+        if in_flight is not None:
+            in_flight[1].cancel()
 
     if failed or await crud.audiobook.has_sentence_status(db, book_id, "error"):
         await crud.audiobook.set_book_pipeline_status(db, book_id, "error")
@@ -505,8 +633,7 @@ async def generate_audio_for_chapter_preview(
         detail=f"Generating manual preview for chapter {chapter.chapter_number}",
     )
     for sentence in sentences:
-        existing_path = LIBRARY_PATH.parent / sentence.audio_file_path if sentence.audio_file_path else None
-        if sentence.status == "audio_generated" and existing_path and existing_path.exists():
+        if sentence.status == "audio_generated" and _sentence_audio_exists(sentence):
             completed += 1
             continue
 
@@ -1,14 +1,30 @@
-"""Create, inspect, verify, and restore portable Story Manager backups."""
+"""Create, inspect, verify, and restore Story Manager backups.
+
+Backups are incremental snapshots. Every file is stored once in a
+content-addressed blob store keyed by its SHA-256, and each backup is a JSON
+manifest listing the blobs it references. A file whose size and modification
+time match the previous backup reuses its cached hash without being read, so
+a nightly backup only copies new or changed files. Append-only snippet packs
+and large files are stored as fixed-size chunks instead, so a pack that grew
+since the last backup adds only the chunks holding its new tail. Pruning
+deletes old manifests and then every blob no remaining manifest references.
+
+Snapshots download as the portable ``.story-manager.zip`` format, which older
+backups use too; both can be verified and restored.
+"""
 
 from __future__ import annotations
 
 import hashlib
 import json
 import os
+import re
 import shutil
 import subprocess
 import tempfile
 import zipfile
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path, PurePosixPath
 from typing import BinaryIO
@@ -18,10 +34,20 @@ from sqlalchemy.engine import URL, make_url
 
 BACKUP_FORMAT = "story-manager-backup"
 BACKUP_FORMAT_VERSION = 1
+SNAPSHOT_FORMAT_VERSION = 2
 MANIFEST_NAME = "manifest.json"
 DATABASE_DUMP_NAME = "database.dump"
 BACKUP_SUFFIX = ".story-manager.zip"
+SNAPSHOT_SUFFIX = ".story-manager.json"
+STORE_DIR_NAME = "store"
+FILE_INDEX_NAME = "file-index.json"
 _COPY_CHUNK_SIZE = 1024 * 1024
+# Files are stored in chunks of this size when they are append-only snippet
+# packs or larger than _CHUNKED_FILE_BYTES.
+_BLOB_CHUNK_SIZE = 1024 * 1024
+_CHUNKED_FILE_BYTES = 64 * 1024 * 1024
+_APPEND_ONLY_SUFFIXES = frozenset({".pack"})
+_SHA256_RE = re.compile(r"^[0-9a-f]{64}$")
 
 
 class BackupError(RuntimeError):
@@ -125,17 +151,6 @@ def _sha256_stream(source: BinaryIO) -> str:
     return digest.hexdigest()
 
 
-def _write_file(archive: zipfile.ZipFile, source: Path, archive_name: str) -> dict[str, object]:
-    digest = hashlib.sha256()
-    size = 0
-    with source.open("rb") as input_file, archive.open(archive_name, "w", force_zip64=True) as output_file:
-        while chunk := input_file.read(_COPY_CHUNK_SIZE):
-            output_file.write(chunk)
-            digest.update(chunk)
-            size += len(chunk)
-    return {"path": archive_name, "size_bytes": size, "sha256": digest.hexdigest()}
-
-
 def _library_files(library_path: Path) -> list[Path]:
     if not library_path.exists():
         return []
@@ -148,7 +163,125 @@ def _library_files(library_path: Path) -> list[Path]:
     return sorted(files, key=lambda item: item.relative_to(library_path).as_posix())
 
 
-def create_backup_archive(
+def _is_snapshot(path: Path) -> bool:
+    return path.name.endswith(SNAPSHOT_SUFFIX)
+
+
+def _blob_path(store: Path, sha256: str) -> Path:
+    return store / "blobs" / sha256[:2] / sha256
+
+
+def _has_blob(store: Path, sha256: str, size: int) -> bool:
+    blob = _blob_path(store, sha256)
+    return blob.is_file() and blob.stat().st_size == size
+
+
+def _entry_blobs(entry: dict[str, object]) -> list[tuple[str, int]]:
+    """Return the ``(sha256, size)`` blobs holding an entry's content, in order."""
+    chunks = entry.get("chunks")
+    if chunks is None:
+        return [(str(entry["sha256"]), int(entry["size_bytes"]))]
+    return [(str(chunk["sha256"]), int(chunk["size_bytes"])) for chunk in chunks]
+
+
+def _stores_in_chunks(source: Path, size: int) -> bool:
+    return source.suffix in _APPEND_ONLY_SUFFIXES or size > _CHUNKED_FILE_BYTES
+
+
+def _store_blob(store: Path, source: Path, staging_dir: Path, name: str) -> tuple[str, int, bool]:
+    """Copy ``source`` into the store under its SHA-256, returning ``(sha256, size, added)``.
+
+    New blobs are re-read and checked before they are renamed into place, so
+    the store never holds a blob whose name does not match its content.
+    """
+    staged = staging_dir / "blob"
+    digest = hashlib.sha256()
+    size = 0
+    with source.open("rb") as input_file, staged.open("wb") as output_file:
+        while chunk := input_file.read(_COPY_CHUNK_SIZE):
+            output_file.write(chunk)
+            digest.update(chunk)
+            size += len(chunk)
+        output_file.flush()
+        os.fsync(output_file.fileno())
+    sha256 = digest.hexdigest()
+    if _has_blob(store, sha256, size):
+        staged.unlink()
+        return sha256, size, False
+    _publish_blob(store, staged, sha256, name)
+    return sha256, size, True
+
+
+def _publish_blob(store: Path, staged: Path, sha256: str, name: str) -> None:
+    with staged.open("rb") as written:
+        if _sha256_stream(written) != sha256:
+            raise BackupError(f"Backup checksum failed for {name}.")
+    os.chmod(staged, 0o600)
+    blob = _blob_path(store, sha256)
+    blob.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(staged, blob)
+
+
+def _store_chunks(store: Path, source: Path, staging_dir: Path, name: str) -> tuple[str, int, list[dict[str, object]], int]:
+    """Store ``source`` as fixed-size chunk blobs, returning ``(sha256, size, chunks, added_bytes)``.
+
+    Only chunks the store lacks are written, so an appended file adds just
+    the chunks that cover its new tail.
+    """
+    staged = staging_dir / "chunk"
+    digest = hashlib.sha256()
+    chunks: list[dict[str, object]] = []
+    size = added_bytes = 0
+    with source.open("rb") as input_file:
+        while data := input_file.read(_BLOB_CHUNK_SIZE):
+            digest.update(data)
+            size += len(data)
+            chunk_sha256 = hashlib.sha256(data).hexdigest()
+            chunks.append({"sha256": chunk_sha256, "size_bytes": len(data)})
+            if _has_blob(store, chunk_sha256, len(data)):
+                continue
+            with staged.open("wb") as output_file:
+                output_file.write(data)
+                output_file.flush()
+                os.fsync(output_file.fileno())
+            _publish_blob(store, staged, chunk_sha256, name)
+            added_bytes += len(data)
+    return digest.hexdigest(), size, chunks, added_bytes
+
+
+def _read_file_index(store: Path) -> dict[str, list]:
+    """Return ``{relative_path: [size, mtime_ns, sha256, chunks?]}`` from the previous backup."""
+    try:
+        index = json.loads((store / FILE_INDEX_NAME).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+        return {}
+    return index if isinstance(index, dict) else {}
+
+
+def _write_json_atomically(path: Path, payload: object, **dump_options) -> None:
+    temporary = path.with_name(f".{path.name}.tmp")
+    temporary.write_text(json.dumps(payload, **dump_options), encoding="utf-8")
+    os.chmod(temporary, 0o600)
+    os.replace(temporary, path)
+
+
+def _cached_entry(store: Path, cached: object, name: str, stat: os.stat_result) -> dict[str, object] | None:
+    """Rebuild a manifest entry from the previous backup's index if the file is unchanged and still stored."""
+    if not isinstance(cached, list) or len(cached) not in (3, 4) or cached[:2] != [stat.st_size, stat.st_mtime_ns]:
+        return None
+    entry: dict[str, object] = {"path": name, "size_bytes": stat.st_size, "sha256": cached[2]}
+    if len(cached) == 4:
+        entry["chunks"] = cached[3]
+    try:
+        _check_entry(entry)
+    except BackupError:
+        return None
+    if not all(_has_blob(store, sha256, size) for sha256, size in _entry_blobs(entry)):
+        return None
+    return entry
+
+
+def create_backup(
     *,
     database_url: str,
     library_path: Path,
@@ -156,46 +289,71 @@ def create_backup_archive(
     pg_dump_path: str | None = None,
     retention_count: int = 10,
 ) -> dict[str, object]:
-    """Create and verify an archive, publishing it atomically when complete."""
+    """Snapshot the database and library, storing only files the store lacks."""
     created_at = _utc_now()
     if backup_path.resolve().is_relative_to(library_path.resolve()):
         raise BackupError("The backup directory must be outside the library directory.")
-    backup_path.mkdir(parents=True, exist_ok=True)
-    filename = f"story-manager-{created_at.strftime('%Y%m%dT%H%M%SZ')}-{uuid4().hex[:8]}{BACKUP_SUFFIX}"
+    store = backup_path / STORE_DIR_NAME
+    store.mkdir(parents=True, exist_ok=True)
+    filename = f"story-manager-{created_at.strftime('%Y%m%dT%H%M%SZ')}-{uuid4().hex[:8]}{SNAPSHOT_SUFFIX}"
     destination = backup_path / filename
 
     with tempfile.TemporaryDirectory(prefix="story-manager-backup-", dir=backup_path) as temp_name:
         temp_dir = Path(temp_name)
         database_dump = temp_dir / DATABASE_DUMP_NAME
-        archive_path = temp_dir / filename
         _dump_database(database_url, database_dump, pg_dump_path)
 
+        previous_index = _read_file_index(store)
+        file_index: dict[str, list] = {}
         file_entries: list[dict[str, object]] = []
-        with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_STORED, allowZip64=True) as archive:
-            file_entries.append(_write_file(archive, database_dump, DATABASE_DUMP_NAME))
-            for source in _library_files(library_path):
-                relative = source.relative_to(library_path).as_posix()
-                file_entries.append(_write_file(archive, source, f"library/{relative}"))
-
-            library_entries = [entry for entry in file_entries if str(entry["path"]).startswith("library/")]
-            manifest = {
-                "format": BACKUP_FORMAT,
-                "format_version": BACKUP_FORMAT_VERSION,
-                "created_at": created_at.isoformat(),
-                "integrity": {"algorithm": "sha256", "verified_at_creation": True},
-                "database": {"path": DATABASE_DUMP_NAME, "format": "postgresql-custom"},
-                "library": {
-                    "path": "library/",
-                    "file_count": len(library_entries),
-                    "size_bytes": sum(int(entry["size_bytes"]) for entry in library_entries),
-                },
-                "files": file_entries,
-            }
-            archive.writestr(MANIFEST_NAME, json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8"))
-
-        verify_backup_archive(archive_path)
-        os.chmod(archive_path, 0o600)
-        os.replace(archive_path, destination)
+        added_count = added_bytes = 0
+
+        def add(source: Path, name: str) -> dict[str, object]:
+            nonlocal added_count, added_bytes
+            if _stores_in_chunks(source, source.stat().st_size):
+                sha256, size, chunks, new_bytes = _store_chunks(store, source, temp_dir, name)
+                entry = {"path": name, "size_bytes": size, "sha256": sha256, "chunks": chunks}
+                added = new_bytes > 0
+            else:
+                sha256, size, added = _store_blob(store, source, temp_dir, name)
+                entry = {"path": name, "size_bytes": size, "sha256": sha256}
+                new_bytes = size if added else 0
+            file_entries.append(entry)
+            if added:
+                added_count += 1
+                added_bytes += new_bytes
+            return entry
+
+        add(database_dump, DATABASE_DUMP_NAME)
+        for source in _library_files(library_path):
+            relative = source.relative_to(library_path).as_posix()
+            stat = source.stat()
+            entry = _cached_entry(store, previous_index.get(relative), f"library/{relative}", stat)
+            if entry is not None:
+                file_entries.append(entry)
+            else:
+                entry = add(source, f"library/{relative}")
+            file_index[relative] = [stat.st_size, stat.st_mtime_ns, entry["sha256"]]
+            if "chunks" in entry:
+                file_index[relative].append(entry["chunks"])
+
+        library_entries = [entry for entry in file_entries if str(entry["path"]).startswith("library/")]
+        manifest = {
+            "format": BACKUP_FORMAT,
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "created_at": created_at.isoformat(),
+            "integrity": {"algorithm": "sha256", "verified_at_creation": True},
+            "database": {"path": DATABASE_DUMP_NAME, "format": "postgresql-custom"},
+            "library": {
+                "path": "library/",
+                "file_count": len(library_entries),
+                "size_bytes": sum(int(entry["size_bytes"]) for entry in library_entries),
+            },
+            "storage": {"added_file_count": added_count, "added_size_bytes": added_bytes},
+            "files": file_entries,
+        }
+        _write_json_atomically(destination, manifest, indent=2, sort_keys=True)
+    _write_json_atomically(store / FILE_INDEX_NAME, file_index, separators=(",", ":"))
 
     prune_backups(backup_path, retention_count=retention_count)
     return backup_summary(destination)
@@ -206,6 +364,14 @@ def _safe_archive_name(name: str) -> bool:
     return bool(name) and not path.is_absolute() and ".." not in path.parts and "\\" not in name
 
 
+def _check_manifest(manifest: object, version: int) -> dict[str, object]:
+    if not isinstance(manifest, dict):
+        raise BackupError("Backup manifest is invalid.")
+    if manifest.get("format") != BACKUP_FORMAT or manifest.get("format_version") != version:
+        raise BackupError("This backup format is not supported by this Story Manager version.")
+    return manifest
+
+
 def _load_manifest(archive: zipfile.ZipFile) -> dict[str, object]:
     try:
         info = archive.getinfo(MANIFEST_NAME)
@@ -217,9 +383,60 @@ def _load_manifest(archive: zipfile.ZipFile) -> dict[str, object]:
         manifest = json.loads(archive.read(info))
     except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         raise BackupError("Backup manifest is invalid.") from exc
-    if manifest.get("format") != BACKUP_FORMAT or manifest.get("format_version") != BACKUP_FORMAT_VERSION:
-        raise BackupError("This backup format is not supported by this Story Manager version.")
-    return manifest
+    return _check_manifest(manifest, BACKUP_FORMAT_VERSION)
+
+
+def _load_snapshot_manifest(manifest_path: Path) -> dict[str, object]:
+    if not manifest_path.is_file():
+        raise BackupError(f"Backup manifest was not found: {manifest_path}")
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError, UnicodeDecodeError) as exc:
+        raise BackupError("Backup manifest is invalid.") from exc
+    return _check_manifest(manifest, SNAPSHOT_FORMAT_VERSION)
+
+
+def _valid_hash_and_size(sha256: object, size: object) -> bool:
+    return isinstance(sha256, str) and bool(_SHA256_RE.match(sha256)) and isinstance(size, int) and size >= 0
+
+
+def _check_entry(entry: dict[str, object]) -> str:
+    """Validate one file entry, including its chunk list if it has one, and return its path."""
+    name = entry.get("path")
+    if not isinstance(name, str) or not _safe_archive_name(name) or name == MANIFEST_NAME:
+        raise BackupError("Backup manifest contains an unsafe path.")
+    if not _valid_hash_and_size(entry.get("sha256"), entry.get("size_bytes")):
+        raise BackupError(f"Backup manifest metadata is invalid for {name}.")
+    chunks = entry.get("chunks")
+    if chunks is not None:
+        if (
+            not isinstance(chunks, list)
+            or not all(
+                isinstance(chunk, dict) and _valid_hash_and_size(chunk.get("sha256"), chunk.get("size_bytes"))
+                for chunk in chunks
+            )
+            or sum(chunk["size_bytes"] for chunk in chunks) != entry["size_bytes"]
+        ):
+            raise BackupError(f"Backup manifest metadata is invalid for {name}.")
+    return name
+
+
+def _manifest_entries(manifest: dict[str, object]) -> list[dict[str, object]]:
+    """Validate the declared file inventory shared by both backup formats."""
+    raw_entries = manifest.get("files")
+    if not isinstance(raw_entries, list):
+        raise BackupError("Backup manifest has no file inventory.")
+    names = set()
+    for entry in raw_entries:
+        if not isinstance(entry, dict):
+            raise BackupError("Backup manifest contains an invalid file entry.")
+        name = _check_entry(entry)
+        if name in names:
+            raise BackupError("Backup contains duplicate or unsafe paths.")
+        names.add(name)
+    if DATABASE_DUMP_NAME not in names:
+        raise BackupError("Backup database dump is missing.")
+    return raw_entries
 
 
 def verify_backup_archive(archive_path: Path) -> dict[str, object]:
@@ -235,47 +452,67 @@ def verify_backup_archive(archive_path: Path) -> dict[str, object]:
             if any(info.compress_type != zipfile.ZIP_STORED for info in infos):
                 raise BackupError("Backup uses an unsupported compression method.")
             manifest = _load_manifest(archive)
-            raw_entries = manifest.get("files")
-            if not isinstance(raw_entries, list):
-                raise BackupError("Backup manifest has no file inventory.")
 
             expected_names = {MANIFEST_NAME}
-            for entry in raw_entries:
-                if not isinstance(entry, dict):
-                    raise BackupError("Backup manifest contains an invalid file entry.")
-                name = entry.get("path")
-                size = entry.get("size_bytes")
-                expected_hash = entry.get("sha256")
-                if not isinstance(name, str) or not _safe_archive_name(name):
-                    raise BackupError("Backup manifest contains an unsafe path.")
-                if not isinstance(size, int) or size < 0 or not isinstance(expected_hash, str):
-                    raise BackupError(f"Backup manifest metadata is invalid for {name}.")
+            for entry in _manifest_entries(manifest):
+                name = str(entry["path"])
                 try:
                     info = archive.getinfo(name)
                 except KeyError as exc:
                     raise BackupError(f"Backup is missing {name}.") from exc
-                if info.file_size != size:
+                if info.file_size != entry["size_bytes"]:
                     raise BackupError(f"Backup size check failed for {name}.")
                 with archive.open(info, "r") as source:
                     actual_hash = _sha256_stream(source)
-                if actual_hash != expected_hash:
+                if actual_hash != entry["sha256"]:
                     raise BackupError(f"Backup checksum failed for {name}.")
                 expected_names.add(name)
             if set(names) != expected_names:
                 raise BackupError("Backup contains files that are not declared in its manifest.")
-            if DATABASE_DUMP_NAME not in expected_names:
-                raise BackupError("Backup database dump is missing.")
             return manifest
     except zipfile.BadZipFile as exc:
         raise BackupError("Backup archive is not a readable ZIP file.") from exc
 
 
+def verify_backup_snapshot(manifest_path: Path) -> dict[str, object]:
+    """Re-hash every stored blob a snapshot manifest references."""
+    manifest = _load_snapshot_manifest(manifest_path)
+    store = manifest_path.parent / STORE_DIR_NAME
+    for entry in _manifest_entries(manifest):
+        name = str(entry["path"])
+        file_digest = hashlib.sha256() if "chunks" in entry else None
+        for sha256, size in _entry_blobs(entry):
+            blob = _blob_path(store, sha256)
+            if not blob.is_file():
+                raise BackupError(f"Backup is missing {name}.")
+            if blob.stat().st_size != size:
+                raise BackupError(f"Backup size check failed for {name}.")
+            digest = hashlib.sha256()
+            with blob.open("rb") as source:
+                while data := source.read(_COPY_CHUNK_SIZE):
+                    digest.update(data)
+                    if file_digest is not None:
+                        file_digest.update(data)
+            if digest.hexdigest() != sha256:
+                raise BackupError(f"Backup checksum failed for {name}.")
+        if file_digest is not None and file_digest.hexdigest() != entry["sha256"]:
+            raise BackupError(f"Backup checksum failed for {name}.")
+    return manifest
+
+
+def verify_backup(path: Path) -> dict[str, object]:
+    if _is_snapshot(path):
+        return verify_backup_snapshot(path)
+    return verify_backup_archive(path)
+
+
 def backup_summary(archive_path: Path) -> dict[str, object]:
     stat = archive_path.stat()
     summary: dict[str, object] = {
         "filename": archive_path.name,
         "created_at": datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
         "size_bytes": stat.st_size,
+        "added_size_bytes": None,
         "library_file_count": 0,
         "library_size_bytes": 0,
         "valid_manifest": False,
@@ -284,8 +521,14 @@ def backup_summary(archive_path: Path) -> dict[str, object]:
         "download_url": f"/api/backups/{archive_path.name}/download",
     }
     try:
-        with zipfile.ZipFile(archive_path, "r") as archive:
-            manifest = _load_manifest(archive)
+        if _is_snapshot(archive_path):
+            manifest = _load_snapshot_manifest(archive_path)
+            storage = manifest.get("storage") if isinstance(manifest.get("storage"), dict) else {}
+            summary["size_bytes"] = sum(int(entry["size_bytes"]) for entry in _manifest_entries(manifest))
+            summary["added_size_bytes"] = int(storage.get("added_size_bytes", 0))
+        else:
+            with zipfile.ZipFile(archive_path, "r") as archive:
+                manifest = _load_manifest(archive)
         library = manifest.get("library") if isinstance(manifest.get("library"), dict) else {}
         integrity = manifest.get("integrity") if isinstance(manifest.get("integrity"), dict) else {}
         created_at = datetime.fromisoformat(str(manifest["created_at"]))
@@ -305,30 +548,72 @@ def backup_summary(archive_path: Path) -> dict[str, object]:
     return summary
 
 
-def list_backups(backup_path: Path) -> list[dict[str, object]]:
+def _managed_backups(backup_path: Path) -> list[Path]:
     if not backup_path.exists():
         return []
-    archives = [item for item in backup_path.iterdir() if item.is_file() and item.name.endswith(BACKUP_SUFFIX)]
-    return sorted((backup_summary(item) for item in archives), key=lambda item: item["created_at"], reverse=True)
+    return [
+        item
+        for item in backup_path.iterdir()
+        if item.is_file() and (item.name.endswith(BACKUP_SUFFIX) or item.name.endswith(SNAPSHOT_SUFFIX))
+    ]
 
 
-def prune_backups(backup_path: Path, *, retention_count: int) -> list[Path]:
-    """Delete oldest managed archives beyond the configured count; zero keeps all."""
-    if retention_count <= 0 or not backup_path.exists():
-        return []
-    archives = sorted(
-        (item for item in backup_path.iterdir() if item.is_file() and item.name.endswith(BACKUP_SUFFIX)),
-        key=lambda item: (item.stat().st_mtime_ns, item.name),
+def list_backups(backup_path: Path) -> list[dict[str, object]]:
+    return sorted(
+        (backup_summary(item) for item in _managed_backups(backup_path)),
+        key=lambda item: item["created_at"],
         reverse=True,
     )
-    removed = archives[retention_count:]
-    for archive in removed:
-        archive.unlink()
+
+
+def collect_unreferenced_blobs(backup_path: Path) -> int:
+    """Delete stored blobs no snapshot manifest references; return how many.
+
+    Nothing is deleted while any manifest is unreadable, because its blobs
+    cannot be told apart from garbage.
+    """
+    store = backup_path / STORE_DIR_NAME
+    if not (store / "blobs").is_dir():
+        return 0
+    referenced = set()
+    for manifest_path in _managed_backups(backup_path):
+        if not _is_snapshot(manifest_path):
+            continue
+        try:
+            manifest = _load_snapshot_manifest(manifest_path)
+            referenced.update(sha256 for entry in _manifest_entries(manifest) for sha256, _size in _entry_blobs(entry))
+        except BackupError:
+            return 0
+    removed = 0
+    for blob in (store / "blobs").glob("*/*"):
+        if blob.name not in referenced:
+            blob.unlink()
+            removed += 1
+    return removed
+
+
+def prune_backups(backup_path: Path, *, retention_count: int) -> list[Path]:
+    """Delete oldest managed backups beyond the configured count; zero keeps all.
+
+    Blobs left unreferenced by the remaining snapshots, including those of
+    manually deleted snapshots, are collected afterwards.
+    """
+    removed: list[Path] = []
+    if retention_count > 0:
+        backups = sorted(
+            _managed_backups(backup_path),
+            key=lambda item: (item.stat().st_mtime_ns, item.name),
+            reverse=True,
+        )
+        removed = backups[retention_count:]
+        for backup in removed:
+            backup.unlink()
+    collect_unreferenced_blobs(backup_path)
     return removed
 
 
 def resolve_backup(backup_path: Path, filename: str) -> Path:
-    if Path(filename).name != filename or not filename.endswith(BACKUP_SUFFIX):
+    if Path(filename).name != filename or not (filename.endswith(BACKUP_SUFFIX) or filename.endswith(SNAPSHOT_SUFFIX)):
         raise BackupError("Invalid backup filename.")
     resolved_root = backup_path.resolve()
     candidate = (resolved_root / filename).resolve()
@@ -337,6 +622,75 @@ def resolve_backup(backup_path: Path, filename: str) -> Path:
     return candidate
 
 
+def portable_archive_name(path: Path) -> str:
+    if _is_snapshot(path):
+        return f"{path.name[: -len(SNAPSHOT_SUFFIX)]}{BACKUP_SUFFIX}"
+    return path.name
+
+
+class _StreamBuffer:
+    """A write-only sink that lets ``zipfile`` stream an archive in pieces."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        return None
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _iter_stored_entry(store: Path, entry: dict[str, object]) -> Iterator[bytes]:
+    """Yield an entry's content from the blob store, joining its chunks in order."""
+    for sha256, _size in _entry_blobs(entry):
+        with _blob_path(store, sha256).open("rb") as source:
+            while data := source.read(_COPY_CHUNK_SIZE):
+                yield data
+
+
+def iter_backup_archive(manifest_path: Path) -> Iterator[bytes]:
+    """Stream a snapshot as a portable ZIP that ``verify`` and ``restore`` accept."""
+    manifest = _load_snapshot_manifest(manifest_path)
+    entries = _manifest_entries(manifest)
+    store = manifest_path.parent / STORE_DIR_NAME
+    portable = {key: value for key, value in manifest.items() if key != "storage"}
+    portable["format_version"] = BACKUP_FORMAT_VERSION
+    portable["files"] = [{key: value for key, value in entry.items() if key != "chunks"} for entry in entries]
+    buffer = _StreamBuffer()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED, allowZip64=True) as archive:
+        for entry in entries:
+            with archive.open(str(entry["path"]), "w", force_zip64=True) as output:
+                for data in _iter_stored_entry(store, entry):
+                    output.write(data)
+                    yield buffer.drain()
+            yield buffer.drain()
+        archive.writestr(MANIFEST_NAME, json.dumps(portable, indent=2, sort_keys=True).encode("utf-8"))
+    yield buffer.drain()
+
+
+def _iter_archive_entry(archive: zipfile.ZipFile, entry: dict[str, object]) -> Iterator[bytes]:
+    with archive.open(str(entry["path"])) as source:
+        while data := source.read(_COPY_CHUNK_SIZE):
+            yield data
+
+
+@contextmanager
+def _backup_reader(path: Path) -> Iterator[Callable[[dict[str, object]], Iterator[bytes]]]:
+    if _is_snapshot(path):
+        store = path.parent / STORE_DIR_NAME
+        yield lambda entry: _iter_stored_entry(store, entry)
+        return
+    with zipfile.ZipFile(path, "r") as archive:
+        yield lambda entry: _iter_archive_entry(archive, entry)
+
+
 def restore_backup_archive(
     *,
     archive_path: Path,
@@ -344,8 +698,8 @@ def restore_backup_archive(
     library_path: Path,
     pg_restore_path: str | None = None,
 ) -> None:
-    """Restore verified files and the database, rolling files back if PostgreSQL fails."""
-    manifest = verify_backup_archive(archive_path)
+    """Restore a verified archive or snapshot, rolling files back if PostgreSQL fails."""
+    manifest = verify_backup(archive_path)
     url, env = _postgres_connection(database_url)
     executable = _find_postgres_tool("pg_restore", pg_restore_path or os.getenv("STORY_MANAGER_PG_RESTORE_PATH"))
     library_path.mkdir(parents=True, exist_ok=True)
@@ -359,7 +713,7 @@ def restore_backup_archive(
         previous_library = temp_dir / "previous-library"
         previous_library.mkdir()
         database_dump = temp_dir / DATABASE_DUMP_NAME
-        with zipfile.ZipFile(archive_path, "r") as archive:
+        with _backup_reader(archive_path) as read_entry:
             for entry in manifest["files"]:
                 name = str(entry["path"])
                 if name == DATABASE_DUMP_NAME:
@@ -369,8 +723,9 @@ def restore_backup_archive(
                 else:
                     raise BackupError(f"Backup contains an unsupported entry: {name}")
                 destination.parent.mkdir(parents=True, exist_ok=True)
-                with archive.open(name) as source, destination.open("wb") as output:
-                    shutil.copyfileobj(source, output, length=_COPY_CHUNK_SIZE)
+                with destination.open("wb") as output:
+                    for data in read_entry(entry):
+                        output.write(data)
 
         previous_entries = [entry for entry in library_path.iterdir() if entry != temp_dir]
         restored_entries: list[Path] = []
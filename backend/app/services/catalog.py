@@ -1,4 +1,4 @@
-"""Paginated catalog serialization helpers for the library views."""
+"""Paginated catalog serialization helpers for the library views and reader feeds."""
 
 from __future__ import annotations
 
@@ -224,3 +224,82 @@ async def build_book_catalog_page(
         total_count=total_count,
         facets=schemas.BookCatalogFacets.model_validate(facets),
     )
+
+
+def _reader_feed_position(book: models.Book, feed: str) -> list:
+    title = book.title or ""
+    primary = book.content_updated_at if feed == "updates" else title
+    return [primary, title, book.id]
+
+
+async def build_reader_feed_page(
+    db: AsyncSession,
+    *,
+    feed: str,
+    limit: int,
+    cursor: str | None = None,
+    since: datetime | None = None,
+    offset: int = 0,
+) -> tuple[list[models.Book], str | None]:
+    """Return one keyset page of a reader feed and the cursor for the page after it.
+
+    Cursors carry the same snapshot id and parameter signature as catalog
+    cursors, so books added while a device pages through a feed wait for the
+    next sync instead of shifting later pages. ``offset`` serves legacy
+    page-number requests without a cursor; the returned cursor continues by keyset.
+    """
+    signature = _cursor_signature(
+        {"feed": feed, "since": since.isoformat() if since else "", "limit": limit},
+    )
+    if cursor:
+        sort_by = "updated_at" if feed == "updates" else "title"
+        snapshot_max_id, position = _decode_cursor(cursor, signature=signature, sort_by=sort_by)
+    else:
+        snapshot_max_id = await crud.get_catalog_snapshot_max_id(db)
+        position = None
+
+    books, has_more = await crud.get_reader_feed_page(
+        db,
+        feed=feed,
+        limit=limit,
+        position=position,
+        snapshot_max_id=snapshot_max_id,
+        since=since,
+        offset=0 if cursor else offset,
+    )
+    next_cursor = None
+    if has_more and books:
+        next_cursor = _encode_cursor(
+            snapshot_max_id=snapshot_max_id,
+            position=_reader_feed_position(books[-1], feed),
+            signature=signature,
+        )
+    return books, next_cursor
+
+
+async def build_reader_search_page(
+    db: AsyncSession,
+    *,
+    q: str,
+    limit: int,
+    cursor: str | None = None,
+) -> tuple[list[models.Book], str | None]:
+    """Return one ranked page of reader search results and the cursor for the next page."""
+    signature = _cursor_signature({"feed": "search", "q": (q or "").strip().casefold(), "limit": limit})
+    if cursor:
+        snapshot_max_id, position = _decode_cursor(cursor, signature=signature, sort_by="rank")
+    else:
+        snapshot_max_id = await crud.get_catalog_snapshot_max_id(db)
+        position = None
+
+    books, has_more, last_position = await crud.search_reader_books(
+        db,
+        q,
+        limit=limit,
+        position=position,
+        snapshot_max_id=snapshot_max_id,
+    )
+    next_cursor = None
+    if has_more and books:
+        next_cursor = _encode_cursor(snapshot_max_id=snapshot_max_id, position=last_position, signature=signature)
+    return books, next_cursor
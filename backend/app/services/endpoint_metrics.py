@@ -2,17 +2,21 @@
 
 from __future__ import annotations
 
+import logging
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import and_, delete, func, literal_column, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from .. import config
 from ..database import SessionLocal
-from ..models import AiEndpointRequestMetric, AudiobookSettings
+from ..models import AiEndpointMetricRollup, AiEndpointRequestMetric, AudiobookSettings
 from .endpoint_pool import configured_endpoints
 
+logger = logging.getLogger(__name__)
+
 
 async def record_attempt(
     settings_id: int,
@@ -41,6 +45,35 @@ async def record_attempt(
         await db.commit()
 
 
+async def recent_success_latencies(settings_id: int, capability: str) -> dict[str, float]:
+    """Return each endpoint's average answered latency over the last 24 hours."""
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=24)
+    async with SessionLocal() as db:
+        rows = await db.execute(
+            select(AiEndpointRequestMetric.endpoint_id, func.avg(AiEndpointRequestMetric.duration_ms))
+            .where(
+                AiEndpointRequestMetric.settings_id == settings_id,
+                AiEndpointRequestMetric.capability == capability,
+                AiEndpointRequestMetric.success.is_(True),
+                AiEndpointRequestMetric.created_at >= cutoff,
+            )
+            .group_by(AiEndpointRequestMetric.endpoint_id)
+        )
+        return {endpoint_id: float(average) for endpoint_id, average in rows if average is not None}
+
+
+SPEED_BUCKETS = (
+    ("under_5s", None, 5_000),
+    ("from_5s_to_15s", 5_000, 15_000),
+    ("from_15s_to_60s", 15_000, 60_000),
+    ("over_60s", 60_000, None),
+)
+ROLLUP_BUCKET = timedelta(hours=1)
+
+_Metric = AiEndpointRequestMetric
+_Rollup = AiEndpointMetricRollup
+
+
 def _percentile(sorted_values: list[float], percentile: float) -> float | None:
     if not sorted_values:
         return None
@@ -55,71 +88,223 @@ def _rounded(value: float | None) -> float | None:
     return round(value, 1) if value is not None else None
 
 
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def _speed_bucket(lower: int | None, upper: int | None):
+    conditions = [_Metric.success.is_(True)]
+    if lower is not None:
+        conditions.append(_Metric.duration_ms >= lower)
+    if upper is not None:
+        conditions.append(_Metric.duration_ms < upper)
+    return and_(*conditions)
+
+
+def _filtered(aggregate, *conditions):
+    conditions = [condition for condition in conditions if condition is not None]
+    return aggregate.filter(and_(*conditions)) if conditions else aggregate
+
+
+def _attempt_aggregates(condition=None) -> list:
+    """Rollup-shaped aggregates over raw attempts, optionally limited by ``condition``."""
+    answered = _Metric.success.is_(True)
+    return [
+        _filtered(func.count(), condition).label("requests"),
+        _filtered(func.count(), condition, ~answered).label("failures"),
+        _filtered(func.sum(_Metric.duration_ms), condition, answered).label("answered_duration_sum_ms"),
+        _filtered(func.min(_Metric.duration_ms), condition, answered).label("fastest_ms"),
+        _filtered(func.max(_Metric.duration_ms), condition, answered).label("slowest_ms"),
+        *(_filtered(func.count(), condition, _speed_bucket(lower, upper)).label(name) for name, lower, upper in SPEED_BUCKETS),
+        _filtered(func.max(_Metric.created_at), condition, answered).label("last_answered_at"),
+    ]
+
+
+def _hour_bucket(db: AsyncSession):
+    if db.get_bind().dialect.name == "postgresql":
+        # A literal unit keeps the SELECT and GROUP BY expressions identical for PostgreSQL.
+        return func.date_trunc(literal_column("'hour'"), _Metric.created_at)
+    return func.strftime("%Y-%m-%d %H:00:00", _Metric.created_at)
+
+
+async def _rolled_until(db: AsyncSession) -> datetime | None:
+    """Return the end of the newest rolled-up hour; raw attempts from then on are not rolled up yet."""
+    latest = await db.scalar(select(func.max(_Rollup.bucket_start)))
+    return _as_utc(latest) + ROLLUP_BUCKET if latest is not None else None
+
+
+async def rollup_endpoint_metrics(db: AsyncSession, *, now: datetime | None = None) -> int:
+    """Fold every completed hour of raw attempts into hourly rollups and return the buckets written."""
+    current_hour = (now or datetime.now(timezone.utc)).replace(minute=0, second=0, microsecond=0)
+    rolled_until = await _rolled_until(db)
+    if rolled_until is not None and rolled_until >= current_hour:
+        return 0
+    conditions = [_Metric.created_at < current_hour]
+    if rolled_until is not None:
+        conditions.append(_Metric.created_at >= rolled_until)
+    bucket = _hour_bucket(db).label("bucket_start")
+    rows = (
+        await db.execute(
+            select(_Metric.settings_id, _Metric.capability, _Metric.endpoint_id, bucket, *_attempt_aggregates())
+            .where(*conditions)
+            .group_by(_Metric.settings_id, _Metric.capability, _Metric.endpoint_id, bucket)
+        )
+    ).all()
+    for row in rows:
+        bucket_start = row.bucket_start
+        if isinstance(bucket_start, str):
+            bucket_start = datetime.fromisoformat(bucket_start)
+        db.add(
+            _Rollup(
+                settings_id=row.settings_id,
+                capability=row.capability,
+                endpoint_id=row.endpoint_id,
+                bucket_start=_as_utc(bucket_start),
+                requests=row.requests,
+                failures=row.failures,
+                answered_duration_sum_ms=row.answered_duration_sum_ms or 0.0,
+                fastest_ms=row.fastest_ms,
+                slowest_ms=row.slowest_ms,
+                **{name: getattr(row, name) for name, _, _ in SPEED_BUCKETS},
+                last_answered_at=row.last_answered_at,
+            )
+        )
+    await db.commit()
+    return len(rows)
+
+
+async def prune_endpoint_metrics(db: AsyncSession, *, now: datetime | None = None) -> int:
+    """Delete raw attempts that are both rolled up and older than the retention window."""
+    rolled_until = await _rolled_until(db)
+    if rolled_until is None:
+        return 0
+    cutoff = min(rolled_until, (now or datetime.now(timezone.utc)) - timedelta(days=config.ENDPOINT_METRICS_RETENTION_DAYS))
+    result = await db.execute(delete(_Metric).where(_Metric.created_at < cutoff))
+    await db.commit()
+    return result.rowcount or 0
+
+
+async def run_endpoint_metrics_maintenance() -> None:
+    async with SessionLocal() as db:
+        buckets = await rollup_endpoint_metrics(db)
+        pruned = await prune_endpoint_metrics(db)
+    if buckets or pruned:
+        logger.info("Rolled up %s endpoint metric buckets and pruned %s raw attempts.", buckets, pruned)
+
+
+async def _rollup_totals(db: AsyncSession, settings_id: int, capability: str) -> dict[str, dict[str, Any]]:
+    rows = await db.execute(
+        select(
+            _Rollup.endpoint_id,
+            func.sum(_Rollup.requests).label("requests"),
+            func.sum(_Rollup.failures).label("failures"),
+            func.sum(_Rollup.answered_duration_sum_ms).label("answered_duration_sum_ms"),
+            func.min(_Rollup.fastest_ms).label("fastest_ms"),
+            func.max(_Rollup.slowest_ms).label("slowest_ms"),
+            *(func.sum(getattr(_Rollup, name)).label(name) for name, _, _ in SPEED_BUCKETS),
+            func.max(_Rollup.last_answered_at).label("last_answered_at"),
+        )
+        .where(_Rollup.settings_id == settings_id, _Rollup.capability == capability)
+        .group_by(_Rollup.endpoint_id)
+    )
+    return {row.endpoint_id: dict(row._mapping) for row in rows}
+
+
+async def _raw_totals(
+    db: AsyncSession,
+    settings_id: int,
+    capability: str,
+    rolled_until: datetime | None,
+) -> dict[str, dict[str, Any]]:
+    """Aggregate raw attempts newer than the rollups, plus the recent and percentile figures."""
+    postgres = db.get_bind().dialect.name == "postgresql"
+    answered = _Metric.success.is_(True)
+    recent = and_(answered, _Metric.created_at >= datetime.now(timezone.utc) - timedelta(hours=24))
+    columns = [
+        *_attempt_aggregates(_Metric.created_at >= rolled_until if rolled_until is not None else None),
+        func.count().filter(recent).label("answered_24h"),
+        func.avg(_Metric.duration_ms).filter(recent).label("average_24h_ms"),
+    ]
+    if postgres:
+        columns.extend(
+            func.percentile_cont(fraction).within_group(_Metric.duration_ms).filter(answered).label(label)
+            for label, fraction in (("p50_ms", 0.50), ("p95_ms", 0.95))
+        )
+    rows = await db.execute(
+        select(_Metric.endpoint_id, *columns)
+        .where(_Metric.settings_id == settings_id, _Metric.capability == capability)
+        .group_by(_Metric.endpoint_id)
+    )
+    totals = {row.endpoint_id: dict(row._mapping) for row in rows}
+    if not postgres:
+        durations = await db.execute(
+            select(_Metric.endpoint_id, _Metric.duration_ms)
+            .where(_Metric.settings_id == settings_id, _Metric.capability == capability, answered)
+            .order_by(_Metric.endpoint_id, _Metric.duration_ms)
+        )
+        by_endpoint: dict[str, list[float]] = defaultdict(list)
+        for endpoint_id, duration in durations:
+            by_endpoint[endpoint_id].append(float(duration))
+        for endpoint_id, values in by_endpoint.items():
+            totals[endpoint_id]["p50_ms"] = _percentile(values, 0.50)
+            totals[endpoint_id]["p95_ms"] = _percentile(values, 0.95)
+    return totals
+
+
+def _combined(values: list, pick):
+    present = [value for value in values if value is not None]
+    return pick(present) if present else None
+
+
 async def endpoint_summaries(
     db: AsyncSession,
     settings: AudiobookSettings | None,
     capability: str,
 ) -> list[dict[str, Any]]:
-    """Return all-time and recent comparison metrics for configured endpoints."""
+    """Return all-time and recent comparison metrics for configured endpoints.
+
+    All-time totals add the hourly rollups to raw attempts not rolled up yet,
+    so their cost does not grow with the attempt history. Percentiles cover the
+    raw attempts still retained, at most ``ENDPOINT_METRICS_RETENTION_DAYS``
+    once maintenance has run.
+    """
     endpoints = configured_endpoints(settings, capability) if settings is not None else []
-    rows: list[AiEndpointRequestMetric] = []
+    rollups: dict[str, dict[str, Any]] = {}
+    raw: dict[str, dict[str, Any]] = {}
     if settings is not None and settings.id is not None:
-        rows = list(
-            (
-                await db.scalars(
-                    select(AiEndpointRequestMetric)
-                    .where(
-                        AiEndpointRequestMetric.settings_id == settings.id,
-                        AiEndpointRequestMetric.capability == capability,
-                    )
-                    .order_by(AiEndpointRequestMetric.created_at.asc())
-                )
-            ).all()
-        )
-
-    by_endpoint: dict[str, list[AiEndpointRequestMetric]] = defaultdict(list)
-    for row in rows:
-        by_endpoint[row.endpoint_id].append(row)
+        rolled_until = await _rolled_until(db)
+        rollups = await _rollup_totals(db, settings.id, capability)
+        raw = await _raw_totals(db, settings.id, capability, rolled_until)
 
-    now = datetime.now(timezone.utc)
-    recent_cutoff = now - timedelta(hours=24)
     summaries = []
     for index, endpoint in enumerate(endpoints):
         endpoint_id = str(endpoint.get("id") or f"{capability}-{index + 1}")
-        attempts = by_endpoint.get(endpoint_id, [])
-        answered = [row for row in attempts if row.success]
-        durations = sorted(float(row.duration_ms) for row in answered)
-        recent = [
-            row
-            for row in answered
-            if row.created_at is not None
-            and (row.created_at if row.created_at.tzinfo else row.created_at.replace(tzinfo=timezone.utc)) >= recent_cutoff
-        ]
-        recent_durations = [float(row.duration_ms) for row in recent]
+        parts = [part for part in (rollups.get(endpoint_id), raw.get(endpoint_id)) if part is not None]
+        requests = sum(part["requests"] or 0 for part in parts)
+        failed = sum(part["failures"] or 0 for part in parts)
+        answered = requests - failed
+        duration_sum = sum(part["answered_duration_sum_ms"] or 0.0 for part in parts)
+        recent = raw.get(endpoint_id, {})
+        last_answered = _combined([part["last_answered_at"] for part in parts], max)
         summaries.append(
             {
                 "endpoint_id": endpoint_id,
                 "name": str(endpoint.get("name") or f"Endpoint {index + 1}"),
                 "provider": str(endpoint.get("provider") or "unknown"),
                 "model": endpoint.get("model"),
-                "requests": len(attempts),
-                "answered": len(answered),
-                "failed": len(attempts) - len(answered),
-                "success_rate": _rounded(100 * len(answered) / len(attempts)) if attempts else None,
-                "average_ms": _rounded(sum(durations) / len(durations)) if durations else None,
-                "p50_ms": _rounded(_percentile(durations, 0.50)),
-                "p95_ms": _rounded(_percentile(durations, 0.95)),
-                "fastest_ms": _rounded(durations[0]) if durations else None,
-                "slowest_ms": _rounded(durations[-1]) if durations else None,
-                "answered_24h": len(recent),
-                "average_24h_ms": _rounded(sum(recent_durations) / len(recent_durations)) if recent_durations else None,
-                "speed_buckets": {
-                    "under_5s": sum(duration < 5_000 for duration in durations),
-                    "from_5s_to_15s": sum(5_000 <= duration < 15_000 for duration in durations),
-                    "from_15s_to_60s": sum(15_000 <= duration < 60_000 for duration in durations),
-                    "over_60s": sum(duration >= 60_000 for duration in durations),
-                },
-                "last_answered_at": answered[-1].created_at if answered else None,
+                "requests": requests,
+                "answered": answered,
+                "failed": failed,
+                "success_rate": _rounded(100 * answered / requests) if requests else None,
+                "average_ms": _rounded(duration_sum / answered) if answered else None,
+                "p50_ms": _rounded(recent.get("p50_ms")),
+                "p95_ms": _rounded(recent.get("p95_ms")),
+                "fastest_ms": _rounded(_combined([part["fastest_ms"] for part in parts], min)),
+                "slowest_ms": _rounded(_combined([part["slowest_ms"] for part in parts], max)),
+                "answered_24h": recent.get("answered_24h") or 0,
+                "average_24h_ms": _rounded(recent.get("average_24h_ms")),
+                "speed_buckets": {name: sum(part[name] or 0 for part in parts) for name, _, _ in SPEED_BUCKETS},
+                "last_answered_at": _as_utc(last_answered) if last_answered is not None else None,
             }
         )
     return summaries
@@ -1,16 +1,20 @@
-"""Ordered AI endpoint pools with lightweight failure cooldowns."""
+"""Load-balanced AI endpoint pools with in-flight limits and failure cooldowns."""
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from dataclasses import dataclass
 from types import SimpleNamespace
 from typing import Any, Awaitable, Callable, Generic, TypeVar
 
+from .. import config
 from ..models import AudiobookSettings
 
 COOLDOWN_SECONDS = 60.0
+# Weight of the newest response time in each endpoint's latency estimate.
+LATENCY_SMOOTHING = 0.3
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +28,10 @@ class RoutedResult(Generic[T]):
 
 
 _cooldowns: dict[tuple[str, str], float] = {}
+_in_flight: dict[tuple[str, str], int] = {}
+_latency_ms: dict[tuple[str, str], float] = {}
+_history_loaded: set[tuple[int, str]] = set()
+_capacity_waiters: list[asyncio.Future[None]] = []
 
 
 def _legacy_endpoint(settings: AudiobookSettings, capability: str) -> dict[str, Any]:
@@ -90,30 +98,143 @@ def cooldown_remaining(capability: str, endpoint: dict[str, Any]) -> float:
     return max(0.0, remaining)
 
 
+def _cooling_down_error(capability: str, endpoints: list[dict[str, Any]]) -> RuntimeError:
+    wait_seconds = min(cooldown_remaining(capability, endpoint) for endpoint in endpoints)
+    return RuntimeError(
+        f"All {capability} endpoints are cooling down after failures; retry in {max(1, round(wait_seconds))} seconds."
+    )
+
+
+def _capacity_timeout_error(capability: str) -> RuntimeError:
+    return RuntimeError(
+        f"Timed out after {config.AI_ENDPOINT_WAIT_TIMEOUT_SECONDS:.0f} seconds waiting for a free {capability} "
+        "endpoint; every endpoint is still busy with earlier requests."
+    )
+
+
+def _select_endpoint(capability: str, candidates: list[dict[str, Any]]) -> dict[str, Any] | None:
+    """Pick the endpoint with the lowest expected wait that still has a free slot.
+
+    The expected wait is the smoothed response time multiplied by the queue the
+    request would join. Endpoints without measurements borrow the fastest known
+    estimate so new hosts are tried, and ties keep the configured priority.
+    """
+    known = [
+        _latency_ms[key] for key in (_endpoint_key(capability, endpoint) for endpoint in candidates) if key in _latency_ms
+    ]
+    baseline = min(known) if known else 1.0
+    selected = None
+    selected_score = 0.0
+    for endpoint in candidates:
+        key = _endpoint_key(capability, endpoint)
+        in_flight = _in_flight.get(key, 0)
+        if in_flight >= config.AI_ENDPOINT_MAX_IN_FLIGHT:
+            continue
+        score = (in_flight + 1) * _latency_ms.get(key, baseline)
+        if selected is None or score < selected_score:
+            selected, selected_score = endpoint, score
+    return selected
+
+
+async def _wait_for_capacity(capability: str, deadline: float) -> None:
+    """Wait until an endpoint releases a slot, failing once ``deadline`` passes."""
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise _capacity_timeout_error(capability)
+    waiter = asyncio.get_running_loop().create_future()
+    _capacity_waiters.append(waiter)
+    try:
+        await asyncio.wait_for(waiter, timeout=remaining)
+    except asyncio.TimeoutError:
+        raise _capacity_timeout_error(capability) from None
+    finally:
+        if waiter in _capacity_waiters:
+            _capacity_waiters.remove(waiter)
+
+
+def _release_endpoint(key: tuple[str, str]) -> None:
+    remaining = _in_flight.get(key, 0) - 1
+    if remaining > 0:
+        _in_flight[key] = remaining
+    else:
+        _in_flight.pop(key, None)
+    waiters = list(_capacity_waiters)
+    _capacity_waiters.clear()
+    for waiter in waiters:
+        if not waiter.done() and not waiter.get_loop().is_closed():
+            waiter.set_result(None)
+
+
+def _observe_latency(key: tuple[str, str], duration_ms: float) -> None:
+    previous = _latency_ms.get(key)
+    if previous is None:
+        _latency_ms[key] = duration_ms
+    else:
+        _latency_ms[key] = previous + LATENCY_SMOOTHING * (duration_ms - previous)
+
+
+async def _load_latency_history(settings: AudiobookSettings, capability: str) -> None:
+    """Seed latency estimates once per process from recorded endpoint metrics."""
+    if settings.id is None or (settings.id, capability) in _history_loaded:
+        return
+    _history_loaded.add((settings.id, capability))
+    try:
+        from .endpoint_metrics import recent_success_latencies
+
+        averages = await recent_success_latencies(settings.id, capability)
+    except Exception:
+        logger.exception("Failed to load %s endpoint latency history", capability.upper())
+        return
+    for endpoint in configured_endpoints(settings, capability):
+        average = averages.get(str(endpoint.get("id") or "unknown"))
+        if average is not None:
+            _latency_ms.setdefault(_endpoint_key(capability, endpoint), average)
+
+
 async def route_request(
     settings: AudiobookSettings,
     capability: str,
     attempt: Callable[[Any], Awaitable[T]],
 ) -> RoutedResult[T]:
-    """Try available endpoints in priority order and cool failed hosts down."""
+    """Send a request to the least-loaded healthy endpoint, failing over on errors.
+
+    Each endpoint serves at most ``AI_ENDPOINT_MAX_IN_FLIGHT`` routed requests
+    at once; callers wait for a free slot when every healthy endpoint is busy,
+    for at most ``AI_ENDPOINT_WAIT_TIMEOUT_SECONDS``.
+    """
     endpoints = configured_endpoints(settings, capability)
     if not endpoints:
         raise RuntimeError(f"No {capability} endpoints are configured in Audio & AI Configuration.")
 
-    available = [endpoint for endpoint in endpoints if cooldown_remaining(capability, endpoint) <= 0]
-    if not available:
-        wait_seconds = min(cooldown_remaining(capability, endpoint) for endpoint in endpoints)
-        raise RuntimeError(
-            f"All {capability} endpoints are cooling down after failures; retry in {max(1, round(wait_seconds))} seconds."
-        )
+    if all(cooldown_remaining(capability, endpoint) > 0 for endpoint in endpoints):
+        raise _cooling_down_error(capability, endpoints)
+    await _load_latency_history(settings, capability)
 
+    tried: set[tuple[str, str]] = set()
     last_error: Exception | None = None
-    for endpoint in available:
+    wait_deadline = time.monotonic() + config.AI_ENDPOINT_WAIT_TIMEOUT_SECONDS
+    while True:
+        candidates = [
+            endpoint
+            for endpoint in endpoints
+            if _endpoint_key(capability, endpoint) not in tried and cooldown_remaining(capability, endpoint) <= 0
+        ]
+        if not candidates:
+            break
+        endpoint = _select_endpoint(capability, candidates)
+        if endpoint is None:
+            await _wait_for_capacity(capability, wait_deadline)
+            continue
+
         key = _endpoint_key(capability, endpoint)
+        tried.add(key)
+        _in_flight[key] = _in_flight.get(key, 0) + 1
         started_at = time.perf_counter()
         try:
             value = await attempt(_endpoint_settings(settings, capability, endpoint))
         except Exception as exc:
+            _release_endpoint(key)
+            _cooldowns[key] = time.monotonic() + COOLDOWN_SECONDS
             await _record_endpoint_attempt(
                 settings,
                 capability,
@@ -122,7 +243,6 @@ async def route_request(
                 duration_ms=(time.perf_counter() - started_at) * 1000,
                 error_type=type(exc).__name__,
             )
-            _cooldowns[key] = time.monotonic() + COOLDOWN_SECONDS
             logger.warning(
                 "%s endpoint %r failed and will cool down for %.0f seconds: %s",
                 capability.upper(),
@@ -132,20 +252,34 @@ async def route_request(
             )
             last_error = exc
             continue
+        except BaseException:
+            _release_endpoint(key)
+            raise
+        duration_ms = (time.perf_counter() - started_at) * 1000
+        _release_endpoint(key)
+        _observe_latency(key, duration_ms)
         await _record_endpoint_attempt(
             settings,
             capability,
             endpoint,
             success=True,
-            duration_ms=(time.perf_counter() - started_at) * 1000,
+            duration_ms=duration_ms,
         )
         _cooldowns.pop(key, None)
         return RoutedResult(value=value, endpoint=endpoint)
 
-    assert last_error is not None
+    if last_error is None:
+        raise _cooling_down_error(capability, endpoints)
     raise last_error
 
 
+def dispatch_capacity(settings: AudiobookSettings | None, capability: str) -> int:
+    """Return how many routed requests the healthy endpoints can serve at once."""
+    endpoints = configured_endpoints(settings, capability)
+    healthy = [endpoint for endpoint in endpoints if cooldown_remaining(capability, endpoint) <= 0]
+    return max(1, len(healthy or endpoints) * config.AI_ENDPOINT_MAX_IN_FLIGHT)
+
+
 async def _record_endpoint_attempt(
     settings: AudiobookSettings,
     capability: str,
@@ -164,5 +298,9 @@ async def _record_endpoint_attempt(
 
 
 def reset_cooldowns() -> None:
-    """Clear process-local cooldown state (primarily useful for tests)."""
+    """Clear process-local routing state (primarily useful for tests)."""
     _cooldowns.clear()
+    _in_flight.clear()
+    _latency_ms.clear()
+    _history_loaded.clear()
+    _capacity_waiters.clear()
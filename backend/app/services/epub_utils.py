@@ -4,9 +4,13 @@ import copy
 import logging
 import posixpath
 import re
+import threading
 import zipfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from io import BytesIO
 from pathlib import Path, PurePosixPath
-from typing import Optional
+from typing import BinaryIO, Optional
 from urllib.parse import unquote
 
 import ebooklib
@@ -22,6 +26,16 @@ DC_NS = {
     **OPF_NS,
     "dc": "http://purl.org/dc/elements/1.1/",
 }
+CALIBRE_NAMESPACES = {"calibre", "http://calibre.kovidgoyal.net/2009/metadata"}
+XHTML_MEDIA_TYPE = "application/xhtml+xml"
+NON_TEXT_TAGS = {"script", "style", "template"}
+WORD_COUNT_CHUNK_BYTES = 64 * 1024
+# Word counts keyed by (CRC-32, uncompressed size) of a zip entry. Refreshes
+# count the same EPUB before and after download, and cleaning rewrites leave
+# most chapters byte-identical, so repeat counts are dictionary lookups.
+WORD_COUNT_CACHE_ENTRIES = 100_000
+_word_count_cache: OrderedDict[tuple[int, int], int] = OrderedDict()
+_word_count_cache_lock = threading.Lock()
 
 IMAGE_EXTENSIONS = {".gif", ".jpeg", ".jpg", ".png", ".svg", ".webp"}
 IMAGE_EXTENSION_BY_MEDIA_TYPE = {
@@ -329,16 +343,112 @@ def normalize_epub_prose_blocks(epub_path: Path) -> bool:
     return changed
 
 
+class _BodyWordCounter:
+    """lxml parser target counting whitespace-separated tokens in ``<body>`` text.
+
+    Mirrors ``BeautifulSoup.get_text().split()`` over the body: adjacent text
+    nodes join without a separator, and script/style/template text is skipped.
+    """
+
+    def __init__(self) -> None:
+        self.words = 0
+        self._body_depth = 0
+        self._skip_depth = 0
+        self._in_word = False
+
+    def start(self, tag: str, attrib) -> None:
+        if self._body_depth or tag == "body":
+            self._body_depth += 1
+            if self._skip_depth or tag in NON_TEXT_TAGS:
+                self._skip_depth += 1
+
+    def end(self, tag: str) -> None:
+        if self._body_depth:
+            self._body_depth -= 1
+            if self._skip_depth:
+                self._skip_depth -= 1
+
+    def data(self, text: str) -> None:
+        if not self._body_depth or self._skip_depth or not text:
+            return
+        tokens = len(text.split())
+        if tokens and self._in_word and not text[0].isspace():
+            tokens -= 1
+        self.words += tokens
+        self._in_word = not text[-1].isspace()
+
+    def close(self) -> int:
+        return self.words
+
+
+def count_xhtml_words(source: bytes | BinaryIO) -> int:
+    """Count body words in one XHTML document, streaming it through lxml in fixed-size chunks."""
+    if isinstance(source, (bytes, bytearray)):
+        source = BytesIO(source)
+    first_chunk = source.read(WORD_COUNT_CHUNK_BYTES)
+    if not first_chunk:
+        return 0
+    # EPUB content documents are UTF-8 unless they carry a UTF-16 byte-order mark.
+    encoding = None if first_chunk.startswith((b"\xff\xfe", b"\xfe\xff")) else "utf-8"
+    parser = etree.HTMLParser(target=_BodyWordCounter(), encoding=encoding)
+    chunk = first_chunk
+    while chunk:
+        parser.feed(chunk)
+        chunk = source.read(WORD_COUNT_CHUNK_BYTES)
+    return parser.close()
+
+
+def _count_archive_entry_words(archive: zipfile.ZipFile, path: str) -> int:
+    """Count an entry's words, reusing the result for byte-identical entries (same CRC and size)."""
+    info = archive.getinfo(path)
+    key = (info.CRC, info.file_size)
+    with _word_count_cache_lock:
+        cached = _word_count_cache.get(key)
+        if cached is not None:
+            _word_count_cache.move_to_end(key)
+            return cached
+    with archive.open(info) as entry:
+        words = count_xhtml_words(entry)
+    with _word_count_cache_lock:
+        _word_count_cache[key] = words
+        if len(_word_count_cache) > WORD_COUNT_CACHE_ENTRIES:
+            _word_count_cache.popitem(last=False)
+    return words
+
+
+def _xhtml_documents(archive: zipfile.ZipFile, rootfile_path: str, package: etree._Element) -> list[tuple[str, bool]]:
+    """Return (archive path, is navigation document) for every XHTML manifest item present in the archive."""
+    names = set(archive.namelist())
+    documents = []
+    for item in _manifest_items(package):
+        if item.get("media-type") != XHTML_MEDIA_TYPE:
+            continue
+        path = _resolve_epub_href(rootfile_path, item.get("href"))
+        if path is None or path not in names:
+            continue
+        documents.append((path, "nav" in (item.get("properties") or "").split()))
+    return documents
+
+
+def count_epub_words(epub_path: Path | str | BinaryIO, *, include_nav: bool = False) -> tuple[int, int]:
+    """Return (word count, XHTML document count) by streaming each document out of the zip.
+
+    Navigation documents count as chapters but their words are only included
+    with ``include_nav``. Raises on unreadable archives.
+    """
+    with zipfile.ZipFile(epub_path) as archive:
+        rootfile_path = _read_rootfile_path(archive)
+        if not rootfile_path:
+            raise ValueError("EPUB has no package document.")
+        package = etree.fromstring(archive.read(rootfile_path))
+        documents = _xhtml_documents(archive, rootfile_path, package)
+        word_count = sum(_count_archive_entry_words(archive, path) for path, is_nav in documents if include_nav or not is_nav)
+    return word_count, len(documents)
+
+
 def get_epub_word_and_chapter_count(epub_path: Path) -> tuple[int, int]:
     try:
-        book = epub.read_epub(epub_path)
-        chapters = list(book.get_items_of_type(ebooklib.ITEM_DOCUMENT))
-        word_count = 0
-        for chapter in chapters:
-            soup = BeautifulSoup(chapter.get_content(), "html.parser")
-            text = soup.get_text()
-            word_count += len(text.split())
-        return word_count, len(chapters)
+        return count_epub_words(epub_path, include_nav=True)
     except Exception as e:
         logger.error(f"Error reading epub file {epub_path}: {e}")
         return 0, 0
@@ -355,6 +465,15 @@ def _read_rootfile_path(archive: zipfile.ZipFile) -> Optional[str]:
     return rootfiles[0].get("full-path")
 
 
+def epub_package_dir(archive: zipfile.ZipFile) -> Optional[str]:
+    """Return the directory manifest hrefs are relative to, or None without a package document."""
+    try:
+        rootfile_path = _read_rootfile_path(archive)
+    except (KeyError, etree.XMLSyntaxError):
+        return None
+    return posixpath.dirname(rootfile_path) if rootfile_path else None
+
+
 def _resolve_epub_href(base_path: str, href: str | None) -> Optional[str]:
     if not href:
         return None
@@ -458,13 +577,20 @@ def _find_cover_image_path(
     return None
 
 
-def get_and_save_epub_cover(epub_path: Path, book_id: int) -> Optional[Path]:
-    """Extracts the cover image from an EPUB file and saves it to the covers directory."""
+def _save_cover_bytes(book_id: int, cover_path_in_epub: str, media_type: Optional[str], cover_data: bytes) -> Path:
     from ..config import LIBRARY_PATH
 
     covers_path = (LIBRARY_PATH / "covers").resolve()
     covers_path.mkdir(parents=True, exist_ok=True)
+    cover_extension = PurePosixPath(cover_path_in_epub).suffix or IMAGE_EXTENSION_BY_MEDIA_TYPE.get(media_type or "", ".jpg")
+    save_path = covers_path / f"{book_id}{cover_extension}"
+    with open(save_path, "wb") as f:
+        f.write(cover_data)
+    return save_path
 
+
+def get_and_save_epub_cover(epub_path: Path, book_id: int) -> Optional[Path]:
+    """Extracts the cover image from an EPUB file and saves it to the covers directory."""
     try:
         with zipfile.ZipFile(epub_path) as z:
             rootfile_path = _read_rootfile_path(z)
@@ -479,15 +605,7 @@ def get_and_save_epub_cover(epub_path: Path, book_id: int) -> Optional[Path]:
                 return None
 
             cover_path_in_epub, media_type = cover_match
-            cover_data = z.read(cover_path_in_epub)
-            cover_extension = PurePosixPath(cover_path_in_epub).suffix or IMAGE_EXTENSION_BY_MEDIA_TYPE.get(
-                media_type or "", ".jpg"
-            )
-            save_path = covers_path / f"{book_id}{cover_extension}"
-
-            with open(save_path, "wb") as f:
-                f.write(cover_data)
-            return save_path
+            return _save_cover_bytes(book_id, cover_path_in_epub, media_type, z.read(cover_path_in_epub))
     except Exception as e:
         logger.error(f"Error extracting cover from {epub_path}: {e}")
         return None
@@ -590,6 +708,17 @@ def _split_subject_tags(subject_tags: list[str]) -> dict[str, list[str]]:
     }
 
 
+def _tag_metadata_from_package(archive: zipfile.ZipFile, rootfile_path: str, package: etree._Element) -> dict[str, list[str]]:
+    title_page_tags = _extract_title_page_tag_metadata(archive, rootfile_path, package)
+    if title_page_tags["genre_tags"] or title_page_tags["source_tags"]:
+        return title_page_tags
+
+    subject_tags = _extract_subject_tags(package)
+    if _is_scribblehub_package(package):
+        return _split_subject_tags(subject_tags)
+    return {"genre_tags": subject_tags, "source_tags": []}
+
+
 def get_epub_tag_metadata(epub_path: Path) -> dict[str, list[str]]:
     """Return broad genres and source-specific tags from an EPUB."""
     try:
@@ -598,15 +727,7 @@ def get_epub_tag_metadata(epub_path: Path) -> dict[str, list[str]]:
             if not rootfile_path:
                 return {"genre_tags": [], "source_tags": []}
             package = etree.fromstring(z.read(rootfile_path))
-
-            title_page_tags = _extract_title_page_tag_metadata(z, rootfile_path, package)
-            if title_page_tags["genre_tags"] or title_page_tags["source_tags"]:
-                return title_page_tags
-
-            subject_tags = _extract_subject_tags(package)
-            if _is_scribblehub_package(package):
-                return _split_subject_tags(subject_tags)
-            return {"genre_tags": subject_tags, "source_tags": []}
+            return _tag_metadata_from_package(z, rootfile_path, package)
     except Exception as e:
         logger.warning(f"Error extracting genre tags from {epub_path}: {e}")
         return {"genre_tags": [], "source_tags": []}
@@ -620,3 +741,106 @@ def get_epub_genre_tags(epub_path: Path) -> list[str]:
 def get_epub_source_tags(epub_path: Path) -> list[str]:
     """Return source-site category/tag metadata from an EPUB."""
     return get_epub_tag_metadata(epub_path)["source_tags"]
+
+
+@dataclass(frozen=True)
+class EpubAnalysis:
+    """Everything ingestion needs from one EPUB, gathered while the archive is open once.
+
+    ``word_count`` skips navigation documents like ``epub_editor.get_word_count``;
+    ``chapter_count`` counts every XHTML document like
+    ``get_epub_word_and_chapter_count``. Both are zero when text was not read.
+    """
+
+    title: Optional[str]
+    author: Optional[str]
+    series: Optional[str]
+    source: Optional[str]
+    genre_tags: list[str]
+    source_tags: list[str]
+    word_count: int
+    chapter_count: int
+    cover_path: Optional[str] = None
+    cover_media_type: Optional[str] = None
+    cover_data: Optional[bytes] = None
+
+    @property
+    def source_url(self) -> Optional[str]:
+        """Return dc:source only when it is an HTTP(S) web-novel URL."""
+        if self.source and self.source.lower().startswith(("http://", "https://")):
+            return self.source
+        return None
+
+    def save_cover(self, book_id: int) -> Optional[Path]:
+        """Write the embedded cover captured during analysis to the covers directory."""
+        if self.cover_path is None or self.cover_data is None:
+            return None
+        try:
+            return _save_cover_bytes(book_id, self.cover_path, self.cover_media_type, self.cover_data)
+        except OSError as e:
+            logger.error(f"Error saving cover for book {book_id}: {e}")
+            return None
+
+
+def _package_dc_text(package: etree._Element, name: str) -> Optional[str]:
+    nodes = package.xpath(f"//opf:metadata/dc:{name}", namespaces=DC_NS)
+    return nodes[0].text if nodes else None
+
+
+def _package_calibre_value(package: etree._Element, name: str) -> Optional[str]:
+    metadata = package.find(f"{{{OPF_NS['opf']}}}metadata")
+    if metadata is None:
+        return None
+    for node in metadata:
+        if not isinstance(node.tag, str):
+            continue
+        qname = etree.QName(node)
+        if qname.namespace in CALIBRE_NAMESPACES and qname.localname == name:
+            return node.text
+        if qname.localname == "meta" and node.get("name") == f"calibre:{name}":
+            return node.text or node.get("content")
+    return None
+
+
+def analyze_epub(source: Path | str | BinaryIO, *, include_text: bool = True) -> EpubAnalysis:
+    """Read metadata, tags, cover, and word/chapter counts in a single pass.
+
+    Set ``include_text=False`` when only package metadata is needed (for
+    example, import previews); counts are then reported as zero. Raises
+    ``ValueError`` when the archive has no readable package document.
+    """
+    with zipfile.ZipFile(source) as archive:
+        rootfile_path = _read_rootfile_path(archive)
+        if not rootfile_path:
+            raise ValueError("EPUB has no package document.")
+        package = etree.fromstring(archive.read(rootfile_path))
+
+        word_count = 0
+        chapter_count = 0
+        if include_text:
+            documents = _xhtml_documents(archive, rootfile_path, package)
+            chapter_count = len(documents)
+            word_count = sum(_count_archive_entry_words(archive, path) for path, is_nav in documents if not is_nav)
+
+        cover_path = cover_media_type = None
+        cover_data = None
+        cover_match = _find_cover_image_path(archive, rootfile_path, package)
+        if cover_match:
+            cover_path, cover_media_type = cover_match
+            cover_data = archive.read(cover_path)
+
+        tags = _tag_metadata_from_package(archive, rootfile_path, package)
+
+    return EpubAnalysis(
+        title=_package_dc_text(package, "title"),
+        author=_package_dc_text(package, "creator"),
+        series=_package_calibre_value(package, "series"),
+        source=_package_dc_text(package, "source"),
+        genre_tags=tags["genre_tags"],
+        source_tags=tags["source_tags"],
+        word_count=word_count,
+        chapter_count=chapter_count,
+        cover_path=cover_path,
+        cover_media_type=cover_media_type,
+        cover_data=cover_data,
+    )
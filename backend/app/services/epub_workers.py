@@ -0,0 +1,79 @@
+"""Bounded process pool for CPU-bound EPUB transforms.
+
+BeautifulSoup parsing, selector matching and ebooklib serialisation hold the
+GIL for the whole book, so running them on the event loop (or even in a
+thread) stalls every request and queue worker. Transforms submitted here run in
+separate processes; callers pass module-level functions and picklable
+arguments, and get the result back as an awaitable.
+"""
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, TypeVar
+
+from .. import config
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def epub_worker_count() -> int:
+    """Return how many EPUB transforms may run at once."""
+    return max(1, config.EPUB_PROCESS_WORKERS)
+
+
+def _get_executor() -> Optional[ProcessPoolExecutor]:
+    global _executor
+    if config.EPUB_PROCESS_WORKERS <= 0:
+        return None
+    with _executor_lock:
+        if _executor is None:
+            # Spawned children never inherit the parent's event loop, DB pools or
+            # held locks, which a forked child of a threaded server could.
+            _executor = ProcessPoolExecutor(
+                max_workers=config.EPUB_PROCESS_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info("Started EPUB process pool with %s workers.", config.EPUB_PROCESS_WORKERS)
+        return _executor
+
+
+async def run_epub_transform(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run ``func(*args, **kwargs)`` in the EPUB process pool and await its result."""
+    call = functools.partial(func, *args, **kwargs)
+    executor = _get_executor()
+    if executor is None:
+        return await asyncio.to_thread(call)
+    try:
+        return await asyncio.get_running_loop().run_in_executor(executor, call)
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM-killed on a huge book). Drop the pool so the
+        # next transform starts a fresh one instead of failing forever.
+        _discard_executor(executor)
+        raise
+
+
+def _discard_executor(executor: ProcessPoolExecutor) -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_epub_workers() -> None:
+    """Stop the pool; queued transforms are cancelled and running ones finish."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,261 @@
+"""Banded, vectorized global alignment of two token sequences.
+
+Scores follow the fuzzy gap alignment used for audiobook sync: identical
+tokens earn 2.5, other substitutions ``2 * similarity - 1.25`` and every
+insertion or deletion -1.15, where similarity is ``difflib.SequenceMatcher``'s
+ratio. Similarities are computed once per unique token pair, in bulk, by a
+NumPy port of SequenceMatcher's longest-match recursion, and the dynamic
+program fills one row at a time with a running maximum for the horizontal
+moves. Scores are fixed-point integers so ties break exactly as in the
+row-major reference (diagonal, then up, then left).
+
+When the full matrix exceeds the cell budget, only a band around the
+corner-to-corner diagonal is filled, as wide as the budget allows.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from difflib import SequenceMatcher
+
+import numpy as np
+
+# Fixed-point scale for similarities and scores.
+SCALE = 10_000
+_MATCH = 25_000
+_GAP = -11_500
+_MISMATCH_OFFSET = -12_500
+_UNKNOWN = -1
+_NEGATIVE = np.iinfo(np.int64).min // 4
+# Narrowest band worth filling; anything tighter is unlikely to contain the path.
+MIN_BAND = 32
+# Pairs scored per vectorized batch, bounding the (pairs x chars x chars) work arrays.
+_PAIR_BATCH = 4096
+# Below these sizes, array setup costs more than scoring cells or pairs directly.
+_MIN_VECTOR_CELLS = 400
+_MIN_VECTOR_PAIRS = 64
+
+
+def _encode(tokens: Sequence[str]) -> tuple[np.ndarray, np.ndarray]:
+    lengths = np.fromiter((len(token) for token in tokens), dtype=np.int64, count=len(tokens))
+    codes = np.full((len(tokens), max(1, int(lengths.max(initial=1)))), -1, dtype=np.int32)
+    for index, token in enumerate(tokens):
+        codes[index, slice(len(token))] = [ord(character) for character in token]
+    return codes, lengths
+
+
+def _matching_characters(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """Total size of SequenceMatcher's matching blocks for each row pair.
+
+    ``left`` and ``right`` hold character codes padded with distinct negative
+    values, so padding never matches.
+    """
+    pairs, left_width = left.shape
+    right_width = right.shape[1]
+    equal = left[:, :, None] == right[:, None, :]
+    # Length of the common run ending at (i, j).
+    runs = np.zeros((pairs, left_width, right_width), dtype=np.int16)
+    runs[:, 0, :] = equal[:, 0, :]
+    for row in range(1, left_width):
+        runs[:, row, 0] = equal[:, row, 0]
+        runs[:, row, 1:] = (runs[:, row - 1, :-1] + 1) * equal[:, row, 1:]
+
+    rows = np.arange(left_width, dtype=np.int16)[None, :]
+    columns = np.arange(right_width, dtype=np.int16)[None, :]
+    matched = np.zeros(pairs, dtype=np.int64)
+    owner = np.arange(pairs)
+    # The first search covers whole tokens, where padding already scores zero.
+    flat = runs.reshape(pairs, -1)
+    a_low = np.zeros(pairs, dtype=np.int16)
+    a_high = np.full(pairs, left_width, dtype=np.int16)
+    b_low = np.zeros(pairs, dtype=np.int16)
+    b_high = np.full(pairs, right_width, dtype=np.int16)
+    while True:
+        # argmax keeps the first maximum: earliest end in ``left``, then in ``right``,
+        # which is the block SequenceMatcher.find_longest_match reports.
+        best = flat.argmax(axis=1)
+        size = flat[np.arange(owner.size), best].astype(np.int16)
+        found = size > 0
+        owner, best, size = owner[found], best[found], size[found]
+        a_low, a_high, b_low, b_high = a_low[found], a_high[found], b_low[found], b_high[found]
+        matched += np.bincount(owner, weights=size, minlength=pairs).astype(np.int64)
+
+        a_end, b_end = (best // right_width + 1).astype(np.int16), (best % right_width + 1).astype(np.int16)
+        a_start, b_start = a_end - size, b_end - size
+        before = (a_low < a_start) & (b_low < b_start)
+        after = (a_end < a_high) & (b_end < b_high)
+        owner = np.concatenate((owner[before], owner[after]))
+        if not owner.size:
+            break
+        a_low, a_high = np.concatenate((a_low[before], a_end[after])), np.concatenate((a_start[before], a_high[after]))
+        b_low, b_high = np.concatenate((b_low[before], b_end[after])), np.concatenate((b_start[before], b_high[after]))
+
+        # Later searches are confined to the unmatched ranges either side of a block,
+        # and a run entering a range only counts from the range start.
+        row_limit = np.where((rows >= a_low[:, None]) & (rows < a_high[:, None]), rows - a_low[:, None] + 1, 0).astype(
+            np.int16
+        )
+        column_limit = np.where(
+            (columns >= b_low[:, None]) & (columns < b_high[:, None]), columns - b_low[:, None] + 1, 0
+        ).astype(np.int16)
+        flat = np.minimum(runs[owner], np.minimum(row_limit[:, :, None], column_limit[:, None, :])).reshape(owner.size, -1)
+    return matched
+
+
+def _similarity(left: str, right: str) -> int:
+    matched = sum(block.size for block in SequenceMatcher(None, left, right, autojunk=False).get_matching_blocks())
+    return 2 * matched * SCALE // (len(left) + len(right))
+
+
+def pair_similarities(
+    left: Sequence[str],
+    right: Sequence[str],
+    left_ids: np.ndarray,
+    right_ids: np.ndarray,
+) -> np.ndarray:
+    """Fixed-point SequenceMatcher ratios, floored to ``1 / SCALE``, for the given id pairs."""
+    if left_ids.size < _MIN_VECTOR_PAIRS:
+        return np.fromiter(
+            (_similarity(left[a], right[b]) for a, b in zip(left_ids.tolist(), right_ids.tolist(), strict=True)),
+            dtype=np.int64,
+            count=left_ids.size,
+        )
+    left_codes, left_lengths = _encode(left)
+    right_codes, right_lengths = _encode(right)
+    right_codes[right_codes < 0] = -2
+    totals = left_lengths[left_ids] + right_lengths[right_ids]
+    matched = np.empty(left_ids.size, dtype=np.int64)
+    # Batch pairs of similar lengths together to keep the padding small.
+    order = np.lexsort((right_lengths[right_ids], left_lengths[left_ids]))
+    for start in range(0, order.size, _PAIR_BATCH):
+        batch = order[slice(start, start + _PAIR_BATCH)]
+        a, b = left_ids[batch], right_ids[batch]
+        left_width, right_width = int(left_lengths[a].max()), int(right_lengths[b].max())
+        matched[batch] = _matching_characters(
+            left_codes[a][:, :left_width],
+            right_codes[b][:, :right_width],
+        )
+    return (2 * matched * SCALE) // np.maximum(totals, 1)
+
+
+def _band(rows: int, columns: int, max_cells: int) -> tuple[np.ndarray, np.ndarray] | None:
+    """First and last column filled in each row, or None when no useful band fits."""
+    row_numbers = np.arange(rows + 1, dtype=np.int64)
+    if (rows + 1) * (columns + 1) <= max_cells:
+        return np.zeros(rows + 1, dtype=np.int64), np.full(rows + 1, columns, dtype=np.int64)
+    step = -(-columns // rows)
+    half_width = (max_cells // (rows + 1) - 1) // 2 - step - 1
+    if half_width < MIN_BAND:
+        return None
+    half_width += step
+    first = np.maximum(0, row_numbers * columns // rows - half_width)
+    last = np.minimum(columns, -(-row_numbers * columns // rows) + half_width)
+    return first, last
+
+
+def _traceback(traces: Sequence[Sequence[int]], first: Sequence[int], rows: int, columns: int) -> list[tuple[int, int]]:
+    pairs = []
+    row, column = rows, columns
+    while row or column:
+        direction = traces[row][column - first[row]]
+        if row and column and direction == 0:
+            pairs.append((row - 1, column - 1))
+            row -= 1
+            column -= 1
+        elif row and (not column or direction == 1):
+            row -= 1
+        else:
+            column -= 1
+    return pairs
+
+
+def _scalar_alignment(left: Sequence[str], right: Sequence[str]) -> list[tuple[int, int]]:
+    """The same dynamic program, cell by cell, for gaps too small to vectorize."""
+    columns = len(right)
+    prior = [column * _GAP for column in range(columns + 1)]
+    traces = [bytes([2]) * (columns + 1)]
+    for row, token in enumerate(left, start=1):
+        current = [row * _GAP] + [0] * columns
+        trace = bytearray(columns + 1)
+        trace[0] = 1
+        for column in range(1, columns + 1):
+            similarity = SCALE if token == right[column - 1] else _similarity(token, right[column - 1])
+            diagonal = prior[column - 1] + (_MATCH if similarity == SCALE else 2 * similarity + _MISMATCH_OFFSET)
+            up = prior[column] + _GAP
+            best = max(diagonal, up, current[column - 1] + _GAP)
+            current[column] = best
+            trace[column] = 0 if best == diagonal else (1 if best == up else 2)
+        traces.append(trace)
+        prior = current
+    return _traceback(traces, [0] * (len(left) + 1), len(left), columns)
+
+
+def banded_alignment(left: Sequence[str], right: Sequence[str], *, max_cells: int) -> list[tuple[int, int]] | None:
+    """Return the ``(left_index, right_index)`` substitutions on the best global alignment.
+
+    Pairs are listed from the end of both sequences backwards. Returns None
+    when even the narrowest band exceeds ``max_cells``.
+    """
+    rows, columns = len(left), len(right)
+    if not rows or not columns:
+        return []
+    if rows * columns <= _MIN_VECTOR_CELLS:
+        return _scalar_alignment(left, right)
+    band = _band(rows, columns, max_cells)
+    if band is None:
+        return None
+    first, last = band
+
+    left_vocabulary, left_ids = np.unique(np.array(left, dtype=str), return_inverse=True)
+    right_vocabulary, right_ids = np.unique(np.array(right, dtype=str), return_inverse=True)
+    left_ids, right_ids = left_ids.ravel(), right_ids.ravel()
+    right_count = len(right_vocabulary)
+    right_index = {token: index for index, token in enumerate(right_vocabulary.tolist())}
+    # The right vocabulary id of each left token, or -1 when it never occurs on the right.
+    counterpart = np.fromiter(
+        (right_index.get(token, -1) for token in left_vocabulary.tolist()), dtype=np.int64, count=len(left_vocabulary)
+    )
+
+    # Every (row, column) pair inside the band, as vocabulary pair codes.
+    widths = last - np.maximum(first, 1) + 1
+    widths[0] = 0
+    widths = np.maximum(widths, 0)
+    starts = np.repeat(np.maximum(first, 1) - np.cumsum(widths) + widths, widths)
+    cell_columns = np.arange(int(widths.sum()), dtype=np.int64) + starts
+    cell_rows = np.repeat(np.arange(rows + 1, dtype=np.int64), widths)
+    codes = left_ids[cell_rows - 1] * right_count + right_ids[cell_columns - 1]
+    unique_codes, cell_pairs = np.unique(codes, return_inverse=True)
+    pair_left, pair_right = unique_codes // right_count, unique_codes % right_count
+    similarity = np.full(unique_codes.size, _UNKNOWN, dtype=np.int64)
+    similarity[counterpart[pair_left] == pair_right] = SCALE
+    pending = similarity == _UNKNOWN
+    similarity[pending] = pair_similarities(
+        left_vocabulary.tolist(), right_vocabulary.tolist(), pair_left[pending], pair_right[pending]
+    )
+    pair_scores = np.where(similarity == SCALE, _MATCH, 2 * similarity + _MISMATCH_OFFSET)
+    cell_scores = pair_scores[cell_pairs.ravel()]
+    row_offsets = np.concatenate(([0], np.cumsum(widths)))
+
+    traces = []
+    previous = np.arange(last[0] + 1, dtype=np.int64) * _GAP
+    traces.append(np.full(last[0] + 1, 2, dtype=np.uint8))
+    for row in range(1, rows + 1):
+        low, high = int(first[row]), int(last[row])
+        prior_low, prior_high = int(first[row - 1]), int(last[row - 1])
+        width = high - low + 1
+        up = np.full(width, _NEGATIVE, dtype=np.int64)
+        reach = min(high, prior_high) - low + 1
+        up[:reach] = previous[slice(low - prior_low, low - prior_low + reach)] + _GAP
+        diagonal = np.full(width, _NEGATIVE, dtype=np.int64)
+        begin, end = max(low, prior_low + 1, 1), min(high, prior_high + 1)
+        if end >= begin:
+            scores = cell_scores[slice(row_offsets[row], row_offsets[row + 1])]
+            scores = scores[slice(begin - max(low, 1), end - max(low, 1) + 1)]
+            diagonal[slice(begin - low, end - low + 1)] = previous[slice(begin - 1 - prior_low, end - prior_low)] + scores
+        best = np.maximum(diagonal, up)
+        steps = np.arange(width, dtype=np.int64) * _GAP
+        current = np.maximum.accumulate(best - steps) + steps
+        traces.append(np.where(current == diagonal, 0, np.where(current == up, 1, 2)).astype(np.uint8))
+        previous = current
+
+    return _traceback(traces, first.tolist(), rows, columns)
@@ -0,0 +1,67 @@
+"""Long-lived, pooled HTTP clients for AI provider endpoints and metadata providers.
+
+Diarization, TTS and transcription make tens of thousands of calls per book
+against a handful of hosts, and a library-wide metadata sync makes thousands
+more against Open Library, Google Books and Amazon. Each endpoint origin (scheme, host and port) gets
+one ``httpx.AsyncClient`` whose connection pool keeps those connections alive
+between calls. HTTPS origins negotiate HTTP/2 when the optional ``h2`` package
+is installed. Callers pass their own per-request timeout.
+
+Clients are bound to the event loop that created them, so the registry is
+kept per loop; ``close_http_clients`` closes the current loop's clients during
+application shutdown.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import weakref
+from urllib.parse import urlsplit
+
+import httpx
+
+from .. import config
+
+logger = logging.getLogger(__name__)
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, httpx.AsyncClient]]" = weakref.WeakKeyDictionary()
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    if not parts.scheme or not parts.netloc:
+        raise ValueError(f"Endpoint URL must be absolute: {url!r}")
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def get_http_client(url: str) -> httpx.AsyncClient:
+    """Return the shared client for ``url``'s origin, creating it on first use."""
+    origin = _origin(url)
+    loop_clients = _clients.setdefault(asyncio.get_running_loop(), {})
+    client = loop_clients.get(origin)
+    if client is None or getattr(client, "is_closed", False):
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=config.AI_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=config.AI_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=config.AI_HTTP_KEEPALIVE_SECONDS,
+            ),
+            # httpx only speaks HTTP/2 over TLS; local plain-HTTP hosts keep HTTP/1.1.
+            http2=origin.startswith("https://") and _http2_available(),
+        )
+        loop_clients[origin] = client
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close every client created on the running loop."""
+    loop_clients = _clients.pop(asyncio.get_running_loop(), {})
+    for origin, client in loop_clients.items():
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning("Failed to close HTTP client for %s: %s", origin, e)
@@ -7,6 +7,7 @@ markup change, or HTTP failure cannot break the rest of metadata sync.
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field, replace
 import re
 from typing import Optional
@@ -14,8 +15,9 @@ from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
 
+from ...normalization import clean_isbn
 from .clients import amazon_base_url, request_amazon_html
-from .scoring import clean_isbn, infer_series_metadata, normalize_text
+from .scoring import infer_series_metadata, normalize_text
 
 _ISBN_10_RE = re.compile(r"ISBN-10\s*:?\s*([0-9Xx\- ]{10,20})", re.IGNORECASE)
 _ISBN_13_RE = re.compile(r"ISBN-13\s*:?\s*([0-9\- ]{13,24})", re.IGNORECASE)
@@ -59,11 +61,22 @@ def _dedupe(values: list[str]) -> list[str]:
     return result
 
 
-def search_amazon(query: str, *, limit: int = 5) -> list[AmazonCandidate]:
-    html = request_amazon_html("/s", params={"k": query, "i": "stripbooks"})
+async def search_amazon(query: str, *, limit: int = 5) -> list[AmazonCandidate]:
+    html = await request_amazon_html("/s", params={"k": query, "i": "stripbooks"})
     if not html:
         return []
+    # Amazon pages run to hundreds of kilobytes; parse them off the event loop.
+    return await asyncio.to_thread(_parse_search_results, html, limit)
 
+
+async def enrich_amazon_candidate(candidate: AmazonCandidate) -> AmazonCandidate:
+    html = await request_amazon_html(f"/dp/{candidate.asin}")
+    if not html:
+        return candidate
+    return await asyncio.to_thread(_parse_product_page, candidate, html)
+
+
+def _parse_search_results(html: str, limit: int) -> list[AmazonCandidate]:
     soup = BeautifulSoup(html, "html.parser")
     candidates: list[AmazonCandidate] = []
     seen_asins: set[str] = set()
@@ -101,11 +114,7 @@ def search_amazon(query: str, *, limit: int = 5) -> list[AmazonCandidate]:
     return candidates
 
 
-def enrich_amazon_candidate(candidate: AmazonCandidate) -> AmazonCandidate:
-    html = request_amazon_html(f"/dp/{candidate.asin}")
-    if not html:
-        return candidate
-
+def _parse_product_page(candidate: AmazonCandidate, html: str) -> AmazonCandidate:
     soup = BeautifulSoup(html, "html.parser")
     page_text = soup.get_text(" ", strip=True)
     title_element = soup.select_one("#productTitle")
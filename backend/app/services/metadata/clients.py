@@ -1,13 +1,21 @@
-"""HTTP clients for online book metadata providers."""
+"""HTTP clients for online book metadata providers.
+
+Requests go through the shared pooled ``httpx`` clients, so a metadata sync can
+keep many lookups in flight at once. Each provider has its own token bucket:
+Open Library, Google Books and Amazon are throttled independently, and a slow
+or rate-limited provider never holds up requests to the others.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import json
 import threading
 import time
+from collections.abc import Callable
 from typing import Any, Optional
 
-import requests
-from requests import exceptions as requests_exceptions
+import httpx
 
 from ...config import (
     AMAZON_METADATA_DOMAIN,
@@ -15,56 +23,80 @@ from ...config import (
     GOOGLE_BOOKS_ALLOW_UNAUTHENTICATED,
     GOOGLE_BOOKS_API_KEY,
 )
+from ..http_clients import get_http_client
+from .http_cache import get_response_cache
 
 OPEN_LIBRARY_BASE_URL = "https://openlibrary.org"
 OPEN_LIBRARY_CONNECT_TIMEOUT_SECONDS = 3
 OPEN_LIBRARY_READ_TIMEOUT_SECONDS = 10
 OPEN_LIBRARY_RETRY_ATTEMPTS = 2
 OPEN_LIBRARY_MIN_REQUEST_INTERVAL_SECONDS = 0.4
+OPEN_LIBRARY_REQUEST_BURST = 3
 OPEN_LIBRARY_USER_AGENT = "story-manager/0.1 (+https://openlibrary.org)"
 GOOGLE_BOOKS_BASE_URL = "https://www.googleapis.com/books/v1"
 GOOGLE_BOOKS_CONNECT_TIMEOUT_SECONDS = 3
 GOOGLE_BOOKS_READ_TIMEOUT_SECONDS = 10
 GOOGLE_BOOKS_RETRY_ATTEMPTS = 2
 GOOGLE_BOOKS_MIN_REQUEST_INTERVAL_SECONDS = 0.25
+GOOGLE_BOOKS_REQUEST_BURST = 4
 GOOGLE_BOOKS_USER_AGENT = "story-manager/0.1 (+https://developers.google.com/books)"
 AMAZON_CONNECT_TIMEOUT_SECONDS = 4
 AMAZON_READ_TIMEOUT_SECONDS = 12
 AMAZON_MIN_REQUEST_INTERVAL_SECONDS = 1.0
+AMAZON_REQUEST_BURST = 1
 AMAZON_USER_AGENT = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) " "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36"
 )
 
-_request_lock = threading.Lock()
-_last_open_library_request_at = 0.0
-_last_google_books_request_at = 0.0
-_last_amazon_request_at = 0.0
 _RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+# Amazon answers robot checks with a 200 page; only pages carrying search
+# results or a product title are worth caching.
+_AMAZON_PAGE_MARKERS = ("s-search-result", "productTitle")
+
+
+class TokenBucket:
+    """Allow ``burst`` requests at once, refilled at one token per ``interval`` seconds.
+
+    A caller reserves its token synchronously and then sleeps until the token
+    is due, so concurrent requests queue in arrival order without holding a
+    lock across the wait, and one bucket serves any event loop.
+    """
 
+    def __init__(self, interval: float, burst: int = 1) -> None:
+        self.interval = interval
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
 
-def _respect_open_library_rate_limit() -> None:
-    global _last_open_library_request_at
+    def reserve(self) -> float:
+        """Take a token and return how many seconds the caller must wait for it."""
+        if self.interval <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) / self.interval)
+            self._updated_at = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens * self.interval)
 
-    with _request_lock:
-        now = time.monotonic()
-        wait_seconds = OPEN_LIBRARY_MIN_REQUEST_INTERVAL_SECONDS - (now - _last_open_library_request_at)
-        if wait_seconds > 0:
-            time.sleep(wait_seconds)
-        _last_open_library_request_at = time.monotonic()
+    async def acquire(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
 
 
-def _respect_google_books_rate_limit() -> None:
-    global _last_google_books_request_at
+_limiters: dict[str, TokenBucket] = {}
 
-    with _request_lock:
-        now = time.monotonic()
-        wait_seconds = GOOGLE_BOOKS_MIN_REQUEST_INTERVAL_SECONDS - (now - _last_google_books_request_at)
-        if wait_seconds > 0:
-            time.sleep(wait_seconds)
-        _last_google_books_request_at = time.monotonic()
 
+def _limiter(provider: str, interval: float, burst: int) -> TokenBucket:
+    limiter = _limiters.get(provider)
+    if limiter is None or limiter.interval != interval or limiter.burst != max(1, burst):
+        limiter = _limiters[provider] = TokenBucket(interval, burst)
+    return limiter
 
-def _retry_delay(response: requests.Response, attempt: int) -> float:
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
     retry_after = response.headers.get("Retry-After") if hasattr(response, "headers") else None
     try:
         return min(5.0, max(0.25, float(retry_after))) if retry_after else 0.5 * attempt
@@ -72,41 +104,100 @@ def _retry_delay(response: requests.Response, attempt: int) -> float:
         return 0.5 * attempt
 
 
-def request_open_library_json(path: str, *, params: Optional[dict[str, Any]] = None) -> dict[str, Any]:
-    last_error: Optional[Exception] = None
-
-    for attempt in range(1, OPEN_LIBRARY_RETRY_ATTEMPTS + 1):
+def _json_object(payload: Any) -> dict[str, Any]:
+    return payload if isinstance(payload, dict) else {}
+
+
+def _response_headers(response: httpx.Response) -> Any:
+    return getattr(response, "headers", None) or {}
+
+
+async def _http_get(
+    url: str,
+    *,
+    params: Optional[dict[str, Any]] = None,
+    headers: Optional[dict[str, str]] = None,
+    timeout: Optional[httpx.Timeout] = None,
+) -> httpx.Response:
+    return await get_http_client(url).get(url, params=params, headers=headers, timeout=timeout, follow_redirects=True)
+
+
+async def _cached_get(
+    provider: str,
+    url: str,
+    *,
+    cache_path: str,
+    params: Optional[dict[str, Any]],
+    request_params: Optional[dict[str, Any]],
+    headers: dict[str, str],
+    timeout: httpx.Timeout,
+    limiter: TokenBucket,
+    attempts: int,
+    as_json: bool,
+    cacheable: Optional[Callable[[str], bool]] = None,
+) -> str:
+    """Return the response body, from the cache when fresh, retrying transient failures.
+
+    The SQLite cache calls run in worker threads, serialised by the cache's
+    own lock, so decompression and eviction never stall the event loop. A body
+    that ``cacheable`` rejects is returned but not stored.
+    """
+    cache = get_response_cache()
+    cached = await asyncio.to_thread(cache.lookup, provider, cache_path, params) if cache else None
+    if cached is not None and cached.fresh:
+        return cached.body
+
+    attempt = 1
+    while True:
         try:
-            _respect_open_library_rate_limit()
-            response = requests.get(
-                f"{OPEN_LIBRARY_BASE_URL}{path}",
-                params=params,
-                timeout=(OPEN_LIBRARY_CONNECT_TIMEOUT_SECONDS, OPEN_LIBRARY_READ_TIMEOUT_SECONDS),
-                headers={"User-Agent": OPEN_LIBRARY_USER_AGENT},
+            await limiter.acquire()
+            response = await _http_get(
+                url,
+                params=request_params,
+                timeout=timeout,
+                headers={**headers, **(cached.conditional_headers() if cached else {})},
             )
-            if response.status_code in _RETRYABLE_STATUS_CODES and attempt < OPEN_LIBRARY_RETRY_ATTEMPTS:
-                time.sleep(_retry_delay(response, attempt))
-                continue
-            response.raise_for_status()
-            payload = response.json()
-            return payload if isinstance(payload, dict) else {}
-        except (requests_exceptions.Timeout, requests_exceptions.ConnectionError) as exc:
-            last_error = exc
-            if attempt < OPEN_LIBRARY_RETRY_ATTEMPTS:
-                time.sleep(0.5 * attempt)
+        except httpx.TransportError:
+            if attempt < attempts:
+                await asyncio.sleep(0.5 * attempt)
+                attempt += 1
                 continue
             raise
-
-    if last_error is not None:
-        raise last_error
-    return {}
+        if response.status_code == 304 and cached is not None:
+            await asyncio.to_thread(cache.revalidated, cached)
+            return cached.body
+        if response.status_code in _RETRYABLE_STATUS_CODES and attempt < attempts:
+            await asyncio.sleep(_retry_delay(response, attempt))
+            attempt += 1
+            continue
+        response.raise_for_status()
+        body = json.dumps(_json_object(response.json())) if as_json else response.text
+        if cache and (cacheable is None or cacheable(body)):
+            await asyncio.to_thread(cache.store, provider, cache_path, params, body, headers=_response_headers(response))
+        return body
+
+
+async def request_open_library_json(path: str, *, params: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+    body = await _cached_get(
+        "open_library",
+        f"{OPEN_LIBRARY_BASE_URL}{path}",
+        cache_path=path,
+        params=params,
+        request_params=params,
+        headers={"User-Agent": OPEN_LIBRARY_USER_AGENT},
+        timeout=httpx.Timeout(OPEN_LIBRARY_READ_TIMEOUT_SECONDS, connect=OPEN_LIBRARY_CONNECT_TIMEOUT_SECONDS),
+        limiter=_limiter("open_library", OPEN_LIBRARY_MIN_REQUEST_INTERVAL_SECONDS, OPEN_LIBRARY_REQUEST_BURST),
+        attempts=OPEN_LIBRARY_RETRY_ATTEMPTS,
+        as_json=True,
+    )
+    return _json_object(json.loads(body))
 
 
 def google_books_enabled() -> bool:
     return bool(GOOGLE_BOOKS_API_KEY) or GOOGLE_BOOKS_ALLOW_UNAUTHENTICATED
 
 
-def request_google_books_json(path: str, *, params: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+async def request_google_books_json(path: str, *, params: Optional[dict[str, Any]] = None) -> dict[str, Any]:
     if not google_books_enabled():
         return {}
 
@@ -116,66 +207,52 @@ def request_google_books_json(path: str, *, params: Optional[dict[str, Any]] = N
     if params:
         request_params.update(params)
 
-    last_error: Optional[Exception] = None
-    for attempt in range(1, GOOGLE_BOOKS_RETRY_ATTEMPTS + 1):
-        try:
-            _respect_google_books_rate_limit()
-            response = requests.get(
-                f"{GOOGLE_BOOKS_BASE_URL}{path}",
-                params=request_params,
-                timeout=(GOOGLE_BOOKS_CONNECT_TIMEOUT_SECONDS, GOOGLE_BOOKS_READ_TIMEOUT_SECONDS),
-                headers={"User-Agent": GOOGLE_BOOKS_USER_AGENT},
-            )
-            if response.status_code in _RETRYABLE_STATUS_CODES and attempt < GOOGLE_BOOKS_RETRY_ATTEMPTS:
-                time.sleep(_retry_delay(response, attempt))
-                continue
-            response.raise_for_status()
-            payload = response.json()
-            return payload if isinstance(payload, dict) else {}
-        except (requests_exceptions.Timeout, requests_exceptions.ConnectionError) as exc:
-            last_error = exc
-            if attempt < GOOGLE_BOOKS_RETRY_ATTEMPTS:
-                time.sleep(0.5 * attempt)
-                continue
-            raise
-
-    if last_error is not None:
-        raise last_error
-    return {}
+    body = await _cached_get(
+        "google_books",
+        f"{GOOGLE_BOOKS_BASE_URL}{path}",
+        cache_path=path,
+        params=params,
+        request_params=request_params,
+        headers={"User-Agent": GOOGLE_BOOKS_USER_AGENT},
+        timeout=httpx.Timeout(GOOGLE_BOOKS_READ_TIMEOUT_SECONDS, connect=GOOGLE_BOOKS_CONNECT_TIMEOUT_SECONDS),
+        limiter=_limiter("google_books", GOOGLE_BOOKS_MIN_REQUEST_INTERVAL_SECONDS, GOOGLE_BOOKS_REQUEST_BURST),
+        attempts=GOOGLE_BOOKS_RETRY_ATTEMPTS,
+        as_json=True,
+    )
+    return _json_object(json.loads(body))
 
 
 def amazon_metadata_enabled() -> bool:
     return AMAZON_METADATA_ENABLED
 
 
+def _is_amazon_metadata_page(html: str) -> bool:
+    return any(marker in html for marker in _AMAZON_PAGE_MARKERS)
+
+
 def amazon_base_url() -> str:
     return f"https://www.amazon.{AMAZON_METADATA_DOMAIN}"
 
 
-def request_amazon_html(path: str, *, params: Optional[dict[str, Any]] = None) -> str:
+async def request_amazon_html(path: str, *, params: Optional[dict[str, Any]] = None) -> str:
     """Fetch a public Amazon page without making Amazon a hard dependency."""
 
-    global _last_amazon_request_at
-
     if not amazon_metadata_enabled():
         return ""
-
-    with _request_lock:
-        now = time.monotonic()
-        wait_seconds = AMAZON_MIN_REQUEST_INTERVAL_SECONDS - (now - _last_amazon_request_at)
-        if wait_seconds > 0:
-            time.sleep(wait_seconds)
-        _last_amazon_request_at = time.monotonic()
-
-    response = requests.get(
+    return await _cached_get(
+        "amazon",
         f"{amazon_base_url()}{path}",
+        cache_path=f"{AMAZON_METADATA_DOMAIN}{path}",
         params=params,
-        timeout=(AMAZON_CONNECT_TIMEOUT_SECONDS, AMAZON_READ_TIMEOUT_SECONDS),
+        request_params=params,
         headers={
             "User-Agent": AMAZON_USER_AGENT,
             "Accept-Language": "en-US,en;q=0.9",
             "Accept": "text/html,application/xhtml+xml",
         },
+        timeout=httpx.Timeout(AMAZON_READ_TIMEOUT_SECONDS, connect=AMAZON_CONNECT_TIMEOUT_SECONDS),
+        limiter=_limiter("amazon", AMAZON_MIN_REQUEST_INTERVAL_SECONDS, AMAZON_REQUEST_BURST),
+        attempts=1,
+        as_json=False,
+        cacheable=_is_amazon_metadata_page,
     )
-    response.raise_for_status()
-    return response.text
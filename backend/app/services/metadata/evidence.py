@@ -16,9 +16,10 @@ from ebooklib import epub
 
 from ...config import LIBRARY_PATH
 from ...models import AudiobookSettings, Book
+from ...normalization import clean_isbn
 from ..audiobook_llm import _call_llm
 from ..endpoint_pool import configured_endpoints
-from .scoring import author_similarity, clean_isbn, normalize_text, title_similarity
+from .scoring import author_similarity, normalize_text, title_similarity
 
 logger = logging.getLogger(__name__)
 
@@ -0,0 +1,209 @@
+"""Durable response cache shared by the metadata provider clients.
+
+Responses live in a SQLite file under the cache directory, keyed by provider,
+path and normalized query parameters, and stay fresh for the configured TTL.
+A stale entry that carried an ``ETag`` or ``Last-Modified`` header is
+revalidated with a conditional request, so an unchanged record costs a 304
+instead of a full download. The cache keeps a running total of the stored
+bytes, and once it exceeds the size budget the least recently used entries
+are evicted.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from ... import config
+
+CACHE_FILE_NAME = "metadata-http.sqlite3"
+# Credentials are part of the request but never part of the cache identity.
+_UNCACHED_PARAMS = frozenset({"key"})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    cache_key TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    expires_at REAL NOT NULL,
+    last_used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_responses_last_used_at ON responses (last_used_at);
+"""
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    key: str
+    body: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fresh: bool
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def _normalized_value(value: Any) -> str:
+    return " ".join(str(value).split()).casefold()
+
+
+def cache_key(provider: str, path: str, params: Optional[dict[str, Any]] = None) -> str:
+    """Identify a request independently of parameter order, spacing and case."""
+    normalized = sorted(
+        (str(name), _normalized_value(value))
+        for name, value in (params or {}).items()
+        if name not in _UNCACHED_PARAMS and value is not None and str(value).strip()
+    )
+    identity = json.dumps([provider, path, normalized], separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    def __init__(self, path: Path, *, ttl_seconds: float, max_bytes: int) -> None:
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+        self._size_bytes = self._stored_bytes()
+
+    def _stored_bytes(self) -> int:
+        return int(self._connection.execute("SELECT total(size_bytes) FROM responses").fetchone()[0])
+
+    def lookup(self, provider: str, path: str, params: Optional[dict[str, Any]] = None) -> Optional[CachedResponse]:
+        key = cache_key(provider, path, params)
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body, etag, last_modified, expires_at FROM responses WHERE cache_key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            body, etag, last_modified, expires_at = row
+            if expires_at > now:
+                self._connection.execute("UPDATE responses SET last_used_at = ? WHERE cache_key = ?", (now, key))
+        return CachedResponse(
+            key=key,
+            body=zlib.decompress(body).decode("utf-8"),
+            etag=etag,
+            last_modified=last_modified,
+            fresh=expires_at > now,
+        )
+
+    def store(
+        self,
+        provider: str,
+        path: str,
+        params: Optional[dict[str, Any]],
+        body: str,
+        *,
+        headers: Optional[Any] = None,
+    ) -> None:
+        headers = headers or {}
+        if "no-store" in str(headers.get("Cache-Control") or "").lower():
+            return
+        compressed = zlib.compress(body.encode("utf-8"), 6)
+        if len(compressed) > self.max_bytes:
+            return
+        key = cache_key(provider, path, params)
+        now = time.time()
+        with self._lock:
+            replaced = self._connection.execute("SELECT size_bytes FROM responses WHERE cache_key = ?", (key,)).fetchone()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(cache_key, provider, body, size_bytes, etag, last_modified, expires_at, last_used_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    provider,
+                    compressed,
+                    len(compressed),
+                    headers.get("ETag"),
+                    headers.get("Last-Modified"),
+                    now + self.ttl_seconds,
+                    now,
+                ),
+            )
+            self._size_bytes += len(compressed) - (replaced[0] if replaced else 0)
+            if self._size_bytes > self.max_bytes:
+                self._evict()
+
+    def revalidated(self, cached: CachedResponse) -> None:
+        """Extend an entry the provider confirmed unchanged with a 304."""
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "UPDATE responses SET expires_at = ?, last_used_at = ? WHERE cache_key = ?",
+                (now + self.ttl_seconds, now, cached.key),
+            )
+
+    def _evict(self) -> None:
+        # Other processes may share the file, so confirm the running total first.
+        total = self._stored_bytes()
+        if total <= self.max_bytes:
+            self._size_bytes = total
+            return
+        # Trim to 90% of the budget so eviction is not repeated on every insert.
+        excess = total - self.max_bytes * 0.9
+        self._connection.execute(
+            "DELETE FROM responses WHERE cache_key IN ("
+            " SELECT cache_key FROM ("
+            "  SELECT cache_key, size_bytes, sum(size_bytes) OVER (ORDER BY last_used_at, cache_key) AS freed"
+            "  FROM responses"
+            " ) WHERE freed - size_bytes < ?"
+            ")",
+            (excess,),
+        )
+        self._size_bytes = self._stored_bytes()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            entries, size_bytes = self._connection.execute(
+                "SELECT count(*), coalesce(sum(size_bytes), 0) FROM responses"
+            ).fetchone()
+        return {"entries": entries, "size_bytes": size_bytes}
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+_cache: Optional[ResponseCache] = None
+_cache_guard = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Return the process-wide cache, or ``None`` when caching is disabled."""
+    global _cache
+
+    if config.METADATA_CACHE_MAX_MB <= 0 or config.METADATA_CACHE_TTL_HOURS <= 0:
+        return None
+    with _cache_guard:
+        if _cache is None:
+            _cache = ResponseCache(
+                config.CACHE_DIR / CACHE_FILE_NAME,
+                ttl_seconds=config.METADATA_CACHE_TTL_HOURS * 3600,
+                max_bytes=config.METADATA_CACHE_MAX_MB * 1024 * 1024,
+            )
+        return _cache
@@ -4,10 +4,10 @@ from __future__ import annotations
 
 from difflib import SequenceMatcher
 import re
-import unicodedata
 from typing import Any, Iterable, Optional
 
-_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+from ...normalization import canonical_isbn, normalize_text
+
 _SEPARATOR_RE = re.compile(r"[\s\-:,_]+")
 _TRAILING_CONTRIBUTOR_RE = re.compile(
     r"\s*\((?:author|editor|translator|illustrator|narrator)\)\s*$",
@@ -50,7 +50,6 @@ _BOOK_OF_SERIES_RE = re.compile(
     rf"^(?P<title>.+?)\s*:\s*Book\s+(?P<index>{_SERIES_NUMBER_TOKEN})\s+of\s+(?:the\s+)?(?P<series>.+?)\)?\s*$",
     re.IGNORECASE,
 )
-_ISBN_RE = re.compile(r"[^0-9Xx]")
 _MISLEADING_EDITION_TOKENS = {
     "analysis",
     "boxed",
@@ -65,39 +64,10 @@ _MISLEADING_EDITION_TOKENS = {
 }
 
 
-def normalize_text(value: str) -> str:
-    """Return a search-safe representation that is stable across providers."""
-
-    decomposed = unicodedata.normalize("NFKD", value or "")
-    ascii_text = "".join(character for character in decomposed if not unicodedata.combining(character))
-    ascii_text = ascii_text.casefold().replace("&", " and ")
-    return _NON_ALNUM_RE.sub(" ", ascii_text).strip()
-
-
 def normalize_series(value: str) -> str:
     return _SEPARATOR_RE.sub(" ", normalize_text(value)).strip()
 
 
-def clean_isbn(value: Any) -> str:
-    if value is None:
-        return ""
-    cleaned = _ISBN_RE.sub("", str(value)).upper()
-    if len(cleaned) == 10 and re.fullmatch(r"\d{9}[\dX]", cleaned):
-        return cleaned
-    if len(cleaned) == 13 and cleaned.isdigit():
-        return cleaned
-    return ""
-
-
-def canonical_isbn(value: Any) -> str:
-    isbn = clean_isbn(value)
-    if len(isbn) != 10:
-        return isbn
-    body = "978" + isbn[:9]
-    checksum = (10 - (sum((1 if index % 2 == 0 else 3) * int(digit) for index, digit in enumerate(body)) % 10)) % 10
-    return body + str(checksum)
-
-
 def _isbn_set(remote_ids: dict[str, Any]) -> set[str]:
     return {canonical for key in ("isbn_13", "isbn_10") if (canonical := canonical_isbn(remote_ids.get(key)))}
 
@@ -17,6 +17,7 @@ from .metadata_sync import (
     apply_suggestion_to_book,
     generate_candidate_suggestions,
 )
+from .metadata.scoring import normalize_text
 from .series import enrich_series_metadata
 
 logger = logging.getLogger(__name__)
@@ -43,10 +44,9 @@ async def create_metadata_sync_job_request(
     book_ids: Optional[list[int]] = None,
 ) -> models.MetadataSyncJob:
     if book_ids:
-        resolved_books = await crud.get_books_by_ids(db, book_ids)
+        resolved_ids = [book.id for book in await crud.get_books_by_ids(db, book_ids)]
     else:
-        resolved_books = await crud.get_books(db, limit=100000)
-    resolved_ids = [book.id for book in resolved_books]
+        resolved_ids = await crud.get_live_book_ids(db)
     return await crud.create_metadata_sync_job(db, trigger=trigger, book_ids=resolved_ids)
 
 
@@ -153,6 +153,7 @@ async def _sync_one_book(
             all_books,
             max_candidates=MAX_MATCH_CANDIDATES,
             settings=settings,
+            db=db,
         )
         suggestions = candidate_groups[0]
     else:
@@ -331,6 +332,15 @@ async def _sync_one_book(
     return True, proposed, applied
 
 
+def _sync_order_key(book: models.Book) -> tuple[str, str, float, str]:
+    return (
+        (book.author or "").casefold(),
+        (book.series or "").casefold(),
+        float(book.series_index) if book.series_index is not None else float("inf"),
+        (book.title or "").casefold(),
+    )
+
+
 async def process_metadata_sync_job(db: AsyncSession, job_id: int) -> None:
     job = await crud.get_metadata_sync_job(db, job_id)
     if job is None:
@@ -340,77 +350,68 @@ async def process_metadata_sync_job(db: AsyncSession, job_id: int) -> None:
     await crud.mark_metadata_sync_job_running(db, job)
 
     try:
+        from .book_recovery import add_book_revision, snapshot_book
+
         scope = job.scope or {}
-        book_ids = scope.get("book_ids") or []
-        target_books = await crud.get_books_by_ids(db, book_ids)
-        all_books = await crud.get_books(db, limit=100000)
-        target_books.sort(
-            key=lambda book: (
-                (book.author or "").casefold(),
-                (book.series or "").casefold(),
-                float(book.series_index) if book.series_index is not None else float("inf"),
-                (book.title or "").casefold(),
-            )
-        )
+        # Targets are streamed in author order, one batch at a time. Each batch
+        # loads only its authors' books: series inference and local-series
+        # context never look past the author, and books elsewhere holding a
+        # suggested remote record are found through the identifier index.
+        ordered_ids = await crud.get_book_ids_in_author_order(db, scope.get("book_ids") or [])
         checked_at = datetime.now(timezone.utc)
+        settings = await crud.audiobook.get_audiobook_settings(db)
+        for batch_start in range(0, len(ordered_ids), METADATA_JOB_BATCH_SIZE):
+            batch = await crud.get_books_by_ids(db, ordered_ids[slice(batch_start, batch_start + METADATA_JOB_BATCH_SIZE)])
+            if not batch:
+                continue
+            neighborhood = await crud.get_books_by_author_keys(db, {normalize_text(book.author or "") for book in batch})
 
-        from .book_recovery import add_book_revision, snapshot_book
-
-        prior_series_snapshots = {book.id: snapshot_book(book) for book in all_books}
-        series_enriched_books = enrich_series_metadata(
-            all_books,
-            target_ids={book.id for book in target_books},
-        )
-        series_enriched_ids = {book.id for book in series_enriched_books}
-        for enriched_book in series_enriched_books:
-            add_book_revision(
-                db,
-                enriched_book,
-                action="metadata_changed",
-                summary="Inferred series name or position from title evidence",
-                snapshot=prior_series_snapshots[enriched_book.id],
-            )
-        if series_enriched_books:
-            await db.commit()
-            target_books.sort(
-                key=lambda book: (
-                    (book.author or "").casefold(),
-                    (book.series or "").casefold(),
-                    float(book.series_index) if book.series_index is not None else float("inf"),
-                    (book.title or "").casefold(),
+            prior_series_snapshots = {book.id: snapshot_book(book) for book in batch}
+            series_enriched_books = enrich_series_metadata(neighborhood, target_ids=set(prior_series_snapshots))
+            series_enriched_ids = {book.id for book in series_enriched_books}
+            for enriched_book in series_enriched_books:
+                add_book_revision(
+                    db,
+                    enriched_book,
+                    action="metadata_changed",
+                    summary="Inferred series name or position from title evidence",
+                    snapshot=prior_series_snapshots[enriched_book.id],
                 )
-            )
+            if series_enriched_books:
+                await db.commit()
+                batch.sort(key=_sync_order_key)
 
-        settings = await crud.audiobook.get_audiobook_settings(db)
-        for batch_start in range(0, len(target_books), METADATA_JOB_BATCH_SIZE):
-            batch_end = batch_start + METADATA_JOB_BATCH_SIZE
-            batch = target_books[batch_start:batch_end]
             candidate_groups = await generate_candidate_suggestions(
                 batch,
-                all_books,
+                neighborhood,
                 max_candidates=MAX_MATCH_CANDIDATES,
                 settings=settings,
+                db=db,
             )
+            matched_count = proposed_count = applied_count = 0
             for book, candidates in zip(batch, candidate_groups):
                 matched, proposed, applied = await _sync_one_book(
                     db,
                     book=book,
-                    all_books=all_books,
+                    all_books=neighborhood,
                     checked_at=checked_at,
                     candidate_suggestions=candidates,
                 )
-                applied = applied or book.id in series_enriched_ids
-                job = await crud.get_metadata_sync_job(db, job_id)
-                if job is None:
-                    return
-                await crud.mark_metadata_sync_job_progress(
-                    db,
-                    job,
-                    processed_increment=1,
-                    matched_increment=1 if matched else 0,
-                    proposed_increment=1 if proposed else 0,
-                    applied_increment=1 if applied else 0,
-                )
+                matched_count += matched
+                proposed_count += proposed
+                applied_count += applied or book.id in series_enriched_ids
+
+            job = await crud.get_metadata_sync_job(db, job_id)
+            if job is None:
+                return
+            await crud.mark_metadata_sync_job_progress(
+                db,
+                job,
+                processed_increment=len(batch),
+                matched_increment=matched_count,
+                proposed_increment=proposed_count,
+                applied_increment=applied_count,
+            )
 
         job = await crud.get_metadata_sync_job(db, job_id)
         if job is not None:
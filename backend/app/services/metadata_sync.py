@@ -9,11 +9,13 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Optional
 
-import requests
+import httpx
 from bs4 import BeautifulSoup
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .. import crud, models, schemas
+from .. import config, crud, models, schemas
+from ..normalization import clean_isbn as _clean_isbn
+from ..normalization import stable_remote_identifiers as _stable_remote_identifiers
 from .metadata.arbitration import arbitrate_candidate_suggestions, refine_unmatched_search_identity
 from .metadata.amazon import AmazonCandidate, enrich_amazon_candidate, search_amazon
 from .metadata.clients import amazon_metadata_enabled as _amazon_metadata_enabled
@@ -28,8 +30,6 @@ from .metadata.scoring import normalize_series as _normalize_series
 from .metadata.scoring import normalize_text as _normalize_text
 from .metadata.scoring import best_author_similarity as _best_author_similarity
 from .metadata.scoring import bibliographic_title_variants as _bibliographic_title_variants
-from .metadata.scoring import canonical_isbn as _canonical_isbn
-from .metadata.scoring import clean_isbn as _clean_isbn
 from .metadata.scoring import infer_series_metadata as _infer_series_metadata
 from .metadata.scoring import score_metadata_candidate as _score_metadata_candidate
 from .metadata.scoring import series_match_issues as _series_match_issues
@@ -55,6 +55,10 @@ _TRAILING_PARENS_RE = re.compile(r"\s*\([^)]*\)\s*$")
 _TRAILING_SERIES_BOOK_RE = re.compile(r"\s*\([^)]*book\s+\d+[^)]*\)\s*$", re.IGNORECASE)
 _TRAILING_PUNCTUATION_RE = re.compile(r"[\s:;,\-]+$")
 
+# Open Library author works keyed by author, shared by every book in one sync.
+# Entries are futures so concurrent books wait on a single in-flight request.
+AuthorWorkCache = dict[str, "asyncio.Future[list[dict[str, Any]]]"]
+
 
 @dataclass
 class MetadataSuggestion:
@@ -199,19 +203,6 @@ def _merge_remote_ids(*groups: dict[str, Any]) -> dict[str, Any]:
     return merged
 
 
-def _stable_remote_identifiers(remote_ids: dict[str, Any] | None) -> set[tuple[str, str]]:
-    remote_ids = remote_ids or {}
-    identifiers = {
-        (key, str(remote_ids[key]).strip())
-        for key in ("google_books_volume_id", "open_library_work_key", "asin")
-        if remote_ids.get(key) and str(remote_ids[key]).strip()
-    }
-    identifiers.update(
-        ("isbn", normalized) for key in ("isbn_10", "isbn_13") if (normalized := _canonical_isbn(remote_ids.get(key)))
-    )
-    return identifiers
-
-
 def _annotate_duplicate_assignments(
     book: models.Book,
     suggestions: list[MetadataSuggestion],
@@ -600,26 +591,43 @@ def _get_manual_remote_ids(book: models.Book) -> dict[str, str]:
     return {key: str(value).strip() for key, value in raw_ids.items() if value is not None and str(value).strip()}
 
 
-def _fetch_search_docs(params: dict[str, Any]) -> list[dict[str, Any]]:
-    payload = _request_json("/search.json", params=params)
+async def _gather_requests(*awaitables: Any) -> list[Any]:
+    """Run provider requests concurrently, raising the first failure only once all have settled."""
+    results = await asyncio.gather(*awaitables, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
+
+async def _warn_on_failure(awaitable: Any, default: Any, message: str, *args: Any) -> Any:
+    try:
+        return await awaitable
+    except httpx.HTTPError:
+        logger.warning(message, *args)
+        return default
+
+
+async def _fetch_search_docs(params: dict[str, Any]) -> list[dict[str, Any]]:
+    payload = await _request_json("/search.json", params=params)
     docs = payload.get("docs") or []
     return [doc for doc in docs if isinstance(doc, dict)]
 
 
-def _fetch_google_books_volumes(query: str) -> list[dict[str, Any]]:
+async def _fetch_google_books_volumes(query: str) -> list[dict[str, Any]]:
     if not _google_books_enabled():
         return []
 
-    payload = _request_google_books_json("/volumes", params={"q": query, "maxResults": 10})
+    payload = await _request_google_books_json("/volumes", params={"q": query, "maxResults": 10})
     items = payload.get("items") or []
     return [item for item in items if isinstance(item, dict)]
 
 
-def _fetch_google_books_volume_by_id(volume_id: str) -> Optional[dict[str, Any]]:
+async def _fetch_google_books_volume_by_id(volume_id: str) -> Optional[dict[str, Any]]:
     if not _google_books_enabled() or not volume_id.strip():
         return None
 
-    payload = _request_google_books_json(f"/volumes/{volume_id.strip()}")
+    payload = await _request_google_books_json(f"/volumes/{volume_id.strip()}")
     return payload if payload else None
 
 
@@ -644,18 +652,21 @@ def _series_peer_author_keys(
     return keys
 
 
-def _fetch_series_context_doc(
+async def _fetch_series_context_doc(
     book: models.Book,
     *,
     preferred_author_keys: set[str],
-    author_work_cache: dict[str, list[dict[str, Any]]],
+    author_work_cache: AuthorWorkCache,
 ) -> tuple[Optional[dict[str, Any]], float]:
     if not preferred_author_keys:
         return None, 0.0
 
+    author_keys = sorted(preferred_author_keys)
+    author_entries = await asyncio.gather(
+        *(_fetch_author_work_entries(author_key, author_work_cache) for author_key in author_keys)
+    )
     candidate_entries: list[dict[str, Any]] = []
-    for author_key in preferred_author_keys:
-        entries = _fetch_author_work_entries(author_key, author_work_cache)
+    for author_key, entries in zip(author_keys, author_entries):
         if not entries:
             continue
 
@@ -697,11 +708,31 @@ def _fetch_series_context_doc(
     return best_doc, best_score
 
 
-def _collect_search_doc_candidates(
+async def _fetch_manual_work_doc(
+    book: models.Book,
+    work_key: Optional[str],
+    author_key: Optional[str],
+) -> Optional[dict[str, Any]]:
+    if not work_key:
+        return None
+    try:
+        work_data = await _request_json(f"{work_key}.json")
+    except httpx.HTTPError:
+        logger.warning("Failed to fetch manually configured Open Library work %s.", work_key)
+        return None
+    return {
+        "key": work_key,
+        "title": work_data.get("title") or book.title,
+        "author_name": [book.author],
+        "author_key": [author_key] if author_key else [],
+    }
+
+
+async def _collect_search_doc_candidates(
     book: models.Book,
     *,
     local_books_by_author: dict[str, list[models.Book]],
-    author_work_cache: dict[str, list[dict[str, Any]]],
+    author_work_cache: AuthorWorkCache,
     limit: int = DEFAULT_MATCH_CANDIDATE_LIMIT,
 ) -> list[tuple[dict[str, Any], float]]:
     manual_remote_ids = _get_manual_remote_ids(book)
@@ -718,18 +749,23 @@ def _collect_search_doc_candidates(
     for title_variant in _title_search_variants(book):
         search_variants.append({"title": title_variant, "author": book.author, "limit": 5})
         search_variants.append({"title": title_variant, "limit": 10})
+    unique_searches = list({tuple(sorted(params.items())): params for params in search_variants}.values())
+
+    manual_work_key = manual_remote_ids.get("open_library_work_key")
+    search_results, manual_doc, (series_doc, series_score) = await _gather_requests(
+        _gather_requests(*(_fetch_search_docs(params) for params in unique_searches)),
+        _fetch_manual_work_doc(book, manual_work_key, manual_author_key),
+        _fetch_series_context_doc(
+            book,
+            preferred_author_keys=preferred_author_keys,
+            author_work_cache=author_work_cache,
+        ),
+    )
 
     ranked: list[tuple[dict[str, Any], float, float]] = []
-    seen_searches: set[tuple[tuple[str, Any], ...]] = set()
     seen_docs: set[str] = set()
-
-    for params in search_variants:
-        key = tuple(sorted(params.items()))
-        if key in seen_searches:
-            continue
-        seen_searches.add(key)
-
-        for doc in _fetch_search_docs(params):
+    for docs in search_results:
+        for doc in docs:
             doc_key = str(doc.get("key") or doc.get("cover_edition_key") or doc.get("title") or "")
             if not doc_key or doc_key in seen_docs:
                 continue
@@ -747,28 +783,11 @@ def _collect_search_doc_candidates(
             seen_docs.add(doc_key)
             ranked.append((doc, score, ranking_score))
 
-    manual_work_key = manual_remote_ids.get("open_library_work_key")
-    if manual_work_key and manual_work_key not in seen_docs:
-        try:
-            work_data = _request_json(f"{manual_work_key}.json")
-        except requests.RequestException:
-            logger.warning("Failed to fetch manually configured Open Library work %s.", manual_work_key)
-        else:
-            manual_doc = {
-                "key": manual_work_key,
-                "title": work_data.get("title") or book.title,
-                "author_name": [book.author],
-                "author_key": [manual_author_key] if manual_author_key else [],
-            }
-            manual_score = _score_search_doc(book, manual_doc)
-            ranked.append((manual_doc, manual_score, manual_score + 0.1))
-            seen_docs.add(manual_work_key)
-
-    series_doc, series_score = _fetch_series_context_doc(
-        book,
-        preferred_author_keys=preferred_author_keys,
-        author_work_cache=author_work_cache,
-    )
+    if manual_doc is not None and manual_work_key not in seen_docs:
+        manual_score = _score_search_doc(book, manual_doc)
+        ranked.append((manual_doc, manual_score, manual_score + 0.1))
+        seen_docs.add(manual_work_key)
+
     if series_doc is not None:
         doc_key = str(series_doc.get("key") or series_doc.get("title") or "")
         if doc_key and doc_key not in seen_docs:
@@ -778,7 +797,7 @@ def _collect_search_doc_candidates(
     return [(doc, score) for doc, score, _ranking_score in ranked[:limit]]
 
 
-def _collect_google_books_matches(
+async def _collect_google_books_matches(
     book: models.Book,
     *,
     limit: int = DEFAULT_MATCH_CANDIDATE_LIMIT,
@@ -787,48 +806,52 @@ def _collect_google_books_matches(
         return []
 
     manual_remote_ids = _get_manual_remote_ids(book)
-    candidates: list[dict[str, Any]] = []
-    seen_ids: set[str] = set()
-
-    manual_volume_id = manual_remote_ids.get("google_books_volume_id")
-    if manual_volume_id:
-        try:
-            volume = _fetch_google_books_volume_by_id(manual_volume_id)
-        except requests.RequestException:
-            logger.warning("Failed to fetch Google Books volume metadata for %s.", manual_volume_id)
-            volume = None
-        if volume and isinstance(volume.get("id"), str):
-            seen_ids.add(volume["id"])
-            candidates.append(volume)
-
+    manual_volume_id = manual_remote_ids.get("google_books_volume_id") or ""
+    searches = []
     for isbn_key in ("isbn_13", "isbn_10"):
         isbn_value = manual_remote_ids.get(isbn_key)
-        if not isbn_value:
-            continue
-        try:
-            isbn_candidates = _fetch_google_books_volumes(f"isbn:{isbn_value}")
-        except requests.RequestException:
-            logger.warning("Failed to search Google Books for ISBN %s.", isbn_value)
-            continue
-        for candidate in isbn_candidates:
+        if isbn_value:
+            searches.append(
+                _warn_on_failure(
+                    _fetch_google_books_volumes(f"isbn:{isbn_value}"),
+                    [],
+                    "Failed to search Google Books for ISBN %s.",
+                    isbn_value,
+                )
+            )
+    for title_variant in _title_search_variants(book):
+        for query in (f'intitle:"{title_variant}" inauthor:"{book.author}"', f'intitle:"{title_variant}"'):
+            searches.append(
+                _warn_on_failure(
+                    _fetch_google_books_volumes(query),
+                    [],
+                    "Failed to search Google Books for %s by %s.",
+                    title_variant,
+                    book.author,
+                )
+            )
+
+    manual_volume, *search_results = await asyncio.gather(
+        _warn_on_failure(
+            _fetch_google_books_volume_by_id(manual_volume_id),
+            None,
+            "Failed to fetch Google Books volume metadata for %s.",
+            manual_volume_id,
+        ),
+        *searches,
+    )
+    candidates: list[dict[str, Any]] = []
+    seen_ids: set[str] = set()
+    if manual_volume and isinstance(manual_volume.get("id"), str):
+        seen_ids.add(manual_volume["id"])
+        candidates.append(manual_volume)
+    for results in search_results:
+        for candidate in results:
             candidate_id = candidate.get("id")
             if isinstance(candidate_id, str) and candidate_id not in seen_ids:
                 seen_ids.add(candidate_id)
                 candidates.append(candidate)
 
-    for title_variant in _title_search_variants(book):
-        for query in (f'intitle:"{title_variant}" inauthor:"{book.author}"', f'intitle:"{title_variant}"'):
-            try:
-                search_candidates = _fetch_google_books_volumes(query)
-            except requests.RequestException:
-                logger.warning("Failed to search Google Books for %s by %s.", title_variant, book.author)
-                continue
-            for candidate in search_candidates:
-                candidate_id = candidate.get("id")
-                if isinstance(candidate_id, str) and candidate_id not in seen_ids:
-                    seen_ids.add(candidate_id)
-                    candidates.append(candidate)
-
     if not candidates:
         return []
 
@@ -859,7 +882,14 @@ def _collect_google_books_matches(
     return ranked[:limit]
 
 
-def _collect_amazon_matches(
+async def _enrich_amazon_candidate_or_keep(candidate: AmazonCandidate) -> AmazonCandidate:
+    try:
+        return await enrich_amazon_candidate(candidate)
+    except httpx.HTTPError:
+        return candidate
+
+
+async def _collect_amazon_matches(
     book: models.Book,
     *,
     limit: int = 3,
@@ -871,14 +901,20 @@ def _collect_amazon_matches(
     queries = [manual_remote_ids[key] for key in ("asin", "isbn_13", "isbn_10") if manual_remote_ids.get(key)]
     queries.extend(f"{title_variant} {book.author}".strip() for title_variant in _title_search_variants(book))
 
+    search_results = await asyncio.gather(
+        *(
+            _warn_on_failure(
+                search_amazon(query, limit=5),
+                [],
+                "Amazon metadata search failed for %s; continuing with other providers.",
+                query,
+            )
+            for query in queries
+        )
+    )
     candidates: list[AmazonCandidate] = []
     seen_asins: set[str] = set()
-    for query in queries:
-        try:
-            results = search_amazon(query, limit=5)
-        except requests.RequestException:
-            logger.warning("Amazon metadata search failed for %s; continuing with other providers.", query)
-            continue
+    for results in search_results:
         for candidate in results:
             if candidate.asin in seen_asins:
                 continue
@@ -888,11 +924,10 @@ def _collect_amazon_matches(
     ranked: list[AmazonMatch] = []
     # Fetch only a few detail pages. Amazon is the slowest and least reliable
     # provider, and the other sources should remain useful if it blocks us.
-    for candidate in candidates[: max(limit * 2, 3)]:
-        try:
-            detailed = enrich_amazon_candidate(candidate)
-        except requests.RequestException:
-            detailed = candidate
+    detailed_candidates = await asyncio.gather(
+        *(_enrich_amazon_candidate_or_keep(candidate) for candidate in candidates[: max(limit * 2, 3)])
+    )
+    for detailed in detailed_candidates:
         score = _score_metadata_candidate(
             local_title=book.title,
             local_author=book.author,
@@ -924,13 +959,13 @@ def _collect_amazon_matches(
     return ranked[:limit]
 
 
-def _fetch_work_data(doc: dict[str, Any]) -> dict[str, Any]:
+async def _fetch_work_data(doc: dict[str, Any]) -> dict[str, Any]:
     key = doc.get("key")
     if not key:
         return {}
     try:
-        return _request_json(f"{key}.json")
-    except requests.RequestException:
+        return await _request_json(f"{key}.json")
+    except httpx.HTTPError:
         logger.warning("Failed to fetch Open Library work metadata for %s.", key, exc_info=True)
         return {}
 
@@ -960,24 +995,15 @@ def _open_library_metadata_details(doc: dict[str, Any], work_data: dict[str, Any
     )
 
 
-def _fetch_author_work_entries(
-    author_key: Optional[str],
-    author_work_cache: dict[str, list[dict[str, Any]]],
-) -> list[dict[str, Any]]:
-    if not author_key:
-        return []
-    if author_key in author_work_cache:
-        return author_work_cache[author_key]
-
+async def _request_author_work_entries(author_key: str) -> list[dict[str, Any]]:
     try:
-        payload = _request_json(f"/authors/{author_key}/works.json", params={"limit": 200})
-    except requests.RequestException:
+        payload = await _request_json(f"/authors/{author_key}/works.json", params={"limit": 200})
+    except httpx.HTTPError:
         logger.warning("Failed to fetch Open Library author works for %s.", author_key, exc_info=True)
-        author_work_cache[author_key] = []
         return []
 
     entries = payload.get("entries") or []
-    normalized_entries = [
+    return [
         {
             "key": entry.get("key"),
             "title": entry.get("title", "").strip(),
@@ -985,18 +1011,37 @@ def _fetch_author_work_entries(
         for entry in entries
         if isinstance(entry, dict) and isinstance(entry.get("title"), str) and entry.get("title").strip()
     ]
-    author_work_cache[author_key] = normalized_entries
-    return normalized_entries
 
 
-def _build_open_library_suggestion(
+async def _fetch_author_work_entries(
+    author_key: Optional[str],
+    author_work_cache: AuthorWorkCache,
+) -> list[dict[str, Any]]:
+    """Return an author's works, sharing one request between every book in flight that needs them."""
+    if not author_key:
+        return []
+    pending = author_work_cache.get(author_key)
+    if pending is None:
+        pending = author_work_cache[author_key] = asyncio.ensure_future(_request_author_work_entries(author_key))
+    # Shielded so that cancelling one book cannot cancel a lookup other books are waiting on.
+    return await asyncio.shield(pending)
+
+
+async def _build_open_library_suggestion(
     book: models.Book,
     doc: dict[str, Any],
     score: float,
     local_books_by_author: dict[str, list[models.Book]],
-    author_work_cache: dict[str, list[dict[str, Any]]],
+    author_work_cache: AuthorWorkCache,
 ) -> MetadataSuggestion:
-    work_data = _fetch_work_data(doc)
+    author_keys = doc.get("author_key") or []
+    if isinstance(author_keys, str):
+        author_keys = [author_keys]
+    author_key = author_keys[0] if author_keys else None
+    work_data, author_work_entries = await asyncio.gather(
+        _fetch_work_data(doc),
+        _fetch_author_work_entries(author_key, author_work_cache),
+    )
     subjects = _extract_subjects(doc, work_data)
     genre_tags = _derive_genre_tags(subjects)
     existing_tags = {tag.casefold() for tag in (book.genre_tags or [])}
@@ -1005,12 +1050,6 @@ def _build_open_library_suggestion(
     author_names = doc.get("author_name") or []
     if isinstance(author_names, str):
         author_names = [author_names]
-    author_keys = doc.get("author_key") or []
-    if isinstance(author_keys, str):
-        author_keys = [author_keys]
-    author_key = author_keys[0] if author_keys else None
-
-    author_work_entries = _fetch_author_work_entries(author_key, author_work_cache)
     author_work_titles = [entry["title"] for entry in author_work_entries if entry.get("title")]
     possible_missing = _infer_possible_missing_books(book, local_books_by_author, author_work_titles)
 
@@ -1169,10 +1208,59 @@ def _consolidate_suggestions(suggestions: list[MetadataSuggestion]) -> list[Meta
     return consolidated
 
 
-def _build_suggestions_for_book(
+async def _open_library_suggestions(
+    book: models.Book,
+    search_book: models.Book,
+    local_books_by_author: dict[str, list[models.Book]],
+    author_work_cache: AuthorWorkCache,
+    max_candidates: int,
+) -> list[MetadataSuggestion]:
+    try:
+        candidates = await _collect_search_doc_candidates(
+            search_book,
+            local_books_by_author=local_books_by_author,
+            author_work_cache=author_work_cache,
+            limit=max_candidates,
+        )
+    except httpx.HTTPError:
+        logger.warning("Metadata sync request failed for %s by %s; continuing.", book.title, book.author)
+        return []
+    return list(
+        await asyncio.gather(
+            *(
+                _build_open_library_suggestion(book, doc, score, local_books_by_author, author_work_cache)
+                for doc, score in candidates
+            )
+        )
+    )
+
+
+async def _google_books_suggestions(
+    book: models.Book,
+    search_book: models.Book,
+    max_candidates: int,
+) -> list[MetadataSuggestion]:
+    try:
+        matches = await _collect_google_books_matches(search_book, limit=max_candidates)
+    except httpx.HTTPError:
+        logger.warning("Google Books metadata request failed for %s by %s; continuing.", book.title, book.author)
+        return []
+    return [_build_google_books_suggestion(book, match) for match in matches]
+
+
+async def _amazon_suggestions(book: models.Book, search_book: models.Book) -> list[MetadataSuggestion]:
+    try:
+        matches = await _collect_amazon_matches(search_book)
+    except httpx.HTTPError:
+        logger.warning("Amazon metadata request failed for %s by %s; continuing.", book.title, book.author)
+        return []
+    return [_build_amazon_suggestion(book, match) for match in matches]
+
+
+async def _build_suggestions_for_book(
     book: models.Book,
     local_books_by_author: dict[str, list[models.Book]],
-    author_work_cache: dict[str, list[dict[str, Any]]],
+    author_work_cache: AuthorWorkCache,
     *,
     max_candidates: int = DEFAULT_MATCH_CANDIDATE_LIMIT,
     search_identity: Optional[SearchIdentity] = None,
@@ -1193,34 +1281,14 @@ def _build_suggestions_for_book(
     if not search_book.title or not search_book.author or search_book.author.strip().lower() == "pending":
         return [MetadataSuggestion(book=book, matched=False, note="Book is missing stable title/author metadata.")]
 
-    suggestions: list[MetadataSuggestion] = []
-    try:
-        open_library_candidates = _collect_search_doc_candidates(
-            search_book,
-            local_books_by_author=local_books_by_author,
-            author_work_cache=author_work_cache,
-            limit=max_candidates,
-        )
-    except requests.RequestException:
-        logger.warning("Metadata sync request failed for %s by %s; continuing.", book.title, book.author)
-        open_library_candidates = []
-    suggestions.extend(
-        _build_open_library_suggestion(book, doc, score, local_books_by_author, author_work_cache)
-        for doc, score in open_library_candidates
+    # Each provider is throttled by its own token bucket, so searching them
+    # side by side costs the slowest provider's time rather than the sum.
+    provider_suggestions = await asyncio.gather(
+        _open_library_suggestions(book, search_book, local_books_by_author, author_work_cache, max_candidates),
+        _google_books_suggestions(book, search_book, max_candidates),
+        _amazon_suggestions(book, search_book),
     )
-
-    try:
-        suggestions.extend(
-            _build_google_books_suggestion(book, match)
-            for match in _collect_google_books_matches(search_book, limit=max_candidates)
-        )
-    except requests.RequestException:
-        logger.warning("Google Books metadata request failed for %s by %s; continuing.", book.title, book.author)
-
-    try:
-        suggestions.extend(_build_amazon_suggestion(book, match) for match in _collect_amazon_matches(search_book))
-    except requests.RequestException:
-        logger.warning("Amazon metadata request failed for %s by %s; continuing.", book.title, book.author)
+    suggestions = [suggestion for group in provider_suggestions for suggestion in group]
 
     if suggestions:
         consolidated = _consolidate_suggestions(suggestions)[:max_candidates]
@@ -1248,57 +1316,84 @@ def _build_suggestions_for_book(
     return [MetadataSuggestion(book=book, matched=False, note="No confident metadata match found across enabled providers.")]
 
 
-async def _generate_suggestions(
-    target_books: list[models.Book],
-    all_books: list[models.Book],
-    *,
-    settings: Optional[models.AudiobookSettings] = None,
-) -> list[MetadataSuggestion]:
+def _local_books_by_author(all_books: list[models.Book]) -> dict[str, list[models.Book]]:
     local_books_by_author: dict[str, list[models.Book]] = {}
     for book in all_books:
         local_books_by_author.setdefault(_normalize_text(book.author or ""), []).append(book)
+    return local_books_by_author
 
-    author_work_cache: dict[str, list[dict[str, Any]]] = {}
-    identities = [await resolve_search_identity(book, settings) for book in target_books]
 
-    suggestions = await asyncio.to_thread(
-        lambda: [
-            _build_suggestions_for_book(
+async def _search_books_concurrently(
+    target_books: list[models.Book],
+    all_books: list[models.Book],
+    *,
+    max_candidates: int,
+    settings: Optional[models.AudiobookSettings],
+) -> tuple[list[SearchIdentity], list[list[MetadataSuggestion]]]:
+    """Resolve and search every target book, keeping several books in flight at once.
+
+    Results come back in ``target_books`` order. An unmatched book is retried
+    once with an LLM-refined query before its slot is released.
+    """
+    local_books_by_author = _local_books_by_author(all_books)
+    author_work_cache: AuthorWorkCache = {}
+    slots = asyncio.Semaphore(config.METADATA_SYNC_CONCURRENCY)
+
+    async def search(book: models.Book) -> tuple[SearchIdentity, list[MetadataSuggestion]]:
+        async with slots:
+            identity = await resolve_search_identity(book, settings)
+            suggestions = await _build_suggestions_for_book(
                 book,
                 local_books_by_author,
                 author_work_cache,
-                max_candidates=1,
+                max_candidates=max_candidates,
                 search_identity=identity,
-            )[0]
-            for book, identity in zip(target_books, identities)
-        ]
-    )
-    for index, (book, identity, suggestion) in enumerate(zip(target_books, identities, suggestions)):
-        if suggestion.matched:
-            continue
-        refined = await refine_unmatched_search_identity(identity, settings)
-        if refined is None:
-            continue
-        refined_identity = SearchIdentity(
-            title=refined["title"],
-            author=refined["author"],
-            series=identity.series,
-            series_index=identity.series_index,
-            remote_ids=identity.remote_ids,
-            evidence_note=f"LLM retry query: {refined['reason']}" if refined["reason"] else "LLM retry query",
-            used_llm=True,
-            opening_excerpt=identity.opening_excerpt,
-        )
-        suggestions[index] = (
-            await asyncio.to_thread(
-                _build_suggestions_for_book,
+            )
+            if any(suggestion.matched for suggestion in suggestions):
+                return identity, suggestions
+            refined = await refine_unmatched_search_identity(identity, settings)
+            if refined is None:
+                return identity, suggestions
+            refined_identity = SearchIdentity(
+                title=refined["title"],
+                author=refined["author"],
+                series=identity.series,
+                series_index=identity.series_index,
+                remote_ids=identity.remote_ids,
+                evidence_note=f"LLM retry query: {refined['reason']}" if refined["reason"] else "LLM retry query",
+                used_llm=True,
+                opening_excerpt=identity.opening_excerpt,
+            )
+            return identity, await _build_suggestions_for_book(
                 book,
                 local_books_by_author,
                 author_work_cache,
-                max_candidates=1,
+                max_candidates=max_candidates,
                 search_identity=refined_identity,
             )
-        )[0]
+
+    tasks = [asyncio.ensure_future(search(book)) for book in target_books]
+    try:
+        results = await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+    return [identity for identity, _ in results], [suggestions for _, suggestions in results]
+
+
+async def _generate_suggestions(
+    target_books: list[models.Book],
+    all_books: list[models.Book],
+    *,
+    settings: Optional[models.AudiobookSettings] = None,
+) -> list[MetadataSuggestion]:
+    identities, candidate_groups = await _search_books_concurrently(
+        target_books,
+        all_books,
+        max_candidates=1,
+        settings=settings,
+    )
+    suggestions = [group[0] for group in candidate_groups]
     for book, suggestion in zip(target_books, suggestions):
         _annotate_duplicate_assignments(book, [suggestion], all_books)
     suggestions = [
@@ -1308,56 +1403,40 @@ async def _generate_suggestions(
     return suggestions
 
 
+async def _with_remote_identifier_holders(
+    db: AsyncSession,
+    books: list[models.Book],
+    candidate_groups: list[list[MetadataSuggestion]],
+) -> list[models.Book]:
+    """Add every library book already holding a suggested remote record to ``books``."""
+    identifiers = {
+        identifier
+        for suggestions in candidate_groups
+        for suggestion in suggestions
+        if suggestion.matched
+        for identifier in _stable_remote_identifiers(suggestion.remote_ids)
+    }
+    known_ids = {book.id for book in books}
+    holders = await crud.get_books_with_remote_identifiers(db, identifiers)
+    return [*books, *(holder for holder in holders if holder.id not in known_ids)]
+
+
 async def _generate_candidate_suggestions(
     target_books: list[models.Book],
     all_books: list[models.Book],
     *,
     max_candidates: int = DEFAULT_MATCH_CANDIDATE_LIMIT,
     settings: Optional[models.AudiobookSettings] = None,
+    db: Optional[AsyncSession] = None,
 ) -> list[list[MetadataSuggestion]]:
-    local_books_by_author: dict[str, list[models.Book]] = {}
-    for book in all_books:
-        local_books_by_author.setdefault(_normalize_text(book.author or ""), []).append(book)
-
-    author_work_cache: dict[str, list[dict[str, Any]]] = {}
-    identities = [await resolve_search_identity(book, settings) for book in target_books]
-
-    candidate_groups = await asyncio.to_thread(
-        lambda: [
-            _build_suggestions_for_book(
-                book,
-                local_books_by_author,
-                author_work_cache,
-                max_candidates=max_candidates,
-                search_identity=identity,
-            )
-            for book, identity in zip(target_books, identities)
-        ]
+    identities, candidate_groups = await _search_books_concurrently(
+        target_books,
+        all_books,
+        max_candidates=max_candidates,
+        settings=settings,
     )
-    for index, (book, identity, suggestions) in enumerate(zip(target_books, identities, candidate_groups)):
-        if any(suggestion.matched for suggestion in suggestions):
-            continue
-        refined = await refine_unmatched_search_identity(identity, settings)
-        if refined is None:
-            continue
-        refined_identity = SearchIdentity(
-            title=refined["title"],
-            author=refined["author"],
-            series=identity.series,
-            series_index=identity.series_index,
-            remote_ids=identity.remote_ids,
-            evidence_note=f"LLM retry query: {refined['reason']}" if refined["reason"] else "LLM retry query",
-            used_llm=True,
-            opening_excerpt=identity.opening_excerpt,
-        )
-        candidate_groups[index] = await asyncio.to_thread(
-            _build_suggestions_for_book,
-            book,
-            local_books_by_author,
-            author_work_cache,
-            max_candidates=max_candidates,
-            search_identity=refined_identity,
-        )
+    if db is not None:
+        all_books = await _with_remote_identifier_holders(db, all_books, candidate_groups)
     target_ids = {book.id for book in target_books}
     for book, suggestions in zip(target_books, candidate_groups):
         _annotate_duplicate_assignments(
@@ -1389,12 +1468,20 @@ async def generate_candidate_suggestions(
     *,
     max_candidates: int = DEFAULT_MATCH_CANDIDATE_LIMIT,
     settings: Optional[models.AudiobookSettings] = None,
+    db: Optional[AsyncSession] = None,
 ) -> list[list[MetadataSuggestion]]:
+    """Rank remote candidates for ``target_books`` against the local ``all_books``.
+
+    ``all_books`` must cover the targets' authors. When ``db`` is given, books
+    elsewhere in the library that already hold a suggested remote record are
+    looked up by identifier, so the caller need not load the whole library.
+    """
     return await _generate_candidate_suggestions(
         target_books,
         all_books,
         max_candidates=max_candidates,
         settings=settings,
+        db=db,
     )
 
 
@@ -4,12 +4,11 @@ from __future__ import annotations
 
 import os
 import shutil
-from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
-from sqlalchemy import select, text
+from sqlalchemy import and_, case, func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .. import crud
@@ -17,68 +16,99 @@ from ..config import LIBRARY_PATH
 from ..logging_config import read_persisted_logs, redact_value
 from ..models import ProcessingJob
 from .endpoint_pool import configured_endpoints
-from .processing_queue import ProcessingQueue
+from .processing_queue import RESOURCE_LANES, ProcessingQueue
 
+_JOB_STATUS_COUNTS = {
+    "queued": "queued",
+    "running": "running",
+    "completed": "completed",
+    "failed": "error",
+    "canceled": "canceled",
+}
 
-def _aware(value: datetime | None) -> datetime | None:
-    if value is None or value.tzinfo is not None:
-        return value
-    return value.replace(tzinfo=timezone.utc)
 
+def _average(total: float | None, count: int) -> float | None:
+    return round(total / count, 1) if count and total is not None else None
 
-def _average(values: list[float]) -> float | None:
-    return round(sum(values) / len(values), 1) if values else None
+
+def _elapsed_ms(db: AsyncSession, start, end):
+    """Non-negative milliseconds between two timestamp columns, NULL when either is missing."""
+    if db.get_bind().dialect.name == "postgresql":
+        elapsed = func.extract("epoch", end - start) * 1000
+    else:
+        elapsed = (func.julianday(end) - func.julianday(start)) * 86_400_000
+    return case((elapsed > 0, elapsed), else_=0.0)
 
 
 async def processing_job_metrics(db: AsyncSession, *, window_hours: int = 24) -> dict[str, Any]:
     """Summarize queue delay, runtime, retries, cancellation, and failures."""
     now = datetime.now(timezone.utc)
     cutoff = now - timedelta(hours=window_hours)
-    jobs = list(
-        (
-            await db.scalars(
-                select(ProcessingJob).where(ProcessingJob.created_at >= cutoff).order_by(ProcessingJob.created_at.desc())
-            )
-        ).all()
+    queue_delay = _elapsed_ms(db, ProcessingJob.created_at, ProcessingJob.started_at)
+    duration = _elapsed_ms(db, ProcessingJob.started_at, ProcessingJob.completed_at)
+    started = ProcessingJob.started_at.is_not(None)
+    finished = and_(started, ProcessingJob.completed_at.is_not(None))
+    rows = await db.execute(
+        select(
+            ProcessingJob.job_type,
+            func.count().label("total"),
+            *(func.count().filter(ProcessingJob.status == status).label(name) for name, status in _JOB_STATUS_COUNTS.items()),
+            func.coalesce(
+                func.sum(case((ProcessingJob.attempt_count > 1, ProcessingJob.attempt_count - 1), else_=0)), 0
+            ).label("retries"),
+            func.sum(queue_delay).filter(started).label("queue_delay_sum"),
+            func.count().filter(started).label("queue_delay_count"),
+            func.sum(duration).filter(finished).label("duration_sum"),
+            func.count().filter(finished).label("duration_count"),
+        )
+        .where(ProcessingJob.created_at >= cutoff)
+        .group_by(ProcessingJob.job_type)
+        .order_by(ProcessingJob.job_type)
     )
-    grouped: dict[str, list[ProcessingJob]] = defaultdict(list)
-    for job in jobs:
-        grouped[job.job_type].append(job)
-
-    def summarize(rows: list[ProcessingJob]) -> dict[str, Any]:
-        queue_delays = [
-            max(0.0, ((_aware(row.started_at) - _aware(row.created_at)).total_seconds() * 1000))
-            for row in rows
-            if row.started_at and row.created_at
-        ]
-        durations = [
-            max(0.0, ((_aware(row.completed_at) - _aware(row.started_at)).total_seconds() * 1000))
-            for row in rows
-            if row.completed_at and row.started_at
-        ]
-        statuses = defaultdict(int)
-        for row in rows:
-            statuses[row.status] += 1
+    grouped = {row.job_type: row._mapping for row in rows}
+    counters = ("total", *_JOB_STATUS_COUNTS, "retries")
+    sums = ("queue_delay_sum", "queue_delay_count", "duration_sum", "duration_count")
+
+    def summarize(values: dict[str, Any]) -> dict[str, Any]:
         return {
-            "total": len(rows),
-            "queued": statuses["queued"],
-            "running": statuses["running"],
-            "completed": statuses["completed"],
-            "failed": statuses["error"],
-            "canceled": statuses["canceled"],
-            "retries": sum(max(0, row.attempt_count - 1) for row in rows),
-            "average_queue_delay_ms": _average(queue_delays),
-            "average_duration_ms": _average(durations),
+            **{name: int(values[name] or 0) for name in counters},
+            "average_queue_delay_ms": _average(values["queue_delay_sum"], values["queue_delay_count"]),
+            "average_duration_ms": _average(values["duration_sum"], values["duration_count"]),
         }
 
+    totals = {name: sum(row[name] or 0 for row in grouped.values()) for name in (*counters, *sums)}
     return {
         "generated_at": now.isoformat(),
         "window_hours": window_hours,
-        "aggregate": summarize(jobs),
-        "by_job_type": {job_type: summarize(rows) for job_type, rows in sorted(grouped.items())},
+        "aggregate": summarize(totals),
+        "by_job_type": {job_type: summarize(row) for job_type, row in grouped.items()},
     }
 
 
+async def processing_queue_depth(db: AsyncSession, *, window_hours: int = 24) -> dict[str, Any]:
+    """Return the recorded per-lane queue depth, running count and oldest-queued age series."""
+    now = datetime.now(timezone.utc)
+    samples = await crud.get_processing_queue_samples(db, since=now - timedelta(hours=window_hours))
+    lanes: dict[str, list[dict[str, Any]]] = {lane: [] for lane in RESOURCE_LANES}
+    for sample in samples:
+        sampled_at = sample.sampled_at
+        if sampled_at.tzinfo is None:
+            sampled_at = sampled_at.replace(tzinfo=timezone.utc)
+        lanes.setdefault(sample.resource_lane, []).append(
+            {
+                "sampled_at": sampled_at.isoformat(),
+                "queued": sample.queued,
+                "running": sample.running,
+                "oldest_queued_age_ms": _rounded(sample.oldest_queued_age_ms),
+            }
+        )
+    return {"generated_at": now.isoformat(), "window_hours": window_hours, "lanes": lanes}
+
+
+def _rounded(value: float | None) -> float | None:
+    return round(value, 1) if value is not None else None
+
+
 def storage_health(path: Path = LIBRARY_PATH) -> dict[str, Any]:
     """Report capacity and writability without exposing the host path."""
     target = path if path.exists() else path.parent
@@ -165,12 +195,37 @@ def diagnostic_configuration() -> dict[str, Any]:
         "PROCESSING_LEASE_SECONDS",
         "PROCESSING_HEARTBEAT_SECONDS",
         "PROCESSING_POLL_SECONDS",
+        "PROCESSING_SAFETY_POLL_SECONDS",
+        "PROCESSING_RECOVERY_SECONDS",
         "PROCESSING_RETRY_BACKOFF_SECONDS",
+        "PROCESSING_QUEUE_SAMPLE_SECONDS",
+        "PROCESSING_QUEUE_SAMPLE_RETENTION_DAYS",
         "PROCESSING_CPU_CONCURRENCY",
         "PROCESSING_MAINTENANCE_CONCURRENCY",
         "PROCESSING_LLM_CONCURRENCY",
         "PROCESSING_TTS_CONCURRENCY",
         "PROCESSING_TRANSCRIPTION_CONCURRENCY",
+        "PROCESSING_CPU_PREFETCH",
+        "PROCESSING_MAINTENANCE_PREFETCH",
+        "PROCESSING_LLM_PREFETCH",
+        "PROCESSING_TTS_PREFETCH",
+        "PROCESSING_TRANSCRIPTION_PREFETCH",
+        "WEB_REFRESH_CONCURRENCY",
+        "WEB_REFRESH_PER_HOST_CONCURRENCY",
+        "WEB_REFRESH_HOST_DELAY_SECONDS",
+        "EPUB_PROCESS_WORKERS",
+        "AI_HTTP_MAX_CONNECTIONS",
+        "AI_HTTP_MAX_KEEPALIVE_CONNECTIONS",
+        "AI_HTTP_KEEPALIVE_SECONDS",
+        "AI_ENDPOINT_MAX_IN_FLIGHT",
+        "TRANSCRIPTION_WINDOW_SECONDS",
+        "METADATA_CACHE_TTL_HOURS",
+        "METADATA_CACHE_MAX_MB",
+        "METADATA_SYNC_CONCURRENCY",
+        "TRANSCRIPTION_WINDOW_OVERLAP_SECONDS",
+        "READER_KEY_CACHE_SECONDS",
+        "API_KEY_USAGE_FLUSH_SECONDS",
+        "ENDPOINT_METRICS_RETENTION_DAYS",
     )
     return redact_value({name: os.getenv(name, "default") for name in names})
 
@@ -6,10 +6,12 @@ import asyncio
 import logging
 import os
 import socket
+from datetime import datetime, timedelta, timezone
 from typing import Awaitable, Callable, TypeVar
 from uuid import uuid4
 
 from sqlalchemy import func, select
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .. import crud
@@ -33,8 +35,9 @@ from .audiobook_tts import generate_audio_for_sentence
 from .audiobook_assembly import assemble_chapter_preview
 from .audiobook_tts import generate_audio_for_chapter_preview
 from .backup_barrier import backup_barrier
-from .backups import create_backup_archive, resolve_backup, verify_backup_archive
+from .backups import create_backup, resolve_backup, verify_backup
 from .cover_processing import reextract_book_cover
+from .epub_workers import epub_worker_count
 from .metadata_jobs import process_metadata_sync_job
 from .transcription_providers import transcription_provider_name
 from .update_scheduler import run_web_novel_update
@@ -46,6 +49,8 @@ logger = logging.getLogger(__name__)
 _Result = TypeVar("_Result")
 
 RESOURCE_LANES = ("cpu", "maintenance", "llm", "tts", "transcription")
+# Lanes dominated by short jobs claim several per round trip; override with PROCESSING_<LANE>_PREFETCH.
+DEFAULT_LANE_PREFETCH = {"maintenance": 8, "tts": 8}
 JOB_POLICIES: dict[str, tuple[str, int]] = {
     "clean_book": ("cpu", 3),
     "clean_all": ("cpu", 3),
@@ -82,26 +87,54 @@ def _positive_float_env(name: str, default: float) -> float:
         return default
 
 
+def _listen_conninfo(database_url: str) -> str | None:
+    """Translate the SQLAlchemy URL into a libpq URI, or None when NOTIFY is unavailable."""
+    url = make_url(database_url)
+    if url.get_backend_name() != "postgresql":
+        return None
+    return url.set(drivername="postgresql").render_as_string(hide_password=False)
+
+
 class ProcessingQueue:
-    """A durable ledger backed by a small set of resource-aware workers."""
+    """A durable ledger backed by a small set of resource-aware workers.
+
+    Workers sleep until PostgreSQL delivers a NOTIFY for their lane on the
+    shared LISTEN connection. Polling remains as a slow safety net, and a single
+    sweeper finalizes abandoned leases for the whole process.
+    """
 
     def __init__(self) -> None:
         self._worker_tasks: list[asyncio.Task[None]] = []
-        self._wake = asyncio.Event()
+        self._service_tasks: list[asyncio.Task[None]] = []
+        self._lane_wakes = {lane: asyncio.Event() for lane in RESOURCE_LANES}
+        self._listening = False
         self._instance_id = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
         self._lease_seconds = _positive_int_env("PROCESSING_LEASE_SECONDS", 60)
+        self._lane_prefetch = {
+            lane: _positive_int_env(f"PROCESSING_{lane.upper()}_PREFETCH", DEFAULT_LANE_PREFETCH.get(lane, 1))
+            for lane in RESOURCE_LANES
+        }
         self._heartbeat_seconds = min(
             _positive_int_env("PROCESSING_HEARTBEAT_SECONDS", 15),
             max(1, self._lease_seconds // 2),
         )
         self._poll_seconds = _positive_float_env("PROCESSING_POLL_SECONDS", 1)
+        self._safety_poll_seconds = _positive_float_env("PROCESSING_SAFETY_POLL_SECONDS", 30)
+        self._recovery_seconds = _positive_float_env("PROCESSING_RECOVERY_SECONDS", 30)
         self._retry_backoff_seconds = _positive_int_env("PROCESSING_RETRY_BACKOFF_SECONDS", 5)
+        self._sample_seconds = _positive_float_env("PROCESSING_QUEUE_SAMPLE_SECONDS", 60)
+        self._sample_retention_days = _positive_int_env("PROCESSING_QUEUE_SAMPLE_RETENTION_DAYS", 7)
 
-    async def start(self) -> None:
+    async def start(self, *, listen: bool = True) -> None:
         if self._worker_tasks:
             if all(not task.done() for task in self._worker_tasks):
                 return
             await self.stop()
+        conninfo = _listen_conninfo(DATABASE_URL) if listen else None
+        if conninfo is not None:
+            self._start_service_task(self._listen(conninfo), "processing-listener")
+        self._start_service_task(self._sweep(), "processing-lease-sweeper")
+        self._start_service_task(self._sample_depth(), "processing-depth-sampler")
         for lane in RESOURCE_LANES:
             count = _positive_int_env(f"PROCESSING_{lane.upper()}_CONCURRENCY", 1)
             for index in range(count):
@@ -112,7 +145,19 @@ class ProcessingQueue:
                 task.add_done_callback(self._worker_finished)
                 self._worker_tasks.append(task)
         await get_audiobook_queue().start_background_audio()
-        self._wake.set()
+        self._wake_lanes()
+
+    def _start_service_task(self, coroutine: Awaitable[None], name: str) -> None:
+        task = asyncio.create_task(coroutine, name=name)
+        task.add_done_callback(self._worker_finished)
+        self._service_tasks.append(task)
+
+    def _wake_lanes(self, resource_lane: str | None = None) -> None:
+        if resource_lane is None:
+            for event in self._lane_wakes.values():
+                event.set()
+        elif resource_lane in self._lane_wakes:
+            self._lane_wakes[resource_lane].set()
 
     @property
     def is_running(self) -> bool:
@@ -143,86 +188,242 @@ class ProcessingQueue:
             "active_workers": len(alive),
             "failed_workers": len(dead),
             "lanes": configured,
+            "notifications": "listening" if self._listening else "polling",
         }
 
     async def stop(self) -> None:
         if not self._worker_tasks:
             return
-        for task in self._worker_tasks:
+        tasks = [*self._worker_tasks, *self._service_tasks]
+        for task in tasks:
             task.cancel()
-        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        await asyncio.gather(*tasks, return_exceptions=True)
         self._worker_tasks.clear()
+        self._service_tasks.clear()
+        self._listening = False
         await get_audiobook_queue().stop_background_audio()
-        self._wake = asyncio.Event()
+        self._lane_wakes = {lane: asyncio.Event() for lane in RESOURCE_LANES}
 
-    async def enqueue(self, job_id: int) -> bool:
-        """Wake database pollers; the job ID is never held as queue ownership."""
+    async def enqueue(self, job_id: int, resource_lane: str | None = None) -> bool:
+        """Wake local workers; the job ID is never held as queue ownership."""
         del job_id
-        self._wake.set()
+        self._wake_lanes(resource_lane)
         return True
 
     async def requeue_pending(self) -> int:
         async with SessionLocal() as db:
             canceled, exhausted = await crud.recover_abandoned_processing_jobs(db)
-        self._wake.set()
+        self._wake_lanes()
         return canceled + exhausted
 
+    async def _listen(self, conninfo: str) -> None:
+        """Hold one LISTEN connection and wake a lane's workers on each NOTIFY."""
+        import psycopg
+        from psycopg import sql
+
+        channels = {crud.processing_lane_channel(lane): lane for lane in RESOURCE_LANES}
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(conninfo, autocommit=True) as conn:
+                    for channel in channels:
+                        await conn.execute(sql.SQL("LISTEN {}").format(sql.Identifier(channel)))
+                    self._listening = True
+                    # Anything queued while the connection was down produced no notification.
+                    self._wake_lanes()
+                    async for notification in conn.notifies():
+                        self._wake_lanes(channels.get(notification.channel))
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("Processing queue notifications are unavailable; falling back to polling: %s", exc)
+            finally:
+                self._listening = False
+            await asyncio.sleep(self._safety_poll_seconds)
+
+    async def _sweep(self) -> None:
+        """Finalize expired leases once per interval instead of on every worker poll."""
+        while True:
+            await asyncio.sleep(self._recovery_seconds)
+            try:
+                await backup_barrier.wait_until_writes_allowed()
+                await self.requeue_pending()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Processing lease sweeper could not recover abandoned jobs.")
+
+    async def _sample_depth(self) -> None:
+        """Record per-lane backlog each interval so queue depth can be graphed over time."""
+        while True:
+            await asyncio.sleep(self._sample_seconds)
+            try:
+                await backup_barrier.wait_until_writes_allowed()
+                async with SessionLocal() as db:
+                    await crud.record_processing_queue_samples(
+                        db,
+                        resource_lanes=RESOURCE_LANES,
+                        min_interval_seconds=self._sample_seconds / 2,
+                        retention_days=self._sample_retention_days,
+                    )
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Processing queue sampler could not record lane depth.")
+
+    async def _idle_timeout(self, lane: str) -> float:
+        """Sleep until the next delayed retry, bounded by the active polling interval."""
+        timeout = self._safety_poll_seconds if self._listening else self._poll_seconds
+        async with SessionLocal() as db:
+            available_at = await crud.get_next_processing_job_available_at(db, resource_lane=lane)
+        if available_at is not None:
+            timeout = min(timeout, max(0.0, (available_at - datetime.now(timezone.utc)).total_seconds()))
+        return timeout
+
     async def _run(self, lane: str, worker_number: int) -> None:
         lease_owner = f"{self._instance_id}:{lane}:{worker_number}"
         while True:
+            # Clear before claiming so a NOTIFY that lands mid-claim still wakes this worker.
+            wake = self._lane_wakes[lane]
+            wake.clear()
             try:
                 await backup_barrier.wait_until_writes_allowed()
                 async with SessionLocal() as db:
-                    await crud.recover_abandoned_processing_jobs(db)
-                    job = await crud.claim_processing_job(
+                    jobs = await crud.claim_processing_jobs(
                         db,
                         resource_lane=lane,
                         lease_owner=lease_owner,
                         lease_seconds=self._lease_seconds,
+                        limit=self._lane_prefetch[lane],
                     )
+                timeout = await self._idle_timeout(lane) if not jobs else 0.0
             except asyncio.CancelledError:
                 raise
             except Exception:
                 logger.exception("Processing %s worker could not poll the durable queue.", lane)
                 await asyncio.sleep(self._poll_seconds)
                 continue
-            if job is None:
-                self._wake.clear()
+            if not jobs:
                 try:
-                    await asyncio.wait_for(self._wake.wait(), timeout=self._poll_seconds)
+                    await asyncio.wait_for(wake.wait(), timeout=timeout)
                 except asyncio.TimeoutError:
                     pass
                 continue
+            await self._run_claimed(lane, lease_owner, jobs)
 
-            if backup_barrier.backup_active and job.job_type != "create_backup":
-                async with SessionLocal() as db:
-                    await crud.defer_processing_job_for_backup(db, job.id, lease_owner=lease_owner)
-                await backup_barrier.wait_until_writes_allowed()
-                self._wake.set()
-                continue
+    def _start_deadline(self, job: ProcessingJob) -> datetime:
+        """Latest time a prefetched job may start and still see its first heartbeat in time."""
+        lease_expires_at = job.lease_expires_at
+        if lease_expires_at.tzinfo is None:
+            lease_expires_at = lease_expires_at.replace(tzinfo=timezone.utc)
+        return lease_expires_at - timedelta(seconds=2 * self._heartbeat_seconds)
 
-            with correlation_context(request_id=job.request_id, job_id=job.id):
-                try:
-                    detail = await self._execute_with_heartbeat(job, lease_owner)
+    async def _run_claimed(self, lane: str, lease_owner: str, jobs: list[ProcessingJob]) -> None:
+        """Run a claimed batch in order, handing back whatever cannot start while its lease holds."""
+        start_deadline = self._start_deadline(jobs[0])
+        prefetched = list(jobs)
+        try:
+            while prefetched:
+                job = prefetched.pop(0)
+                if backup_barrier.backup_active and job.job_type != "create_backup":
                     async with SessionLocal() as db:
-                        if await crud.is_processing_job_cancel_requested(db, job.id):
-                            await crud.mark_processing_job_canceled(db, job.id)
-                        else:
-                            await crud.complete_processing_job(db, job.id, detail, lease_owner=lease_owner)
-                except asyncio.CancelledError:
-                    raise
-                except Exception as exc:
-                    logger.exception("Processing job %s (%s) failed.", job.id, job.job_type)
+                        await crud.defer_processing_job_for_backup(db, job.id, lease_owner=lease_owner)
+                    await self._release_prefetched(
+                        lane, lease_owner, prefetched, detail="Waiting for library backup to finish"
+                    )
+                    await backup_barrier.wait_until_writes_allowed()
+                    self._wake_lanes(lane)
+                    return
+                if job is not jobs[0]:
                     async with SessionLocal() as db:
-                        status = await crud.fail_processing_job(
-                            db,
-                            job.id,
-                            redact_text(str(exc)),
-                            lease_owner=lease_owner,
-                            retry_backoff_seconds=self._retry_backoff_seconds,
-                        )
-                    if status == "queued":
-                        self._wake.set()
+                        if not await crud.start_prefetched_processing_job(db, job.id, lease_owner=lease_owner):
+                            continue
+                await self._run_job(lane, lease_owner, job, prefetched, start_deadline)
+                if prefetched and datetime.now(timezone.utc) >= start_deadline:
+                    await self._release_prefetched(lane, lease_owner, prefetched)
+        finally:
+            if prefetched:
+                await self._release_prefetched(lane, lease_owner, prefetched)
+
+    async def _release_prefetched(
+        self,
+        lane: str,
+        lease_owner: str,
+        prefetched: list[ProcessingJob],
+        *,
+        detail: str = "Queued",
+    ) -> None:
+        job_ids = [job.id for job in prefetched]
+        prefetched.clear()
+        if not job_ids:
+            return
+        try:
+            async with SessionLocal() as db:
+                await crud.release_processing_jobs(
+                    db,
+                    job_ids,
+                    resource_lane=lane,
+                    lease_owner=lease_owner,
+                    detail=detail,
+                )
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Processing %s worker could not release %s prefetched jobs.", lane, len(job_ids))
+        self._wake_lanes(lane)
+
+    async def _run_job(
+        self,
+        lane: str,
+        lease_owner: str,
+        job: ProcessingJob,
+        prefetched: list[ProcessingJob],
+        start_deadline: datetime,
+    ) -> None:
+        with correlation_context(request_id=job.request_id, job_id=job.id):
+            try:
+                detail = await self._execute_ahead_of_prefetched(job, lease_owner, lane, prefetched, start_deadline)
+                async with SessionLocal() as db:
+                    if await crud.is_processing_job_cancel_requested(db, job.id):
+                        await crud.mark_processing_job_canceled(db, job.id)
+                    else:
+                        await crud.complete_processing_job(db, job.id, detail, lease_owner=lease_owner)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.exception("Processing job %s (%s) failed.", job.id, job.job_type)
+                async with SessionLocal() as db:
+                    status = await crud.fail_processing_job(
+                        db,
+                        job.id,
+                        redact_text(str(exc)),
+                        lease_owner=lease_owner,
+                        retry_backoff_seconds=self._retry_backoff_seconds,
+                    )
+                if status == "queued":
+                    self._wake_lanes(lane)
+
+    async def _execute_ahead_of_prefetched(
+        self,
+        job: ProcessingJob,
+        lease_owner: str,
+        lane: str,
+        prefetched: list[ProcessingJob],
+        start_deadline: datetime,
+    ) -> str:
+        """Run one job, releasing the jobs claimed behind it if it outlasts their start deadline."""
+        if not prefetched:
+            return await self._execute_with_heartbeat(job, lease_owner)
+        operation = asyncio.create_task(self._execute_with_heartbeat(job, lease_owner), name=f"processing-job-{job.id}")
+        try:
+            remaining = max(0.0, (start_deadline - datetime.now(timezone.utc)).total_seconds())
+            done, _pending = await asyncio.wait({operation}, timeout=remaining)
+            if not done:
+                await self._release_prefetched(lane, lease_owner, prefetched)
+            return await operation
+        except asyncio.CancelledError:
+            operation.cancel()
+            await asyncio.gather(operation, return_exceptions=True)
+            raise
 
     async def _execute_with_heartbeat(self, job: ProcessingJob, lease_owner: str) -> str:
         operation = asyncio.create_task(self._execute(job), name=f"processing-operation-{job.id}")
@@ -281,7 +482,7 @@ class ProcessingQueue:
                     )
                 await self._update_progress(job.id, 0, 2, "Creating database and library snapshot")
                 summary = await asyncio.to_thread(
-                    create_backup_archive,
+                    create_backup,
                     database_url=DATABASE_URL,
                     library_path=LIBRARY_PATH,
                     backup_path=BACKUP_PATH,
@@ -293,7 +494,7 @@ class ProcessingQueue:
             filename = str(payload.get("filename") or "")
             archive = resolve_backup(BACKUP_PATH, filename)
             await self._update_progress(job.id, 0, 1, f"Verifying {filename}")
-            await asyncio.to_thread(verify_backup_archive, archive)
+            await asyncio.to_thread(verify_backup, archive)
             await self._update_progress(job.id, 1, 1, f"Verified {filename}")
             return f"Backup verified: {filename}"
         if job.job_type == "clean_book":
@@ -383,7 +584,7 @@ class ProcessingQueue:
                     dedupe_key=f"align_imported_audiobook:imported_audiobook:{target_id}",
                     progress_detail="Queued automatically after audiobook import",
                 )
-                await self.enqueue(child.id)
+                await self.enqueue(child.id, child.resource_lane)
                 return "Human audiobook import completed; timestamp alignment queued"
             return "Human audiobook import completed"
         if job.job_type == "upgrade_imported_audiobook":
@@ -421,7 +622,7 @@ class ProcessingQueue:
                     dedupe_key=f"align_imported_audiobook:imported_audiobook:{job.target_id}",
                     progress_detail="Queued after human-audio rematch",
                 )
-                await self.enqueue(child.id)
+                await self.enqueue(child.id, child.resource_lane)
             return f"Human audiobook rematched ({matched} tracks)"
         if job.job_type == "align_imported_audiobook":
             target_id = _required_target(job)
@@ -522,21 +723,57 @@ class ProcessingQueue:
             configs = await crud.get_cleaning_configs(db)
             total = len(books)
             await crud.update_processing_job_progress(db, job_id, current=0, total=total, detail="Starting library cleaning")
+            # Rewrites fan out across the EPUB process pool; results are recorded
+            # one at a time here because the session is not safe to share.
+            window = epub_worker_count() * 2
+            remaining = iter(books)
+            running: dict[asyncio.Task, Book] = {}
+            finished = 0
             updated = 0
-            for index, book in enumerate(books, start=1):
-                if await crud.is_processing_job_cancel_requested(db, job_id):
-                    return f"Stopped after {index - 1} of {total} books"
-                changed = await epub_editor.apply_book_cleaning(book, db, force=True, cleaning_configs=configs)
-                if changed:
-                    updated += 1
-                    await queue_audio_reconciliation(book, db, parent_job_id=job_id)
-                await crud.update_processing_job_progress(
-                    db,
-                    job_id,
-                    current=index,
-                    total=total,
-                    detail=f"Cleaned {index} of {total} books; {updated} changed",
-                )
+            stopped = False
+            try:
+                while True:
+                    while not stopped and len(running) < window:
+                        book = next(remaining, None)
+                        if book is None:
+                            break
+                        if await crud.is_processing_job_cancel_requested(db, job_id):
+                            stopped = True
+                            break
+                        plan = epub_editor.plan_book_cleaning(
+                            book, epub_editor.match_cleaning_configs(book, configs), force=True
+                        )
+                        if plan is None:
+                            finished += 1
+                            continue
+                        running[asyncio.create_task(epub_editor.run_cleaning_plan(plan))] = book
+                    if not running:
+                        break
+                    done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        book = running.pop(task)
+                        finished += 1
+                        try:
+                            changed = await epub_editor.record_book_cleaning(book, db, task.result(), force=True)
+                        except Exception as e:
+                            await db.rollback()
+                            logger.error("Failed to apply cleaning to %s: %s", book.title, e, exc_info=True)
+                            changed = False
+                        if changed:
+                            updated += 1
+                            await queue_audio_reconciliation(book, db, parent_job_id=job_id)
+                        await crud.update_processing_job_progress(
+                            db,
+                            job_id,
+                            current=finished,
+                            total=total,
+                            detail=f"Cleaned {finished} of {total} books; {updated} changed",
+                        )
+            finally:
+                for task in running:
+                    task.cancel()
+        if stopped:
+            return f"Stopped after {finished} of {total} books; {updated} changed"
         return f"Cleaned {total} books; {updated} changed"
 
     async def _run_audiobook_pipeline(self, job: ProcessingJob) -> str:
@@ -766,7 +1003,7 @@ async def queue_processing_job(
             progress_detail=progress_detail,
         )
         if created and get_processing_queue().is_running:
-            await get_processing_queue().enqueue(job.id)
+            await get_processing_queue().enqueue(job.id, resource_lane)
         return job
     finally:
         if owns_session:
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import re
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Iterable
 
 from .metadata.scoring import infer_series_metadata
@@ -26,6 +26,7 @@ _SERIES_PATTERNS = (
     re.compile(rf"^(?P<series>.+?)\s+(?P<num>{_NUMBER_TOKEN})(?:\s*[-:(].*)?$", re.IGNORECASE),
 )
 _PARENTHETICAL_SERIES_RE = re.compile(r"^.+?\((?P<series>[^)]+)\)\s*$")
+_LABEL_PREFIX_SEPARATOR_RE = re.compile(r"(?=: | - |, )")
 
 
 @dataclass(frozen=True)
@@ -86,34 +87,94 @@ def _extract_series_hints(title: str) -> list[str]:
     return deduped
 
 
-def _labels_overlap(left: str, right: str) -> bool:
-    if left == right:
-        return True
-    return left.endswith(" " + right) or right.endswith(" " + left)
-
-
 def _choose_canonical_label(labels: Iterable[str]) -> str:
     return min(labels, key=lambda label: (len(_normalize_series_name(label)), len(label), label.casefold()))
 
 
-def _title_matches_series(title: str, label: str) -> bool:
-    raw_title = title.strip()
-    raw_label = label.strip()
-    normalized_title = _normalize_series_name(raw_title)
-    normalized_label = _normalize_series_name(raw_label)
-    if normalized_title == normalized_label:
-        return True
+@dataclass
+class _SeriesCluster:
+    labels: list[str] = field(default_factory=list)
+    books: set[tuple[str, str]] = field(default_factory=set)
+
 
-    title_without_trailing_metadata = _TRAILING_METADATA_RE.sub("", raw_title).strip()
-    normalized_without_metadata = _normalize_series_name(title_without_trailing_metadata)
-    if normalized_without_metadata == normalized_label:
-        return True
+class _AuthorSeriesIndex:
+    """Series clusters for one author bucket, built one book at a time.
 
-    prefixes = (f"{raw_label}: ", f"{raw_label} - ", f"{raw_label}, ")
-    return any(raw_title.startswith(prefix) for prefix in prefixes)
+    Two hints belong to the same cluster when one is a word suffix of the other, so every
+    cluster is indexed by its exact labels and by each word suffix of them. A new hint finds
+    the earliest overlapping cluster with one lookup per word it contains instead of
+    comparing itself with every label seen so far.
+    """
+
+    def __init__(self) -> None:
+        self.books: list[SeriesBook] = []
+        self.clusters: list[_SeriesCluster] = []
+        self._label_owner: dict[str, int] = {}
+        self._suffix_owner: dict[str, int] = {}
+
+    def add(self, book: SeriesBook) -> None:
+        self.books.append(book)
+        for hint in _extract_series_hints(book.title):
+            normalized_hint = _normalize_series_name(hint)
+            position = self._overlapping_cluster(normalized_hint)
+            if position is None:
+                position = len(self.clusters)
+                self.clusters.append(_SeriesCluster())
+            cluster = self.clusters[position]
+            cluster.labels.append(hint)
+            cluster.books.add((book.author, book.title))
+            self._index_label(normalized_hint, position)
+
+    def _overlapping_cluster(self, normalized_hint: str) -> int | None:
+        words = normalized_hint.split(" ")
+        owners = [self._label_owner.get(" ".join(words[start:])) for start in range(len(words))]
+        owners.append(self._suffix_owner.get(normalized_hint))
+        return min((owner for owner in owners if owner is not None), default=None)
+
+    def _index_label(self, normalized_label: str, position: int) -> None:
+        self._label_owner[normalized_label] = min(position, self._label_owner.get(normalized_label, position))
+        words = normalized_label.split(" ")
+        for start in range(len(words)):
+            suffix = " ".join(words[start:])
+            self._suffix_owner[suffix] = min(position, self._suffix_owner.get(suffix, position))
+
+    def assignments(self) -> dict[tuple[str, str], str]:
+        result: dict[tuple[str, str], str] = {}
+        by_normalized_label: dict[str, tuple[int, str]] = {}
+        by_label: dict[str, tuple[int, str]] = {}
+        for rank, cluster in enumerate(cluster for cluster in self.clusters if len(cluster.books) >= 2):
+            canonical = _choose_canonical_label(cluster.labels)
+            for key in cluster.books:
+                result[key] = canonical
+            for label in cluster.labels:
+                by_normalized_label.setdefault(_normalize_series_name(label), (rank, canonical))
+                by_label.setdefault(label.strip(), (rank, canonical))
 
+        if not by_label:
+            return result
 
-def detect_series_from_books(books: list[SeriesBook]) -> dict[tuple[str, str], str]:
+        for book in self.books:
+            key = (book.author, book.title)
+            if key in result:
+                continue
+            raw_title = book.title.strip()
+            without_trailing_metadata = _TRAILING_METADATA_RE.sub("", raw_title).strip()
+            matches = [
+                by_normalized_label.get(_normalize_series_name(raw_title)),
+                by_normalized_label.get(_normalize_series_name(without_trailing_metadata)),
+                *(by_label.get(raw_title[slice(match.start())]) for match in _LABEL_PREFIX_SEPARATOR_RE.finditer(raw_title)),
+            ]
+            best = min((match for match in matches if match is not None), default=None)
+            if best is not None:
+                result[key] = best[1]
+        return result
+
+
+def detect_series_from_books(
+    books: list[SeriesBook],
+    *,
+    changed: Iterable[SeriesBook] | None = None,
+) -> dict[tuple[str, str], str]:
     """
     Detect series assignments from title patterns, grouped by normalized author.
 
@@ -123,57 +184,25 @@ def detect_series_from_books(books: list[SeriesBook]) -> dict[tuple[str, str], s
       - "<title>: Series, Book II"
       - "<series>: Book 2 (...)"
       - "<series> 3"
+
+    When ``changed`` is given, only the author buckets containing one of those books are
+    evaluated, so adding or editing a few books does not re-cluster the whole library.
     """
 
-    result: dict[tuple[str, str], str] = {}
     books_by_author: dict[str, list[SeriesBook]] = defaultdict(list)
     for book in books:
         books_by_author[_normalize_author_name(book.author)].append(book)
 
-    for author_books in books_by_author.values():
-        clusters: list[dict[str, list[str] | set[tuple[str, str]]]] = []
-
-        for book in author_books:
-            for hint in _extract_series_hints(book.title):
-                normalized_hint = _normalize_series_name(hint)
-                cluster = next(
-                    (
-                        existing
-                        for existing in clusters
-                        if any(_labels_overlap(normalized_hint, existing_label) for existing_label in existing["normalized"])
-                    ),
-                    None,
-                )
-                if cluster is None:
-                    cluster = {"labels": [], "normalized": [], "books": set()}
-                    clusters.append(cluster)
-                cluster["labels"].append(hint)
-                cluster["normalized"].append(normalized_hint)
-                cluster["books"].add((book.author, book.title))
-
-        confirmed = []
-        for cluster in clusters:
-            if len(cluster["books"]) < 2:
-                continue
-            canonical = _choose_canonical_label(cluster["labels"])
-            confirmed.append((canonical, list(cluster["labels"]), set(cluster["books"])))
-            for key in cluster["books"]:
-                result[key] = canonical
-
-        if not confirmed:
-            continue
-
-        for book in author_books:
-            key = (book.author, book.title)
-            if key in result:
-                continue
-            for canonical, labels, _cluster_books in confirmed:
-                if _title_matches_series(book.title, canonical) or any(
-                    _title_matches_series(book.title, label) for label in labels
-                ):
-                    result[key] = canonical
-                    break
+    authors: Iterable[str] = books_by_author
+    if changed is not None:
+        authors = {_normalize_author_name(book.author) for book in changed} & books_by_author.keys()
 
+    result: dict[tuple[str, str], str] = {}
+    for author in authors:
+        index = _AuthorSeriesIndex()
+        for book in books_by_author[author]:
+            index.add(book)
+        result.update(index.assignments())
     return result
 
 
@@ -185,15 +214,30 @@ def detect_series_from_titles(titles: list[str]) -> dict[str, str]:
     return {title: assignments[("", title)] for title in titles if ("", title) in assignments}
 
 
-def enrich_series_metadata(books: list[object], *, target_ids: set[int] | None = None) -> list[object]:
-    """Fill only missing series names and positions from deterministic title evidence."""
+def enrich_series_metadata(
+    books: list[object],
+    *,
+    target_ids: set[int] | None = None,
+    changed_ids: set[int] | None = None,
+) -> list[object]:
+    """Fill only missing series names and positions from deterministic title evidence.
+
+    ``target_ids`` limits which books are updated. ``changed_ids`` limits detection to the
+    authors of those books but may still update their unchanged peers; it defaults to the
+    targets.
+    """
 
-    without_series = [
-        SeriesBook(title=str(getattr(book, "title", "")), author=str(getattr(book, "author", "")))
-        for book in books
-        if not getattr(book, "series", None)
-    ]
-    detected = detect_series_from_books(without_series) if len(without_series) >= 2 else {}
+    scope_ids = changed_ids if changed_ids is not None else target_ids
+    without_series = []
+    changed_books: list[SeriesBook] | None = None if scope_ids is None else []
+    for book in books:
+        if getattr(book, "series", None):
+            continue
+        series_book = SeriesBook(title=str(getattr(book, "title", "")), author=str(getattr(book, "author", "")))
+        without_series.append(series_book)
+        if changed_books is not None and getattr(book, "id", None) in scope_ids:
+            changed_books.append(series_book)
+    detected = detect_series_from_books(without_series, changed=changed_books) if len(without_series) >= 2 else {}
     changed: list[object] = []
     for book in books:
         if target_ids is not None and getattr(book, "id", None) not in target_ids:
@@ -0,0 +1,175 @@
+"""Append-only per-chapter containers for generated sentence audio.
+
+Each chapter keeps its sentence clips in one ``.pack`` file of concatenated
+MP3 payloads. A JSON index beside it maps sentence ids to byte ranges and
+exact durations and names the pack generation currently in use. Regenerated
+sentences are appended and the index points at the newest copy;
+``compact_pack`` rewrites live clips into a new generation once superseded
+bytes dominate, switching over by atomically replacing the index.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+import json
+import os
+from pathlib import Path
+import threading
+
+INDEX_SUFFIX = ".index.json"
+PACK_SUFFIX = ".pack"
+# Rewrite a pack when more than this share of its bytes is no longer indexed.
+COMPACT_GARBAGE_RATIO = 0.25
+
+
+@dataclass(frozen=True)
+class SnippetEntry:
+    offset: int
+    length: int
+    duration_ms: float
+
+
+@dataclass(frozen=True)
+class SnippetPack:
+    """The pack generation an index currently points at."""
+
+    path: Path
+    generation: int
+    entries: dict[int, SnippetEntry]
+
+
+_locks: dict[Path, threading.Lock] = {}
+_locks_guard = threading.Lock()
+
+
+def is_snippet_index(path: str | Path | None) -> bool:
+    return bool(path) and str(path).endswith(INDEX_SUFFIX)
+
+
+def chapter_index_name(chapter_id: int) -> str:
+    return f"chapter-{chapter_id}{INDEX_SUFFIX}"
+
+
+def _stem(index_path: Path) -> str:
+    return index_path.name[: -len(INDEX_SUFFIX)]
+
+
+def _pack_path(index_path: Path, generation: int) -> Path:
+    return index_path.with_name(f"{_stem(index_path)}.{generation}{PACK_SUFFIX}")
+
+
+def _lock(index_path: Path) -> threading.Lock:
+    key = index_path.resolve()
+    with _locks_guard:
+        return _locks.setdefault(key, threading.Lock())
+
+
+def _read_pack(index_path: Path) -> SnippetPack:
+    try:
+        payload = json.loads(index_path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return SnippetPack(path=_pack_path(index_path, 1), generation=1, entries={})
+    generation = int(payload["generation"])
+    entries = {
+        int(sentence_id): SnippetEntry(int(offset), int(length), float(duration_ms))
+        for sentence_id, (offset, length, duration_ms) in payload["entries"].items()
+    }
+    return SnippetPack(path=_pack_path(index_path, generation), generation=generation, entries=entries)
+
+
+def _write_index(index_path: Path, generation: int, entries: dict[int, SnippetEntry]) -> None:
+    payload = {
+        "generation": generation,
+        "entries": {
+            str(sentence_id): [entry.offset, entry.length, entry.duration_ms] for sentence_id, entry in entries.items()
+        },
+    }
+    temporary = index_path.with_name(f"{index_path.name}.tmp")
+    temporary.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+    os.replace(temporary, index_path)
+
+
+def read_pack(index_path: Path) -> SnippetPack:
+    with _lock(index_path):
+        return _read_pack(index_path)
+
+
+def append_snippets(index_path: Path, clips: Iterable[tuple[int, bytes, float]]) -> dict[int, SnippetEntry]:
+    """Append ``(sentence_id, mp3_bytes, duration_ms)`` clips and index them.
+
+    The payload is synced before the index is replaced, so a crash can only
+    leave unindexed bytes at the end of the pack for the next compaction.
+    """
+    with _lock(index_path):
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        pack = _read_pack(index_path)
+        entries = dict(pack.entries)
+        written = {}
+        with pack.path.open("ab") as handle:
+            offset = handle.seek(0, os.SEEK_END)
+            for sentence_id, audio_bytes, duration_ms in clips:
+                handle.write(audio_bytes)
+                written[sentence_id] = SnippetEntry(offset, len(audio_bytes), duration_ms)
+                offset += len(audio_bytes)
+            handle.flush()
+            os.fsync(handle.fileno())
+        entries.update(written)
+        _write_index(index_path, pack.generation, entries)
+        return written
+
+
+def read_snippet(index_path: Path, sentence_id: int) -> bytes:
+    with _lock(index_path):
+        pack = _read_pack(index_path)
+        entry = pack.entries.get(sentence_id)
+        if entry is None:
+            raise KeyError(f"Sentence {sentence_id} has no audio in {index_path.name}.")
+        with pack.path.open("rb") as handle:
+            handle.seek(entry.offset)
+            audio_bytes = handle.read(entry.length)
+    if len(audio_bytes) != entry.length:
+        raise ValueError(f"Snippet pack {pack.path.name} is truncated at sentence {sentence_id}.")
+    return audio_bytes
+
+
+def has_snippet(index_path: Path, sentence_id: int) -> bool:
+    pack = read_pack(index_path)
+    entry = pack.entries.get(sentence_id)
+    return entry is not None and pack.path.is_file() and pack.path.stat().st_size >= entry.offset + entry.length
+
+
+def compact_pack(index_path: Path, keep: Sequence[int]) -> SnippetPack:
+    """Drop superseded clips and store the ``keep`` sentences in that order.
+
+    Packs whose garbage stays under ``COMPACT_GARBAGE_RATIO`` are left alone.
+    """
+    with _lock(index_path):
+        pack = _read_pack(index_path)
+        live = [sentence_id for sentence_id in dict.fromkeys(keep) if sentence_id in pack.entries]
+        size = pack.path.stat().st_size if pack.path.exists() else 0
+        live_bytes = sum(pack.entries[sentence_id].length for sentence_id in live)
+        if size - live_bytes <= size * COMPACT_GARBAGE_RATIO:
+            return pack
+
+        generation = pack.generation + 1
+        target = _pack_path(index_path, generation)
+        entries = {}
+        with pack.path.open("rb") as source, target.open("wb") as output:
+            for sentence_id in live:
+                entry = pack.entries[sentence_id]
+                source.seek(entry.offset)
+                entries[sentence_id] = SnippetEntry(output.tell(), entry.length, entry.duration_ms)
+                output.write(source.read(entry.length))
+            output.flush()
+            os.fsync(output.fileno())
+        _write_index(index_path, generation, entries)
+        for stale in pack_files(index_path):
+            if stale.suffix == PACK_SUFFIX and stale != target:
+                stale.unlink(missing_ok=True)
+        return SnippetPack(path=target, generation=generation, entries=entries)
+
+
+def pack_files(index_path: Path) -> list[Path]:
+    """Return the index and every pack generation stored for it."""
+    return [index_path, *sorted(index_path.parent.glob(f"{_stem(index_path)}.*{PACK_SUFFIX}"))]
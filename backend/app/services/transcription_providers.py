@@ -9,6 +9,7 @@ import httpx
 
 from ..models import AudiobookSettings
 from .endpoint_pool import primary_provider, route_request
+from .http_clients import get_http_client
 
 SUPPORTED_TRANSCRIPTION_PROVIDERS = {"none", "whisperx"}
 
@@ -56,10 +57,10 @@ async def _transcription_service_health_endpoint(settings: AudiobookSettings) ->
     if transcription_provider_name(settings) == "none":
         raise RuntimeError("Configure a transcription provider first.")
     timeout = httpx.Timeout(30.0, connect=10.0)
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        response = await client.get(f"{_service_root(settings)}/health", headers=_headers(settings))
-        response.raise_for_status()
-        payload = response.json()
+    url = f"{_service_root(settings)}/health"
+    response = await get_http_client(url).get(url, headers=_headers(settings), timeout=timeout)
+    response.raise_for_status()
+    payload = response.json()
     if payload.get("status") != "ready":
         raise RuntimeError(f"Transcription service is not ready: {payload.get('status', 'unknown')}.")
     return payload
@@ -90,16 +91,17 @@ async def _transcribe_file_endpoint(settings: AudiobookSettings, audio_path: Pat
         data["language"] = settings.transcription_language
 
     timeout = httpx.Timeout(4 * 60 * 60.0, connect=20.0)
+    url = f"{_service_root(settings)}/transcribe"
     with audio_path.open("rb") as audio:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(
-                f"{_service_root(settings)}/transcribe",
-                data=data,
-                files={"file": (audio_path.name, audio, "audio/flac")},
-                headers=_headers(settings),
-            )
-            response.raise_for_status()
-            payload = response.json()
+        response = await get_http_client(url).post(
+            url,
+            data=data,
+            files={"file": (audio_path.name, audio, "audio/flac")},
+            headers=_headers(settings),
+            timeout=timeout,
+        )
+        response.raise_for_status()
+        payload = response.json()
 
     raw_words = payload.get("words")
     if not isinstance(raw_words, list):
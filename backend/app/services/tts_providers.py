@@ -13,6 +13,7 @@ import httpx
 
 from ..models import AudiobookSettings
 from .endpoint_pool import RoutedResult, primary_provider, route_request
+from .http_clients import get_http_client
 
 DEFAULT_VOICE_PROMPT = "[gender-neutral][pitch-medium][speed-normal]"
 SUPPORTED_TTS_PROVIDERS = {
@@ -175,18 +176,18 @@ async def _synthesize_speech_endpoint(
         if not settings.tts_base_url:
             raise RuntimeError("OmniVoice base URL is required in Audio Settings.")
         url = f"{_omnivoice_root(settings.tts_base_url)}/generate"
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(
-                url,
-                json={
-                    "voice": request.voice_prompt,
-                    "voice_id": _request_voice_id(request, provider),
-                    "text": request.text,
-                },
-                headers={"Accept": "audio/mpeg"},
-            )
-            response.raise_for_status()
-            return response.content
+        response = await get_http_client(url).post(
+            url,
+            json={
+                "voice": request.voice_prompt,
+                "voice_id": _request_voice_id(request, provider),
+                "text": request.text,
+            },
+            headers={"Accept": "audio/mpeg"},
+            timeout=timeout,
+        )
+        response.raise_for_status()
+        return response.content
 
     endpoint_voice_id = _request_voice_id(request, provider)
     voice_id = endpoint_voice_id or settings.tts_default_voice
@@ -227,14 +228,10 @@ async def _synthesize_speech_endpoint(
             if instructions:
                 payload["instructions"] = instructions
 
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(
-                _openai_speech_url(base_url),
-                json=payload,
-                headers=headers,
-            )
-            response.raise_for_status()
-            return response.content
+        url = _openai_speech_url(base_url)
+        response = await get_http_client(url).post(url, json=payload, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        return response.content
 
     if not settings.tts_api_key:
         raise RuntimeError("An API key is required for ElevenLabs TTS.")
@@ -242,23 +239,23 @@ async def _synthesize_speech_endpoint(
     model = settings.tts_model or "eleven_multilingual_v2"
     api_root = base_url if base_url.endswith("/v1") else f"{base_url}/v1"
     url = f"{api_root}/text-to-speech/{voice_id}"
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        response = await client.post(
-            url,
-            params={"output_format": "mp3_44100_128"},
-            json={
-                "text": _plain_text(request.text),
-                "model_id": model,
-                "voice_settings": {"speed": _speech_speed(request.voice_prompt)},
-            },
-            headers={
-                "Accept": "audio/mpeg",
-                "Content-Type": "application/json",
-                "xi-api-key": settings.tts_api_key,
-            },
-        )
-        response.raise_for_status()
-        return response.content
+    response = await get_http_client(url).post(
+        url,
+        params={"output_format": "mp3_44100_128"},
+        json={
+            "text": _plain_text(request.text),
+            "model_id": model,
+            "voice_settings": {"speed": _speech_speed(request.voice_prompt)},
+        },
+        headers={
+            "Accept": "audio/mpeg",
+            "Content-Type": "application/json",
+            "xi-api-key": settings.tts_api_key,
+        },
+        timeout=timeout,
+    )
+    response.raise_for_status()
+    return response.content
 
 
 async def synthesize_speech_routed(
@@ -291,14 +288,15 @@ async def _design_omnivoice_voice_endpoint(settings: AudiobookSettings, voice_pr
     if not settings.tts_base_url:
         raise RuntimeError("OmniVoice base URL is required in Audio Settings.")
     timeout = httpx.Timeout(600.0, connect=10.0)
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        response = await client.post(
-            f"{_omnivoice_root(settings.tts_base_url)}/voices/design",
-            json={"voice": voice_prompt},
-            headers={"Accept": "application/json"},
-        )
-        response.raise_for_status()
-        payload = response.json()
+    url = f"{_omnivoice_root(settings.tts_base_url)}/voices/design"
+    response = await get_http_client(url).post(
+        url,
+        json={"voice": voice_prompt},
+        headers={"Accept": "application/json"},
+        timeout=timeout,
+    )
+    response.raise_for_status()
+    payload = response.json()
     try:
         return DesignedVoice(
             id=str(payload["id"]),
@@ -328,12 +326,9 @@ async def _get_omnivoice_voice_sample_endpoint(
     if not settings.tts_base_url:
         raise RuntimeError("OmniVoice base URL is required in Audio Settings.")
     timeout = httpx.Timeout(30.0, connect=10.0)
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        response = await client.get(
-            f"{_omnivoice_root(settings.tts_base_url)}/voices/{voice_id}/sample",
-            headers={"Accept": "audio/wav"},
-        )
-        response.raise_for_status()
+    url = f"{_omnivoice_root(settings.tts_base_url)}/voices/{voice_id}/sample"
+    response = await get_http_client(url).get(url, headers={"Accept": "audio/wav"}, timeout=timeout)
+    response.raise_for_status()
     media_type = response.headers.get("content-type", "audio/wav").split(";", 1)[0]
     return VoiceSample(audio_bytes=response.content, media_type=media_type)
 
@@ -393,23 +388,23 @@ async def _synthesize_speech_batch_endpoint(
     root = _omnivoice_root(settings.tts_base_url)
     url = f"{root}/generate-batch"
     timeout = httpx.Timeout(600.0, connect=10.0)
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        response = await client.post(
-            url,
-            json={
-                "requests": [
-                    {
-                        "voice": request.voice_prompt,
-                        "voice_id": _request_voice_id(request, "omnivoice"),
-                        "text": request.text,
-                    }
-                    for request in requests
-                ]
-            },
-            headers={"Accept": "application/json"},
-        )
-        response.raise_for_status()
-        payload = response.json()
+    response = await get_http_client(url).post(
+        url,
+        json={
+            "requests": [
+                {
+                    "voice": request.voice_prompt,
+                    "voice_id": _request_voice_id(request, "omnivoice"),
+                    "text": request.text,
+                }
+                for request in requests
+            ]
+        },
+        headers={"Accept": "application/json"},
+        timeout=timeout,
+    )
+    response.raise_for_status()
+    payload = response.json()
 
     items = payload.get("items")
     if not isinstance(items, list) or len(items) != len(requests):
@@ -10,6 +10,7 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 from .. import crud, models
 from ..database import SessionLocal
+from .endpoint_metrics import run_endpoint_metrics_maintenance
 from .metadata_jobs import queue_stale_metadata_sync
 from .web_novel import update_web_novels
 
@@ -22,6 +23,8 @@ METADATA_STALE_SCAN_JOB_ID = "enqueue_stale_metadata_sync"
 METADATA_STALE_SCAN_INTERVAL_HOURS = 24
 METADATA_STALE_SCAN_INTERVAL = timedelta(hours=METADATA_STALE_SCAN_INTERVAL_HOURS)
 METADATA_SYNC_STALE_AFTER_DAYS = 30
+ENDPOINT_METRICS_ROLLUP_JOB_ID = "roll_up_endpoint_metrics"
+ENDPOINT_METRICS_ROLLUP_INTERVAL = timedelta(hours=1)
 OVERDUE_RUN_DELAY = timedelta(seconds=5)
 
 _run_lock = asyncio.Lock()
@@ -209,6 +212,18 @@ async def schedule_next_metadata_recheck(now: Optional[datetime] = None) -> date
     return next_run_at
 
 
+def schedule_endpoint_metrics_rollup(now: Optional[datetime] = None) -> None:
+    """Roll up and prune endpoint metrics shortly after startup, then every hour."""
+    _scheduler.add_job(
+        run_endpoint_metrics_maintenance,
+        "interval",
+        id=ENDPOINT_METRICS_ROLLUP_JOB_ID,
+        replace_existing=True,
+        seconds=ENDPOINT_METRICS_ROLLUP_INTERVAL.total_seconds(),
+        next_run_time=(_as_utc(now) or datetime.now(timezone.utc)) + OVERDUE_RUN_DELAY,
+    )
+
+
 async def run_web_novel_update(trigger: str = "scheduled") -> bool:
     if _run_lock.locked():
         logger.info("Skipping %s web novel update because another run is already in progress.", trigger)
@@ -7,16 +7,24 @@ import shutil
 import tempfile
 import traceback
 import zipfile
+from collections import defaultdict
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+from typing import Any, AsyncIterator, Callable, Dict, List, Mapping, Optional, Sequence
+from urllib.parse import urlparse
 
-from ebooklib import epub
 from fastapi import HTTPException, status
 from lxml import etree
 
 from .. import crud, epub_editor, models, schemas
-from ..config import LIBRARY_PATH
+from ..config import (
+    LIBRARY_PATH,
+    WEB_REFRESH_CONCURRENCY,
+    WEB_REFRESH_HOST_DELAY_SECONDS,
+    WEB_REFRESH_PER_HOST_CONCURRENCY,
+)
 from ..database import SessionLocal
 from ..lifecycle import (
     AUDIOBOOK_PIPELINE,
@@ -29,22 +37,42 @@ from ..lifecycle import (
 )
 from .cover_collectors import collect_cover
 from .epub_utils import (
-    get_and_save_epub_cover,
-    get_epub_tag_metadata,
-    get_epub_word_and_chapter_count,
+    analyze_epub,
     normalize_epub_prose_blocks,
 )
+from .epub_workers import run_epub_transform
 from .fanficfare_config import get_fff_config_paths
 from .library_paths import build_book_paths
 from .metadata_jobs import queue_metadata_sync_job
 
 logger = logging.getLogger(__name__)
 
-# Module-level lock to serialize all FanFicFare downloads.
+# Module-level lock to serialize new FanFicFare downloads.
 # A fresh asyncio.Lock() inside download_web_novel would create a new lock per
-# call, defeating the purpose. This single lock ensures only one FFF invocation
-# runs at a time, preventing the before/after EPUB-detection race condition.
+# call, defeating the purpose. New downloads detect their output by scanning the
+# library directory before and after FFF runs, so only one may run at a time.
+# Lossless updates write a private temp file beside their EPUB and only need to
+# exclude concurrent updates of that same file.
 _fff_lock = asyncio.Lock()
+# Per-EPUB update locks with the number of callers holding or awaiting each one.
+_fff_update_locks: dict[Path, tuple[asyncio.Lock, int]] = {}
+
+
+@asynccontextmanager
+async def _fff_update_lock(epub_path: Path) -> AsyncIterator[None]:
+    """Serialize updates of one EPUB, forgetting its lock once nobody holds or awaits it."""
+    lock, users = _fff_update_locks.get(epub_path, (None, 0))
+    lock = lock or asyncio.Lock()
+    _fff_update_locks[epub_path] = (lock, users + 1)
+    try:
+        async with lock:
+            yield
+    finally:
+        _lock, users = _fff_update_locks[epub_path]
+        if users <= 1:
+            del _fff_update_locks[epub_path]
+        else:
+            _fff_update_locks[epub_path] = (lock, users - 1)
 
 
 class LosslessChapterUpdateError(RuntimeError):
@@ -377,23 +405,39 @@ def _get_story_manager_output_filename() -> str:
 
 
 def _read_epub_metadata(epub_path: Path) -> Dict[str, Any]:
-    book = epub.read_epub(epub_path)
-    title = book.get_metadata("DC", "title")[0][0]
-    author = book.get_metadata("DC", "creator")[0][0]
-    try:
-        series_metadata = book.get_metadata("calibre", "series")
-    except KeyError:
-        series_metadata = []
-    series = series_metadata[0][0] if series_metadata else None
-    metadata = {"title": title, "author": author, "series": series}
-    tag_metadata = get_epub_tag_metadata(epub_path)
-    if tag_metadata["genre_tags"]:
-        metadata["genre_tags"] = tag_metadata["genre_tags"]
-    if tag_metadata["source_tags"]:
-        metadata["source_tags"] = tag_metadata["source_tags"]
+    """Read package metadata and the word and chapter counts in one pass over the EPUB."""
+    analysis = analyze_epub(epub_path)
+    if not analysis.title or not analysis.author:
+        raise ValueError("EPUB metadata must include a title and author.")
+    metadata = {
+        "title": analysis.title,
+        "author": analysis.author,
+        "series": analysis.series,
+        "word_count": analysis.word_count,
+        "chapter_count": analysis.chapter_count,
+    }
+    if analysis.genre_tags:
+        metadata["genre_tags"] = analysis.genre_tags
+    if analysis.source_tags:
+        metadata["source_tags"] = analysis.source_tags
     return metadata
 
 
+def _pop_epub_counts(metadata: Dict[str, Any]) -> tuple[int, int]:
+    """Remove the word and chapter counts from downloaded metadata and return them."""
+    return metadata.pop("word_count", 0), metadata.pop("chapter_count", 0)
+
+
+def _epub_counts(epub_path: Path) -> tuple[int, int]:
+    """Return an existing EPUB's word and chapter counts, or zeros when it cannot be read."""
+    try:
+        analysis = analyze_epub(epub_path)
+    except Exception as e:
+        logger.error(f"Error reading epub file {epub_path}: {e}")
+        return 0, 0
+    return analysis.word_count, analysis.chapter_count
+
+
 def _get_rootfile_path(epub_path: Path) -> str:
     with zipfile.ZipFile(epub_path) as archive:
         container = etree.fromstring(archive.read("META-INF/container.xml"))
@@ -493,7 +537,8 @@ async def download_web_novel(
     LIBRARY_PATH.mkdir(exist_ok=True)
     config_paths = get_fff_config_paths()
 
-    async with _fff_lock:
+    lock = _fff_update_lock(existing_epub_path.resolve()) if existing_epub_path is not None else _fff_lock
+    async with lock:
         changed_epubs: List[Path] = []
         updated_epub_path: Optional[Path] = None
 
@@ -504,7 +549,7 @@ async def download_web_novel(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                     detail=f"Expected existing EPUB for update, but none was found at {updated_epub_path}.",
                 )
-            _sync_epub_source_url(updated_epub_path, source_url)
+            await asyncio.to_thread(_sync_epub_source_url, updated_epub_path, source_url)
             loop = asyncio.get_running_loop()
             try:
                 update_result = await loop.run_in_executor(
@@ -556,10 +601,10 @@ async def download_web_novel(
             detail="FanFicFare ran but no new or updated EPUB file was found.",
         )
     new_epub_path = updated_epub_path or changed_epubs[0]
-    normalize_epub_prose_blocks(new_epub_path)
+    await run_epub_transform(normalize_epub_prose_blocks, new_epub_path)
 
     try:
-        return new_epub_path, _read_epub_metadata(new_epub_path)
+        return new_epub_path, await run_epub_transform(_read_epub_metadata, new_epub_path)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -585,6 +630,7 @@ async def finish_web_novel_download(book_id: int, source_url: str) -> None:
                 await db.commit()
                 return
             new_epub_path, metadata = result
+            master_word_count, chapter_count = _pop_epub_counts(metadata)
 
             existing = await crud.get_book_by_title_and_author(db, title=metadata["title"], author=metadata["author"])
             if existing and existing.id != book_id and existing.source_type == models.SourceType.web:
@@ -598,8 +644,8 @@ async def finish_web_novel_download(book_id: int, source_url: str) -> None:
             new_epub_path.rename(immutable_path)
             shutil.copyfile(immutable_path, current_path)
 
-            master_word_count = epub_editor.get_word_count(str(immutable_path))
-            _, chapter_count = get_epub_word_and_chapter_count(current_path)
+            # The text was counted with the metadata; only the cover is needed here.
+            analysis = await run_epub_transform(analyze_epub, immutable_path, include_text=False)
 
             db_book.title = metadata["title"]
             db_book.author = metadata["author"]
@@ -612,7 +658,7 @@ async def finish_web_novel_download(book_id: int, source_url: str) -> None:
             db_book.current_word_count = master_word_count
             await crud.touch_book_content(db, db_book)
 
-            cover_path = get_and_save_epub_cover(epub_path=immutable_path, book_id=db_book.id)
+            cover_path = analysis.save_cover(db_book.id)
             if cover_path is None:
                 cover_path = await collect_cover(source_url, db_book.id)
             if cover_path:
@@ -682,12 +728,11 @@ async def run_book_refresh(book_id: int) -> None:
                 if result is None:
                     raise RuntimeError("FanFicFare did not produce a refreshed EPUB.")
                 new_epub_path, metadata = result
+                new_word_count, new_chapter_count = _pop_epub_counts(metadata)
 
                 immutable_path, current_path = build_book_paths(new_epub_path.name, metadata["author"])
                 new_epub_path.rename(immutable_path)
                 shutil.copyfile(immutable_path, current_path)
-
-                new_word_count, new_chapter_count = get_epub_word_and_chapter_count(current_path)
                 update_data = schemas.BookUpdate(**metadata)
                 updated_book = await crud.update_book(db=db, book=db_book, update_data=update_data)
                 updated_book.removed_chapters = []
@@ -719,18 +764,17 @@ async def run_book_refresh(book_id: int) -> None:
             immutable_path = LIBRARY_PATH.parent / db_book.immutable_path
             current_path = LIBRARY_PATH.parent / db_book.current_path
 
-            old_word_count, old_chapter_count = get_epub_word_and_chapter_count(current_path)
+            old_word_count, old_chapter_count = await run_epub_transform(_epub_counts, current_path)
             result = await download_web_novel(db_book.source_url, overwrite=True, existing_epub_path=immutable_path)
             if result is None:
                 raise RuntimeError("FanFicFare did not update the existing EPUB during refresh.")
             new_epub_path, metadata = result
+            new_word_count, new_chapter_count = _pop_epub_counts(metadata)
 
             if new_epub_path != immutable_path:
                 new_epub_path.rename(immutable_path)
             shutil.copyfile(immutable_path, current_path)
 
-            new_word_count, new_chapter_count = get_epub_word_and_chapter_count(current_path)
-
             if new_chapter_count > old_chapter_count:
                 logger.info(
                     "Found %s new chapters for %s.",
@@ -777,13 +821,142 @@ async def run_book_refresh(book_id: int) -> None:
                 logger.exception("Failed to mark refresh_status=error for book %s", book_id)
 
 
+def _source_host(source_url: Optional[str]) -> str:
+    host = (urlparse(source_url or "").hostname or "").lower()
+    return host.removeprefix("www.")
+
+
+class _HostRateLimiter:
+    """Bound concurrent refreshes per source host and space out their starts."""
+
+    def __init__(self, per_host: int, delay_seconds: float) -> None:
+        self._per_host = per_host
+        self._delay_seconds = delay_seconds
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._next_start: Dict[str, float] = {}
+
+    @asynccontextmanager
+    async def slot(self, host: str) -> AsyncIterator[None]:
+        semaphore = self._semaphores.setdefault(host, asyncio.Semaphore(self._per_host))
+        async with semaphore:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            start = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start + self._delay_seconds
+            if start > now:
+                await asyncio.sleep(start - now)
+            yield
+
+
+def _interleave_by_host(books: Sequence[models.Book]) -> List[models.Book]:
+    """Order books round-robin across hosts so early workers start on different sites."""
+    by_host: Dict[str, List[models.Book]] = defaultdict(list)
+    for book in books:
+        by_host[_source_host(book.source_url)].append(book)
+    ordered: List[models.Book] = []
+    queues = list(by_host.values())
+    for index in range(max((len(queue) for queue in queues), default=0)):
+        ordered.extend(queue[index] for queue in queues if index < len(queue))
+    return ordered
+
+
+async def _refresh_scheduled_book(book_id: int, task_started_at: Optional[datetime]) -> bool:
+    """Check one web book for new chapters in its own session; return True on failure."""
+    async with SessionLocal() as db:
+        book = await crud.get_book(db, book_id=book_id)
+        if book is None:
+            return False
+        old_chapter_count: Optional[int] = None
+        try:
+            if not book.immutable_path or not book.current_path:
+                logger.warning("Skipping %s (id=%s): missing epub paths.", book.title, book.id)
+                return False
+
+            latest_log = await crud.get_latest_book_log(db, book.id)
+            if latest_log and task_started_at is not None and latest_log.timestamp >= task_started_at:
+                logger.info(f"Skipping {book.title}, already processed in this task.")
+                return False
+
+            logger.info(f"Checking {book.title} for updates.")
+            immutable_path = LIBRARY_PATH.parent / book.immutable_path
+            current_path = LIBRARY_PATH.parent / book.current_path
+
+            old_word_count, old_chapter_count = await run_epub_transform(_epub_counts, immutable_path)
+            result = await download_web_novel(book.source_url, existing_epub_path=immutable_path)
+
+            if result is None:
+                logger.info(f"No update available for {book.title} (FFF skipped).")
+                log_entry = schemas.BookLogCreate(
+                    book_id=book.id,
+                    entry_type="checked",
+                    previous_chapter_count=old_chapter_count,
+                    new_chapter_count=old_chapter_count,
+                    words_added=0,
+                )
+                await crud.create_book_log(db, log_entry)
+                return False
+
+            new_epub_path, metadata = result
+            new_word_count, new_chapter_count = _pop_epub_counts(metadata)
+            if new_epub_path != immutable_path:
+                new_epub_path.rename(immutable_path)
+            await asyncio.to_thread(shutil.copyfile, immutable_path, current_path)
+
+            if new_chapter_count > old_chapter_count:
+                logger.info(f"Found {new_chapter_count - old_chapter_count} new chapters for {book.title}.")
+                log_entry = schemas.BookLogCreate(
+                    book_id=book.id,
+                    entry_type="updated",
+                    previous_chapter_count=old_chapter_count,
+                    new_chapter_count=new_chapter_count,
+                    words_added=new_word_count - old_word_count,
+                )
+            else:
+                logger.info(f"No new chapters for {book.title}.")
+                log_entry = schemas.BookLogCreate(
+                    book_id=book.id,
+                    entry_type="checked",
+                    previous_chapter_count=old_chapter_count,
+                    new_chapter_count=new_chapter_count,
+                    words_added=0,
+                )
+            book.master_word_count = new_word_count
+            book.current_word_count = new_word_count
+            await crud.touch_book_content(db, book)
+            await db.commit()
+            await crud.create_book_log(db, log_entry)
+            await epub_editor.apply_book_cleaning(book, db)
+            await _enqueue_audiobook_refresh(book, db)
+            return False
+        except Exception as e:
+            logger.error(f"Failed to update {book.title}: {e}\n{traceback.format_exc()}")
+            await db.rollback()
+            await crud.create_book_log(
+                db,
+                schemas.BookLogCreate(
+                    book_id=book_id,
+                    entry_type="error",
+                    previous_chapter_count=old_chapter_count,
+                    new_chapter_count=old_chapter_count,
+                    words_added=0,
+                ),
+            )
+            return True
+
+
 async def update_web_novels() -> None:
-    """Scheduler job: checks all web novels for updates every 24 hours."""
+    """Scheduler job: checks all web novels for updates every 24 hours.
+
+    Books are refreshed concurrently, bounded by ``WEB_REFRESH_CONCURRENCY``
+    overall and by ``WEB_REFRESH_PER_HOST_CONCURRENCY`` per source host, so a
+    run takes about as long as its busiest site rather than the sum of all sites.
+    """
     logger.info("Starting web novel update job.")
     db = SessionLocal()
     task = None
     failed = False
     had_book_failures = False
+    workers: List[asyncio.Task[bool]] = []
     try:
         books = await crud.get_web_books(db)
         task = await crud.get_active_update_task(db)
@@ -793,90 +966,36 @@ async def update_web_novels() -> None:
         task = await crud.create_update_task(db, total_books=len(books))
         logger.info(f"Update task {task.id} processing {task.completed_books}/{task.total_books} books.")
 
-        for book in books:
-            old_chapter_count: Optional[int] = None
-            try:
-                if not book.immutable_path or not book.current_path:
-                    logger.warning("Skipping %s (id=%s): missing epub paths.", book.title, book.id)
-                    continue
-
-                latest_log = await crud.get_latest_book_log(db, book.id)
-                if latest_log and latest_log.timestamp >= task.started_at:
-                    logger.info(f"Skipping {book.title}, already processed in this task.")
-                    continue
+        global_slots = asyncio.Semaphore(WEB_REFRESH_CONCURRENCY)
+        host_limiter = _HostRateLimiter(WEB_REFRESH_PER_HOST_CONCURRENCY, WEB_REFRESH_HOST_DELAY_SECONDS)
+        task_started_at = task.started_at
 
-                logger.info(f"Checking {book.title} for updates.")
-                immutable_path = LIBRARY_PATH.parent / book.immutable_path
-                current_path = LIBRARY_PATH.parent / book.current_path
+        async def refresh(book: models.Book) -> bool:
+            # Take the host slot first so a worker never idles on a busy site while holding a global slot.
+            async with host_limiter.slot(_source_host(book.source_url)):
+                async with global_slots:
+                    return await _refresh_scheduled_book(book.id, task_started_at)
 
-                old_word_count, old_chapter_count = get_epub_word_and_chapter_count(immutable_path)
-                result = await download_web_novel(book.source_url, existing_epub_path=immutable_path)
-
-                if result is None:
-                    logger.info(f"No update available for {book.title} (FFF skipped).")
-                    log_entry = schemas.BookLogCreate(
-                        book_id=book.id,
-                        entry_type="checked",
-                        previous_chapter_count=old_chapter_count,
-                        new_chapter_count=old_chapter_count,
-                        words_added=0,
-                    )
-                    await crud.create_book_log(db, log_entry)
-                    continue
-
-                new_epub_path, _ = result
-                if new_epub_path != immutable_path:
-                    new_epub_path.rename(immutable_path)
-                shutil.copyfile(immutable_path, current_path)
-
-                new_word_count, new_chapter_count = get_epub_word_and_chapter_count(immutable_path)
-
-                if new_chapter_count > old_chapter_count:
-                    logger.info(f"Found {new_chapter_count - old_chapter_count} new chapters for {book.title}.")
-                    log_entry = schemas.BookLogCreate(
-                        book_id=book.id,
-                        entry_type="updated",
-                        previous_chapter_count=old_chapter_count,
-                        new_chapter_count=new_chapter_count,
-                        words_added=new_word_count - old_word_count,
-                    )
-                    book.master_word_count = new_word_count
-                    book.current_word_count = new_word_count
-                else:
-                    logger.info(f"No new chapters for {book.title}.")
-                    log_entry = schemas.BookLogCreate(
-                        book_id=book.id,
-                        entry_type="checked",
-                        previous_chapter_count=old_chapter_count,
-                        new_chapter_count=new_chapter_count,
-                        words_added=0,
-                    )
-                book.master_word_count = new_word_count
-                book.current_word_count = new_word_count
-                await crud.touch_book_content(db, book)
-                await db.commit()
-                await crud.create_book_log(db, log_entry)
-                await epub_editor.apply_book_cleaning(book, db)
-                await _enqueue_audiobook_refresh(book, db)
+        workers = [
+            asyncio.create_task(refresh(book), name=f"web-refresh-book-{book.id}") for book in _interleave_by_host(books)
+        ]
+        for finished in asyncio.as_completed(workers):
+            try:
+                if await finished:
+                    had_book_failures = True
             except Exception as e:
                 had_book_failures = True
-                logger.error(f"Failed to update {book.title}: {e}\n{traceback.format_exc()}")
-                await crud.create_book_log(
-                    db,
-                    schemas.BookLogCreate(
-                        book_id=book.id,
-                        entry_type="error",
-                        previous_chapter_count=old_chapter_count,
-                        new_chapter_count=old_chapter_count,
-                        words_added=0,
-                    ),
-                )
+                logger.error(f"Web novel refresh worker failed: {e}\n{traceback.format_exc()}")
             finally:
                 await crud.increment_update_task(db, task)
     except Exception as e:
         logger.error(f"Scheduler run failed: {e}\n{traceback.format_exc()}")
         failed = True
     finally:
+        for worker in workers:
+            worker.cancel()
+        if workers:
+            await asyncio.gather(*workers, return_exceptions=True)
         if task is not None:
             if failed or had_book_failures:
                 await crud.fail_update_task(db, task)
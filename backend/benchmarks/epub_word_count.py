@@ -0,0 +1,118 @@
+"""Compare the streaming EPUB word counter with the ebooklib/BeautifulSoup counter it replaced.
+
+Usage::
+
+    python -m backend.benchmarks.epub_word_count --chapters 2000 --paragraphs 40
+
+Generates a web-novel-sized EPUB in a temporary directory, checks that both
+implementations agree, then reports the median wall time of each, and of a
+repeat count served from the per-entry CRC cache.
+"""
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import ebooklib
+from bs4 import BeautifulSoup
+from ebooklib import epub
+
+from backend.app.services import epub_utils
+
+WORDS = "the of and to in a was he that it his her with as had for on but she at by not".split()
+
+
+def legacy_word_and_chapter_count(epub_path: Path) -> tuple[int, int]:
+    """The pre-streaming implementation of ``get_epub_word_and_chapter_count``."""
+    book = epub.read_epub(str(epub_path))
+    chapters = list(book.get_items_of_type(ebooklib.ITEM_DOCUMENT))
+    word_count = 0
+    for chapter in chapters:
+        word_count += len(BeautifulSoup(chapter.get_content(), "html.parser").get_text().split())
+    return word_count, len(chapters)
+
+
+def build_epub(path: Path, chapters: int, paragraphs: int, seed: int = 7) -> None:
+    rng = random.Random(seed)
+    book = epub.EpubBook()
+    book.set_identifier("benchmark")
+    book.set_title("Benchmark Serial")
+    book.set_language("en")
+    book.add_author("Benchmark")
+    items = []
+    for index in range(1, chapters + 1):
+        body = "".join(
+            "<p>" + " ".join(rng.choice(WORDS) for _ in range(rng.randint(20, 120))) + " <em>emph</em>asis&nbsp;end.</p>\n"
+            for _ in range(paragraphs)
+        )
+        chapter = epub.EpubHtml(title=f"Chapter {index}", file_name=f"chap_{index:05d}.xhtml", lang="en")
+        chapter.content = f"<h1>Chapter {index}</h1>\n{body}<script>var ignored = 1;</script>"
+        book.add_item(chapter)
+        items.append(chapter)
+    book.toc = tuple(items)
+    book.add_item(epub.EpubNcx())
+    book.add_item(epub.EpubNav())
+    book.spine = ["nav", *items]
+    epub.write_epub(str(path), book, {})
+
+
+def _time(func, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def _peak_memory(func) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chapters", type=int, default=2000)
+    parser.add_argument("--paragraphs", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "benchmark.epub"
+        build_epub(path, args.chapters, args.paragraphs)
+        print(f"EPUB: {args.chapters} chapters, {path.stat().st_size / 1024 / 1024:.1f} MiB")
+
+        legacy = legacy_word_and_chapter_count(path)
+        epub_utils._word_count_cache.clear()
+        streaming = epub_utils.get_epub_word_and_chapter_count(path)
+        if legacy != streaming:
+            raise SystemExit(f"Counts differ: legacy={legacy} streaming={streaming}")
+        print(f"Counts agree: {streaming[0]} words, {streaming[1]} documents")
+
+        def cold() -> None:
+            epub_utils._word_count_cache.clear()
+            epub_utils.get_epub_word_and_chapter_count(path)
+
+        rows = [
+            ("ebooklib + BeautifulSoup", _time(lambda: legacy_word_and_chapter_count(path), args.repeat)),
+            ("streaming lxml, cold cache", _time(cold, args.repeat)),
+            ("streaming lxml, warm cache", _time(lambda: epub_utils.get_epub_word_and_chapter_count(path), args.repeat)),
+        ]
+        for label, seconds in rows:
+            print(f"{label:<28} {seconds * 1000:10.1f} ms")
+        print(
+            f"{'peak memory, legacy':<28} {_peak_memory(lambda: legacy_word_and_chapter_count(path)) / 1024 / 1024:10.1f} MiB"
+        )
+        print(f"{'peak memory, streaming':<28} {_peak_memory(cold) / 1024 / 1024:10.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
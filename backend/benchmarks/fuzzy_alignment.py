@@ -0,0 +1,178 @@
+"""Compare banded NumPy fuzzy gap alignment with the pure-Python dynamic program it replaced.
+
+Usage::
+
+    python -m backend.benchmarks.fuzzy_alignment --words 6000 --garbled 1500
+
+Generates a chapter of synthetic prose and an ASR-style transcript of it
+(misspelt, dropped and inserted words, plus one stretch where every word is
+misheard, as happens under music or crosstalk), splits both at the exact
+matching blocks the aligner anchors on, and aligns every gap between them.
+Reports the wall time of each implementation and how many of their matches
+agree. The legacy program runs with its old 250,000-cell cap, as shipped, and
+uncapped on one fully misheard gap of ``--gap-words`` tokens to compare speed
+and results.
+"""
+
+import argparse
+import random
+import time
+from difflib import SequenceMatcher
+
+from backend.app.services import audiobook_alignment
+from backend.app.services.audiobook_alignment import _CanonicalToken, _TranscriptToken, _token_similarity
+
+LEGACY_MAX_CELLS = 250_000
+LETTERS = "etaoinshrdlucmfwypvbgkjqxz"
+
+
+def legacy_fuzzy_gap_matches(canonical, transcript, canonical_offset, transcript_offset, max_cells=LEGACY_MAX_CELLS):
+    """The pre-NumPy implementation of ``_fuzzy_gap_matches``."""
+    m, n = len(canonical), len(transcript)
+    if not m or not n or m * n > max_cells:
+        return {}
+
+    gap_penalty = -1.15
+    prior = [index * gap_penalty for index in range(n + 1)]
+    trace = [bytearray(n + 1) for _ in range(m + 1)]
+    for column in range(1, n + 1):
+        trace[0][column] = 2  # left
+    for row in range(1, m + 1):
+        trace[row][0] = 1  # up
+        current = [row * gap_penalty] + [0.0] * n
+        for column in range(1, n + 1):
+            similarity = _token_similarity(canonical[row - 1].normalized, transcript[column - 1].normalized)
+            diagonal_score = 2.5 if similarity == 1 else (2.0 * similarity - 1.25)
+            diagonal = prior[column - 1] + diagonal_score
+            up = prior[column] + gap_penalty
+            left = current[column - 1] + gap_penalty
+            best = max(diagonal, up, left)
+            current[column] = best
+            trace[row][column] = 0 if best == diagonal else (1 if best == up else 2)
+        prior = current
+
+    matches = {}
+    row, column = m, n
+    while row or column:
+        direction = trace[row][column]
+        if row and column and direction == 0:
+            similarity = _token_similarity(canonical[row - 1].normalized, transcript[column - 1].normalized)
+            if similarity >= 0.58:
+                matches[canonical_offset + row - 1] = (transcript_offset + column - 1, similarity)
+            row -= 1
+            column -= 1
+        elif row and (not column or direction == 1):
+            row -= 1
+        else:
+            column -= 1
+    return matches
+
+
+def _misheard(rng: random.Random, word: str) -> str:
+    index = rng.randrange(len(word))
+    replacement = rng.choice([letter for letter in LETTERS if letter != word[index]])
+    return word[:index] + replacement + word[slice(index + 1, None)]
+
+
+def build_chapter(words: int, garbled: int, seed: int = 11) -> tuple[list[str], list[str]]:
+    rng = random.Random(seed)
+    vocabulary = sorted({"".join(rng.choice(LETTERS) for _ in range(max(1, round(rng.gauss(5, 2))))) for _ in range(3000)})
+    weights = [1 / rank for rank in range(1, len(vocabulary) + 1)]
+    chapter = rng.choices(vocabulary, weights, k=words)
+    garbled_start = (words - garbled) // 2
+    transcript = []
+    for index, word in enumerate(chapter):
+        if garbled_start <= index < garbled_start + garbled:
+            transcript.append(_misheard(rng, word))
+            continue
+        roll = rng.random()
+        if roll < 0.03:
+            continue
+        transcript.append(_misheard(rng, word) if roll < 0.15 else word)
+        if rng.random() < 0.03:
+            transcript.append(rng.choice(vocabulary))
+    return chapter, transcript
+
+
+def gaps(canonical: list[_CanonicalToken], transcript: list[_TranscriptToken]):
+    blocks = SequenceMatcher(
+        None,
+        [token.normalized for token in canonical],
+        [token.normalized for token in transcript],
+        autojunk=False,
+    ).get_matching_blocks()
+    prior_canonical = prior_transcript = 0
+    for block in blocks:
+        yield (
+            canonical[slice(prior_canonical, block.a)],
+            transcript[slice(prior_transcript, block.b)],
+            prior_canonical,
+            prior_transcript,
+        )
+        prior_canonical, prior_transcript = block.a + block.size, block.b + block.size
+
+
+def _timed(function, chapter_gaps) -> tuple[float, dict]:
+    started = time.perf_counter()
+    matches = {}
+    for gap in chapter_gaps:
+        matches.update(function(*gap))
+    return time.perf_counter() - started, matches
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, default=6000)
+    parser.add_argument("--garbled", type=int, default=1500)
+    parser.add_argument("--gap-words", type=int, default=700)
+    args = parser.parse_args()
+
+    chapter, heard = build_chapter(args.words, args.garbled)
+    canonical = [_CanonicalToken(normalized=word, sentence_index=0) for word in chapter]
+    transcript = [_TranscriptToken(normalized=word, word_index=index) for index, word in enumerate(heard)]
+    chapter_gaps = [gap for gap in gaps(canonical, transcript) if gap[0] and gap[1]]
+    widest = max(chapter_gaps, key=lambda gap: len(gap[0]) * len(gap[1]))
+    exact = len(canonical) - sum(len(gap[0]) for gap in gaps(canonical, transcript))
+    print(
+        f"Chapter: {len(canonical)} words, transcript {len(transcript)} words, {exact} exact matches, "
+        f"{len(chapter_gaps)} gaps, widest {len(widest[0])} x {len(widest[1])}"
+    )
+
+    capped = [gap for gap in chapter_gaps if len(gap[0]) * len(gap[1]) <= LEGACY_MAX_CELLS]
+    uncapped = [gap for gap in chapter_gaps if len(gap[0]) * len(gap[1]) > LEGACY_MAX_CELLS]
+    legacy_seconds, legacy = _timed(legacy_fuzzy_gap_matches, capped)
+    banded_seconds, banded = _timed(audiobook_alignment._fuzzy_gap_matches, capped)
+    wide_seconds, wide = _timed(audiobook_alignment._fuzzy_gap_matches, uncapped)
+    agreeing = sum(1 for index in legacy.keys() | banded.keys() if legacy.get(index) == banded.get(index))
+    print(
+        f"{len(capped)} gaps under the legacy cap: legacy {legacy_seconds:.2f} s, banded {banded_seconds:.2f} s, "
+        f"{agreeing}/{len(legacy.keys() | banded.keys())} matches identical"
+    )
+    print(
+        f"{len(uncapped)} gaps over the legacy cap: legacy skips them, banded {wide_seconds:.2f} s "
+        f"for {len(wide)} more grounded tokens"
+    )
+
+    rng = random.Random(args.gap_words)
+    gap_canonical = canonical[slice(args.gap_words)]
+    gap_transcript = [
+        _TranscriptToken(normalized=_misheard(rng, token.normalized), word_index=index)
+        for index, token in enumerate(gap_canonical)
+    ]
+    cells = len(gap_canonical) * len(gap_transcript)
+    started = time.perf_counter()
+    reference = legacy_fuzzy_gap_matches(gap_canonical, gap_transcript, 0, 0, max_cells=cells)
+    legacy_gap_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    candidate = audiobook_alignment._fuzzy_gap_matches(gap_canonical, gap_transcript, 0, 0)
+    banded_gap_seconds = time.perf_counter() - started
+    same = sum(1 for index in reference.keys() | candidate.keys() if reference.get(index) == candidate.get(index))
+    print(
+        f"\nSingle {len(gap_canonical)} x {len(gap_transcript)} gap ({cells:,} cells): "
+        f"legacy uncapped {legacy_gap_seconds:.2f} s, banded {banded_gap_seconds:.3f} s, "
+        f"{same}/{len(reference.keys() | candidate.keys())} matches identical"
+    )
+
+
+if __name__ == "__main__":
+    main()
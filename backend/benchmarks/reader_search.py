@@ -0,0 +1,172 @@
+"""Compare ranked, index-backed reader search with the three-column ILIKE search it replaced.
+
+Usage::
+
+    python -m backend.benchmarks.reader_search --books 10000
+    python -m backend.benchmarks.reader_search --database-url postgresql+psycopg://.../scratch
+
+Builds the 10,000-book catalog fixture described in ``docs/CATALOG_PAGINATION.md``
+(500 series, 250 authors, two alternating genre families, 10% web sources and
+generated audiobooks on every seventh book) in a temporary SQLite database, or
+in the given database, which must be an empty scratch database. It checks
+that both searches find the same books for title/author/series terms, then
+reports the median time of each. On PostgreSQL it also creates the migration
+0031 trigram index and prints both query plans.
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import asc, or_, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from backend.app import crud, models
+from backend.app.crud.reader import _reader_books_query
+from backend.app.database import Base
+
+GENRE_FAMILIES = (["Fantasy", "Adventure"], ["Science Fiction", "Thriller"])
+WORDS = "amber ash blade crown dawn ember frost gate harbor iron jade lantern moon oath river stone thorn".split()
+TERMS = {
+    "selective title": "ash gate 4217",
+    "series": "series 137",
+    "author": "author 42",
+    "broad": "stone",
+}
+
+
+def legacy_search_query(q: str, limit: int = 100):
+    """The pre-trigram implementation of ``search_reader_books``."""
+    pattern = f"%{q}%"
+    return (
+        _reader_books_query()
+        .where(
+            or_(
+                models.Book.title.ilike(pattern),
+                models.Book.author.ilike(pattern),
+                models.Book.series.ilike(pattern),
+            )
+        )
+        .order_by(asc(models.Book.title))
+        .limit(limit)
+    )
+
+
+def build_books(count: int) -> list[models.Book]:
+    books = []
+    for index in range(1, count + 1):
+        first, second = WORDS[index % len(WORDS)], WORDS[(index * 7) % len(WORDS)]
+        is_web = index % 10 == 0
+        books.append(
+            models.Book(
+                title=f"{first.title()} {second.title()} {index}",
+                author=f"Author {index % 250}",
+                series=f"Series {index % 500}",
+                series_index=index // 500 + 1,
+                genre_tags=GENRE_FAMILIES[index % 2],
+                immutable_path=f"library/benchmark/immutable_{index}.epub",
+                current_path=f"library/benchmark/{index}.epub",
+                source_type=models.SourceType.web if is_web else models.SourceType.epub,
+                source_url=f"https://example.com/story/{index}" if is_web else None,
+                audiobook_enabled=index % 7 == 0,
+                current_word_count=1000 + index,
+            )
+        )
+    return books
+
+
+async def _time(session_factory, query_factory, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        async with session_factory() as db:
+            started = time.perf_counter()
+            await query_factory(db)
+            samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+async def _all_search_ids(db: AsyncSession, q: str) -> set[int]:
+    books, _, _ = await crud.search_reader_books(db, q, limit=1_000_000)
+    return {book.id for book in books}
+
+
+async def run(database_url: str, book_count: int, repeat: int, page_size: int) -> None:
+    engine = create_async_engine(database_url)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    postgres = engine.dialect.name == "postgresql"
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        if postgres:
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            await conn.execute(
+                text(
+                    "CREATE INDEX IF NOT EXISTS ix_books_catalog_search_trgm "
+                    "ON books USING gin (catalog_search_text gin_trgm_ops)"
+                )
+            )
+    async with session_factory() as db:
+        db.add_all(build_books(book_count))
+        await db.commit()
+        if postgres:
+            await db.execute(text("ANALYZE books"))
+    print(f"Fixture: {book_count} books on {engine.dialect.name}")
+
+    async with session_factory() as db:
+        for label, term in TERMS.items():
+            legacy = {book.id for book in (await db.execute(legacy_search_query(term, limit=1_000_000))).scalars()}
+            ranked = await _all_search_ids(db, term)
+            if legacy != ranked:
+                raise SystemExit(f"Results differ for {label!r}: legacy={len(legacy)} ranked={len(ranked)}")
+            print(f"{label:<16} {len(ranked):6d} matches agree")
+
+    for label, term in TERMS.items():
+
+        async def legacy_page(db, term=term):
+            return (await db.execute(legacy_search_query(term))).scalars().all()
+
+        async def ranked_page(db, term=term):
+            return await crud.search_reader_books(db, term, limit=page_size)
+
+        legacy_seconds = await _time(session_factory, legacy_page, repeat)
+        ranked_seconds = await _time(session_factory, ranked_page, repeat)
+        print(f"{label:<16} legacy {legacy_seconds * 1000:8.2f} ms   ranked {ranked_seconds * 1000:8.2f} ms")
+
+    if postgres:
+        async with session_factory() as db:
+            term = TERMS["selective title"]
+            legacy_sql = legacy_search_query(term).compile(engine, compile_kwargs={"literal_binds": True})
+            print("\nLegacy plan:")
+            for row in await db.execute(text(f"EXPLAIN ANALYZE {legacy_sql}")):
+                print(f"  {row[0]}")
+            ranked_sql = (
+                _reader_books_query()
+                .where(models.Book.catalog_search_text.ilike(f"%{term}%"))
+                .compile(engine, compile_kwargs={"literal_binds": True})
+            )
+            print("Ranked plan (match predicate):")
+            for row in await db.execute(text(f"EXPLAIN ANALYZE {ranked_sql}")):
+                print(f"  {row[0]}")
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--books", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=15)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--database-url", help="empty scratch database; defaults to a temporary SQLite file")
+    args = parser.parse_args()
+
+    if args.database_url:
+        asyncio.run(run(args.database_url, args.books, args.repeat, args.page_size))
+        return
+    with tempfile.TemporaryDirectory() as directory:
+        url = f"sqlite+aiosqlite:///{Path(directory) / 'reader_search.db'}"
+        asyncio.run(run(url, args.books, args.repeat, args.page_size))
+
+
+if __name__ == "__main__":
+    main()
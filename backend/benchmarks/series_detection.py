@@ -0,0 +1,182 @@
+"""Compare indexed series detection with the linear cluster scan it replaced.
+
+Usage::
+
+    python -m backend.benchmarks.series_detection --books 50000 --authors 5000
+
+Generates a library in which most authors write a handful of books and a few
+prolific web-novel authors write hundreds, spread over many series in the
+title formats the detector recognises, plus standalones. Detects series for
+the whole library with both implementations, checks that their assignments are
+identical, then times an incremental pass for one newly added book.
+"""
+
+import argparse
+import random
+import time
+from collections import defaultdict
+
+from backend.app.services.series import (
+    _TRAILING_METADATA_RE,
+    SeriesBook,
+    _choose_canonical_label,
+    _extract_series_hints,
+    _normalize_author_name,
+    _normalize_series_name,
+    detect_series_from_books,
+)
+
+WORDS = (
+    "ash blade crown dawn ember fall gate hollow iron jade king lost moon night oath pale quill rune "
+    "shadow thorn under veil wild year zenith arcane broken cinder dragon echo frost grave heart"
+).split()
+FORMATS = (
+    "{series} {number}",
+    "{series} #{number}",
+    "{subtitle} ({series} Book {number})",
+    "{series}: Book {number} - {subtitle}",
+    "{subtitle}: {series}, Book {number}",
+)
+
+
+def _legacy_labels_overlap(left: str, right: str) -> bool:
+    if left == right:
+        return True
+    return left.endswith(" " + right) or right.endswith(" " + left)
+
+
+def _legacy_title_matches_series(title: str, label: str) -> bool:
+    raw_title = title.strip()
+    raw_label = label.strip()
+    normalized_title = _normalize_series_name(raw_title)
+    normalized_label = _normalize_series_name(raw_label)
+    if normalized_title == normalized_label:
+        return True
+    title_without_trailing_metadata = _TRAILING_METADATA_RE.sub("", raw_title).strip()
+    if _normalize_series_name(title_without_trailing_metadata) == normalized_label:
+        return True
+    prefixes = (f"{raw_label}: ", f"{raw_label} - ", f"{raw_label}, ")
+    return any(raw_title.startswith(prefix) for prefix in prefixes)
+
+
+def legacy_detect_series_from_books(books: list[SeriesBook]) -> dict[tuple[str, str], str]:
+    """The pre-index implementation of ``detect_series_from_books``."""
+    result: dict[tuple[str, str], str] = {}
+    books_by_author: dict[str, list[SeriesBook]] = defaultdict(list)
+    for book in books:
+        books_by_author[_normalize_author_name(book.author)].append(book)
+
+    for author_books in books_by_author.values():
+        clusters: list[dict] = []
+        for book in author_books:
+            for hint in _extract_series_hints(book.title):
+                normalized_hint = _normalize_series_name(hint)
+                cluster = next(
+                    (
+                        existing
+                        for existing in clusters
+                        if any(_legacy_labels_overlap(normalized_hint, label) for label in existing["normalized"])
+                    ),
+                    None,
+                )
+                if cluster is None:
+                    cluster = {"labels": [], "normalized": [], "books": set()}
+                    clusters.append(cluster)
+                cluster["labels"].append(hint)
+                cluster["normalized"].append(normalized_hint)
+                cluster["books"].add((book.author, book.title))
+
+        confirmed = []
+        for cluster in clusters:
+            if len(cluster["books"]) < 2:
+                continue
+            canonical = _choose_canonical_label(cluster["labels"])
+            confirmed.append((canonical, list(cluster["labels"])))
+            for key in cluster["books"]:
+                result[key] = canonical
+
+        for book in author_books:
+            key = (book.author, book.title)
+            if key in result:
+                continue
+            for canonical, labels in confirmed:
+                if _legacy_title_matches_series(book.title, canonical) or any(
+                    _legacy_title_matches_series(book.title, label) for label in labels
+                ):
+                    result[key] = canonical
+                    break
+    return result
+
+
+def _phrase(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS).title() for _ in range(words))
+
+
+def build_library(books: int, authors: int, prolific: int, seed: int = 24) -> list[SeriesBook]:
+    rng = random.Random(seed)
+    names = [f"{_phrase(rng, 1)} {_phrase(rng, 1)}son {index}" for index in range(authors)]
+    # A few prolific authors hold a third of the library between them.
+    weights = [60.0 if index < prolific else 1.0 for index in range(authors)]
+    library: list[SeriesBook] = []
+    seen: set[tuple[str, str]] = set()
+    open_series: dict[str, list[list]] = defaultdict(list)
+    while len(library) < books:
+        author = rng.choices(names, weights)[0]
+        series = open_series[author]
+        roll = rng.random()
+        if roll < 0.15:
+            title = _phrase(rng, rng.randint(2, 4))
+        else:
+            if not series or roll < 0.3:
+                series.append([_phrase(rng, rng.randint(1, 3)), 0, rng.choice(FORMATS)])
+            entry = rng.choice(series)
+            entry[1] += 1
+            title = entry[2].format(series=entry[0], number=entry[1], subtitle=_phrase(rng, 2))
+        if (author, title) not in seen:
+            seen.add((author, title))
+            library.append(SeriesBook(title=title, author=author))
+    return library
+
+
+def _timed(function, *args, **kwargs):
+    started = time.perf_counter()
+    result = function(*args, **kwargs)
+    return time.perf_counter() - started, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--books", type=int, default=50_000)
+    parser.add_argument("--authors", type=int, default=5_000)
+    parser.add_argument("--prolific", type=int, default=25)
+    args = parser.parse_args()
+
+    library = build_library(args.books, args.authors, args.prolific)
+    per_author: dict[str, int] = defaultdict(int)
+    for book in library:
+        per_author[book.author] += 1
+    print(
+        f"Library: {len(library)} books by {len(per_author)} authors, "
+        f"largest author bucket {max(per_author.values())} books"
+    )
+
+    legacy_seconds, legacy = _timed(legacy_detect_series_from_books, library)
+    indexed_seconds, indexed = _timed(detect_series_from_books, library)
+    print(
+        f"Full library: linear scan {legacy_seconds:.2f} s, indexed {indexed_seconds:.2f} s, "
+        f"{len(indexed)} assignments, identical: {legacy == indexed}"
+    )
+
+    busiest = max(per_author, key=per_author.get)
+    added = SeriesBook(title=f"{library[0].title} Extra", author=busiest)
+    updated = library + [added]
+    full_seconds, _ = _timed(detect_series_from_books, updated)
+    incremental_seconds, incremental = _timed(detect_series_from_books, updated, changed=[added])
+    print(
+        f"One book added to the largest bucket: full pass {full_seconds:.2f} s, "
+        f"incremental {incremental_seconds * 1000:.1f} ms ({len(incremental)} assignments re-evaluated)"
+    )
+
+
+if __name__ == "__main__":
+    main()
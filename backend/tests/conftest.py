@@ -6,8 +6,10 @@ from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.pool import StaticPool
 
+from backend.app.auth import forget_verified_key
 from backend.app.database import Base, get_db
 from backend.app.main import app
+from backend.app.services.api_key_usage import get_api_key_usage_recorder
 
 SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
@@ -19,6 +21,25 @@ def disable_unconfigured_network_metadata(mocker):
     mocker.patch("backend.app.services.metadata.clients.GOOGLE_BOOKS_ALLOW_UNAUTHENTICATED", False)
     mocker.patch("backend.app.services.metadata.clients.GOOGLE_BOOKS_MIN_REQUEST_INTERVAL_SECONDS", 0)
     mocker.patch("backend.app.services.metadata.clients.AMAZON_METADATA_ENABLED", False)
+    mocker.patch("backend.app.services.metadata.clients.get_response_cache", return_value=None)
+
+
+@pytest.fixture(autouse=True)
+def run_epub_transforms_in_threads(mocker):
+    """Keep EPUB transforms in-process so tests can monkeypatch the helpers they call."""
+
+    mocker.patch("backend.app.config.EPUB_PROCESS_WORKERS", 0)
+
+
+@pytest.fixture(autouse=True)
+def reset_reader_key_state():
+    """Keep cached reader keys and buffered usage from leaking between test databases."""
+
+    forget_verified_key()
+    get_api_key_usage_recorder().clear()
+    yield
+    forget_verified_key()
+    get_api_key_usage_recorder().clear()
 
 
 @pytest_asyncio.fixture
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 from sqlalchemy import select
 
 from backend.app import models
-from backend.app.services import audiobook_alignment, transcription_providers
+from backend.app.services import audiobook_alignment, fuzzy_alignment, transcription_providers
 from backend.app.services.transcription_providers import TranscriptWord
 
 
@@ -78,6 +80,35 @@ def test_sequence_alignment_uses_real_word_boundaries_despite_asr_differences():
     assert result.cues[0].clip_end_ms == expected_boundary
 
 
+def test_fuzzy_gap_alignment_grounds_gaps_beyond_the_full_matrix_budget(monkeypatch):
+    vocabulary = ["lantern", "harbor", "ember", "thorn", "river", "oath", "crown", "frost", "amber", "stone"]
+    canonical = [f"{vocabulary[index % 10]}{index}" for index in range(600)]
+    heard = [f"x{token[1:]}" for token in canonical]
+    monkeypatch.setattr(audiobook_alignment, "_MAX_FUZZY_GAP_CELLS", 120_000)
+
+    matches = audiobook_alignment._fuzzy_gap_matches(
+        [audiobook_alignment._CanonicalToken(normalized=token, sentence_index=0) for token in canonical],
+        [audiobook_alignment._TranscriptToken(normalized=token, word_index=index) for index, token in enumerate(heard)],
+        canonical_offset=10,
+        transcript_offset=20,
+    )
+
+    assert len(matches) == 600
+    assert matches[10] == (20, audiobook_alignment._token_similarity(canonical[0], heard[0]))
+    assert all(transcript_index - canonical_index == 10 for canonical_index, (transcript_index, _) in matches.items())
+
+
+def test_vectorized_and_cell_by_cell_gap_alignment_agree(monkeypatch):
+    canonical = "she whispered that the lantern had gone out before the harbor bells".split()
+    heard = "he whisper that lanterns had gone out for the harbour bell rang".split()
+    cell_by_cell = fuzzy_alignment._scalar_alignment(canonical, heard)
+    monkeypatch.setattr(fuzzy_alignment, "_MIN_VECTOR_CELLS", 0)
+    monkeypatch.setattr(fuzzy_alignment, "_MIN_VECTOR_PAIRS", 0)
+
+    assert fuzzy_alignment.banded_alignment(canonical, heard, max_cells=1_000) == cell_by_cell
+    assert (2, 2) in cell_by_cell and (4, 3) in cell_by_cell
+
+
 def test_unmatched_sentence_is_interpolated_between_transcribed_anchors():
     sentences = [
         (1, "First grounded sentence."),
@@ -96,6 +127,93 @@ def test_unmatched_sentence_is_interpolated_between_transcribed_anchors():
     assert result.cues[1].clip_end_ms == result.cues[2].clip_begin_ms
 
 
+def test_transcription_windows_cut_at_pauses_and_stitch_without_duplicates():
+    windows = audiobook_alignment.plan_transcription_windows(
+        25_000,
+        [(3_000, 3_400), (10_400, 10_800), (30_000, 31_000)],
+        window_ms=10_000,
+        overlap_ms=2_000,
+    )
+
+    assert [(window.keep_from_ms, window.keep_until_ms) for window in windows] == [
+        (0, 10_600),
+        (10_600, 20_600),
+        (20_600, 25_000),
+    ]
+    assert (windows[1].start_ms, windows[1].end_ms) == (9_600, 21_600)
+
+    # Both windows hear the word at the first seam, timed either side of the cut.
+    first = transcription_providers.TranscriptResult(
+        language="en",
+        duration_ms=11_600,
+        words=[TranscriptWord("before", 9_800, 10_100, 0.9), TranscriptWord("seam", 10_300, 10_800, 0.9)],
+    )
+    second = transcription_providers.TranscriptResult(
+        language="en",
+        duration_ms=12_000,
+        words=[TranscriptWord("seam", 800, 1_300, 0.8), TranscriptWord("after", 1_600, 1_900, 0.9)],
+    )
+    last = transcription_providers.TranscriptResult(language="en", duration_ms=5_400, words=[])
+
+    stitched = audiobook_alignment.stitch_window_transcripts(windows, [first, second, last])
+
+    assert [(word.text, word.start_ms) for word in stitched.words] == [
+        ("before", 9_800),
+        ("seam", 10_300),
+        ("after", 11_200),
+    ]
+    assert stitched.duration_ms == 25_000
+
+
+@pytest.mark.asyncio
+async def test_windowed_transcription_resumes_from_cached_windows(tmp_path, monkeypatch):
+    monkeypatch.setattr(audiobook_alignment.config, "TRANSCRIPTION_WINDOW_SECONDS", 10)
+    monkeypatch.setattr(audiobook_alignment.config, "TRANSCRIPTION_WINDOW_OVERLAP_SECONDS", 2)
+    settings = models.AudiobookSettings(transcription_provider="whisperx", transcription_base_url="http://whisper:8002")
+    track = models.ImportedAudiobookTrack(id=7, title="Whole book", source_start_ms=60_000, duration_ms=25_000)
+    narration = _words([f"word{index}" for index in range(60)], first_start=100, word_ms=300, gap_ms=100)
+    clips = {}
+    transcribed = []
+    failures = {9_600}
+
+    async def fake_silences(_track):
+        return [(10_400, 10_800)]
+
+    async def fake_extract(_track, destination, window):
+        clips[destination] = window
+
+    async def fake_transcribe(_settings, path):
+        window = clips[path]
+        transcribed.append(window.start_ms)
+        if window.start_ms in failures:
+            failures.clear()
+            raise RuntimeError("endpoint went away")
+        words = [
+            TranscriptWord(word.text, word.start_ms - window.start_ms, word.end_ms - window.start_ms, word.score)
+            for word in narration
+            if window.start_ms <= word.start_ms and word.end_ms <= window.end_ms
+        ]
+        return transcription_providers.TranscriptResult("en", window.end_ms - window.start_ms, words)
+
+    monkeypatch.setattr(audiobook_alignment, "_detect_track_silences", fake_silences)
+    monkeypatch.setattr(audiobook_alignment, "_extract_track_clip", fake_extract)
+    monkeypatch.setattr(audiobook_alignment, "transcribe_file", fake_transcribe)
+    cache_config = audiobook_alignment._transcription_cache_config(settings)
+
+    with pytest.raises(RuntimeError, match="endpoint went away"):
+        await audiobook_alignment._transcribe_track(settings, track, tmp_path, cache_config, asyncio.Semaphore(2))
+    assert sorted(transcribed) == [0, 9_600, 19_600]
+
+    cache_path, transcript = await audiobook_alignment._transcribe_track(
+        settings, track, tmp_path, cache_config, asyncio.Semaphore(2)
+    )
+
+    assert sorted(transcribed) == [0, 9_600, 9_600, 19_600]
+    assert transcript.words == [word for word in narration if word.end_ms <= 25_000]
+    assert cache_path == tmp_path / "alignment" / "transcripts" / "track-7.json.gz"
+    assert not (tmp_path / "alignment" / "transcripts" / "track-7").exists()
+
+
 class _Response:
     def raise_for_status(self):
         return None
@@ -228,7 +346,7 @@ async def test_process_alignment_replaces_estimates_and_caches_transcript(db, tm
     monkeypatch.setattr(audiobook_alignment, "imported_audiobook_dir", lambda *_args: edition_dir)
     monkeypatch.setattr(audiobook_alignment, "relative_library_path", lambda path: str(path))
 
-    async def fake_extract(_track, destination):
+    async def fake_extract(_track, destination, _window=None):
         destination.parent.mkdir(parents=True, exist_ok=True)
         destination.write_bytes(b"flac")
 
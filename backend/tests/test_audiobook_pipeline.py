@@ -21,6 +21,7 @@ from backend.app.services import (
     audiobook_text,
     audiobook_tts,
     processing_queue,
+    snippet_packs,
     web_novel,
 )
 from backend.app.services import audiobook_queue
@@ -1402,6 +1403,156 @@ async def test_tts_failure_marks_book_error_instead_of_advancing_to_assembly(db,
     assert sentence.audio_file_path is None
 
 
+@pytest.mark.asyncio
+async def test_book_tts_pipelines_rounds_and_records_each_in_one_transaction(db, tmp_path, monkeypatch):
+    book = await _make_book(db)
+    chapter, character, _sentence = await _seed_audio_chapter(db, book.id)
+    await crud.audiobook.create_sentences_bulk(
+        db,
+        chapter.id,
+        [
+            {
+                "html_element_id": f"ch1_s{index}",
+                "sequence_order": index,
+                "original_text": f"Sentence {index}.",
+                "tagged_text": f"Sentence {index}.",
+                "character_id": character.id,
+                "status": "ready_for_audio",
+            }
+            for index in range(1, 5)
+        ],
+    )
+    monkeypatch.setattr(audiobook_tts, "LIBRARY_PATH", tmp_path / "library")
+    monkeypatch.setattr(audiobook_tts, "TTS_BATCH_SIZE", 2)
+    monkeypatch.setattr(audiobook_tts, "_get_mp3_duration_ms", lambda _audio: 500.0)
+    events = []
+
+    async def fake_tts(_settings, request):
+        events.append(f"synthesize {request.text}")
+        await asyncio.sleep(0)
+        return b"mp3"
+
+    record_batch = crud.audiobook.record_sentence_audio_batch
+
+    async def recording_batch(db, book_id, clips, failed, **progress):
+        events.append(f"record {len(clips)}")
+        return await record_batch(db, book_id, clips, failed, **progress)
+
+    monkeypatch.setattr(audiobook_tts, "synthesize_speech", fake_tts)
+    monkeypatch.setattr(crud.audiobook, "record_sentence_audio_batch", recording_batch)
+
+    await audiobook_tts.generate_audio_for_book(book.id, db)
+
+    assert events == [
+        "synthesize One sentence.",
+        "synthesize Sentence 1.",
+        "synthesize Sentence 2.",
+        "synthesize Sentence 3.",
+        "record 2",
+        "synthesize Sentence 4.",
+        "record 2",
+        "record 1",
+    ]
+    await db.refresh(book)
+    await db.refresh(chapter)
+    assert await crud.audiobook.count_sentences_by_status(db, book.id) == {"audio_generated": 5}
+    assert book.audiobook_progress_current == 5
+    assert book.audiobook_pipeline_status == "assembling"
+    assert chapter.needs_reassembly is True
+    snippets_dir = tmp_path / "library" / "audiobooks" / str(book.id) / "snippets"
+    assert sorted(path.name for path in snippets_dir.iterdir()) == [
+        f"chapter-{chapter.id}.1.pack",
+        f"chapter-{chapter.id}.index.json",
+    ]
+
+
+async def _run_two_sentence_tts_rounds(db, tmp_path, monkeypatch, *, on_first_synthesis=None):
+    book = await _make_book(db)
+    chapter, character, _sentence = await _seed_audio_chapter(db, book.id)
+    await crud.audiobook.create_sentences_bulk(
+        db,
+        chapter.id,
+        [
+            {
+                "html_element_id": f"ch1_s{index}",
+                "sequence_order": index,
+                "original_text": f"Sentence {index}.",
+                "tagged_text": f"Sentence {index}.",
+                "character_id": character.id,
+                "status": "ready_for_audio",
+            }
+            for index in range(1, 5)
+        ],
+    )
+    monkeypatch.setattr(audiobook_tts, "LIBRARY_PATH", tmp_path / "library")
+    monkeypatch.setattr(audiobook_tts, "TTS_BATCH_SIZE", 2)
+    monkeypatch.setattr(audiobook_tts, "_get_mp3_duration_ms", lambda _audio: 500.0)
+    synthesized = []
+
+    async def fake_tts(_settings, request):
+        synthesized.append(request.text)
+        if len(synthesized) == 1 and on_first_synthesis is not None:
+            await on_first_synthesis(book)
+        await asyncio.sleep(0)
+        return b"mp3"
+
+    monkeypatch.setattr(audiobook_tts, "synthesize_speech", fake_tts)
+    return book, synthesized
+
+
+@pytest.mark.asyncio
+async def test_one_batch_tts_run_does_not_synthesize_a_round_it_would_discard(db, tmp_path, monkeypatch):
+    book, synthesized = await _run_two_sentence_tts_rounds(db, tmp_path, monkeypatch)
+    book.audiobook_batch_limit = 1
+    await db.commit()
+
+    await audiobook_tts.generate_audio_for_book(book.id, db)
+
+    await db.refresh(book)
+    assert synthesized == ["One sentence.", "Sentence 1."]
+    assert book.audiobook_pipeline_status == "paused"
+    assert await crud.audiobook.count_sentences_by_status(db, book.id) == {"audio_generated": 2, "ready_for_audio": 3}
+
+
+@pytest.mark.asyncio
+async def test_tts_pause_records_the_round_in_flight_and_starts_no_other(db, tmp_path, monkeypatch):
+    async def request_pause(book):
+        # The next round-boundary query flushes this, as a concurrent pause request would commit it.
+        book.audiobook_pause_requested = True
+
+    book, synthesized = await _run_two_sentence_tts_rounds(db, tmp_path, monkeypatch, on_first_synthesis=request_pause)
+
+    await audiobook_tts.generate_audio_for_book(book.id, db)
+
+    await db.refresh(book)
+    # The second round was already synthesizing when the pause landed; it is kept, and no third round starts.
+    assert synthesized == ["One sentence.", "Sentence 1.", "Sentence 2.", "Sentence 3."]
+    assert book.audiobook_pipeline_status == "paused"
+    assert await crud.audiobook.count_sentences_by_status(db, book.id) == {"audio_generated": 4, "ready_for_audio": 1}
+
+
+def test_snippet_pack_appends_regenerated_clips_and_compacts_in_reading_order(tmp_path):
+    index_path = tmp_path / snippet_packs.chapter_index_name(7)
+    snippet_packs.append_snippets(index_path, [(1, b"first-clip", 100.0), (2, b"second", 200.0), (3, b"third-clip", 300.0)])
+    snippet_packs.append_snippets(index_path, [(2, b"SECOND!", 250.0)])
+
+    assert snippet_packs.read_snippet(index_path, 2) == b"SECOND!"
+    assert snippet_packs.has_snippet(index_path, 3)
+    assert not snippet_packs.has_snippet(index_path, 4)
+
+    untouched = snippet_packs.compact_pack(index_path, [1, 2, 3])
+    assert untouched.generation == 1
+
+    pack = snippet_packs.compact_pack(index_path, [3, 2])
+    assert pack.generation == 2
+    assert pack.path.read_bytes() == b"third-clipSECOND!"
+    assert pack.entries[2] == snippet_packs.SnippetEntry(offset=10, length=7, duration_ms=250.0)
+    assert snippet_packs.read_snippet(index_path, 3) == b"third-clip"
+    with pytest.raises(KeyError):
+        snippet_packs.read_snippet(index_path, 1)
+    assert [path.name for path in snippet_packs.pack_files(index_path)] == [index_path.name, "chapter-7.2.pack"]
+
+
 @pytest.mark.asyncio
 async def test_provider_change_clears_stored_tts_api_key(db):
     settings = models.AudiobookSettings(
@@ -1858,6 +2009,10 @@ def _simple_sentence_split(text: str) -> list[str]:
     return [f"{chunk.strip()}." for chunk in text.split(".") if chunk.strip()]
 
 
+def _simple_sentence_splits(texts: list[str]) -> list[list[str]]:
+    return [_simple_sentence_split(text) for text in texts]
+
+
 @pytest.mark.asyncio
 async def test_ingestion_preserves_nested_markup_and_records_spine_file(db, tmp_path, monkeypatch):
     library_path = tmp_path / "library"
@@ -1871,7 +2026,7 @@ async def test_ingestion_preserves_nested_markup_and_records_spine_file(db, tmp_
     )
     monkeypatch.setattr(audiobook_ingestion, "LIBRARY_PATH", library_path)
     monkeypatch.setattr(audiobook_publication, "LIBRARY_PATH", library_path)
-    monkeypatch.setattr(audiobook_ingestion, "_tokenize_text", _simple_sentence_split)
+    monkeypatch.setattr(audiobook_ingestion, "_tokenize_texts", _simple_sentence_splits)
 
     await audiobook_ingestion.ingest_epub(book.id, db)
 
@@ -1915,7 +2070,7 @@ async def test_incremental_ingestion_appends_chapter_without_invalidating_ready_
     )
     monkeypatch.setattr(audiobook_ingestion, "LIBRARY_PATH", library_path)
     monkeypatch.setattr(audiobook_publication, "LIBRARY_PATH", library_path)
-    monkeypatch.setattr(audiobook_ingestion, "_tokenize_text", _simple_sentence_split)
+    monkeypatch.setattr(audiobook_ingestion, "_tokenize_texts", _simple_sentence_splits)
 
     await audiobook_ingestion.ingest_epub(book.id, db)
     original = await crud.audiobook.get_chapters_for_book(db, book.id)
@@ -1948,6 +2103,49 @@ async def test_incremental_ingestion_appends_chapter_without_invalidating_ready_
     assert chapters[2].generation_state == "pending"
 
 
+@pytest.mark.asyncio
+async def test_incremental_ingestion_tokenizes_only_new_chapters(db, tmp_path, monkeypatch):
+    library_path = tmp_path / "library"
+    library_path.mkdir()
+    epub_path = library_path / "incremental.epub"
+    initial = [
+        ("Text/one.xhtml", "One", "First original sentence. It has two."),
+        ("Text/two.xhtml", "Two", "Second original sentence."),
+    ]
+    _write_incremental_epub(epub_path, initial)
+    book = await _make_book(
+        db,
+        audiobook_enabled=True,
+        immutable_path=str(epub_path.relative_to(library_path.parent)),
+        current_path=str(epub_path.relative_to(library_path.parent)),
+    )
+    tokenized: list[str] = []
+
+    def recording_splits(texts):
+        tokenized.extend(texts)
+        return _simple_sentence_splits(texts)
+
+    monkeypatch.setattr(audiobook_ingestion, "LIBRARY_PATH", library_path)
+    monkeypatch.setattr(audiobook_publication, "LIBRARY_PATH", library_path)
+    monkeypatch.setattr(audiobook_ingestion, "_tokenize_texts", recording_splits)
+
+    await audiobook_ingestion.ingest_epub(book.id, db)
+    _write_incremental_epub(epub_path, [*initial, ("Text/three.xhtml", "Three", "A newly appended sentence.")])
+    await crud.touch_book_content(db, book)
+    await db.commit()
+    tokenized.clear()
+    await audiobook_ingestion.ingest_epub(book.id, db)
+
+    assert tokenized == ["Three", "A newly appended sentence."]
+    chapters = await crud.audiobook.get_chapters_for_book(db, book.id)
+    working_epub = epub.read_epub(str(library_path / "audiobooks" / str(book.id) / "working.epub"))
+    for chapter in chapters:
+        soup = BeautifulSoup(working_epub.get_item_with_href(chapter.source_href).get_content(), "html.parser")
+        sentences = await crud.audiobook.get_sentences_for_chapter(db, chapter.id)
+        assert [span["id"] for span in soup.find_all("span", id=True)] == [sentence.html_element_id for sentence in sentences]
+    assert [len(await crud.audiobook.get_sentences_for_chapter(db, chapter.id)) for chapter in chapters] == [3, 2, 2]
+
+
 @pytest.mark.asyncio
 async def test_incremental_ingestion_invalidates_only_edited_chapter(db, tmp_path, monkeypatch):
     library_path = tmp_path / "library"
@@ -1966,7 +2164,7 @@ async def test_incremental_ingestion_invalidates_only_edited_chapter(db, tmp_pat
     )
     monkeypatch.setattr(audiobook_ingestion, "LIBRARY_PATH", library_path)
     monkeypatch.setattr(audiobook_publication, "LIBRARY_PATH", library_path)
-    monkeypatch.setattr(audiobook_ingestion, "_tokenize_text", _simple_sentence_split)
+    monkeypatch.setattr(audiobook_ingestion, "_tokenize_texts", _simple_sentence_splits)
 
     await audiobook_ingestion.ingest_epub(book.id, db)
     original = await crud.audiobook.get_chapters_for_book(db, book.id)
@@ -2012,7 +2210,7 @@ async def test_incremental_ingestion_removes_deleted_chapter_and_assets(db, tmp_
     )
     monkeypatch.setattr(audiobook_ingestion, "LIBRARY_PATH", library_path)
     monkeypatch.setattr(audiobook_publication, "LIBRARY_PATH", library_path)
-    monkeypatch.setattr(audiobook_ingestion, "_tokenize_text", _simple_sentence_split)
+    monkeypatch.setattr(audiobook_ingestion, "_tokenize_texts", _simple_sentence_splits)
 
     await audiobook_ingestion.ingest_epub(book.id, db)
     original = await crud.audiobook.get_chapters_for_book(db, book.id)
@@ -2340,7 +2538,7 @@ async def test_offline_harness_builds_downloadable_media_overlay_epub(db, tmp_pa
     )
     for module in (audiobook_ingestion, audiobook_publication, audiobook_tts, audiobook_assembly):
         monkeypatch.setattr(module, "LIBRARY_PATH", library_path)
-    monkeypatch.setattr(audiobook_ingestion, "_tokenize_text", _simple_sentence_split)
+    monkeypatch.setattr(audiobook_ingestion, "_tokenize_texts", _simple_sentence_splits)
 
     await audiobook_ingestion.ingest_epub(book.id, db)
     await audiobook_llm.generate_character_roster(book.id, db)
@@ -1,3 +1,6 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
 import httpx
 import pytest
 from sqlalchemy import select
@@ -84,6 +87,94 @@ async def test_all_cooling_endpoints_fail_fast(monkeypatch):
         await endpoint_pool.route_request(settings, "tts", fail)
 
 
+@pytest.mark.asyncio
+async def test_concurrent_requests_fill_every_endpoint_up_to_in_flight_limit(monkeypatch):
+    monkeypatch.setattr(endpoint_pool.config, "AI_ENDPOINT_MAX_IN_FLIGHT", 2)
+    settings = models.AudiobookSettings(
+        tts_endpoints=[
+            {"id": "one", "name": "One", "provider": "omnivoice", "base_url": "http://one"},
+            {"id": "two", "name": "Two", "provider": "omnivoice", "base_url": "http://two"},
+        ]
+    )
+    release = asyncio.Event()
+    active: dict[str, int] = {"http://one": 0, "http://two": 0}
+    peak: dict[str, int] = {"http://one": 0, "http://two": 0}
+
+    async def attempt(endpoint_settings):
+        host = endpoint_settings.tts_base_url
+        active[host] += 1
+        peak[host] = max(peak[host], active[host])
+        await release.wait()
+        active[host] -= 1
+        return host
+
+    tasks = [asyncio.create_task(endpoint_pool.route_request(settings, "tts", attempt)) for _ in range(6)]
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert active == {"http://one": 2, "http://two": 2}
+    assert endpoint_pool.dispatch_capacity(settings, "tts") == 4
+
+    release.set()
+    results = await asyncio.gather(*tasks)
+    assert len(results) == 6
+    assert peak == {"http://one": 2, "http://two": 2}
+
+
+@pytest.mark.asyncio
+async def test_waiting_for_a_stuck_endpoint_times_out(monkeypatch):
+    monkeypatch.setattr(endpoint_pool.config, "AI_ENDPOINT_MAX_IN_FLIGHT", 1)
+    monkeypatch.setattr(endpoint_pool.config, "AI_ENDPOINT_WAIT_TIMEOUT_SECONDS", 0.05)
+    settings = models.AudiobookSettings(
+        tts_endpoints=[{"id": "one", "name": "One", "provider": "omnivoice", "base_url": "http://one"}]
+    )
+    stuck = asyncio.Event()
+
+    async def hang(endpoint_settings):
+        await stuck.wait()
+        return "late"
+
+    holder = asyncio.create_task(endpoint_pool.route_request(settings, "tts", hang))
+    await asyncio.sleep(0)
+    with pytest.raises(RuntimeError, match="Timed out .* waiting for a free tts endpoint"):
+        await endpoint_pool.route_request(settings, "tts", hang)
+    assert endpoint_pool._capacity_waiters == []
+
+    stuck.set()
+    assert (await holder).value == "late"
+
+
+@pytest.mark.asyncio
+async def test_recorded_latency_history_routes_to_faster_endpoint(monkeypatch, sqlite_sessionmaker):
+    monkeypatch.setattr(endpoint_metrics, "SessionLocal", sqlite_sessionmaker)
+    endpoints = [
+        {"id": "slow", "name": "Slow", "provider": "ollama", "base_url": "http://slow"},
+        {"id": "fast", "name": "Fast", "provider": "ollama", "base_url": "http://fast"},
+    ]
+    async with sqlite_sessionmaker() as db:
+        settings = models.AudiobookSettings(llm_endpoints=endpoints)
+        db.add(settings)
+        await db.flush()
+        for endpoint_id, duration in (("slow", 9_000), ("fast", 1_000), ("fast", 2_000)):
+            db.add(
+                models.AiEndpointRequestMetric(
+                    settings_id=settings.id,
+                    capability="llm",
+                    endpoint_id=endpoint_id,
+                    endpoint_name=endpoint_id,
+                    provider="ollama",
+                    success=True,
+                    duration_ms=duration,
+                )
+            )
+        await db.commit()
+
+    async def attempt(endpoint_settings):
+        return endpoint_settings.llm_base_url
+
+    routed = await endpoint_pool.route_request(settings, "llm", attempt)
+    assert routed.value == "http://fast"
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("capability", ["llm", "tts", "transcription"])
 async def test_routes_record_successful_endpoint_attempt(monkeypatch, sqlite_sessionmaker, capability):
@@ -172,6 +263,49 @@ async def test_endpoint_summaries_include_latency_percentiles_and_buckets(db):
     assert summaries[1]["average_ms"] is None
 
 
+@pytest.mark.asyncio
+async def test_endpoint_metric_rollups_preserve_summaries_after_pruning(db):
+    settings = models.AudiobookSettings(tts_endpoints=[{"id": "voice", "name": "Voice host", "provider": "omnivoice"}])
+    db.add(settings)
+    await db.flush()
+    now = datetime.now(timezone.utc)
+    for age, duration, success in (
+        (timedelta(days=20), 70_000, True),
+        (timedelta(days=20), 400, False),
+        (timedelta(hours=3), 2_000, True),
+        (timedelta(hours=3), 8_000, True),
+        (timedelta(0), 20_000, True),
+    ):
+        db.add(
+            models.AiEndpointRequestMetric(
+                settings_id=settings.id,
+                capability="tts",
+                endpoint_id="voice",
+                endpoint_name="Voice host",
+                provider="omnivoice",
+                success=success,
+                duration_ms=duration,
+                created_at=now - age,
+            )
+        )
+    await db.commit()
+    before = (await endpoint_metrics.endpoint_summaries(db, settings, "tts"))[0]
+
+    assert await endpoint_metrics.rollup_endpoint_metrics(db, now=now) == 2
+    assert await endpoint_metrics.rollup_endpoint_metrics(db, now=now) == 0
+    assert await endpoint_metrics.prune_endpoint_metrics(db, now=now) == 2
+    after = (await endpoint_metrics.endpoint_summaries(db, settings, "tts"))[0]
+
+    all_time = ("requests", "answered", "failed", "average_ms", "fastest_ms", "slowest_ms", "speed_buckets")
+    assert {key: after[key] for key in all_time} == {key: before[key] for key in all_time}
+    assert after["requests"] == 5
+    assert after["slowest_ms"] == 70_000.0
+    assert after["speed_buckets"] == {"under_5s": 1, "from_5s_to_15s": 1, "from_15s_to_60s": 1, "over_60s": 1}
+    assert after["answered_24h"] == before["answered_24h"] == 3
+    assert before["p50_ms"] == 14_000.0
+    assert after["p50_ms"] == 8_000.0
+
+
 @pytest.mark.asyncio
 async def test_llm_stats_api_returns_configured_endpoint_metrics(app_client, sqlite_sessionmaker):
     async with sqlite_sessionmaker() as db:
@@ -5,7 +5,7 @@ import pytest
 from bs4 import BeautifulSoup
 from ebooklib import epub
 
-from backend.app import epub_editor, models
+from backend.app import config, epub_editor, models
 from backend.app.services.epub_utils import PROSE_BLOCK_MAX_CHARS
 
 
@@ -83,3 +83,78 @@ async def test_forced_cleaning_rebuild_restores_epub_after_last_rule_is_removed(
     assert len(calls) == 1
     assert calls[0][0][2:4] == ([], [])
     assert book.current_word_count == 3
+
+
+@pytest.mark.asyncio
+async def test_process_epub_runs_in_the_epub_process_pool(tmp_path, monkeypatch):
+    from backend.app.services import epub_workers
+
+    immutable = tmp_path / "immutable.epub"
+    current = tmp_path / "current.epub"
+    _create_epub(immutable, "<h1>Chapter 1</h1><p>Keep these words.</p><div class='ad'>Buy now</div>")
+    monkeypatch.setattr(config, "EPUB_PROCESS_WORKERS", 1)
+    try:
+        word_count = await epub_workers.run_epub_transform(epub_editor.process_epub, str(immutable), str(current), [], [".ad"])
+    finally:
+        epub_workers.shutdown_epub_workers()
+
+    assert word_count == epub_editor.get_word_count(str(current))
+    assert _chapter_soup(current).select(".ad") == []
+
+
+def _create_serial(filepath: Path, chapter_count: int) -> None:
+    book = epub.EpubBook()
+    book.set_identifier("serial-id")
+    book.set_title("Serial")
+    book.set_language("en")
+    book.add_author("Test Author")
+    chapters = []
+    for index in range(1, chapter_count + 1):
+        chapter = epub.EpubHtml(title=f"Chapter {index}", file_name=f"chap_{index}.xhtml", lang="en")
+        chapter.content = f"<h1>Chapter {index}</h1><p>Story words for chapter {index}.</p><div class='ad'>Support me</div>"
+        book.add_item(chapter)
+        chapters.append(chapter)
+    book.spine = ["nav", *chapters]
+    book.toc = tuple(chapters)
+    book.add_item(epub.EpubNcx())
+    book.add_item(epub.EpubNav())
+    epub.write_epub(str(filepath), book, {})
+
+
+def _document_entries(epub_path: Path) -> dict[str, bytes]:
+    with zipfile.ZipFile(epub_path) as archive:
+        return {name: archive.read(name) for name in archive.namelist() if name.endswith(".xhtml")}
+
+
+def test_process_epub_only_cleans_new_chapters_when_the_rules_are_unchanged(tmp_path, monkeypatch):
+    immutable = tmp_path / "immutable.epub"
+    current = tmp_path / "current.epub"
+    cache = tmp_path / "cleaning-cache" / "1.json"
+    _create_serial(immutable, 3)
+    epub_editor.process_epub(str(immutable), str(current), [], [".ad"], cache_path=str(cache))
+
+    _create_serial(immutable, 4)
+    parsed = []
+    real_soup = epub_editor.BeautifulSoup
+
+    def counting_soup(markup, *args, **kwargs):
+        parsed.append(markup)
+        return real_soup(markup, *args, **kwargs)
+
+    monkeypatch.setattr(epub_editor, "BeautifulSoup", counting_soup)
+    word_count = epub_editor.process_epub(str(immutable), str(current), [], [".ad"], cache_path=str(cache))
+    monkeypatch.setattr(epub_editor, "BeautifulSoup", real_soup)
+
+    assert parsed and all("Chapter 4" in str(markup) for markup in parsed)
+    uncached = tmp_path / "uncached.epub"
+    assert word_count == epub_editor.process_epub(str(immutable), str(uncached), [], [".ad"])
+    assert _document_entries(current) == _document_entries(uncached)
+
+    # A rule change invalidates every cached chapter.
+    assert epub_editor.process_epub(str(immutable), str(current), [], [], cache_path=str(cache)) == word_count + 8
+
+
+def test_cleaning_cache_lives_outside_the_library(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "CACHE_DIR", tmp_path / "cache")
+
+    assert epub_editor.cleaning_cache_path(7) == tmp_path / "cache" / "cleaning" / "7.json"
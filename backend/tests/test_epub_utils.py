@@ -2,10 +2,14 @@ import zipfile
 from pathlib import Path
 
 from bs4 import BeautifulSoup
+from ebooklib import epub
 
+from backend.app.epub_editor import get_word_count
 from backend.app.services.epub_utils import (
     PROSE_BLOCK_MAX_CHARS,
+    analyze_epub,
     get_and_save_epub_cover,
+    get_epub_word_and_chapter_count,
     get_epub_genre_tags,
     get_epub_source_tags,
     normalize_epub_prose_blocks,
@@ -293,3 +297,87 @@ def test_get_epub_genre_tags_falls_back_to_dc_subjects(tmp_path):
 
     assert get_epub_genre_tags(epub_path) == ["FanFiction", "Adventure"]
     assert get_epub_source_tags(epub_path) == ["Character Growth"]
+
+
+def test_analyze_epub_matches_the_individual_readers_in_one_pass(tmp_path, monkeypatch):
+    from backend.app import config
+
+    monkeypatch.setattr(config, "LIBRARY_PATH", tmp_path / "library")
+    book = epub.EpubBook()
+    book.set_identifier("analysis-id")
+    book.set_title("Analysis Title")
+    book.set_language("en")
+    book.add_author("Analysis Author")
+    book.add_metadata("calibre", "series", "Analysis Series")
+    book.add_metadata("DC", "source", "https://www.royalroad.com/fiction/1")
+    book.add_metadata("DC", "subject", "Fantasy")
+    book.add_item(epub.EpubImage(uid="cover-image", file_name="images/cover.png", media_type="image/png", content=b"png"))
+    chapters = []
+    for index in range(2):
+        chapter = epub.EpubHtml(title=f"Chapter {index}", file_name=f"chap_{index}.xhtml", lang="en")
+        chapter.content = f"<h1>Chapter {index}</h1><p>One two three four.</p>"
+        book.add_item(chapter)
+        chapters.append(chapter)
+    book.toc = tuple(chapters)
+    book.add_item(epub.EpubNcx())
+    book.add_item(epub.EpubNav())
+    book.spine = ["nav", *chapters]
+    epub_path = tmp_path / "analysis.epub"
+    epub.write_epub(str(epub_path), book, {})
+
+    analysis = analyze_epub(epub_path)
+
+    assert (analysis.title, analysis.author, analysis.series) == ("Analysis Title", "Analysis Author", "Analysis Series")
+    assert analysis.source_url == "https://www.royalroad.com/fiction/1"
+    assert analysis.genre_tags == ["Fantasy"]
+    assert analysis.word_count == get_word_count(str(epub_path))
+    assert analysis.chapter_count == get_epub_word_and_chapter_count(epub_path)[1]
+    assert analysis.cover_path == "EPUB/images/cover.png"
+    assert analysis.save_cover(7) == (tmp_path / "library" / "covers" / "7.png").resolve()
+
+    metadata_only = analyze_epub(epub_path, include_text=False)
+    assert metadata_only.title == "Analysis Title"
+    assert (metadata_only.word_count, metadata_only.chapter_count) == (0, 0)
+
+
+def test_count_xhtml_words_matches_beautifulsoup_text_across_chunk_boundaries(monkeypatch):
+    from backend.app.services import epub_utils
+
+    html = (
+        b"<?xml version='1.0' encoding='utf-8'?><html><head><title>Not counted</title></head>"
+        b"<body><h1>Chapter&nbsp;One</h1><p>Split <b>bo</b>ld words, caf\xc3\xa9 and<!-- note -->more.</p>"
+        b"<script>var skipped = 1;</script><p>Last   line</p></body></html>"
+    )
+    monkeypatch.setattr(epub_utils, "WORD_COUNT_CHUNK_BYTES", 7)
+
+    expected = len(BeautifulSoup(html, "html.parser").body.get_text().split())
+    assert epub_utils.count_xhtml_words(html) == expected == 7
+
+
+def test_epub_word_counts_are_cached_per_unchanged_archive_entry(tmp_path, monkeypatch):
+    from backend.app.services import epub_utils
+
+    book = epub.EpubBook()
+    book.set_identifier("count-id")
+    book.set_title("Counted")
+    book.set_language("en")
+    chapter = epub.EpubHtml(title="One", file_name="chap_1.xhtml", lang="en")
+    chapter.content = "<p>One two three.</p>"
+    book.add_item(chapter)
+    book.toc = (chapter,)
+    book.add_item(epub.EpubNcx())
+    book.add_item(epub.EpubNav())
+    book.spine = ["nav", chapter]
+    epub_path = tmp_path / "counted.epub"
+    epub.write_epub(str(epub_path), book, {})
+
+    epub_utils._word_count_cache.clear()
+    first = get_epub_word_and_chapter_count(epub_path)
+
+    def fail(_source):
+        raise AssertionError("cached entries must not be re-parsed")
+
+    monkeypatch.setattr(epub_utils, "count_xhtml_words", fail)
+    assert get_epub_word_and_chapter_count(epub_path) == first
+    assert first[1] == 2
+    assert get_word_count(str(epub_path)) == 3
@@ -12,9 +12,10 @@ from pathlib import Path
 from ebooklib import epub
 from backend.app.main import app
 from backend.app.services import update_scheduler, web_novel
+from backend.app.services.api_key_usage import get_api_key_usage_recorder
 from backend.app.services.series import SeriesBook, detect_series_from_books, detect_series_from_titles
 from backend.app.database import Base, get_db
-from backend.app import crud, epub_editor, models, schemas
+from backend.app import auth, crud, epub_editor, models, schemas
 
 # Use an in-memory SQLite database for testing with an async driver
 SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
@@ -411,7 +412,7 @@ async def test_metadata_sync_preview_returns_genres_and_possible_missing_series_
             )
         raise AssertionError(f"Unexpected URL: {url}")
 
-    mocker.patch("backend.app.services.metadata.clients.requests.get", side_effect=fake_open_library_get)
+    mocker.patch("backend.app.services.metadata.clients._http_get", side_effect=fake_open_library_get)
 
     response = client.post("/api/metadata/sync-preview", json={})
 
@@ -463,7 +464,7 @@ async def test_metadata_sync_apply_persists_genres_and_provenance(db_session, mo
             return FakeRequestsResponse({"entries": [{"title": "Dragon Saga 1"}]})
         raise AssertionError(f"Unexpected URL: {url}")
 
-    mocker.patch("backend.app.services.metadata.clients.requests.get", side_effect=fake_open_library_get)
+    mocker.patch("backend.app.services.metadata.clients._http_get", side_effect=fake_open_library_get)
 
     response = client.post("/api/metadata/apply", json={"book_ids": [book.id]})
 
@@ -527,7 +528,7 @@ async def test_metadata_sync_uses_manual_isbn_identifier(db_session, mocker):
             return FakeRequestsResponse({"entries": [{"title": "Manual ID Book"}]})
         raise AssertionError(f"Unexpected URL: {url}")
 
-    mocker.patch("backend.app.services.metadata.clients.requests.get", side_effect=fake_open_library_get)
+    mocker.patch("backend.app.services.metadata.clients._http_get", side_effect=fake_open_library_get)
 
     response = client.post("/api/metadata/sync-preview", json={})
 
@@ -575,7 +576,7 @@ async def test_metadata_sync_falls_back_to_google_books_when_open_library_has_no
         raise AssertionError(f"Unexpected URL: {url}")
 
     mocker.patch("backend.app.services.metadata.clients.GOOGLE_BOOKS_API_KEY", "test-key")
-    mocker.patch("backend.app.services.metadata.clients.requests.get", side_effect=fake_requests_get)
+    mocker.patch("backend.app.services.metadata.clients._http_get", side_effect=fake_requests_get)
 
     response = client.post("/api/metadata/apply", json={"book_ids": [book.id]})
 
@@ -651,7 +652,7 @@ async def test_metadata_sync_supplements_open_library_match_with_google_books_ca
         raise AssertionError(f"Unexpected URL: {url}")
 
     mocker.patch("backend.app.services.metadata.clients.GOOGLE_BOOKS_API_KEY", "test-key")
-    mocker.patch("backend.app.services.metadata.clients.requests.get", side_effect=fake_requests_get)
+    mocker.patch("backend.app.services.metadata.clients._http_get", side_effect=fake_requests_get)
 
     response = client.post("/api/metadata/apply", json={"book_ids": [book.id]})
 
@@ -720,7 +721,7 @@ async def test_metadata_sync_uses_same_series_open_library_author_key_for_relate
             return FakeRequestsResponse({"subjects": ["Fantasy"]})
         raise AssertionError(f"Unexpected URL: {url}")
 
-    mocker.patch("backend.app.services.metadata.clients.requests.get", side_effect=fake_open_library_get)
+    mocker.patch("backend.app.services.metadata.clients._http_get", side_effect=fake_open_library_get)
 
     response = client.post("/api/metadata/sync-preview", json={"book_ids": [sequel.id]})
 
@@ -847,7 +848,7 @@ async def test_metadata_job_keeps_close_match_candidates_for_human_selection(db_
             return FakeRequestsResponse({"entries": [{"title": "Dragon Saga 6"}, {"title": "Dragon Saga 8"}]})
         raise AssertionError(f"Unexpected URL: {url}")
 
-    mocker.patch("backend.app.services.metadata.clients.requests.get", side_effect=fake_open_library_get)
+    mocker.patch("backend.app.services.metadata.clients._http_get", side_effect=fake_open_library_get)
 
     async with AsyncTestingSessionLocal() as session:
         await process_metadata_sync_job(session, job.id)
@@ -1952,6 +1953,7 @@ async def test_book_revision_can_restore_metadata(db_session):
 @pytest.mark.asyncio
 async def test_restore_original_epub_clears_book_cleaning_rules(db_session, tmp_path, monkeypatch):
     from backend.app.routers import books as books_router
+    from backend.app.services.epub_utils import analyze_epub
 
     library_path = (tmp_path / "library").resolve()
     monkeypatch.setattr(books_router, "LIBRARY_PATH", library_path)
@@ -1980,6 +1982,7 @@ async def test_restore_original_epub_clears_book_cleaning_rules(db_session, tmp_
     assert response.status_code == 200
     assert response.json()["removed_chapters"] == []
     assert response.json()["content_selectors"] == []
+    assert response.json()["current_word_count"] == analyze_epub(immutable_path).word_count > 0
     assert current_path.read_bytes() == immutable_path.read_bytes()
     revisions = client.get(f"/api/books/{book.id}/revisions").json()
     assert revisions[0]["action"] == "original_restored"
@@ -2492,7 +2495,7 @@ async def test_update_web_novels_counts_and_logs_book_failures(db_session, mocke
             ),
         )
 
-    mocker.patch("backend.app.services.web_novel.get_epub_word_and_chapter_count", return_value=(1000, 10))
+    mocker.patch("backend.app.services.web_novel._epub_counts", return_value=(1000, 10))
     mocker.patch(
         "backend.app.services.web_novel.download_web_novel",
         side_effect=HTTPException(status_code=500, detail="boom"),
@@ -2954,6 +2957,54 @@ async def test_opds_search_feed(db_session):
     assert entries[0].findtext(f"{ATOM}title") == "Searchable Title"
 
 
+@pytest.mark.asyncio
+async def test_reader_search_ranks_matches_and_pages_by_cursor(db_session):
+    async with AsyncTestingSessionLocal() as session:
+        for index, (title, author) in enumerate(
+            [
+                ("The Last Dragon", "Author A"),
+                ("Quiet Harbor", "Sam Dragonsworn"),
+                ("Dragon Rider", "Author B"),
+                ("Dragon", "Author C"),
+                ("Unrelated", "Author D"),
+            ]
+        ):
+            await crud.create_book(
+                session,
+                schemas.BookCreate(
+                    title=title,
+                    author=author,
+                    immutable_path=f"library/immutable_search_{index}.epub",
+                    current_path=f"library/search_{index}.epub",
+                    source_type=models.SourceType.epub,
+                ),
+            )
+
+    token = client.post("/api/reader-keys", json={"label": "Search Pager"}).json()["token"]
+    auth = ("reader", token)
+
+    first = client.get("/reader/search?q=DRAGON&limit=3", auth=auth)
+    assert first.status_code == 200
+    assert [book["title"] for book in first.json()] == ["Dragon", "Dragon Rider", "The Last Dragon"]
+    next_url = first.headers["link"].split(">", 1)[0].removeprefix("<")
+    second = client.get(next_url, auth=auth)
+    assert [book["title"] for book in second.json()] == ["Quiet Harbor"]
+    assert "link" not in second.headers
+    assert client.get(next_url.replace("limit=3", "limit=2"), auth=auth).status_code == 400
+
+    import xml.etree.ElementTree as ET
+
+    ATOM = "{http://www.w3.org/2005/Atom}"
+    root = ET.fromstring(client.get("/reader/opds/search?q=dragon&page_size=2", auth=auth).content)
+    assert [entry.findtext(f"{ATOM}title") for entry in root.findall(f"{ATOM}entry")] == ["Dragon", "Dragon Rider"]
+    next_links = [link.get("href") for link in root.findall(f"{ATOM}link") if link.get("rel") == "next"]
+    root = ET.fromstring(client.get(next_links[0], auth=auth).content)
+    assert [entry.findtext(f"{ATOM}title") for entry in root.findall(f"{ATOM}entry")] == [
+        "The Last Dragon",
+        "Quiet Harbor",
+    ]
+
+
 @pytest.mark.asyncio
 async def test_duplicate_epub_upload(db_session):
     """
@@ -3136,9 +3187,6 @@ async def test_finish_web_novel_download_allowed_when_epub_has_same_title_and_au
         return_value=(fake_epub, {"title": title, "author": author, "series": None}),
     )
     mocker.patch("backend.app.services.web_novel.SessionLocal", AsyncTestingSessionLocal)
-    mocker.patch("backend.app.services.web_novel.epub_editor.get_word_count", return_value=50000)
-    mocker.patch("backend.app.services.web_novel.get_epub_word_and_chapter_count", return_value=(50000, 42))
-    mocker.patch("backend.app.services.web_novel.get_and_save_epub_cover", return_value=None)
     mocker.patch("backend.app.services.web_novel.collect_cover", mocker.AsyncMock(return_value=None))
     mocker.patch("backend.app.services.web_novel.epub_editor.apply_book_cleaning", mocker.AsyncMock(return_value=False))
     mocker.patch("backend.app.services.web_novel.queue_metadata_sync_job", mocker.AsyncMock())
@@ -3689,6 +3737,33 @@ def test_detect_series_does_not_cross_authors():
     assert detect_series_from_books(books) == {}
 
 
+def test_detect_series_changed_books_only_reevaluate_their_author():
+    """Incremental detection clusters only the buckets of changed books, including their unchanged peers."""
+    books = [
+        SeriesBook(title="Shared Saga 1", author="Author One"),
+        SeriesBook(title="Shared Saga 2", author="Author One"),
+        SeriesBook(title="Other Saga 1", author="Author Two"),
+        SeriesBook(title="Other Saga 2", author="Author Two"),
+    ]
+    result = detect_series_from_books(books, changed=[books[1]])
+    assert result == {("Author One", "Shared Saga 1"): "Shared Saga", ("Author One", "Shared Saga 2"): "Shared Saga"}
+    assert detect_series_from_books(books, changed=[]) == {}
+
+
+def test_detect_series_joins_suffix_labels_to_earliest_cluster():
+    """A hint that is a word suffix of several clusters' labels joins the first of them."""
+    books = [
+        SeriesBook(title="Dark Crown 1", author="Author"),
+        SeriesBook(title="Iron Crown 1", author="Author"),
+        SeriesBook(title="Crown 2", author="Author"),
+        SeriesBook(title="Iron Crown 2", author="Author"),
+    ]
+    result = detect_series_from_books(books)
+    assert result[("Author", "Dark Crown 1")] == "Crown"
+    assert result[("Author", "Crown 2")] == "Crown"
+    assert result[("Author", "Iron Crown 2")] == "Crown"
+
+
 @pytest.mark.asyncio
 async def test_detect_series_endpoint_uses_author_aware_patterns(db_session):
     """The detect-series endpoint updates books for the live formats seen in the library sample."""
@@ -3930,6 +4005,78 @@ async def test_reader_opds_and_json_include_web_book_source_url(db_session):
     assert alternate_links[0].get("type") == "text/html"
 
 
+@pytest.mark.asyncio
+async def test_reader_feeds_page_by_cursor_and_answer_conditional_requests(db_session):
+    async with AsyncTestingSessionLocal() as session:
+        for index, title in enumerate(["Gamma", "Alpha", "Delta", "Beta"]):
+            book = await crud.create_book(
+                session,
+                schemas.BookCreate(
+                    title=title,
+                    author="Feed Author",
+                    immutable_path=f"library/immutable_feed_{index}.epub",
+                    current_path=f"library/feed_{index}.epub",
+                    source_type=models.SourceType.epub,
+                ),
+            )
+            book.content_updated_at = datetime(2026, 5, 1, tzinfo=timezone.utc) + timedelta(days=index)
+        await session.commit()
+
+    token = client.post("/api/reader-keys", json={"label": "Feed Reader"}).json()["token"]
+    auth = ("reader", token)
+
+    titles = []
+    url = "/reader/books/all?limit=3"
+    while url:
+        response = client.get(url, auth=auth)
+        assert response.status_code == 200
+        titles.extend(book["title"] for book in response.json())
+        next_link = response.headers.get("link")
+        url = next_link.split(">", 1)[0].removeprefix("<") if next_link else None
+    assert titles == ["Alpha", "Beta", "Delta", "Gamma"]
+
+    first_updates = client.get("/reader/updates?limit=2", auth=auth)
+    assert [book["title"] for book in first_updates.json()] == ["Beta", "Delta"]
+    assert client.get("/reader/updates?cursor=abc", auth=auth).status_code == 400
+
+    etag = first_updates.headers["etag"]
+    last_modified = first_updates.headers["last-modified"]
+    assert last_modified
+    cached = client.get("/reader/updates?limit=2", auth=auth, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    assert client.get("/reader/updates?limit=2", auth=auth, headers={"If-Modified-Since": last_modified}).status_code == 304
+
+    async with AsyncTestingSessionLocal() as session:
+        book = (await session.execute(select(models.Book).where(models.Book.title == "Alpha"))).scalar_one()
+        book.content_updated_at = datetime(2026, 6, 1, tzinfo=timezone.utc)
+        await session.commit()
+
+    refreshed = client.get("/reader/updates?limit=2", auth=auth, headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["etag"] != etag
+    assert [book["title"] for book in refreshed.json()] == ["Alpha", "Beta"]
+
+    import xml.etree.ElementTree as ET
+
+    ATOM = "{http://www.w3.org/2005/Atom}"
+    opds_titles = []
+    url = "/reader/opds/catalog?page_size=3"
+    while url:
+        root = ET.fromstring(client.get(url, auth=auth).content)
+        opds_titles.extend(entry.find(f"{ATOM}title").text for entry in root.findall(f"{ATOM}entry"))
+        next_links = [link.get("href") for link in root.findall(f"{ATOM}link") if link.get("rel") == "next"]
+        url = next_links[0] if next_links else None
+    assert opds_titles == ["Alpha", "Beta", "Delta", "Gamma"]
+
+    # Legacy ?page=N links still land on the matching page and continue by cursor.
+    legacy = ET.fromstring(client.get("/reader/opds/catalog?page=1&page_size=2", auth=auth).content)
+    assert [entry.find(f"{ATOM}title").text for entry in legacy.findall(f"{ATOM}entry")] == ["Delta", "Gamma"]
+    legacy_links = {link.get("rel"): link.get("href") for link in legacy.findall(f"{ATOM}link")}
+    assert legacy_links["previous"].endswith("/reader/opds/catalog?page_size=2")
+    assert "next" not in legacy_links
+
+
 @pytest.mark.asyncio
 async def test_reader_books_all_returns_only_reader_eligible_books(db_session):
     async with AsyncTestingSessionLocal() as session:
@@ -4014,6 +4161,51 @@ async def test_reader_opds_requires_auth_and_revoked_keys_fail(db_session):
     assert revoked.status_code == 401
 
 
+@pytest.mark.asyncio
+async def test_reader_key_usage_is_cached_and_written_behind(db_session, monkeypatch):
+    create_response = client.post("/api/reader-keys", json={"label": "Streaming Reader"})
+    key = create_response.json()
+    lookups = []
+    original_lookup = auth._lookup_key
+
+    async def counting_lookup(db, token, token_digest):
+        lookups.append(token_digest)
+        return await original_lookup(db, token, token_digest)
+
+    monkeypatch.setattr(auth, "_lookup_key", counting_lookup)
+
+    for _ in range(3):
+        assert client.get("/reader/opds", auth=("reader", key["token"])).status_code == 200
+
+    assert len(lookups) == 1
+    async with AsyncTestingSessionLocal() as session:
+        stored = await session.get(models.ApiKey, key["id"])
+        assert stored.last_used_at is None
+        assert stored.request_count == 0
+    assert get_api_key_usage_recorder().pending()[key["id"]][1] == 3
+
+    listed = client.get("/api/reader-keys").json()
+    assert listed[0]["request_count"] == 3
+    assert listed[0]["last_used_at"] is not None
+    assert get_api_key_usage_recorder().pending() == {}
+
+
+@pytest.mark.asyncio
+async def test_reader_key_listing_survives_a_failed_usage_flush(db_session, monkeypatch):
+    key = client.post("/api/reader-keys", json={"label": "Flaky Reader"}).json()
+    assert client.get("/reader/opds", auth=("reader", key["token"])).status_code == 200
+
+    async def failing_usage_write(db, pending):
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(crud, "record_api_key_usage", failing_usage_write)
+    response = client.get("/api/reader-keys")
+
+    assert response.status_code == 200
+    assert response.json()[0]["request_count"] == 0
+    assert get_api_key_usage_recorder().pending()[key["id"]][1] == 1
+
+
 @pytest.mark.asyncio
 async def test_get_series_genres_endpoint(db_session):
     async with AsyncTestingSessionLocal() as session:
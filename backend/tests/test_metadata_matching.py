@@ -1,4 +1,6 @@
+import asyncio
 import json
+import os
 from datetime import datetime, timezone
 from types import SimpleNamespace
 
@@ -8,7 +10,13 @@ from ebooklib import epub
 from backend.app import crud, models, schemas
 from backend.app.services.metadata.amazon import enrich_amazon_candidate, search_amazon
 from backend.app.services.metadata.arbitration import arbitrate_candidate_suggestions, refine_unmatched_search_identity
-from backend.app.services.metadata.clients import request_google_books_json
+from backend.app.services.metadata.clients import (
+    TokenBucket,
+    request_amazon_html,
+    request_google_books_json,
+    request_open_library_json,
+)
+from backend.app.services.metadata.http_cache import ResponseCache
 from backend.app.services.metadata.evidence import EpubEvidence, extract_epub_evidence, resolve_search_identity
 from backend.app.services.metadata.scoring import (
     author_similarity,
@@ -26,6 +34,7 @@ from backend.app.services.metadata_sync import (
     _build_suggestions_for_book,
     _google_books_metadata_details,
     allocate_unique_candidate_suggestions,
+    generate_candidate_suggestions,
 )
 from backend.app.services.series import enrich_series_metadata
 
@@ -408,7 +417,8 @@ def test_collection_wide_allocator_gives_shared_record_to_best_fitting_volume():
     assert record_one_for_two.match_issues == ['Collection-wide assignment reserved this remote record for "Dragon Road 1".']
 
 
-def test_amazon_collector_parses_search_and_detail_metadata(mocker):
+@pytest.mark.asyncio
+async def test_amazon_collector_parses_search_and_detail_metadata(mocker):
     search_html = """
     <div data-component-type="s-search-result" data-asin="B012345678">
       <h2><a href="/dp/B012345678"><span>The Hidden Crown</span></a></h2>
@@ -428,8 +438,8 @@ def test_amazon_collector_parses_search_and_detail_metadata(mocker):
         side_effect=[search_html, detail_html],
     )
 
-    candidates = search_amazon("The Hidden Crown Élodie Martin")
-    detailed = enrich_amazon_candidate(candidates[0])
+    candidates = await search_amazon("The Hidden Crown Élodie Martin")
+    detailed = await enrich_amazon_candidate(candidates[0])
 
     assert detailed.asin == "B012345678"
     assert detailed.authors == ["Élodie Martin"]
@@ -438,25 +448,156 @@ def test_amazon_collector_parses_search_and_detail_metadata(mocker):
     assert request.call_count == 2
 
 
-def test_google_books_client_retries_rate_limit_response(mocker):
+@pytest.mark.asyncio
+async def test_google_books_client_retries_rate_limit_response(mocker):
     rate_limited = mocker.Mock(status_code=429, headers={"Retry-After": "0"})
     success = mocker.Mock(status_code=200, headers={})
     success.json.return_value = {"items": [{"id": "volume-1"}]}
     request = mocker.patch(
-        "backend.app.services.metadata.clients.requests.get",
+        "backend.app.services.metadata.clients._http_get",
         side_effect=[rate_limited, success],
     )
-    sleep = mocker.patch("backend.app.services.metadata.clients.time.sleep")
+    sleep = mocker.patch("backend.app.services.metadata.clients.asyncio.sleep")
     mocker.patch("backend.app.services.metadata.clients.GOOGLE_BOOKS_API_KEY", "test-key")
 
-    payload = request_google_books_json("/volumes", params={"q": "Dune"})
+    payload = await request_google_books_json("/volumes", params={"q": "Dune"})
 
     assert payload["items"][0]["id"] == "volume-1"
     assert request.call_count == 2
     sleep.assert_called_once_with(0.25)
 
 
-def test_provider_candidates_compete_in_one_ranked_pool(mocker):
+def test_token_bucket_allows_a_burst_then_spaces_requests(mocker):
+    now = [100.0]
+    mocker.patch("backend.app.services.metadata.clients.time.monotonic", side_effect=lambda: now[0])
+    bucket = TokenBucket(0.5, burst=2)
+
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+    now[0] += 3.0
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.5]
+    assert TokenBucket(0).reserve() == 0.0
+
+
+@pytest.mark.asyncio
+async def test_sync_searches_books_and_providers_concurrently(mocker):
+    books = [models.Book(id=index, title=f"Dragon Saga {index}", author="Alice Smith") for index in (1, 2, 3)]
+    started: list[str] = []
+    everyone_started = asyncio.Event()
+
+    async def fake_request(path, *, params=None):
+        started.append(path)
+        if len(started) >= 6:
+            everyone_started.set()
+        await asyncio.wait_for(everyone_started.wait(), timeout=2)
+        if path == "/search.json":
+            number = params["title"].rsplit(" ", 1)[-1]
+            return {
+                "docs": [
+                    {
+                        "key": f"/works/OL{number}W",
+                        "title": params["title"],
+                        "author_name": ["Alice Smith"],
+                        "author_key": ["OLA1A"],
+                    }
+                ]
+            }
+        if path == "/authors/OLA1A/works.json":
+            return {"entries": [{"title": f"Dragon Saga {index}"} for index in (1, 2, 3, 4)]}
+        return {"subjects": ["Fantasy"]}
+
+    async def fake_google(path, *, params=None):
+        started.append("google")
+        if len(started) >= 6:
+            everyone_started.set()
+        await asyncio.wait_for(everyone_started.wait(), timeout=2)
+        return {}
+
+    mocker.patch("backend.app.services.metadata_sync._request_json", side_effect=fake_request)
+    mocker.patch("backend.app.services.metadata_sync._request_google_books_json", side_effect=fake_google)
+    mocker.patch("backend.app.services.metadata_sync._google_books_enabled", return_value=True)
+
+    groups = await generate_candidate_suggestions(books, books, max_candidates=1)
+
+    assert [group[0].remote_title for group in groups] == ["Dragon Saga 1", "Dragon Saga 2", "Dragon Saga 3"]
+    # Every book's Open Library and Google Books searches were waiting at the same time,
+    # and the three books shared a single author-works request.
+    assert started.count("google") >= 3
+    assert started.count("/authors/OLA1A/works.json") == 1
+
+
+@pytest.mark.asyncio
+async def test_provider_responses_are_cached_and_revalidated(mocker, tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite3", ttl_seconds=3600, max_bytes=1024 * 1024)
+    mocker.patch("backend.app.services.metadata.clients.get_response_cache", return_value=cache)
+    mocker.patch("backend.app.services.metadata.clients.OPEN_LIBRARY_MIN_REQUEST_INTERVAL_SECONDS", 0)
+    fetched = mocker.Mock(status_code=200, headers={"ETag": '"v1"'})
+    fetched.json.return_value = {"docs": [{"key": "/works/OL1W"}]}
+    unchanged = mocker.Mock(status_code=304, headers={})
+    request = mocker.patch("backend.app.services.metadata.clients._http_get", side_effect=[fetched, unchanged])
+
+    first = await request_open_library_json("/search.json", params={"title": "Dune", "author": "Frank  Herbert"})
+    repeat = await request_open_library_json("/search.json", params={"author": "frank herbert", "title": "DUNE"})
+    assert first == repeat == {"docs": [{"key": "/works/OL1W"}]}
+    assert request.call_count == 1
+
+    cache.ttl_seconds = -1
+    cache.revalidated(cache.lookup("open_library", "/search.json", {"title": "Dune", "author": "Frank Herbert"}))
+    revalidated = await request_open_library_json("/search.json", params={"title": "Dune", "author": "Frank Herbert"})
+
+    assert revalidated == first
+    assert request.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_response_cache_excludes_api_keys_and_evicts_least_recently_used(mocker, tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite3", ttl_seconds=3600, max_bytes=4096)
+    mocker.patch("backend.app.services.metadata.clients.get_response_cache", return_value=cache)
+    mocker.patch("backend.app.services.metadata.clients.GOOGLE_BOOKS_API_KEY", "secret-key")
+    success = mocker.Mock(status_code=200, headers={})
+    success.json.return_value = {"items": [{"id": "volume-1"}]}
+    request = mocker.patch("backend.app.services.metadata.clients._http_get", return_value=success)
+
+    await request_google_books_json("/volumes", params={"q": "Dune"})
+    mocker.patch("backend.app.services.metadata.clients.GOOGLE_BOOKS_API_KEY", "rotated-key")
+    await request_google_books_json("/volumes", params={"q": "Dune"})
+    assert request.call_count == 1
+    assert b"secret-key" not in (tmp_path / "cache.sqlite3").read_bytes()
+
+    incompressible = [json.dumps({"noise": os.urandom(900).hex()}) for _ in range(4)]
+    for index, body in enumerate(incompressible):
+        cache.store("open_library", f"/works/OL{index}W.json", None, body)
+        cache.lookup("google_books", "/volumes", {"q": "Dune"})
+
+    assert cache.stats()["size_bytes"] == cache._size_bytes <= 4096
+    assert cache.lookup("google_books", "/volumes", {"q": "Dune"}) is not None
+    assert cache.lookup("open_library", "/works/OL0W.json") is None
+    assert cache.lookup("open_library", "/works/OL3W.json") is not None
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_amazon_robot_check_pages_are_not_cached(mocker, tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite3", ttl_seconds=3600, max_bytes=1024 * 1024)
+    mocker.patch("backend.app.services.metadata.clients.get_response_cache", return_value=cache)
+    mocker.patch("backend.app.services.metadata.clients.AMAZON_METADATA_ENABLED", True)
+    mocker.patch("backend.app.services.metadata.clients.AMAZON_MIN_REQUEST_INTERVAL_SECONDS", 0)
+    robot_check = mocker.Mock(status_code=200, headers={}, text="<form action='/errors/validateCaptcha'></form>")
+    results = mocker.Mock(
+        status_code=200, headers={}, text='<div data-component-type="s-search-result" data-asin="B0TEST"></div>'
+    )
+    request = mocker.patch("backend.app.services.metadata.clients._http_get", side_effect=[robot_check, results])
+
+    assert "validateCaptcha" in await request_amazon_html("/s", params={"k": "Dune"})
+    assert "s-search-result" in await request_amazon_html("/s", params={"k": "Dune"})
+    assert "s-search-result" in await request_amazon_html("/s", params={"k": "Dune"})
+    assert request.call_count == 2
+    assert cache.stats() == {"entries": 1, "size_bytes": cache._size_bytes}
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_provider_candidates_compete_in_one_ranked_pool(mocker):
     book = models.Book(id=11, title="The Hidden Crown", author="Élodie Martin")
     open_library_doc = {
         "key": "/works/study-guide",
@@ -483,14 +624,15 @@ def test_provider_candidates_compete_in_one_ranked_pool(mocker):
     mocker.patch("backend.app.services.metadata_sync._fetch_work_data", return_value={})
     mocker.patch("backend.app.services.metadata_sync._fetch_author_work_entries", return_value=[])
 
-    suggestions = _build_suggestions_for_book(book, {"elodie martin": [book]}, {}, max_candidates=5)
+    suggestions = await _build_suggestions_for_book(book, {"elodie martin": [book]}, {}, max_candidates=5)
 
     assert [suggestion.source for suggestion in suggestions] == ["google_books", "open_library"]
     assert suggestions[0].remote_ids == {"google_books_volume_id": "google-exact"}
     assert suggestions[0].metadata_details == {"publisher": "Crown Press"}
 
 
-def test_two_independent_providers_create_near_perfect_corroborated_match(mocker):
+@pytest.mark.asyncio
+async def test_two_independent_providers_create_near_perfect_corroborated_match(mocker):
     book = models.Book(id=14, title="The Hidden Crown", author="Élodie Martin")
     open_library_doc = {
         "key": "/works/exact",
@@ -518,7 +660,7 @@ def test_two_independent_providers_create_near_perfect_corroborated_match(mocker
     mocker.patch("backend.app.services.metadata_sync._fetch_work_data", return_value={})
     mocker.patch("backend.app.services.metadata_sync._fetch_author_work_entries", return_value=[])
 
-    suggestions = _build_suggestions_for_book(book, {"elodie martin": [book]}, {}, max_candidates=5)
+    suggestions = await _build_suggestions_for_book(book, {"elodie martin": [book]}, {}, max_candidates=5)
 
     assert len(suggestions) == 1
     assert suggestions[0].source == "open_library+google_books"
@@ -771,3 +913,82 @@ async def test_resync_skips_rejected_candidate_and_supersedes_stale_pending_matc
     assert replacement.proposed_genre_tags == ["Mystery"]
     assert refreshed_stale.status == "superseded"
     assert proposal.match_id == replacement.id
+
+
+@pytest.mark.asyncio
+async def test_remote_identifier_index_follows_book_metadata(db):
+    book = await crud.create_book(
+        db,
+        schemas.BookCreate(
+            title="Indexed Crown",
+            author="Élodie Martin",
+            immutable_path="indexed-immutable.epub",
+            current_path="indexed.epub",
+            source_type=models.SourceType.epub,
+        ),
+    )
+    book.metadata_remote_ids = {"isbn_10": "1402894627", "asin": "B012345678", "calibre_id": "7"}
+    await db.commit()
+
+    assert book.author_key == "elodie martin"
+    assert [holder.id for holder in await crud.get_books_with_remote_identifiers(db, {("isbn", "9781402894626")})] == [book.id]
+
+    book.metadata_remote_ids = {"asin": "B099999999"}
+    await db.commit()
+
+    assert await crud.get_books_with_remote_identifiers(db, {("isbn", "9781402894626")}) == []
+    assert await crud.get_books_with_remote_identifiers(db, {("asin", "B099999999")}) == [book]
+
+
+@pytest.mark.asyncio
+async def test_book_update_sync_loads_only_the_author_neighborhood(db, mocker):
+    def create(title, author, path, **extra):
+        return crud.create_book(
+            db,
+            schemas.BookCreate(
+                title=title,
+                author=author,
+                immutable_path=f"{path}-immutable.epub",
+                current_path=f"{path}.epub",
+                source_type=models.SourceType.epub,
+                **extra,
+            ),
+        )
+
+    await create("Dragon Saga 1", "Elodie Martin", "saga-1")
+    target = await create("Dragon Saga 2", "Elodie Martin", "saga-2")
+    holder = await create("Borrowed Crown", "Someone Else", "holder")
+    await create("Unrelated Book", "Another Author", "unrelated")
+    holder.metadata_remote_ids = {"isbn_13": "9781402894626"}
+    await db.commit()
+    job = await crud.create_metadata_sync_job(db, trigger="book_update", book_ids=[target.id])
+
+    suggestion = MetadataSuggestion(
+        book=target,
+        matched=True,
+        source="open_library",
+        match_confidence=0.95,
+        remote_title="Dragon Saga 2",
+        remote_ids={"isbn_13": "9781402894626"},
+    )
+    build = mocker.patch(
+        "backend.app.services.metadata_sync._build_suggestions_for_book",
+        new=mocker.AsyncMock(return_value=[suggestion]),
+    )
+    progress = mocker.spy(crud, "mark_metadata_sync_job_progress")
+
+    from backend.app.services.metadata_jobs import process_metadata_sync_job
+
+    await process_metadata_sync_job(db, job.id)
+    job = await crud.get_metadata_sync_job(db, job.id)
+    matches = await crud.get_metadata_matches_by_book_id(db, target.id)
+
+    local_books_by_author = build.call_args.args[1]
+    assert {key: [book.title for book in books] for key, books in local_books_by_author.items()} == {
+        "elodie martin": ["Dragon Saga 1", "Dragon Saga 2"]
+    }
+    assert target.series == "Dragon Saga"
+    assert matches[0].status == "pending"
+    assert '"Borrowed Crown"' in matches[0].match_issues[0]
+    assert (job.status, job.processed_books, job.matched_books, job.proposed_books) == ("completed", 1, 1, 1)
+    assert progress.call_count == 1
@@ -11,14 +11,18 @@ from datetime import datetime, timedelta, timezone
 import pytest
 from unittest.mock import AsyncMock, Mock
 
+from backend.app import logging_config
 from backend.app.logging_config import (
+    _IndexedRotatingFileHandler,
     _RedactedTextFormatter,
+    _StructuredFormatter,
     is_quiet_successful_access_entry,
     read_persisted_logs,
     redact_text,
 )
+from backend.app import crud
 from backend.app.models import ProcessingJob
-from backend.app.services.observability import health_report, processing_job_metrics
+from backend.app.services.observability import health_report, processing_job_metrics, processing_queue_depth
 
 
 def test_redact_text_removes_common_secret_forms():
@@ -58,6 +62,42 @@ def test_persisted_logs_can_be_read_after_memory_is_gone(tmp_path):
     assert restored[1]["request_id"] == "request-123"
 
 
+def test_indexed_logs_find_a_request_across_rotations_without_decoding_history(tmp_path, monkeypatch):
+    log_file = tmp_path / "story-manager.jsonl"
+    handler = _IndexedRotatingFileHandler(log_file, maxBytes=100_000, backupCount=3, encoding="utf-8")
+    handler.setFormatter(_StructuredFormatter())
+    logger = logging.getLogger("indexed-log-test")
+    logger.propagate = False
+    logger.addHandler(handler)
+    try:
+        logger.warning("slow request started", extra={"request_id": "trace-me", "job_id": None})
+        for index in range(1500):
+            logger.info("unrelated entry %d", index, extra={"request_id": f"other-{index}", "job_id": index})
+        logger.error("slow request finished", extra={"request_id": "trace-me", "job_id": None})
+        logger.info("latest", extra={"request_id": None, "job_id": None})
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+    decoded = []
+    decode_line = logging_config._decode_line
+    monkeypatch.setattr(logging_config, "_decode_line", lambda line: decoded.append(line) or decode_line(line))
+
+    traced = read_persisted_logs(log_file=log_file, request_id="trace-me")
+    errors = read_persisted_logs(log_file=log_file, level="error")
+    job = read_persisted_logs(log_file=log_file, job_id=42)
+
+    assert log_file.with_name("story-manager.jsonl.1").is_file()
+    assert log_file.with_name("story-manager.jsonl.1.idx").is_file()
+    assert [entry["message"] for entry in traced] == ["slow request started", "slow request finished"]
+    assert [entry["message"] for entry in errors] == ["slow request finished"]
+    assert [entry["message"] for entry in job] == ["unrelated entry 42"]
+    assert len(decoded) == 4
+    assert [entry["message"] for entry in read_persisted_logs(log_file=log_file, limit=2)] == [
+        "slow request finished",
+        "latest",
+    ]
+
+
 def test_plain_console_formatter_redacts_interpolated_secrets():
     record = logging.LogRecord(
         name="test",
@@ -149,6 +189,48 @@ async def test_processing_metrics_are_grouped_by_job_type(db):
     assert result["by_job_type"]["refresh_book"]["canceled"] == 1
 
 
+@pytest.mark.asyncio
+async def test_queue_depth_samples_record_each_lane_once_per_interval(db):
+    now = datetime.now(timezone.utc)
+    db.add_all(
+        [
+            ProcessingJob(
+                job_type="clean_book",
+                resource_lane="cpu",
+                status="queued",
+                request_id="depth-1",
+                available_at=now - timedelta(minutes=2),
+            ),
+            ProcessingJob(
+                job_type="clean_book",
+                resource_lane="cpu",
+                status="queued",
+                request_id="depth-2",
+                available_at=now + timedelta(minutes=5),
+            ),
+            ProcessingJob(job_type="generate_speech", resource_lane="tts", status="running", request_id="depth-3"),
+        ]
+    )
+    await db.commit()
+
+    recorded = await crud.record_processing_queue_samples(
+        db, resource_lanes=("cpu", "tts"), min_interval_seconds=60, retention_days=7
+    )
+    repeated = await crud.record_processing_queue_samples(
+        db, resource_lanes=("cpu", "tts"), min_interval_seconds=60, retention_days=7
+    )
+    result = await processing_queue_depth(db, window_hours=1)
+
+    assert len(recorded) == 2
+    assert repeated == []
+    [cpu] = result["lanes"]["cpu"]
+    assert (cpu["queued"], cpu["running"]) == (2, 0)
+    assert 110_000 < cpu["oldest_queued_age_ms"] < 130_000
+    [tts] = result["lanes"]["tts"]
+    assert (tts["queued"], tts["running"], tts["oldest_queued_age_ms"]) == (0, 1, None)
+    assert result["lanes"]["llm"] == []
+
+
 def test_request_ids_are_returned_and_can_be_supplied(app_client):
     generated = app_client.get("/health/live")
     supplied = app_client.get("/health/live", headers={"X-Request-ID": "browser-check-42"})
@@ -2,9 +2,11 @@
 
 import asyncio
 from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
 
 from backend.app import crud
 from backend.app.models import (
@@ -66,7 +68,7 @@ async def test_processing_queue_creates_backup_under_write_barrier(sqlite_sessio
         return {"filename": "test.story-manager.zip"}
 
     monkeypatch.setattr(processing_queue_module, "SessionLocal", sqlite_sessionmaker)
-    monkeypatch.setattr(processing_queue_module, "create_backup_archive", create_backup)
+    monkeypatch.setattr(processing_queue_module, "create_backup", create_backup)
     monkeypatch.setattr(processing_queue_module, "LIBRARY_PATH", tmp_path / "library")
     monkeypatch.setattr(processing_queue_module, "BACKUP_PATH", tmp_path / "backups")
     monkeypatch.setattr(processing_queue_module, "DATABASE_URL", "postgresql+psycopg://localhost/test")
@@ -193,6 +195,51 @@ async def test_processing_failure_backoff_and_manual_retry_reset(sqlite_sessionm
         assert retry_at <= datetime.now(timezone.utc)
 
 
+@pytest.mark.asyncio
+async def test_processing_lane_notify_is_transactional_and_postgres_only(sqlite_sessionmaker):
+    db = Mock()
+    db.get_bind.return_value.dialect.name = "postgresql"
+    db.execute = AsyncMock()
+
+    await crud.notify_processing_lane(db, "tts", 7)
+
+    statement = db.execute.await_args.args[0].compile(dialect=postgresql.dialect())
+    assert "pg_notify" in str(statement)
+    assert set(statement.params.values()) == {"processing_jobs_tts", "7"}
+
+    async with sqlite_sessionmaker() as session:
+        await crud.notify_processing_lane(session, "tts", 7)
+        job, created = await crud.create_processing_job(session, job_type="clean_book", resource_lane="cpu")
+        assert created and job.status == "queued"
+
+
+def test_processing_listener_uses_a_plain_libpq_url():
+    assert (
+        processing_queue_module._listen_conninfo("postgresql+psycopg://user:secret@db:5432/story_manager")
+        == "postgresql://user:secret@db:5432/story_manager"
+    )
+    assert processing_queue_module._listen_conninfo("sqlite+aiosqlite:///:memory:") is None
+
+
+@pytest.mark.asyncio
+async def test_idle_worker_wakes_for_its_lane_and_sleeps_until_delayed_retry(monkeypatch, sqlite_sessionmaker):
+    monkeypatch.setattr(processing_queue_module, "SessionLocal", sqlite_sessionmaker)
+    queue = ProcessingQueue()
+    queue._listening = True
+
+    assert await queue._idle_timeout("llm") == queue._safety_poll_seconds
+    async with sqlite_sessionmaker() as db:
+        job, _created = await crud.create_processing_job(db, job_type="metadata_sync", resource_lane="llm")
+        job.available_at = datetime.now(timezone.utc) + timedelta(seconds=5)
+        await db.commit()
+    assert 0 < await queue._idle_timeout("llm") <= 5
+    assert await queue._idle_timeout("tts") == queue._safety_poll_seconds
+
+    await queue.enqueue(job.id, "llm")
+    assert queue._lane_wakes["llm"].is_set()
+    assert not queue._lane_wakes["tts"].is_set()
+
+
 @pytest.mark.asyncio
 async def test_active_processing_job_deduplication_includes_running(sqlite_sessionmaker):
     async with sqlite_sessionmaker() as db:
@@ -216,6 +263,206 @@ async def test_active_processing_job_deduplication_includes_running(sqlite_sessi
         assert duplicate.id == first.id
 
 
+@pytest.mark.asyncio
+async def test_batch_claim_shares_a_lease_and_releases_without_spending_attempts(sqlite_sessionmaker):
+    async with sqlite_sessionmaker() as db:
+        job_ids = []
+        for index in range(5):
+            job, _created = await crud.create_processing_job(
+                db,
+                job_type="retry_cover",
+                resource_lane="maintenance",
+                dedupe_key=f"batch-claim-{index}",
+            )
+            job_ids.append(job.id)
+
+    async with sqlite_sessionmaker() as db:
+        first = await crud.claim_processing_jobs(
+            db,
+            resource_lane="maintenance",
+            lease_owner="worker-one",
+            lease_seconds=30,
+            limit=3,
+        )
+        second = await crud.claim_processing_jobs(
+            db,
+            resource_lane="maintenance",
+            lease_owner="worker-two",
+            lease_seconds=30,
+            limit=3,
+        )
+        assert [job.id for job in first] == job_ids[:3]
+        assert [job.id for job in second] == job_ids[3:]
+        assert {job.lease_expires_at for job in first} == {first[0].lease_expires_at}
+        assert {(job.status, job.attempt_count, job.lease_owner) for job in first} == {("running", 1, "worker-one")}
+
+        released = await crud.release_processing_jobs(
+            db,
+            [*job_ids[1:3], job_ids[3]],
+            resource_lane="maintenance",
+            lease_owner="worker-one",
+        )
+        assert released == 2
+
+    async with sqlite_sessionmaker() as db:
+        jobs = {job_id: await db.get(ProcessingJob, job_id) for job_id in job_ids}
+        assert [(jobs[job_id].status, jobs[job_id].attempt_count) for job_id in job_ids] == [
+            ("running", 1),
+            ("queued", 0),
+            ("queued", 0),
+            ("running", 1),
+            ("running", 1),
+        ]
+        assert jobs[job_ids[1]].lease_owner is None
+        assert jobs[job_ids[3]].lease_owner == "worker-two"
+
+
+@pytest.mark.asyncio
+async def test_prefetched_jobs_wait_as_queued_until_they_start(sqlite_sessionmaker):
+    async with sqlite_sessionmaker() as db:
+        for index in range(3):
+            await crud.create_processing_job(
+                db,
+                job_type="retry_cover",
+                resource_lane="maintenance",
+                dedupe_key=f"prefetched-{index}",
+            )
+
+    async with sqlite_sessionmaker() as db:
+        head, waiting, last = await crud.claim_processing_jobs(
+            db,
+            resource_lane="maintenance",
+            lease_owner="worker",
+            lease_seconds=30,
+            limit=3,
+        )
+        assert (head.progress_detail, head.started_at is not None, head.heartbeat_at is not None) == (
+            "Running",
+            True,
+            True,
+        )
+        assert {(job.progress_detail, job.started_at, job.heartbeat_at) for job in (waiting, last)} == {
+            ("Prefetched", None, None)
+        }
+        [sample] = await crud.record_processing_queue_samples(
+            db, resource_lanes=("maintenance",), min_interval_seconds=0, retention_days=7
+        )
+        assert (sample.queued, sample.running) == (2, 1)
+
+    async with sqlite_sessionmaker() as db:
+        assert not await crud.start_prefetched_processing_job(db, waiting.id, lease_owner="other-worker")
+        assert await crud.start_prefetched_processing_job(db, waiting.id, lease_owner="worker")
+        started = await db.get(ProcessingJob, waiting.id)
+        assert started.progress_detail == "Running"
+        assert started.started_at is not None and started.heartbeat_at is not None
+
+
+@pytest.mark.asyncio
+async def test_worker_runs_prefetched_jobs_and_releases_those_past_their_start_deadline(monkeypatch, sqlite_sessionmaker):
+    monkeypatch.setattr(processing_queue_module, "SessionLocal", sqlite_sessionmaker)
+    async with sqlite_sessionmaker() as db:
+        job_ids = []
+        for index in range(6):
+            job, _created = await crud.create_processing_job(
+                db,
+                job_type="generate_sentence_audio",
+                resource_lane="tts",
+                dedupe_key=f"prefetch-{index}",
+            )
+            job_ids.append(job.id)
+
+    executed = []
+
+    async def execute(job):
+        executed.append(job.id)
+        if job.id == job_ids[3]:
+            await asyncio.sleep(0.3)
+        return "done"
+
+    queue = ProcessingQueue()
+    queue._heartbeat_seconds = 0.45
+    monkeypatch.setattr(queue, "_execute", execute)
+
+    async def claim(lease_seconds):
+        async with sqlite_sessionmaker() as db:
+            return await crud.claim_processing_jobs(
+                db,
+                resource_lane="tts",
+                lease_owner="worker",
+                lease_seconds=lease_seconds,
+                limit=3,
+            )
+
+    await queue._run_claimed("tts", "worker", await claim(60))
+    assert executed == job_ids[:3]
+
+    # A one-second lease leaves 0.1 s to start prefetched jobs; the slow head job outlasts it.
+    await queue._run_claimed("tts", "worker", await claim(1))
+    assert executed == job_ids[:4]
+
+    async with sqlite_sessionmaker() as db:
+        jobs = [await db.get(ProcessingJob, job_id) for job_id in job_ids]
+        assert [(job.status, job.attempt_count, job.lease_owner) for job in jobs] == [
+            ("completed", 1, None),
+            ("completed", 1, None),
+            ("completed", 1, None),
+            ("completed", 1, None),
+            ("queued", 0, None),
+            ("queued", 0, None),
+        ]
+
+
+@pytest.mark.asyncio
+async def test_prefetched_jobs_canceled_while_waiting_are_neither_run_nor_requeued(monkeypatch, sqlite_sessionmaker):
+    monkeypatch.setattr(processing_queue_module, "SessionLocal", sqlite_sessionmaker)
+    async with sqlite_sessionmaker() as db:
+        job_ids = []
+        for index in range(5):
+            job, _created = await crud.create_processing_job(
+                db,
+                job_type="generate_sentence_audio",
+                resource_lane="tts",
+                dedupe_key=f"prefetch-cancel-{index}",
+            )
+            job_ids.append(job.id)
+
+    async def claim():
+        async with sqlite_sessionmaker() as db:
+            return await crud.claim_processing_jobs(db, resource_lane="tts", lease_owner="worker", lease_seconds=60, limit=3)
+
+    executed = []
+
+    async def execute(job):
+        executed.append(job.id)
+        if job.id == job_ids[0]:
+            async with sqlite_sessionmaker() as db:
+                await crud.request_processing_job_cancel(db, job_ids[1])
+        return "done"
+
+    queue = ProcessingQueue()
+    monkeypatch.setattr(queue, "_execute", execute)
+    await queue._run_claimed("tts", "worker", await claim())
+    assert executed == [job_ids[0], job_ids[2]]
+
+    claimed = await claim()
+    assert [job.id for job in claimed] == job_ids[3:]
+    async with sqlite_sessionmaker() as db:
+        await crud.request_processing_job_cancel(db, job_ids[4])
+        released = await crud.release_processing_jobs(db, job_ids[3:], resource_lane="tts", lease_owner="worker")
+        assert released == 2
+
+    async with sqlite_sessionmaker() as db:
+        jobs = [await db.get(ProcessingJob, job_id) for job_id in job_ids]
+        assert [(job.status, job.progress_detail, job.lease_owner) for job in jobs] == [
+            ("completed", jobs[0].progress_detail, None),
+            ("canceled", "Canceled", None),
+            ("completed", jobs[2].progress_detail, None),
+            ("queued", "Queued", None),
+            ("canceled", "Canceled", None),
+        ]
+        assert jobs[4].completed_at is not None and jobs[3].completed_at is None
+
+
 @pytest.mark.asyncio
 async def test_canceled_abandoned_job_is_not_reclaimed(sqlite_sessionmaker):
     async with sqlite_sessionmaker() as db:
@@ -473,3 +720,48 @@ async def test_progress_mirror_updates_the_durable_job(monkeypatch, sqlite_sessi
         assert job.progress_current == 2
         assert job.progress_total == 5
         assert job.progress_detail == "Checked 2 of 5 books"
+
+
+@pytest.mark.asyncio
+async def test_clean_all_fans_rewrites_out_and_records_them_in_one_session(monkeypatch, sqlite_sessionmaker):
+    from backend.app import epub_editor
+
+    async with sqlite_sessionmaker() as db:
+        for index in range(5):
+            db.add(
+                Book(
+                    title=f"Clean {index}",
+                    author="Fan Out",
+                    source_type=SourceType.web,
+                    source_url=f"https://example.com/fiction/{index}",
+                    immutable_path=f"library/clean-{index}-immutable.epub",
+                    current_path=f"library/clean-{index}.epub",
+                    current_word_count=0,
+                )
+            )
+        job, _created = await crud.create_processing_job(db, job_type="clean_all", resource_lane="cpu")
+
+    in_flight = 0
+    peak = 0
+
+    async def run_cleaning_plan(plan):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return None if plan.current_path.endswith("clean-0.epub") else 42
+
+    monkeypatch.setattr(processing_queue_module, "SessionLocal", sqlite_sessionmaker)
+    monkeypatch.setattr(processing_queue_module, "epub_worker_count", lambda: 2)
+    monkeypatch.setattr(epub_editor, "run_cleaning_plan", run_cleaning_plan)
+
+    detail = await ProcessingQueue()._clean_all(job.id)
+
+    assert detail == "Cleaned 5 books; 5 changed"
+    assert 1 < peak <= 4
+    async with sqlite_sessionmaker() as db:
+        counts = (await db.execute(select(Book.title, Book.current_word_count).order_by(Book.title))).all()
+        refreshed = await db.get(ProcessingJob, job.id)
+    assert counts == [("Clean 0", 0)] + [(f"Clean {index}", 42) for index in range(1, 5)]
+    assert (refreshed.progress_current, refreshed.progress_total) == (5, 5)
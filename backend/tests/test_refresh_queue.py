@@ -210,10 +210,10 @@ async def test_run_book_refresh_marks_error_when_download_fails(monkeypatch, db,
     def broken_word_count(path):
         raise RuntimeError("cannot read epub")
 
-    # get_epub_word_and_chapter_count is the first call that touches disk in
-    # the "has existing paths" branch — failing it short-circuits the job into
-    # the error handler without requiring real EPUB files on disk.
-    monkeypatch.setattr(web_novel_mod, "get_epub_word_and_chapter_count", broken_word_count)
+    # _epub_counts is the first call that touches disk in the "has existing
+    # paths" branch — failing it short-circuits the job into the error handler
+    # without requiring real EPUB files on disk.
+    monkeypatch.setattr(web_novel_mod, "_epub_counts", broken_word_count)
 
     await web_novel_mod.run_book_refresh(book.id)
 
@@ -222,6 +222,44 @@ async def test_run_book_refresh_marks_error_when_download_fails(monkeypatch, db,
     assert refreshed.refresh_status == "error"
 
 
+@pytest.mark.asyncio
+async def test_run_book_refresh_counts_the_download_in_its_metadata_pass(
+    monkeypatch, mocker, db, sqlite_sessionmaker, tmp_path
+):
+    library_path = tmp_path / "library"
+    (library_path / "Author").mkdir(parents=True)
+    immutable_path = library_path / "Author" / "immutable.epub"
+    current_path = library_path / "Author" / "current.epub"
+    immutable_path.write_bytes(b"downloaded epub")
+    current_path.write_bytes(b"cleaned epub")
+    book = await _make_web_book(
+        db,
+        immutable_path="library/Author/immutable.epub",
+        current_path="library/Author/current.epub",
+    )
+    await db.commit()
+
+    monkeypatch.setattr(web_novel_mod, "SessionLocal", sqlite_sessionmaker)
+    monkeypatch.setattr(web_novel_mod, "LIBRARY_PATH", library_path)
+    counted = mocker.patch.object(web_novel_mod, "_epub_counts", return_value=(10, 3))
+    mocker.patch.object(web_novel_mod, "analyze_epub", side_effect=AssertionError("extra EPUB pass"))
+    metadata = {"title": "Web Book", "author": "Author", "series": None, "word_count": 25, "chapter_count": 5}
+    mocker.patch.object(web_novel_mod, "download_web_novel", mocker.AsyncMock(return_value=(immutable_path, metadata)))
+    mocker.patch.object(web_novel_mod.epub_editor, "apply_book_cleaning", mocker.AsyncMock(return_value=False))
+    mocker.patch.object(web_novel_mod, "_enqueue_audiobook_refresh", mocker.AsyncMock())
+    mocker.patch.object(web_novel_mod, "queue_metadata_sync_job", mocker.AsyncMock())
+
+    await web_novel_mod.run_book_refresh(book.id)
+
+    counted.assert_called_once_with(current_path)
+    refreshed = await crud.get_book(db, book_id=book.id)
+    await db.refresh(refreshed)
+    assert refreshed.refresh_status is None
+    assert (refreshed.master_word_count, refreshed.current_word_count) == (25, 25)
+    [log] = await crud.get_book_logs(db, book.id)
+    assert (log.previous_chapter_count, log.new_chapter_count, log.words_added) == (3, 5, 15)
+
+
 @pytest.mark.asyncio
 async def test_run_book_refresh_swallows_missing_book(monkeypatch, db, sqlite_sessionmaker):
     """Worker should no-op cleanly when the book was deleted between enqueue and run."""
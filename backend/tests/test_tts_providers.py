@@ -326,3 +326,33 @@ async def test_fixed_voice_provider_requires_a_voice_id():
 
     with pytest.raises(RuntimeError, match="voice ID is required"):
         await tts_providers.synthesize_speech(settings, TTSRequest(text="Hello."))
+
+
+@pytest.mark.asyncio
+async def test_tts_calls_reuse_one_pooled_client_per_endpoint(monkeypatch):
+    from backend.app.services import http_clients
+
+    created = []
+
+    class _TrackedClient(_Client):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.is_closed = False
+            created.append(self)
+
+        async def aclose(self):
+            self.is_closed = True
+
+    monkeypatch.setattr(tts_providers.httpx, "AsyncClient", _TrackedClient)
+    settings = models.AudiobookSettings(tts_provider="omnivoice", tts_base_url="http://omnivoice:8001")
+
+    for text in ("One.", "Two.", "Three."):
+        await tts_providers.synthesize_speech(settings, TTSRequest(text=text, voice_prompt="[gender-female]"))
+
+    assert len(created) == 1
+    assert created[0].kwargs["limits"].max_keepalive_connections > 0
+    assert created[0].kwargs["http2"] is False
+    assert all(call[1]["timeout"].read == 600.0 for call in _Client.calls)
+
+    await http_clients.close_http_clients()
+    assert created[0].is_closed is True
@@ -1,5 +1,7 @@
+import asyncio
 import zipfile
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 from ebooklib import epub
@@ -162,7 +164,13 @@ async def test_download_web_novel_existing_epub_uses_lossless_updater_and_user_c
     assert result is not None
     epub_path, metadata = result
     assert epub_path == existing_epub
-    assert metadata == {"title": "After", "author": "Updated Author", "series": None}
+    assert metadata == {
+        "title": "After",
+        "author": "Updated Author",
+        "series": None,
+        "word_count": 4,
+        "chapter_count": 2,
+    }
 
     assert captured_update == {
         "source_url": "https://example.com/story/1",
@@ -227,7 +235,13 @@ async def test_download_web_novel_new_download_uses_story_manager_output_path(tm
     assert result is not None
     epub_path, metadata = result
     assert epub_path == expected_output
-    assert metadata == {"title": "Fresh Title", "author": "Fresh Author", "series": None}
+    assert metadata == {
+        "title": "Fresh Title",
+        "author": "Fresh Author",
+        "series": None,
+        "word_count": 4,
+        "chapter_count": 2,
+    }
 
     args = captured_args["args"]
     output_arg = f"output_filename={library_path.resolve()}/${{title}}-${{siteabbrev}}_${{storyId}}${{formatext}}"
@@ -236,6 +250,60 @@ async def test_download_web_novel_new_download_uses_story_manager_output_path(tm
     normalize_mock.assert_called_once_with(expected_output)
 
 
+@pytest.mark.asyncio
+async def test_per_epub_update_lock_serializes_and_is_forgotten_when_idle(tmp_path):
+    epub_path = tmp_path / "story.epub"
+    order = []
+
+    async def update(name):
+        async with web_novel._fff_update_lock(epub_path):
+            order.append(f"{name} start")
+            await asyncio.sleep(0.01)
+            order.append(f"{name} end")
+
+    await asyncio.gather(update("first"), update("second"))
+
+    assert order == ["first start", "first end", "second start", "second end"]
+    assert epub_path not in web_novel._fff_update_locks
+
+
+def test_scheduled_refresh_interleaves_books_across_source_hosts():
+    books = [
+        SimpleNamespace(id=1, source_url="https://www.royalroad.com/fiction/1"),
+        SimpleNamespace(id=2, source_url="https://royalroad.com/fiction/2"),
+        SimpleNamespace(id=3, source_url="https://archiveofourown.org/works/3"),
+        SimpleNamespace(id=4, source_url="https://www.scribblehub.com/series/4"),
+    ]
+
+    ordered = web_novel._interleave_by_host(books)
+
+    assert [book.id for book in ordered] == [1, 3, 4, 2]
+    assert web_novel._source_host(books[0].source_url) == web_novel._source_host(books[1].source_url)
+
+
+@pytest.mark.asyncio
+async def test_host_rate_limiter_bounds_each_site_but_not_the_library():
+    limiter = web_novel._HostRateLimiter(per_host=1, delay_seconds=0)
+    active: dict[str, int] = {}
+    peaks: dict[str, int] = {}
+    overall = {"active": 0, "peak": 0}
+
+    async def fetch(host: str) -> None:
+        async with limiter.slot(host):
+            active[host] = active.get(host, 0) + 1
+            overall["active"] += 1
+            peaks[host] = max(peaks.get(host, 0), active[host])
+            overall["peak"] = max(overall["peak"], overall["active"])
+            await asyncio.sleep(0.01)
+            active[host] -= 1
+            overall["active"] -= 1
+
+    await asyncio.gather(*(fetch(host) for host in ["royalroad.com", "ao3.org", "scribblehub.com"] * 3))
+
+    assert peaks == {"royalroad.com": 1, "ao3.org": 1, "scribblehub.com": 1}
+    assert overall["peak"] == 3
+
+
 def test_get_fff_config_paths_prefers_local_repo_override(tmp_path, monkeypatch):
     app_dir = tmp_path / "backend" / "app"
     app_dir.mkdir(parents=True)
@@ -35,13 +35,17 @@ function formatDuration(value) {
 
 function Logs({ onBack }) {
   const [level, setLevel] = useState("ALL");
+  const [requestId, setRequestId] = useState("");
   const [autoRefresh, setAutoRefresh] = useState(true);
+  const tracedRequest = requestId.trim();
 
   const logsQuery = useQuery({
-    queryKey: ["logs", level],
+    queryKey: ["logs", level, tracedRequest],
     queryFn: () => {
-      const param = level !== "ALL" ? `&level=${level}` : "";
-      return fetchJson(`/api/logs?limit=500${param}`, "Failed to fetch logs");
+      const params = new URLSearchParams({ limit: "500" });
+      if (level !== "ALL") params.set("level", level);
+      if (tracedRequest) params.set("request_id", tracedRequest);
+      return fetchJson(`/api/logs?${params}`, "Failed to fetch logs");
     },
     refetchInterval: autoRefresh ? 3000 : false,
   });
@@ -158,6 +162,13 @@ function Logs({ onBack }) {
               <option key={item} value={item}>{item}</option>
             ))}
           </select>
+          <input
+            type="search"
+            aria-label="Request ID"
+            placeholder="Request ID"
+            value={requestId}
+            onChange={(event) => setRequestId(event.target.value)}
+          />
           <label>
             <input type="checkbox" checked={autoRefresh} onChange={(event) => setAutoRefresh(event.target.checked)} />
             Auto-refresh
@@ -188,7 +199,11 @@ function Logs({ onBack }) {
                 {entry.message}
                 {(entry.request_id || entry.job_id != null) && (
                   <small>
-                    {entry.request_id && `request ${entry.request_id}`}
+                    {entry.request_id && (
+                      <button type="button" className="btn-text" onClick={() => setRequestId(entry.request_id)}>
+                        request {entry.request_id}
+                      </button>
+                    )}
                     {entry.request_id && entry.job_id != null && " · "}
                     {entry.job_id != null && `job ${entry.job_id}`}
                   </small>
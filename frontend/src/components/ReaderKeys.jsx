@@ -153,6 +153,7 @@ function ReaderKeys() {
                 <div className="hint">{key.token_prefix}</div>
                 <div className="hint">Created: {formatDate(key.created_at)}</div>
                 <div className="hint">Last used: {formatDate(key.last_used_at)}</div>
+                <div className="hint">Requests: {(key.request_count ?? 0).toLocaleString()}</div>
                 {key.revoked_at && <div className="hint">Revoked: {formatDate(key.revoked_at)}</div>}
               </div>
               {!key.revoked_at && (
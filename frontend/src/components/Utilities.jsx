@@ -798,8 +798,9 @@ function Utilities({ onBack }) {
           <section className="settings-section">
             <h3>Backup & Restore</h3>
             <p className="hint">
-              Create a portable snapshot of the PostgreSQL catalog and every library file. Story Manager briefly
-              pauses changes, verifies every file checksum, and only then publishes the backup for download.
+              Create a snapshot of the PostgreSQL catalog and every library file. Story Manager briefly pauses
+              changes, stores only files that are new or changed since the last backup, verifies their checksums,
+              and only then publishes the backup. Each backup downloads as a portable archive.
             </p>
             <div className="settings-actions">
               <button
@@ -863,6 +864,7 @@ function Utilities({ onBack }) {
                       <p className="hint">
                         {formatBytes(backup.size_bytes)} · {backup.library_file_count} library file
                         {backup.library_file_count === 1 ? "" : "s"} · {formatBytes(backup.library_size_bytes)} of library data
+                        {backup.added_size_bytes != null && ` · ${formatBytes(backup.added_size_bytes)} newly stored`}
                       </p>
                       <p className={backup.valid_manifest ? "backup-status-ok" : "error"}>
                         {backup.valid_manifest && backup.verified_at_creation